@@ -1,28 +1,137 @@
-# 公開ドメインオブジェクト
-from fino_ingestor.domain.entity.document import Document
-from fino_ingestor.domain.value.disclosure_date import DisclosureDate
-from fino_ingestor.domain.value.disclosure_source import DisclosureSource
-from fino_ingestor.domain.value.disclosure_type import DisclosureType
-from fino_ingestor.domain.value.document_id import DocumentId
-from fino_ingestor.domain.value.format_type import FormatType, FormatTypeEnum
-from fino_ingestor.domain.value.ticker import Ticker
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-# 公開クラス
-from fino_ingestor.interface.config.disclosure import EdinetConfig
-from fino_ingestor.interface.config.storage import LocalStorageConfig, S3StorageConfig
+# 公開オブジェクトは初回アクセス時に読み込む（PEP 562）
+# boto3, edinet, pydantic などの重い依存をimport時に読み込まないようにするため
+if TYPE_CHECKING:
+    # 公開ドメインオブジェクト
+    from fino_ingestor.domain.entity.dead_letter import DeadLetter
+    from fino_ingestor.domain.entity.document import Document
+    from fino_ingestor.domain.event.document_stored import DocumentStoredEvent
+    from fino_ingestor.domain.value.disclosure_date import DisclosureDate
+    from fino_ingestor.domain.value.disclosure_source import DisclosureSource
+    from fino_ingestor.domain.value.disclosure_type import DisclosureType
+    from fino_ingestor.domain.value.document_id import DocumentId
+    from fino_ingestor.domain.value.format_type import FormatType, FormatTypeEnum
+    from fino_ingestor.domain.value.ticker import Ticker
 
-# 公開config
-from fino_ingestor.public.document_collector import DocumentCollector
+    # 公開config
+    from fino_ingestor.interface.config.concurrency import (
+        BackpressureConfig,
+        BandwidthConfig,
+        ConcurrencyConfig,
+    )
+    from fino_ingestor.interface.config.disclosure import DownloadConfig, EdinetConfig
+    from fino_ingestor.interface.config.integrity import IntegrityConfig
+    from fino_ingestor.interface.config.event import (
+        JournalEventSinkConfig,
+        UnixSocketEventSinkConfig,
+    )
+    from fino_ingestor.interface.config.repository import (
+        BundlingConfig,
+        ExistenceCacheConfig,
+        RepositoryConfig,
+        ZipExtractionConfig,
+    )
+    from fino_ingestor.interface.config.storage import (
+        ContentAddressedStorageConfig,
+        FanOutStorageConfig,
+        LocalStorageConfig,
+        ReadCacheStorageConfig,
+        S3StorageConfig,
+        S3TransferConfig,
+        TieredStorageConfig,
+    )
+    from fino_ingestor.interface.config.plan import PlanConfig
+    from fino_ingestor.interface.config.priority import PriorityConfig
+    from fino_ingestor.interface.config.watch import WatchConfig
 
-# 公開UTILITY
-from fino_ingestor.util.timescope import TimeScope
+    # 公開クラス
+    from fino_ingestor.public.document_collector import DocumentCollector
+
+    # 公開UTILITY
+    from fino_ingestor.infrastructure.adapter.event_sink.journal import (
+        read_event_journal,
+    )
+    from fino_ingestor.util.business_calendar import (
+        BusinessCalendar,
+        JapanMarketCalendar,
+        WeekdayCalendar,
+    )
+    from fino_ingestor.util.date_range import DateRange, DateRangeSet
+    from fino_ingestor.util.timescope import TimeScope
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "DocumentCollector": "fino_ingestor.public.document_collector",
+    "EdinetConfig": "fino_ingestor.interface.config.disclosure",
+    "DownloadConfig": "fino_ingestor.interface.config.disclosure",
+    "LocalStorageConfig": "fino_ingestor.interface.config.storage",
+    "S3StorageConfig": "fino_ingestor.interface.config.storage",
+    "S3TransferConfig": "fino_ingestor.interface.config.storage",
+    "TieredStorageConfig": "fino_ingestor.interface.config.storage",
+    "FanOutStorageConfig": "fino_ingestor.interface.config.storage",
+    "ReadCacheStorageConfig": "fino_ingestor.interface.config.storage",
+    "ContentAddressedStorageConfig": "fino_ingestor.interface.config.storage",
+    "RepositoryConfig": "fino_ingestor.interface.config.repository",
+    "ZipExtractionConfig": "fino_ingestor.interface.config.repository",
+    "BundlingConfig": "fino_ingestor.interface.config.repository",
+    "ExistenceCacheConfig": "fino_ingestor.interface.config.repository",
+    "WatchConfig": "fino_ingestor.interface.config.watch",
+    "PlanConfig": "fino_ingestor.interface.config.plan",
+    "PriorityConfig": "fino_ingestor.interface.config.priority",
+    "ConcurrencyConfig": "fino_ingestor.interface.config.concurrency",
+    "BackpressureConfig": "fino_ingestor.interface.config.concurrency",
+    "BandwidthConfig": "fino_ingestor.interface.config.concurrency",
+    "IntegrityConfig": "fino_ingestor.interface.config.integrity",
+    "JournalEventSinkConfig": "fino_ingestor.interface.config.event",
+    "UnixSocketEventSinkConfig": "fino_ingestor.interface.config.event",
+    "read_event_journal": "fino_ingestor.infrastructure.adapter.event_sink.journal",
+    "Document": "fino_ingestor.domain.entity.document",
+    "DeadLetter": "fino_ingestor.domain.entity.dead_letter",
+    "DocumentStoredEvent": "fino_ingestor.domain.event.document_stored",
+    "DisclosureDate": "fino_ingestor.domain.value.disclosure_date",
+    "DisclosureSource": "fino_ingestor.domain.value.disclosure_source",
+    "DisclosureType": "fino_ingestor.domain.value.disclosure_type",
+    "DocumentId": "fino_ingestor.domain.value.document_id",
+    "FormatType": "fino_ingestor.domain.value.format_type",
+    "FormatTypeEnum": "fino_ingestor.domain.value.format_type",
+    "Ticker": "fino_ingestor.domain.value.ticker",
+    "TimeScope": "fino_ingestor.util.timescope",
+    "DateRange": "fino_ingestor.util.date_range",
+    "DateRangeSet": "fino_ingestor.util.date_range",
+    "BusinessCalendar": "fino_ingestor.util.business_calendar",
+    "JapanMarketCalendar": "fino_ingestor.util.business_calendar",
+    "WeekdayCalendar": "fino_ingestor.util.business_calendar",
+}
 
 __all__ = [
     "DocumentCollector",
     "EdinetConfig",
+    "DownloadConfig",
     "LocalStorageConfig",
     "S3StorageConfig",
+    "S3TransferConfig",
+    "TieredStorageConfig",
+    "FanOutStorageConfig",
+    "ReadCacheStorageConfig",
+    "ContentAddressedStorageConfig",
+    "RepositoryConfig",
+    "ZipExtractionConfig",
+    "BundlingConfig",
+    "ExistenceCacheConfig",
+    "WatchConfig",
+    "PlanConfig",
+    "PriorityConfig",
+    "ConcurrencyConfig",
+    "BackpressureConfig",
+    "BandwidthConfig",
+    "IntegrityConfig",
+    "JournalEventSinkConfig",
+    "UnixSocketEventSinkConfig",
+    "read_event_journal",
     "Document",
+    "DeadLetter",
+    "DocumentStoredEvent",
     "DisclosureDate",
     "DisclosureSource",
     "DisclosureType",
@@ -31,4 +140,24 @@ __all__ = [
     "FormatTypeEnum",
     "Ticker",
     "TimeScope",
+    "DateRange",
+    "DateRangeSet",
+    "BusinessCalendar",
+    "JapanMarketCalendar",
+    "WeekdayCalendar",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_path), name)
+    # 2回目以降はモジュール属性として直接参照させる
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals().keys(), *__all__])
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+from fino_ingestor.infrastructure.adapter.disclosure_source.edinet import (
+    EdinetDocumentSearchCriteria,
+)
+from fino_ingestor.interface.port.disclosure_source import DisclosureSourcePort
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AuditStorageInput:
+    disclosure_source: DisclosureSourcePort[EdinetDocumentSearchCriteria]
+    criteria: EdinetDocumentSearchCriteria
+    """突き合わせる書類一覧の条件"""
+    prefix: str = ""
+    """検証するストレージのprefix"""
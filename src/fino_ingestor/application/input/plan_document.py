@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+from fino_ingestor.domain.value.format_type import FormatType
+from fino_ingestor.infrastructure.adapter.disclosure_source.edinet import (
+    EdinetDocumentSearchCriteria,
+)
+from fino_ingestor.interface.port.disclosure_source import DisclosureSourcePort
+from fino_ingestor.util.business_calendar import BusinessCalendar
+from fino_ingestor.util.date_range import DateScope
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PlanDocumentInput:
+    disclosure_source: DisclosureSourcePort[EdinetDocumentSearchCriteria]
+    timescope: DateScope
+    format_types: list[FormatType]
+    calendar: BusinessCalendar | None = None
+    verify_non_business_days: bool = False
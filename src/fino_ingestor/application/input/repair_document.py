@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+from fino_ingestor.application.output.audit_storage import RepairPlan
+from fino_ingestor.infrastructure.adapter.disclosure_source.edinet import (
+    EdinetDocumentSearchCriteria,
+)
+from fino_ingestor.interface.port.disclosure_source import DisclosureSourcePort
+
+
+@dataclass(frozen=True, slots=True)
+class RepairDocumentInput:
+    disclosure_source: DisclosureSourcePort[EdinetDocumentSearchCriteria]
+    plan: RepairPlan
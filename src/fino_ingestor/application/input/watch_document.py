@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+from fino_ingestor.domain.value.format_type import FormatType
+from fino_ingestor.infrastructure.adapter.disclosure_source.edinet import (
+    EdinetDocumentSearchCriteria,
+)
+from fino_ingestor.interface.port.disclosure_source import (
+    WatchableDisclosureSourcePort,
+)
+from fino_ingestor.util.business_calendar import BusinessCalendar
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class WatchDocumentInput:
+    disclosure_source: WatchableDisclosureSourcePort[EdinetDocumentSearchCriteria]
+    format_type: FormatType
+    calendar: BusinessCalendar | None = None
+    """指定した場合、過去日の再確認は営業日のみ行う"""
@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from fino_ingestor.application.input.audit_storage import AuditStorageInput
+from fino_ingestor.application.output.audit_storage import (
+    AuditStorageOutput,
+    RepairPlan,
+    RepairTarget,
+)
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.repository.document import DocumentRepository
+from fino_ingestor.infrastructure.repository.storage_audit import (
+    AuditFinding,
+    StorageAuditor,
+)
+
+
+class AuditStorageUseCase:
+    """
+    保存済みの書類を検証し、書類一覧と突き合わせて修復計画を作成する
+    - ストレージのprefix配下のオブジェクトを並列に検証し、壊れている書類を検出する
+    - 書類一覧にあるが保存されていない書類を検出する
+    - 書類一覧に含まれる書類のみを再取得の対象とする（書類の属性が一覧からしか得られないため）
+    """
+
+    def __init__(
+        self, document_repository: DocumentRepository, auditor: StorageAuditor
+    ) -> None:
+        self.document_repository = document_repository
+        self.auditor = auditor
+
+    def execute(self, input: AuditStorageInput) -> AuditStorageOutput:
+        listed = input.disclosure_source.list_available_documents(input.criteria)
+        scanned = self.auditor.scan(prefix=input.prefix)
+
+        with ThreadPoolExecutor(
+            max_workers=self.auditor.max_workers, thread_name_prefix="fino-audit"
+        ) as executor:
+            exists = list(executor.map(self.document_repository.exists, listed))
+        missing = [document for document, found in zip(listed, exists) if not found]
+
+        by_id: dict[str, Document] = {d.document_id.value: d for d in listed}
+        targets = [
+            RepairTarget(document=document, problem="missing", path=None)
+            for document in missing
+        ]
+        unresolved: list[AuditFinding] = []
+        for finding in scanned.findings:
+            document = by_id.get(finding.key.document_id)
+            if document is None:
+                unresolved.append(finding)
+                continue
+            targets.append(
+                RepairTarget(
+                    document=document, problem=finding.problem, path=finding.path
+                )
+            )
+
+        return AuditStorageOutput(
+            checked=scanned.checked,
+            skipped=scanned.skipped,
+            findings=scanned.findings,
+            missing=missing,
+            unresolved=unresolved,
+            repair_plan=RepairPlan(targets=targets),
+        )
@@ -1,30 +1,329 @@
+import logging
+import threading
+from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import UTC, datetime
+
 from fino_ingestor.application.input.collect_document import CollectDocumentInput
 from fino_ingestor.application.output.collect_document import CollectDocumentOutput
+from fino_ingestor.domain.entity.dead_letter import DeadLetter
 from fino_ingestor.domain.entity.document import Document
-from fino_ingestor.domain.repository.document import DocumentRepository
+from fino_ingestor.domain.repository.dead_letter import DeadLetterRepository
+from fino_ingestor.domain.repository.document import (
+    DocumentRepository,
+    DocumentStoreError,
+)
+from fino_ingestor.infrastructure.adapter.disclosure_source.edinet import (
+    EdinetDocumentSearchCriteria,
+)
+from fino_ingestor.infrastructure.processor.integrity import PackageVerifier
+from fino_ingestor.infrastructure.scheduler.byte_budget import (
+    ByteBudget,
+    ByteReservation,
+)
+from fino_ingestor.infrastructure.scheduler.concurrency import (
+    AdaptiveConcurrencyLimiter,
+)
+from fino_ingestor.infrastructure.scheduler.download_queue import DownloadQueue
+from fino_ingestor.interface.port.disclosure_source import DisclosureSourcePort
+
+logger = logging.getLogger(__name__)
 
 
 class CollectDocumentUseCase:
-    def __init__(self, document_repository: DocumentRepository) -> None:
+    def __init__(
+        self,
+        document_repository: DocumentRepository,
+        download_queue: DownloadQueue | None = None,
+        download_limiter: AdaptiveConcurrencyLimiter | None = None,
+        byte_budget: ByteBudget | None = None,
+        default_document_bytes: int = 8 * 1024 * 1024,
+        package_verifier: PackageVerifier | None = None,
+        dead_letter_repository: DeadLetterRepository | None = None,
+    ) -> None:
         self.document_repository = document_repository
+        # 指定した場合、未取得の書類を優先度順にダウンロードする（指定しない場合は一覧の順）
+        self.download_queue = download_queue
+        # 指定した場合、リミッターが許可する並列数でダウンロードする（指定しない場合は逐次）
+        self.download_limiter = download_limiter
+        # 指定した場合、並列ダウンロード中にメモリ上に保持する書類の合計バイト数を制限する
+        self.byte_budget = byte_budget
+        self.default_document_bytes = default_document_bytes
+        # 指定した場合、ダウンロードした書類を保存前に検証し、壊れている場合はダウンロードし直す
+        self.package_verifier = package_verifier
+        # 指定した場合、書類ごとの失敗をデッドレターに記録して残りの書類の収集を続ける
+        # （指定しない場合は最初の失敗で収集を中断し、例外を送出する）
+        self.dead_letter_repository = dead_letter_repository
+        if byte_budget is not None and download_limiter is None:
+            raise ValueError("byte_budget requires download_limiter")
 
     def execute(self, input: CollectDocumentInput) -> CollectDocumentOutput:
         available_document_list = input.disclosure_source.list_available_documents(
             input.criteria
         )
+        return self.collect(input.disclosure_source, available_document_list)
 
+    def collect(
+        self,
+        disclosure_source: DisclosureSourcePort[EdinetDocumentSearchCriteria],
+        documents: list[Document],
+        dead_letters: list[DeadLetter] | None = None,
+    ) -> CollectDocumentOutput:
+        """
+        documentsのうち未保存の書類をダウンロードして保存する
+        dead_lettersには記録済みのデッドレターを渡す（省略した場合はリポジトリから読み込む）。
+        """
+        if dead_letters is None and self.dead_letter_repository is not None:
+            dead_letters = self.dead_letter_repository.list_dead_letters()
+        # 保存済みになった書類のデッドレターのみを削除する
+        pending = {d.document.document_id.value for d in dead_letters or []}
+
+        # Documentの比較はIDで行えないため、存在確認の結果で振り分ける
         stored_document_list: list[Document] = []
-        for available_document in available_document_list:
+        missing_document_list: list[Document] = []
+        for available_document in documents:
             if self.document_repository.exists(available_document):
                 stored_document_list.append(available_document)
+            else:
+                missing_document_list.append(available_document)
 
+        downloads = self._iterate_downloads(missing_document_list)
         collected_documents: list[Document] = []
-        for available_document in available_document_list:
-            if available_document not in stored_document_list:
-                file = input.disclosure_source.download_document(
-                    document=available_document,
-                )
-                self.document_repository.save(available_document, file)
+        failed_documents: list[DeadLetter] = []
+        if self.download_limiter is not None:
+            collected_documents, failed_documents = self._download_concurrently(
+                disclosure_source, downloads, self.download_limiter
+            )
+        else:
+            for available_document in downloads:
+                try:
+                    file, sha256 = self._download_verified(
+                        disclosure_source, available_document, None
+                    )
+                    self.document_repository.save(
+                        available_document, file, sha256=sha256, overwrite=False
+                    )
+                except Exception as e:
+                    if self.dead_letter_repository is None:
+                        raise
+                    failed_documents.append(
+                        _record_dead_letter(
+                            self.dead_letter_repository, available_document, e
+                        )
+                    )
+                    continue
                 collected_documents.append(available_document)
 
-        return CollectDocumentOutput(collected_document_list=collected_documents)
+        # 非同期で処理中の保存の完了を待つ
+        try:
+            self.document_repository.flush()
+        except DocumentStoreError as e:
+            if self.dead_letter_repository is None:
+                raise
+            # 非同期の保存に失敗した書類は収集済みから除き、デッドレターに記録する
+            store_failed = {document.document_id.value for document, _ in e.failures}
+            collected_documents = [
+                document
+                for document in collected_documents
+                if document.document_id.value not in store_failed
+            ]
+            for document, error in e.failures:
+                failed_documents.append(
+                    _record_dead_letter(self.dead_letter_repository, document, error)
+                )
+        except Exception as e:
+            if self.dead_letter_repository is None:
+                raise
+            # 保存先への書き込みの確定（アップロードやバンドルの保存など）に失敗した場合は、
+            # どの書類の書き込みが確定していないか判別できないため、収集した書類をすべて記録する
+            for document in collected_documents:
+                failed_documents.append(
+                    _record_dead_letter(self.dead_letter_repository, document, e)
+                )
+            collected_documents = []
+
+        if self.dead_letter_repository is not None:
+            for document in [*stored_document_list, *collected_documents]:
+                if document.document_id.value in pending:
+                    self.dead_letter_repository.remove(document)
+            self.dead_letter_repository.flush()
+
+        return CollectDocumentOutput(
+            collected_document_list=collected_documents,
+            failed_document_list=failed_documents,
+        )
+
+    def _download_concurrently(
+        self,
+        disclosure_source: DisclosureSourcePort[EdinetDocumentSearchCriteria],
+        downloads: Generator[Document, None, None],
+        limiter: AdaptiveConcurrencyLimiter,
+    ) -> tuple[list[Document], list[DeadLetter]]:
+        """
+        リミッターの枠を確保してから次の書類を取り出し、ワーカーでダウンロード・保存する
+        枠の確保後に取り出すことで、ダウンロード待ちの書類を優先度キューに残しておく。
+        デッドレターを記録しない場合、失敗した書類があれば新たな投入を止め、
+        実行中の処理の完了を待って例外を送出する。
+        """
+        failed = threading.Event()
+        futures: list[Future[DeadLetter | None]] = []
+        dead_letter_repository = self.dead_letter_repository
+
+        def on_failure(error: BaseException) -> None:
+            # 書類単位の失敗（Exception）のみデッドレターに記録し、それ以外は収集を止める
+            if dead_letter_repository is None or not isinstance(error, Exception):
+                failed.set()
+
+        def download_and_save(
+            document: Document, reservation: ByteReservation | None
+        ) -> None:
+            handed_over = False
+            try:
+                # 失敗は枠を解放する前に記録し、後続の書類が投入されないようにする
+                with limiter.measure():
+                    try:
+                        file, sha256 = self._download_verified(
+                            disclosure_source, document, reservation
+                        )
+                    except BaseException as e:
+                        on_failure(e)
+                        raise
+                try:
+                    # リポジトリが非同期で保存する場合も、保存が終わるまでは書類を保持しているため、
+                    # 予約はリポジトリが保存を終えた時点で解放する
+                    self.document_repository.save(
+                        document,
+                        file,
+                        sha256=sha256,
+                        overwrite=False,
+                        on_done=reservation.release
+                        if reservation is not None
+                        else None,
+                    )
+                    handed_over = True
+                except BaseException as e:
+                    on_failure(e)
+                    raise
+            finally:
+                # リポジトリに渡せなかった場合は、ここで予約を解放する
+                if reservation is not None and not handed_over:
+                    reservation.release()
+
+        def isolate(
+            document: Document, reservation: ByteReservation | None
+        ) -> DeadLetter | None:
+            try:
+                download_and_save(document, reservation)
+            except Exception as e:
+                if dead_letter_repository is None:
+                    raise
+                return _record_dead_letter(dead_letter_repository, document, e)
+            return None
+
+        documents: list[Document] = []
+
+        with ThreadPoolExecutor(
+            max_workers=limiter.max_limit, thread_name_prefix="fino-download"
+        ) as executor:
+            try:
+                while not failed.is_set():
+                    limiter.acquire()
+                    # メモリの空きができるまで新しいダウンロードを開始しない
+                    reservation = (
+                        self.byte_budget.reserve(self.default_document_bytes)
+                        if self.byte_budget is not None
+                        else None
+                    )
+                    document = next(downloads, None)
+                    if document is None or failed.is_set():
+                        limiter.release(None)
+                        if reservation is not None:
+                            reservation.release()
+                        break
+                    documents.append(document)
+                    futures.append(executor.submit(isolate, document, reservation))
+            finally:
+                downloads.close()
+                _ = wait(futures)
+
+        for future in futures:
+            error = future.exception()
+            if error is not None:
+                raise error
+        collected: list[Document] = []
+        dead_letters: list[DeadLetter] = []
+        for document, future in zip(documents, futures):
+            dead_letter = future.result()
+            if dead_letter is None:
+                collected.append(document)
+            else:
+                dead_letters.append(dead_letter)
+        return collected, dead_letters
+
+    def _download_verified(
+        self,
+        disclosure_source: DisclosureSourcePort[EdinetDocumentSearchCriteria],
+        document: Document,
+        reservation: ByteReservation | None,
+    ) -> tuple[bytes, str | None]:
+        """書類をダウンロードし、(内容, 検証済みのハッシュ) を返す（検証しない場合のハッシュはNone）"""
+        if self.package_verifier is None:
+            return self._download(disclosure_source, document, reservation), None
+        file, verified = self.package_verifier.fetch_verified(
+            document, lambda: self._download(disclosure_source, document, reservation)
+        )
+        return file, verified.sha256
+
+    @staticmethod
+    def _download(
+        disclosure_source: DisclosureSourcePort[EdinetDocumentSearchCriteria],
+        document: Document,
+        reservation: ByteReservation | None,
+    ) -> bytes:
+        if reservation is None:
+            return disclosure_source.download_document(document=document)
+        # サイズが判明した時点（Content-Lengthなど）で予約を実際のサイズに合わせる
+        file = disclosure_source.download_document(
+            document=document, on_size=reservation.resize
+        )
+        reservation.resize(len(file))
+        return file
+
+    def _iterate_downloads(
+        self, documents: list[Document]
+    ) -> Generator[Document, None, None]:
+        if self.download_queue is None:
+            yield from documents
+            return
+
+        self.download_queue.push(documents)
+        try:
+            while (queued := self.download_queue.pop()) is not None:
+                yield queued.document
+        finally:
+            # 途中で失敗した場合も、次回の収集で同じ書類が重複して積まれないようにする
+            self.download_queue.clear()
+
+
+def _record_dead_letter(
+    dead_letter_repository: DeadLetterRepository, document: Document, error: Exception
+) -> DeadLetter:
+    """
+    失敗をデッドレターに記録する
+    記録自体に失敗した場合はログに残し、記録されなかったデッドレターを返して収集を続ける。
+    """
+    try:
+        return dead_letter_repository.record(document, error)
+    except Exception:
+        logger.exception(
+            "Failed to record dead letter for %s", document.document_id.value
+        )
+    now = datetime.now(UTC)
+    return DeadLetter(
+        document=document,
+        error_type=f"{type(error).__module__}.{type(error).__qualname__}",
+        error_message=str(error),
+        attempts=1,
+        first_failed_at=now,
+        last_failed_at=now,
+    )
@@ -0,0 +1,121 @@
+import math
+from collections.abc import Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import date
+
+from fino_ingestor.application.input.plan_document import PlanDocumentInput
+from fino_ingestor.application.output.plan_document import (
+    DayPlan,
+    FormatPlan,
+    PlanDocumentOutput,
+)
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.repository.document import DocumentRepository
+from fino_ingestor.infrastructure.adapter.disclosure_source.edinet import (
+    EdinetDocumentSearchCriteria,
+)
+from fino_ingestor.interface.config.plan import PlanConfig
+from fino_ingestor.interface.config.repository import RepositoryConfig
+from fino_ingestor.util.date_range import DateRange
+
+
+class PlanDocumentUseCase:
+    """
+    書類をダウンロードせずに、収集に必要な作業量を日付・フォーマット単位で見積もる
+    書類一覧の取得と保存済み書類の存在確認のみを行う（一覧はアダプターのキャッシュに残り、後続の収集で再利用される）。
+    """
+
+    def __init__(
+        self,
+        document_repository: DocumentRepository,
+        config: PlanConfig | None = None,
+        repository_config: RepositoryConfig | None = None,
+    ) -> None:
+        self.document_repository = document_repository
+        self.config = config or PlanConfig()
+        self.repository_config = repository_config or RepositoryConfig()
+
+    def execute(self, input: PlanDocumentInput) -> PlanDocumentOutput:
+        days: list[DayPlan] = []
+        with ThreadPoolExecutor(
+            max_workers=self.config.max_workers, thread_name_prefix="fino-plan"
+        ) as executor:
+            for target in self._iterate_target_dates(input):
+                # EDINETの書類一覧は日付ごとに全フォーマット分を返し、アダプターがキャッシュする
+                day = DayPlan(
+                    target_date=target, list_calls=min(1, len(input.format_types))
+                )
+                for format_type in input.format_types:
+                    criteria = EdinetDocumentSearchCriteria(
+                        format_type=format_type,
+                        timescope=DateRange(start=target, end=target),
+                    )
+                    documents = input.disclosure_source.list_available_documents(
+                        criteria
+                    )
+                    day.formats[format_type.enum] = self._plan_format(
+                        documents, executor
+                    )
+                days.append(day)
+
+        list_calls = sum(day.list_calls for day in days)
+        formats = [plan for day in days for plan in day.formats.values()]
+        remaining = sum(plan.remaining for plan in formats)
+        estimated_bytes = sum(plan.estimated_bytes for plan in formats)
+        return PlanDocumentOutput(
+            days=days,
+            list_calls=list_calls,
+            remaining_documents=remaining,
+            estimated_bytes=estimated_bytes,
+            puts=sum(plan.puts for plan in formats),
+            estimated_duration_seconds=self._estimate_duration(
+                requests=list_calls + remaining, estimated_bytes=estimated_bytes
+            ),
+        )
+
+    @staticmethod
+    def _iterate_target_dates(input: PlanDocumentInput) -> Iterator[date]:
+        """収集時と同じ順序で対象日をイテレートする（休業日の検証スイープは最後に行う）"""
+        yield from input.timescope.iterate_by_day(calendar=input.calendar)
+        if input.calendar is not None and input.verify_non_business_days:
+            yield from input.timescope.iterate_non_business_days(input.calendar)
+
+    def _plan_format(self, documents: list[Document], executor: Executor) -> FormatPlan:
+        plan = FormatPlan(available=len(documents))
+        bundled_bytes = 0
+        # 存在確認はストレージへの問い合わせ（S3のHEADなど）になるため並列に行う
+        exists = executor.map(self.document_repository.exists, documents)
+        for document, stored in zip(documents, exists):
+            if stored:
+                plan.stored += 1
+                continue
+            size = self.config.average_document_bytes.get(
+                document.filing_format.enum, 0
+            )
+            plan.remaining += 1
+            plan.estimated_bytes += size
+
+            bundling = self.repository_config.bundling
+            if bundling is not None and size <= bundling.max_member_bytes:
+                bundled_bytes += size
+            else:
+                plan.puts += self._puts_per_document()
+
+        # バンドル対象の書類は上限サイズごとに1回のPUTにまとめられる
+        bundling = self.repository_config.bundling
+        if bundling is not None and bundled_bytes > 0:
+            plan.puts += math.ceil(bundled_bytes / bundling.max_bundle_bytes)
+        return plan
+
+    def _puts_per_document(self) -> int:
+        extraction = self.repository_config.extraction
+        if extraction is not None and extraction.output == "members":
+            # 抽出対象のパターンごとに1メンバー + マニフェストとして見積もる
+            return len(extraction.include_patterns) + 1
+        return 1
+
+    def _estimate_duration(self, requests: int, estimated_bytes: int) -> float:
+        duration = requests / self.config.requests_per_second
+        if self.config.bytes_per_second is not None:
+            duration = max(duration, estimated_bytes / self.config.bytes_per_second)
+        return duration
@@ -0,0 +1,107 @@
+from fino_ingestor.application.input.repair_document import RepairDocumentInput
+from fino_ingestor.application.output.repair_document import RepairDocumentOutput
+from fino_ingestor.domain.entity.dead_letter import DeadLetter
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.repository.dead_letter import DeadLetterRepository
+from fino_ingestor.domain.repository.document import (
+    DocumentRepository,
+    DocumentStoreError,
+)
+from fino_ingestor.infrastructure.processor.integrity import PackageVerifier
+
+
+class RepairDocumentUseCase:
+    """
+    修復計画に含まれる書類のみを再取得し、保存済みのオブジェクトを上書きする
+    保存済みかどうかは確認しない（壊れたオブジェクトも存在するとみなされるため）。
+    問題のあるオブジェクトは保存前に壊れていることを通知し、同じ内容の保存済みデータ（blobなど）を再利用させない。
+    問題のあるオブジェクトが保存先と異なるパス（旧レイアウトなど）にある場合は、再取得後に削除する。
+    """
+
+    def __init__(
+        self,
+        document_repository: DocumentRepository,
+        package_verifier: PackageVerifier | None = None,
+        dead_letter_repository: DeadLetterRepository | None = None,
+    ) -> None:
+        self.document_repository = document_repository
+        # 指定した場合、再取得した書類を保存前に検証する
+        self.package_verifier = package_verifier
+        # 指定した場合、書類ごとの失敗をデッドレターに記録して残りの書類の修復を続ける
+        # （指定しない場合は最初の失敗で修復を中断し、例外を送出する）
+        self.dead_letter_repository = dead_letter_repository
+
+    def execute(self, input: RepairDocumentInput) -> RepairDocumentOutput:
+        # 同じ書類が複数の問題で計画に含まれている場合も1回だけ取得する
+        documents: dict[str, Document] = {}
+        stale_paths: dict[str, dict[str, None]] = {}
+        for target in input.plan.targets:
+            key = target.document.document_id.value
+            _ = documents.setdefault(key, target.document)
+            if target.path is not None:
+                stale_paths.setdefault(key, {})[target.path] = None
+
+        saved: list[Document] = []
+        failed: list[DeadLetter] = []
+        for document in documents.values():
+            try:
+                for path in stale_paths.get(document.document_id.value, {}):
+                    self.document_repository.mark_corrupt(document, path)
+                file, sha256 = self._download(input, document)
+                self.document_repository.save(document, file, sha256=sha256)
+            except Exception as e:
+                failed.append(self._record_failure(document, e))
+                continue
+            saved.append(document)
+
+        # 非同期で処理中の保存の完了を待つ
+        try:
+            self.document_repository.flush()
+        except DocumentStoreError as e:
+            if self.dead_letter_repository is None:
+                raise
+            store_failed = {document.document_id.value for document, _ in e.failures}
+            saved = [d for d in saved if d.document_id.value not in store_failed]
+            for document, error in e.failures:
+                failed.append(self.dead_letter_repository.record(document, error))
+
+        # 保存先への書き込みが確定した後で、保存先と異なるパスに残っている問題のあるオブジェクトを削除する
+        repaired: list[Document] = []
+        for document in saved:
+            try:
+                for path in stale_paths.get(document.document_id.value, {}):
+                    self.document_repository.delete_stale_copy(document, path)
+            except Exception as e:
+                failed.append(self._record_failure(document, e))
+                continue
+            repaired.append(document)
+
+        if self.dead_letter_repository is not None:
+            pending = {
+                d.document.document_id.value
+                for d in self.dead_letter_repository.list_dead_letters()
+            }
+            for document in repaired:
+                if document.document_id.value in pending:
+                    self.dead_letter_repository.remove(document)
+            self.dead_letter_repository.flush()
+
+        return RepairDocumentOutput(
+            repaired_document_list=repaired, failed_document_list=failed
+        )
+
+    def _record_failure(self, document: Document, error: Exception) -> DeadLetter:
+        if self.dead_letter_repository is None:
+            raise error
+        return self.dead_letter_repository.record(document, error)
+
+    def _download(
+        self, input: RepairDocumentInput, document: Document
+    ) -> tuple[bytes, str | None]:
+        def download() -> bytes:
+            return input.disclosure_source.download_document(document=document)
+
+        if self.package_verifier is None:
+            return download(), None
+        file, verified = self.package_verifier.fetch_verified(document, download)
+        return file, verified.sha256
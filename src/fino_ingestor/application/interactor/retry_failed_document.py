@@ -0,0 +1,32 @@
+from fino_ingestor.application.input.retry_failed_document import (
+    RetryFailedDocumentInput,
+)
+from fino_ingestor.application.interactor.collect_document import CollectDocumentUseCase
+from fino_ingestor.application.output.collect_document import CollectDocumentOutput
+from fino_ingestor.domain.repository.dead_letter import DeadLetterRepository
+
+
+class RetryFailedDocumentUseCase:
+    """
+    デッドレターに記録された書類のみを再取得する
+    書類一覧は取得し直さず、記録済みの書類の属性からダウンロードする。
+    成功した書類のデッドレターは削除し、再び失敗した書類は失敗回数を更新する。
+    """
+
+    def __init__(
+        self,
+        collect_usecase: CollectDocumentUseCase,
+        dead_letter_repository: DeadLetterRepository,
+    ) -> None:
+        if collect_usecase.dead_letter_repository is not dead_letter_repository:
+            raise ValueError("collect_usecase must record to dead_letter_repository")
+        self.collect_usecase = collect_usecase
+        self.dead_letter_repository = dead_letter_repository
+
+    def execute(self, input: RetryFailedDocumentInput) -> CollectDocumentOutput:
+        dead_letters = self.dead_letter_repository.list_dead_letters()
+        return self.collect_usecase.collect(
+            input.disclosure_source,
+            [dead_letter.document for dead_letter in dead_letters],
+            dead_letters=dead_letters,
+        )
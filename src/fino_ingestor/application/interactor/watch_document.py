@@ -0,0 +1,194 @@
+import threading
+import time
+from collections.abc import Callable
+from datetime import date, timedelta
+
+from fino_ingestor.application.input.watch_document import WatchDocumentInput
+from fino_ingestor.application.output.watch_document import WatchDocumentOutput
+from fino_ingestor.domain.entity.dead_letter import DeadLetter
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.repository.dead_letter import DeadLetterRepository
+from fino_ingestor.domain.repository.document import (
+    DocumentRepository,
+    DocumentStoreError,
+)
+from fino_ingestor.infrastructure.adapter.disclosure_source.edinet import (
+    EdinetDocumentSearchCriteria,
+)
+from fino_ingestor.infrastructure.processor.integrity import PackageVerifier
+from fino_ingestor.interface.config.watch import WatchConfig
+from fino_ingestor.util.date_range import DateRange
+
+
+class WatchDocumentUseCase:
+    """
+    当日の書類一覧をポーリングし、新着書類を収集し続ける
+    - 日付ごとに確認済みの docID を保持し、新規・変化した行のみを変換・ダウンロードする
+    - 新着書類がない間はポーリング間隔を広げ、見つかった時点で最短間隔に戻す
+    - 過去 lookback_days 日分は lookback_interval_seconds ごとに再確認し、遅れて公開された書類を拾う
+    """
+
+    def __init__(
+        self,
+        document_repository: DocumentRepository,
+        config: WatchConfig | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        today: Callable[[], date] = date.today,
+        package_verifier: PackageVerifier | None = None,
+        dead_letter_repository: DeadLetterRepository | None = None,
+    ) -> None:
+        self.document_repository = document_repository
+        self.config = config or WatchConfig()
+        # 指定した場合、ダウンロードした書類を保存前に検証する
+        self.package_verifier = package_verifier
+        # 指定した場合、書類ごとの失敗をデッドレターに記録して残りの書類の収集を続ける
+        # （指定しない場合は最初の失敗でポーリングを中断し、例外を送出する）
+        self.dead_letter_repository = dead_letter_repository
+        self._clock = clock
+        self._today = today
+        # 日付 -> (docID -> 行のフィンガープリント)
+        self._seen: dict[date, dict[str, str]] = {}
+        self._interval = self.config.min_interval_seconds
+        self._next_lookback_at: float | None = None
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    def poll(self, input: WatchDocumentInput) -> WatchDocumentOutput:
+        """書類一覧を1回確認し、新着書類を収集する"""
+        today = self._today()
+        now = self._clock()
+
+        targets = [today]
+        if self._next_lookback_at is None or now >= self._next_lookback_at:
+            targets.extend(self._lookback_dates(today, input))
+            self._next_lookback_at = now + self.config.lookback_interval_seconds
+
+        collected: list[Document] = []
+        failed: list[DeadLetter] = []
+        for target in targets:
+            collected.extend(self._collect(input, target, failed))
+        # 非同期で処理中の保存の完了を待つ
+        try:
+            self.document_repository.flush()
+        except DocumentStoreError as e:
+            if self.dead_letter_repository is None:
+                for target in targets:
+                    self._seen.pop(target, None)
+                raise
+            # 保存に失敗した書類のみ、次回のポーリングで再度確認する
+            store_failed = {document.document_id.value for document, _ in e.failures}
+            collected = [
+                d for d in collected if d.document_id.value not in store_failed
+            ]
+            for document, error in e.failures:
+                self._forget(document)
+                failed.append(self.dead_letter_repository.record(document, error))
+        except Exception:
+            # 保存に失敗した書類を次回のポーリングで再度確認できるよう、確認済み状態を破棄する
+            for target in targets:
+                self._seen.pop(target, None)
+            raise
+
+        if self.dead_letter_repository is not None and failed:
+            self.dead_letter_repository.flush()
+        self._prune(today)
+        if collected:
+            self._interval = self.config.min_interval_seconds
+        else:
+            self._interval = min(
+                self._interval * self.config.backoff_factor,
+                self.config.max_interval_seconds,
+            )
+        return WatchDocumentOutput(
+            collected_document_list=collected,
+            polled_dates=targets,
+            next_interval=self._interval,
+            failed_document_list=failed,
+        )
+
+    def run(
+        self,
+        input: WatchDocumentInput,
+        stop_event: threading.Event | None = None,
+        on_collected: Callable[[list[Document]], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        """
+        stop_eventがセットされるまでポーリングを繰り返す
+        on_errorを指定した場合、ポーリング中の例外をon_errorに渡して監視を継続する。
+        """
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            try:
+                output = self.poll(input)
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(e)
+            else:
+                if on_collected is not None and output.collected_document_list:
+                    on_collected(output.collected_document_list)
+            stop_event.wait(self._interval)
+
+    def _collect(
+        self, input: WatchDocumentInput, target: date, failed: list[DeadLetter]
+    ) -> list[Document]:
+        seen = self._seen.setdefault(target, {})
+        criteria = EdinetDocumentSearchCriteria(
+            format_type=input.format_type, timescope=DateRange(start=target, end=target)
+        )
+        updated = input.disclosure_source.list_updated_documents(criteria, seen=seen)
+
+        collected: list[Document] = []
+        for index, document in enumerate(updated):
+            try:
+                if self.document_repository.exists(document):
+                    continue
+                file, sha256 = self._download(input, document)
+                self.document_repository.save(
+                    document, file, sha256=sha256, overwrite=False
+                )
+            except Exception as e:
+                # 失敗した書類は次回のポーリングで再度確認する
+                _ = seen.pop(document.document_id.value, None)
+                if self.dead_letter_repository is None:
+                    # 中断する場合は、未収集の行も次回のポーリングで再度確認する
+                    for remaining in updated[index + 1 :]:
+                        _ = seen.pop(remaining.document_id.value, None)
+                    raise
+                failed.append(self.dead_letter_repository.record(document, e))
+                continue
+            collected.append(document)
+        return collected
+
+    def _download(
+        self, input: WatchDocumentInput, document: Document
+    ) -> tuple[bytes, str | None]:
+        def download() -> bytes:
+            return input.disclosure_source.download_document(document=document)
+
+        if self.package_verifier is None:
+            return download(), None
+        file, verified = self.package_verifier.fetch_verified(document, download)
+        return file, verified.sha256
+
+    def _forget(self, document: Document) -> None:
+        """書類を確認済み状態から除き、次回のポーリングで再度確認する"""
+        for seen in self._seen.values():
+            _ = seen.pop(document.document_id.value, None)
+
+    def _lookback_dates(self, today: date, input: WatchDocumentInput) -> list[date]:
+        dates: list[date] = []
+        for days in range(1, self.config.lookback_days + 1):
+            target = today - timedelta(days=days)
+            if input.calendar is None or input.calendar.is_business_day(target):
+                dates.append(target)
+        return dates
+
+    def _prune(self, today: date) -> None:
+        """再確認の対象外となった日付の確認済み状態を破棄する"""
+        oldest = today - timedelta(days=self.config.lookback_days)
+        for target in [target for target in self._seen if target < oldest]:
+            del self._seen[target]
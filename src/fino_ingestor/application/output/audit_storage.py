@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.infrastructure.repository.storage_audit import (
+    AuditFinding,
+    AuditProblem,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RepairTarget:
+    document: Document
+    problem: AuditProblem
+    path: str | None
+    """問題のあるオブジェクトのパス（missingの場合はNone）"""
+
+
+@dataclass(frozen=True, slots=True)
+class RepairPlan:
+    """再取得が必要な書類の一覧（DocumentCollector.repairで実行する）"""
+
+    targets: list[RepairTarget]
+
+    @property
+    def documents(self) -> list[Document]:
+        return [target.document for target in self.targets]
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+
+@dataclass(frozen=True, slots=True)
+class AuditStorageOutput:
+    checked: int
+    """検証したオブジェクト数"""
+    skipped: list[str]
+    """検証対象外のパス（バンドル・members形式など）"""
+    findings: list[AuditFinding]
+    """問題が見つかったオブジェクト"""
+    missing: list[Document]
+    """書類一覧にあるが保存されていない書類"""
+    unresolved: list[AuditFinding]
+    """書類一覧に含まれないため再取得できないオブジェクト（一覧の期間外など）"""
+    repair_plan: RepairPlan
@@ -0,0 +1,39 @@
+from dataclasses import dataclass, field
+from datetime import date
+
+from fino_ingestor.domain.value.format_type import FormatTypeEnum
+
+
+@dataclass(slots=True)
+class FormatPlan:
+    """1日・1フォーマット分の残作業"""
+
+    available: int = 0
+    """取得可能な書類数"""
+    stored: int = 0
+    """保存済みの書類数"""
+    remaining: int = 0
+    """未取得の書類数"""
+    estimated_bytes: int = 0
+    """未取得の書類の推定転送量"""
+    puts: int = 0
+    """未取得の書類の保存に必要なPUT数の見積もり"""
+
+
+@dataclass(slots=True)
+class DayPlan:
+    target_date: date
+    list_calls: int = 0
+    """書類一覧APIの呼び出し回数（一覧は日付ごとに全フォーマット分を1回で取得する）"""
+    formats: dict[FormatTypeEnum, FormatPlan] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class PlanDocumentOutput:
+    days: list[DayPlan]
+    list_calls: int
+    remaining_documents: int
+    estimated_bytes: int
+    puts: int
+    estimated_duration_seconds: float
+    """設定したリクエスト数・帯域の上限で収集した場合の推定所要時間"""
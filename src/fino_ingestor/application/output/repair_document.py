@@ -0,0 +1,11 @@
+from dataclasses import dataclass, field
+
+from fino_ingestor.domain.entity.dead_letter import DeadLetter
+from fino_ingestor.domain.entity.document import Document
+
+
+@dataclass(frozen=True, slots=True)
+class RepairDocumentOutput:
+    repaired_document_list: list[Document]
+    failed_document_list: list[DeadLetter] = field(default_factory=list)
+    """今回の修復で失敗し、デッドレターに記録した書類"""
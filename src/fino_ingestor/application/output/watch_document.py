@@ -0,0 +1,16 @@
+from dataclasses import dataclass, field
+from datetime import date
+
+from fino_ingestor.domain.entity.dead_letter import DeadLetter
+from fino_ingestor.domain.entity.document import Document
+
+
+@dataclass(frozen=True, slots=True)
+class WatchDocumentOutput:
+    collected_document_list: list[Document]
+    polled_dates: list[date]
+    """今回のポーリングで書類一覧を確認した日付"""
+    next_interval: float
+    """次回のポーリングまでの秒数"""
+    failed_document_list: list[DeadLetter] = field(default_factory=list)
+    """今回のポーリングで失敗し、デッドレターに記録した書類"""
@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.value.disclosure_date import DisclosureDate
+from fino_ingestor.domain.value.disclosure_source import (
+    DisclosureSource,
+    DisclosureSourceEnum,
+)
+from fino_ingestor.domain.value.disclosure_type import (
+    DisclosureType,
+    DisclosureTypeEnum,
+)
+from fino_ingestor.domain.value.document_id import DocumentId
+from fino_ingestor.domain.value.format_type import FormatType, FormatTypeEnum
+from fino_ingestor.domain.value.ticker import Ticker
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DeadLetter:
+    """ダウンロード・保存に失敗した書類の記録（再取得に成功するまで保持する）"""
+
+    document: Document
+    error_type: str
+    """最後に発生した例外のクラス名（モジュール名を含む）"""
+    error_message: str
+    attempts: int
+    """失敗した回数"""
+    first_failed_at: datetime
+    last_failed_at: datetime
+
+    def to_dict(self) -> dict[str, Any]:
+        document = self.document
+        return {
+            "document_id": document.document_id.value,
+            "filing_name": document.filing_name,
+            "ticker": document.ticker.value,
+            "disclosure_type": document.disclosure_type.value,
+            "disclosure_source": document.disclosure_source.value,
+            "disclosure_date": document.disclosure_date.value.isoformat(),
+            "filing_format": document.filing_format.value,
+            "error_type": self.error_type,
+            "error_message": self.error_message,
+            "attempts": self.attempts,
+            "first_failed_at": self.first_failed_at.isoformat(),
+            "last_failed_at": self.last_failed_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DeadLetter":
+        document = Document(
+            document_id=DocumentId(value=data["document_id"]),
+            filing_name=data["filing_name"],
+            ticker=Ticker(value=data["ticker"]),
+            disclosure_type=DisclosureType(
+                enum=DisclosureTypeEnum(data["disclosure_type"])
+            ),
+            disclosure_source=DisclosureSource(
+                enum=DisclosureSourceEnum(data["disclosure_source"])
+            ),
+            disclosure_date=DisclosureDate(
+                value=date.fromisoformat(data["disclosure_date"])
+            ),
+            filing_format=FormatType(enum=FormatTypeEnum(data["filing_format"])),
+        )
+        return cls(
+            document=document,
+            error_type=data["error_type"],
+            error_message=data["error_message"],
+            attempts=data["attempts"],
+            first_failed_at=datetime.fromisoformat(data["first_failed_at"]),
+            last_failed_at=datetime.fromisoformat(data["last_failed_at"]),
+        )
@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.value.disclosure_date import DisclosureDate
+from fino_ingestor.domain.value.disclosure_source import (
+    DisclosureSource,
+    DisclosureSourceEnum,
+)
+from fino_ingestor.domain.value.disclosure_type import (
+    DisclosureType,
+    DisclosureTypeEnum,
+)
+from fino_ingestor.domain.value.document_id import DocumentId
+from fino_ingestor.domain.value.format_type import FormatType, FormatTypeEnum
+from fino_ingestor.domain.value.ticker import Ticker
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DocumentStoredEvent:
+    """書類がストレージに保存されたことを表すイベント"""
+
+    document: Document
+    path: str
+    """書類の保存パス"""
+    size: int
+    """保存した内容のバイト数"""
+    sha256: str
+    """保存した内容のSHA-256（16進数）"""
+    stored_at: datetime
+
+    def to_dict(self) -> dict[str, Any]:
+        document = self.document
+        return {
+            "document_id": document.document_id.value,
+            "filing_name": document.filing_name,
+            "ticker": document.ticker.value,
+            "disclosure_type": document.disclosure_type.value,
+            "disclosure_source": document.disclosure_source.value,
+            "disclosure_date": document.disclosure_date.value.isoformat(),
+            "filing_format": document.filing_format.value,
+            "path": self.path,
+            "size": self.size,
+            "sha256": self.sha256,
+            "stored_at": self.stored_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DocumentStoredEvent":
+        document = Document(
+            document_id=DocumentId(value=data["document_id"]),
+            filing_name=data["filing_name"],
+            ticker=Ticker(value=data["ticker"]),
+            disclosure_type=DisclosureType(
+                enum=DisclosureTypeEnum(data["disclosure_type"])
+            ),
+            disclosure_source=DisclosureSource(
+                enum=DisclosureSourceEnum(data["disclosure_source"])
+            ),
+            disclosure_date=DisclosureDate(
+                value=date.fromisoformat(data["disclosure_date"])
+            ),
+            filing_format=FormatType(enum=FormatTypeEnum(data["filing_format"])),
+        )
+        return cls(
+            document=document,
+            path=data["path"],
+            size=data["size"],
+            sha256=data["sha256"],
+            stored_at=datetime.fromisoformat(data["stored_at"]),
+        )
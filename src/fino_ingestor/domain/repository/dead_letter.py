@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+from fino_ingestor.domain.entity.dead_letter import DeadLetter
+from fino_ingestor.domain.entity.document import Document
+
+
+class DeadLetterRepository(ABC):
+    @abstractmethod
+    def record(self, document: Document, error: Exception) -> DeadLetter:
+        """失敗を記録する。記録済みの書類の場合は失敗回数と最終失敗日時を更新する。"""
+        ...
+
+    @abstractmethod
+    def list_dead_letters(self) -> list[DeadLetter]: ...
+    @abstractmethod
+    def remove(self, document: Document) -> None: ...
+
+    def flush(self) -> None:
+        """保留中の書き込みを確定する"""
+        return None
@@ -1,10 +1,74 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager
 
 from fino_ingestor.domain.entity.document import Document
 
 
+class DocumentStoreError(Exception):
+    """非同期で保存した書類のうち、保存に失敗した書類（flushで送出する）"""
+
+    def __init__(self, failures: list[tuple[Document, Exception]]) -> None:
+        super().__init__(
+            "Failed to store documents: "
+            + ", ".join(document.document_id.value for document, _ in failures)
+        )
+        self.failures = failures
+        """(書類, 例外) の一覧"""
+
+
 class DocumentRepository(ABC):
     @abstractmethod
     def exists(self, document: Document) -> bool: ...
     @abstractmethod
-    def save(self, document: Document, file: bytes) -> None: ...
+    def save(
+        self,
+        document: Document,
+        file: bytes,
+        sha256: str | None = None,
+        overwrite: bool = True,
+        on_done: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        書類を保存する。sha256（検証済みの内容のハッシュ）を指定した場合はメタデータとして保存する。
+        overwriteがFalseの場合は未保存であることを確認済みの書類として保存し、
+        複数の保存先を持つストレージでは保存済みの保存先を上書きしない。
+        on_doneは保存処理が終わり、fileを参照しなくなった時点で（失敗した場合も）呼び出す。
+        非同期で保存する場合はsaveから戻った後に呼び出されることがある。
+        """
+        ...
+
+    @abstractmethod
+    def delete_stale_copy(self, document: Document, path: str) -> None:
+        """
+        保存先のレイアウト以外のパス（旧レイアウトなど）に残っている書類のオブジェクトを削除する。
+        pathが保存先のパスの場合は何もしない。
+        """
+        ...
+
+    @abstractmethod
+    def mark_corrupt(self, document: Document, path: str) -> None:
+        """
+        監査で壊れていると判定された書類のオブジェクトを通知する。
+        次回の保存で、保存済みの内容を再利用せずに書き直す。
+        """
+        ...
+
+    @abstractmethod
+    def read(self, document: Document) -> bytes: ...
+    @abstractmethod
+    def open(self, document: Document) -> AbstractContextManager[memoryview]: ...
+    @abstractmethod
+    def iter_documents(
+        self, documents: Iterable[Document], max_workers: int = 4
+    ) -> Iterator[tuple[Document, bytes]]: ...
+
+    def flush(self) -> None:
+        """
+        保留中の保存処理の完了を待つ。
+        非同期の保存に失敗した書類があれば、すべての書類をまとめてDocumentStoreErrorとして送出する。
+        """
+        return None
+
+    def close(self) -> None:
+        """保存処理のワーカーなどを解放する（保存先のストレージは閉じない）"""
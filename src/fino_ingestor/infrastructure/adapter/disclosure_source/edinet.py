@@ -1,9 +1,8 @@
 from dataclasses import dataclass
-from datetime import datetime, time
-from typing import Literal
+from datetime import date, datetime, time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Iterator, Literal
 
-from edinet import Edinet
-from edinet.enums.response import GetDocumentDocs
 from fino_ingestor.domain.entity.document import Document
 from fino_ingestor.domain.value.disclosure_date import DisclosureDate
 from fino_ingestor.domain.value.disclosure_source import (
@@ -17,27 +16,79 @@ from fino_ingestor.domain.value.disclosure_type import (
 from fino_ingestor.domain.value.document_id import DocumentId
 from fino_ingestor.domain.value.format_type import FormatType, FormatTypeEnum
 from fino_ingestor.domain.value.ticker import Ticker
+from fino_ingestor.infrastructure.scheduler.bandwidth import BandwidthLimiter
 from fino_ingestor.interface.config.disclosure import EdinetConfig
-from fino_ingestor.util import TimeScope
+from fino_ingestor.util import BusinessCalendar, DateScope
+
+if TYPE_CHECKING:
+    from edinet import Edinet
+    from edinet.enums.response import GetDocumentDocs
+    from fino_ingestor.infrastructure.adapter.disclosure_source.ranged_download import (
+        RangedHttpDownloader,
+    )
+
+
+def create_edinet_client(api_key: str) -> "Edinet":
+    # EDINETクライアントは生成時に読み込む（import時間短縮のため）
+    from edinet import Edinet
+
+    return Edinet(token=api_key)
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class EdinetDocumentSearchCriteria:
     format_type: FormatType
     """書類のフォーマットタイプ"""
-    timescope: TimeScope
-    """取得に使用する日付範囲"""
+    timescope: DateScope
+    """取得に使用する日付範囲（TimeScope, DateRange, DateRangeSet）"""
+    calendar: BusinessCalendar | None = None
+    """指定した場合、カレンダー上の営業日のみ書類一覧を取得する"""
+    verify_non_business_days: bool = False
+    """calendar指定時、営業日の取得後に休業日も後回しで確認する（検証スイープ）"""
     # disclosure_type: DisclosureType
     # """開示書類の種類"""
     # ticker: Ticker
     # """企業ティッカー"""
 
 
+@dataclass(frozen=True, slots=True)
+class EdinetListingCacheEntry:
+    """日付単位の書類一覧キャッシュ"""
+
+    count: int
+    """書類一覧APIが返した件数"""
+    results: "list[GetDocumentDocs]"
+    """書類一覧APIが返した書類データ"""
+
+
 class EdinetAdapter:
     id: Literal[DisclosureSourceEnum.EDINET] = DisclosureSourceEnum.EDINET
 
-    def __init__(self, config: EdinetConfig) -> None:
-        self.client = Edinet(token=config.api_key)
+    def __init__(
+        self,
+        config: EdinetConfig,
+        client: "Edinet | None" = None,
+        bandwidth_limiter: BandwidthLimiter | None = None,
+    ) -> None:
+        # クライアントが渡された場合は共有クライアントとして再利用する
+        self.client = client or create_edinet_client(config.api_key)
+        self.count_probe = config.count_probe
+        self.api_key = config.api_key
+        self.api_base_url = config.api_base_url.rstrip("/")
+        # 指定した場合、書類のダウンロードで帯域を消費する
+        self.bandwidth_limiter = bandwidth_limiter
+        self.downloader: "RangedHttpDownloader | None" = None
+        if config.download is not None:
+            # requestsは分割ダウンロードを使用する場合のみ読み込む
+            from fino_ingestor.infrastructure.adapter.disclosure_source.ranged_download import (
+                RangedHttpDownloader,
+            )
+
+            self.downloader = RangedHttpDownloader(
+                config.download, bandwidth_limiter=bandwidth_limiter
+            )
+        # 日付ごとの書類一覧キャッシュ（件数が変化していない日は再取得しない）
+        self._listing_cache: dict[date, EdinetListingCacheEntry] = {}
 
     def list_available_documents(
         self, criteria: EdinetDocumentSearchCriteria
@@ -45,15 +96,9 @@ class EdinetAdapter:
         document_list: list[Document] = []
 
         # EDINET APIの仕様に従い、日付単位で一覧を取得していく
-        for target_date in criteria.timescope.iterate_by_day():
-            target_datetime = datetime.combine(target_date, time.min)
-
+        for target_date in self._iterate_target_dates(criteria):
             # 書類一覧取得APIを呼び出し、書類一覧を取得する
-            document_list_response = self.client.get_document_list(
-                date=target_datetime, withdocs=True
-            )
-
-            edinet_document_list = document_list_response["results"]
+            edinet_document_list = self._fetch_document_list(target_date)
 
             # EDINETの書類データをアプリ形式に変換していく
             for edinet_document in edinet_document_list:
@@ -68,7 +113,103 @@ class EdinetAdapter:
 
         return document_list
 
-    def download_document(self, document: Document) -> bytes:
+    def list_updated_documents(
+        self, criteria: EdinetDocumentSearchCriteria, seen: dict[str, str]
+    ) -> list[Document]:
+        """
+        書類一覧のうち、seenに記録されていない行・内容が変化した行のみを変換して返す。
+        seenは docID -> 行のフィンガープリント として呼び出し側が保持し、このメソッドが更新する。
+        （XBRL/CSVの生成完了などでフラグが後から変化した行も再度変換される）
+        件数が変化しない行の更新を検出するため、件数によるキャッシュは使用しない。
+        """
+        document_list: list[Document] = []
+        for target_date in self._iterate_target_dates(criteria):
+            for edinet_document in self._fetch_document_list(target_date, refresh=True):
+                doc_id = edinet_document.get("docID")
+                if doc_id is None:
+                    continue
+                fingerprint = self._fingerprint(edinet_document)
+                if seen.get(doc_id) == fingerprint:
+                    continue
+                seen[doc_id] = fingerprint
+
+                document = self._convert_to_document(
+                    edinet_doc=edinet_document, target_format_type=criteria.format_type
+                )
+                if document is not None:
+                    document_list.append(document)
+        return document_list
+
+    @staticmethod
+    def _fingerprint(edinet_doc: "GetDocumentDocs") -> str:
+        """書類一覧の行の変化を検出するためのフィンガープリント"""
+        return "|".join(
+            str(edinet_doc.get(key))
+            for key in (
+                "opeDateTime",
+                "withdrawalStatus",
+                "docInfoEditStatus",
+                "disclosureStatus",
+                "xbrlFlag",
+                "pdfFlag",
+                "csvFlag",
+            )
+        )
+
+    def _iterate_target_dates(
+        self, criteria: EdinetDocumentSearchCriteria
+    ) -> Iterator[date]:
+        """
+        書類一覧を取得する日付をイテレートする。
+        calendarが指定されている場合は営業日を先に処理し、
+        検証スイープが有効な場合のみ休業日を最後にまとめて処理する。
+        """
+        yield from criteria.timescope.iterate_by_day(calendar=criteria.calendar)
+
+        if criteria.calendar is not None and criteria.verify_non_business_days:
+            yield from criteria.timescope.iterate_non_business_days(criteria.calendar)
+
+    def _fetch_document_list(
+        self, target_date: date, refresh: bool = False
+    ) -> "list[GetDocumentDocs]":
+        """
+        指定日の書類一覧を取得する。
+        count_probeが有効な場合は件数のみを先に取得し、
+        0件の日、またはキャッシュ済みの件数と一致する日は書類一覧の取得を省略する。
+        refreshを指定した場合は件数が一致してもキャッシュを使用せずに再取得する。
+        """
+        target_datetime = datetime.combine(target_date, time.min)
+
+        if self.count_probe:
+            metadata_response = self.client.get_document_list(
+                date=target_datetime, withdocs=False
+            )
+            count = metadata_response["metadata"]["resultset"]["count"]
+
+            # 書類が存在しない日（休日など）は書類一覧を取得しない
+            if count == 0:
+                self._listing_cache[target_date] = EdinetListingCacheEntry(
+                    count=0, results=[]
+                )
+                return []
+
+            # 件数が変化していない場合はキャッシュ済みの書類一覧を利用する
+            cached = self._listing_cache.get(target_date)
+            if not refresh and cached is not None and cached.count == count:
+                return cached.results
+
+        document_list_response = self.client.get_document_list(
+            date=target_datetime, withdocs=True
+        )
+        results = document_list_response["results"]
+        self._listing_cache[target_date] = EdinetListingCacheEntry(
+            count=len(results), results=results
+        )
+        return results
+
+    def download_document(
+        self, document: Document, on_size: Callable[[int], None] | None = None
+    ) -> bytes:
         """
         ** EDINETでは同一docIdで複数のフォーマットが存在する可能性が、
         設計上、document IDにformat typeをsuffixに追加しているため、
@@ -81,7 +222,18 @@ class EdinetAdapter:
 
         doc_id, _ = self._parse_edinet_doc_id(document.document_id)
 
-        return self.client.get_document(docId=doc_id, type=edinet_format_type)
+        if self.downloader is not None:
+            return self.downloader.download(
+                url=f"{self.api_base_url}/documents/{doc_id}",
+                params={"type": edinet_format_type, "Subscription-Key": self.api_key},
+                resume_key=f"{doc_id}_{edinet_format_type}",
+                on_size=on_size,
+            )
+        file = self.client.get_document(docId=doc_id, type=edinet_format_type)
+        if self.bandwidth_limiter is not None:
+            # edinetクライアントはレスポンスを一括で読み込むため、取得後にまとめて消費する
+            self.bandwidth_limiter.consume(len(file))
+        return file
 
     @classmethod
     def _generate_document_id(cls, doc_id: str, format_type: FormatType) -> DocumentId:
@@ -105,7 +257,7 @@ class EdinetAdapter:
         return parts[1], FormatType(enum=FormatTypeEnum(parts[2]))
 
     def _convert_to_document(
-        self, edinet_doc: GetDocumentDocs, target_format_type: FormatType
+        self, edinet_doc: "GetDocumentDocs", target_format_type: FormatType
     ) -> Document | None:
         """
         EDINET APIのレスポンスの書類一覧データをDocumentに変換する。
@@ -0,0 +1,294 @@
+import json
+import os
+import re
+import threading
+from collections.abc import Callable, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import requests
+from fino_ingestor.infrastructure.scheduler.bandwidth import BandwidthLimiter
+from fino_ingestor.interface.config.disclosure import DownloadConfig
+from fino_ingestor.util.retry import call_with_retry
+from requests.adapters import HTTPAdapter
+
+_CONTENT_RANGE_PATTERN = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+_REQUEST_TIMEOUT_SECONDS = 60
+# 帯域を制限する場合にレスポンスを読み出すチャンクサイズ
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class RetryableDownloadError(IOError):
+    """再試行で回復し得るダウンロードエラー（429・5xx、不完全なレスポンスなど）"""
+
+    overloaded = True
+    """並列数を減らすべきエラーであること（is_overload_errorが参照する）"""
+
+
+@dataclass(frozen=True, slots=True)
+class RangeResponse:
+    status_code: int
+    headers: MutableMapping[str, str]
+    content: bytes
+
+
+class PartialDownload:
+    """
+    パート単位で取得したデータを保持する
+    pathを指定した場合はファイルに書き込み、取得済みパートを状態ファイルに記録する。
+    検証子（ETag / Last-Modified）とサイズが一致する場合のみ、前回の続きから再開する。
+    """
+
+    def __init__(
+        self, total: int, part_size: int, validator: str, path: Path | None = None
+    ) -> None:
+        self.total = total
+        self.part_size = part_size
+        self.validator = validator
+        self.path = path
+        self.done: set[int] = set()
+        self._lock = threading.Lock()
+        self._buffer: bytearray | None = None
+        self._fd: int | None = None
+
+        if path is None:
+            self._buffer = bytearray(total)
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.done = self._load_state()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        os.ftruncate(self._fd, total)
+
+    @property
+    def part_count(self) -> int:
+        return -(-self.total // self.part_size)
+
+    def part_range(self, index: int) -> tuple[int, int]:
+        """パートの [start, end) を返す"""
+        start = index * self.part_size
+        return start, min(start + self.part_size, self.total)
+
+    def write(self, index: int, data: bytes) -> None:
+        start, _ = self.part_range(index)
+        if self._fd is not None:
+            _ = os.pwrite(self._fd, data, start)
+        else:
+            assert self._buffer is not None
+            self._buffer[start : start + len(data)] = data
+
+        with self._lock:
+            self.done.add(index)
+            if self._fd is not None:
+                self._save_state()
+
+    def read_all(self) -> bytes:
+        if self._fd is None:
+            assert self._buffer is not None
+            return bytes(self._buffer)
+        return os.pread(self._fd, self.total, 0)
+
+    def discard(self) -> None:
+        """完了したダウンロードの一時ファイルを削除する"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+            self._state_path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """再開できるよう一時ファイルを残したまま閉じる"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    @property
+    def _state_path(self) -> Path:
+        assert self.path is not None
+        return self.path.with_name(f"{self.path.name}.json")
+
+    def _load_state(self) -> set[int]:
+        try:
+            state = json.loads(self._state_path.read_text())
+        except (FileNotFoundError, ValueError):
+            return set()
+        if (
+            state.get("total") != self.total
+            or state.get("part_size") != self.part_size
+            or state.get("validator") != self.validator
+        ):
+            # 配信元のファイルが変わっている場合は最初から取得し直す
+            return set()
+        return set(state.get("done", []))
+
+    def _save_state(self) -> None:
+        state = {
+            "total": self.total,
+            "part_size": self.part_size,
+            "validator": self.validator,
+            "done": sorted(self.done),
+        }
+        temp_path = self._state_path.with_name(f"{self._state_path.name}.tmp")
+        _ = temp_path.write_text(json.dumps(state))
+        _ = temp_path.replace(self._state_path)
+
+
+class RangedHttpDownloader:
+    """
+    HTTP Rangeリクエストによる並列・再開可能なダウンロード
+    最初のパートをRange付きで取得し、206が返った場合のみ残りのパートを並列に取得する。
+    Rangeに対応していない配信元（200を返す）の場合は、そのレスポンスをそのまま使用する。
+    """
+
+    def __init__(
+        self,
+        config: DownloadConfig,
+        session: requests.Session | None = None,
+        bandwidth_limiter: BandwidthLimiter | None = None,
+    ) -> None:
+        self.range_threshold = config.range_threshold
+        self.part_size = config.part_size
+        self.max_concurrency = config.max_concurrency
+        self.max_attempts = config.max_attempts
+        self.resume_dir = Path(config.resume_dir) if config.resume_dir else None
+        self.session = session or self._create_session(config.max_concurrency)
+        # 指定した場合、レスポンスをチャンク単位で読み出しながら帯域を消費する
+        self.bandwidth_limiter = bandwidth_limiter
+
+    def download(
+        self,
+        url: str,
+        params: dict[str, Any],
+        resume_key: str | None = None,
+        on_size: Callable[[int], None] | None = None,
+    ) -> bytes:
+        """
+        書類をダウンロードする
+        on_sizeを指定した場合、最初のレスポンスで全体のサイズが判明した時点で呼び出す。
+        """
+        first = self._fetch_with_retry(url, params, 0, self.part_size)
+        if first.status_code == 200:
+            if on_size is not None:
+                on_size(len(first.content))
+            return first.content
+
+        total = self._parse_total_size(first)
+        if on_size is not None:
+            # 残りのパートを取得する前に通知し、呼び出し側がメモリの空きを待てるようにする
+            on_size(total)
+        if total <= len(first.content):
+            return first.content
+
+        validator = first.headers.get("ETag") or first.headers.get("Last-Modified", "")
+        path = (
+            self.resume_dir / f"{resume_key}.part"
+            if self.resume_dir is not None and resume_key is not None
+            else None
+        )
+        if total <= self.range_threshold:
+            # 閾値以下の書類は残りを1リクエストで取得する
+            rest = self._fetch_with_retry(
+                url, params, len(first.content), total - len(first.content)
+            )
+            return first.content + rest.content
+
+        partial = PartialDownload(
+            total=total, part_size=self.part_size, validator=validator, path=path
+        )
+        try:
+            partial.write(0, first.content)
+            self._download_parts(url, params, partial)
+        except BaseException:
+            partial.close()
+            raise
+
+        data = partial.read_all()
+        partial.discard()
+        return data
+
+    def _download_parts(
+        self, url: str, params: dict[str, Any], partial: PartialDownload
+    ) -> None:
+        pending = [i for i in range(partial.part_count) if i not in partial.done]
+
+        def fetch(index: int) -> None:
+            start, end = partial.part_range(index)
+            response = self._fetch_with_retry(url, params, start, end - start)
+            partial.write(index, response.content)
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="fino-download"
+        ) as executor:
+            futures = [executor.submit(fetch, index) for index in pending]
+            for future in futures:
+                future.result()
+
+    def _fetch_with_retry(
+        self, url: str, params: dict[str, Any], offset: int, length: int
+    ) -> RangeResponse:
+        return call_with_retry(
+            lambda: self._fetch(url, params, offset, length),
+            max_attempts=self.max_attempts,
+            retry_on=(
+                RetryableDownloadError,
+                requests.ConnectionError,
+                requests.Timeout,
+            ),
+        )
+
+    def _fetch(
+        self, url: str, params: dict[str, Any], offset: int, length: int
+    ) -> RangeResponse:
+        with self.session.get(
+            url,
+            params=params,
+            headers={"Range": f"bytes={offset}-{offset + length - 1}"},
+            timeout=_REQUEST_TIMEOUT_SECONDS,
+            stream=self.bandwidth_limiter is not None,
+        ) as response:
+            # 過負荷（429）も再試行の対象とする
+            if response.status_code >= 500 or response.status_code == 429:
+                raise RetryableDownloadError(
+                    f"Server error while downloading: {response.status_code}"
+                )
+            response.raise_for_status()
+            fetched = RangeResponse(
+                status_code=response.status_code,
+                headers=response.headers,
+                content=self._read_content(response),
+            )
+
+        if fetched.status_code == 206:
+            expected = min(length, self._parse_total_size(fetched) - offset)
+            if len(fetched.content) != expected:
+                raise RetryableDownloadError(
+                    f"Incomplete range response: {len(fetched.content)} != {expected}"
+                )
+        return fetched
+
+    def _read_content(self, response: requests.Response) -> bytes:
+        if self.bandwidth_limiter is None:
+            return response.content
+        chunks = response.iter_content(chunk_size=_STREAM_CHUNK_SIZE)
+        return b"".join(self.bandwidth_limiter.throttle(chunks))
+
+    @staticmethod
+    def _parse_total_size(response: RangeResponse) -> int:
+        match = _CONTENT_RANGE_PATTERN.fullmatch(
+            response.headers.get("Content-Range", "")
+        )
+        if match is None:
+            raise RetryableDownloadError("Invalid Content-Range header")
+        return int(match.group(3))
+
+    @staticmethod
+    def _create_session(max_concurrency: int) -> requests.Session:
+        session = requests.Session()
+        # 並列数分のコネクションを再利用できるようにする
+        adapter = HTTPAdapter(pool_maxsize=max_concurrency)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
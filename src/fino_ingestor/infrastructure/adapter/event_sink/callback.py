@@ -0,0 +1,14 @@
+from collections.abc import Callable
+
+from fino_ingestor.domain.event.document_stored import DocumentStoredEvent
+from fino_ingestor.interface.port.event_sink import EventSinkPort
+
+
+class CallbackEventSink(EventSinkPort):
+    """保存イベントをプロセス内のコールバックに渡す"""
+
+    def __init__(self, callback: Callable[[DocumentStoredEvent], None]) -> None:
+        self._callback = callback
+
+    def publish(self, event: DocumentStoredEvent) -> None:
+        self._callback(event)
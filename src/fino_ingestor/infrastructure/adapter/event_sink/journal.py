@@ -0,0 +1,78 @@
+import json
+import os
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from fino_ingestor.domain.event.document_stored import DocumentStoredEvent
+from fino_ingestor.interface.config.event import JournalEventSinkConfig
+from fino_ingestor.interface.port.event_sink import EventSinkPort
+
+
+@dataclass(frozen=True, slots=True)
+class JournalRecord:
+    offset: int
+    """レコードの開始位置"""
+    next_offset: int
+    """次のレコードの開始位置（再開時はこの値から読み込む）"""
+    event: DocumentStoredEvent
+
+
+class JournalEventSink(EventSinkPort):
+    """保存イベントを追記専用のJSONLファイルに1行ずつ記録する"""
+
+    def __init__(self, config: JournalEventSinkConfig) -> None:
+        self.path = Path(config.path)
+        self.fsync = config.fsync
+        self._lock = threading.Lock()
+        self._file: BinaryIO | None = None
+
+    def publish(self, event: DocumentStoredEvent) -> None:
+        line = json.dumps(event.to_dict(), ensure_ascii=False).encode("utf-8") + b"\n"
+        with self._lock:
+            file = self._open()
+            # 1行を1回の書き込みで追記し、他のプロセスの読み込みで行が分断されないようにする
+            _ = file.write(line)
+            file.flush()
+            if self.fsync:
+                os.fsync(file.fileno())
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _open(self) -> BinaryIO:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("ab")
+        return self._file
+
+
+def read_event_journal(path: str | Path, offset: int = 0) -> Iterator[JournalRecord]:
+    """
+    ジャーナルをoffsetから順に読み込む
+    書き込み途中の末尾行（改行で終わっていない行）は読み込まない。
+
+    Examples
+    --------
+    >>> for record in read_event_journal("events.jsonl", offset=saved_offset):
+    ...     handle(record.event)
+    ...     saved_offset = record.next_offset
+    """
+    journal = Path(path)
+    if not journal.exists():
+        return
+    with journal.open("rb") as file:
+        _ = file.seek(offset)
+        current = offset
+        for line in file:
+            if not line.endswith(b"\n"):
+                return
+            next_offset = current + len(line)
+            event = DocumentStoredEvent.from_dict(json.loads(line))
+            yield JournalRecord(offset=current, next_offset=next_offset, event=event)
+            current = next_offset
@@ -0,0 +1,58 @@
+import json
+import socket
+import threading
+
+from fino_ingestor.domain.event.document_stored import DocumentStoredEvent
+from fino_ingestor.interface.config.event import UnixSocketEventSinkConfig
+from fino_ingestor.interface.port.event_sink import EventSinkPort
+
+
+class UnixSocketEventSink(EventSinkPort):
+    """
+    保存イベントをUnixドメインソケットへJSON行として送信する
+    送信はベストエフォートで、コンシューマに接続できない場合はイベントを破棄して次回に再接続する。
+    送信が途中で失敗した場合（タイムアウトなど）は接続を閉じるため、コンシューマは改行で終わらない
+    末尾の行を破棄すればよい（次のイベントが途中までの行に連結されることはない）。
+    """
+
+    def __init__(self, config: UnixSocketEventSinkConfig) -> None:
+        self.socket_path = config.socket_path
+        self.timeout_seconds = config.timeout_seconds
+        self._lock = threading.Lock()
+        self._socket: socket.socket | None = None
+        self.dropped = 0
+        """送信できずに破棄したイベント数"""
+
+    def publish(self, event: DocumentStoredEvent) -> None:
+        line = json.dumps(event.to_dict(), ensure_ascii=False).encode("utf-8") + b"\n"
+        with self._lock:
+            try:
+                self._connect().sendall(line)
+            except OSError:
+                # 途中まで送信している可能性があるため、接続を閉じて行の途中から送信しないようにする
+                self._disconnect()
+                self.dropped += 1
+            except BaseException:
+                self._disconnect()
+                raise
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def _connect(self) -> socket.socket:
+        if self._socket is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout_seconds)
+            try:
+                sock.connect(self.socket_path)
+            except OSError:
+                sock.close()
+                raise
+            self._socket = sock
+        return self._socket
+
+    def _disconnect(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
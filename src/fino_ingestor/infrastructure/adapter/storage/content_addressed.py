@@ -0,0 +1,159 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping
+
+from fino_ingestor.interface.config.storage import ContentAddressedStorageConfig
+from fino_ingestor.interface.port.storage import StoragePort
+
+# ハッシュ計算時のチャンクサイズ
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class ContentAddressedStorage(StoragePort):
+    """
+    コンテンツアドレス形式のストレージ
+    - 実体はハッシュ値から決まるパス（blobs/sha256/ab/cd/<digest>）に1度だけ保存する
+    - 書類のパスにはblobへの参照（JSON）のみを保存する
+    同一内容の再ダウンロードや、内容が同一の訂正書類の添付ファイルは実体を再保存しない。
+    """
+
+    def __init__(
+        self, backend: StoragePort, config: ContentAddressedStorageConfig
+    ) -> None:
+        self.backend = backend
+        self.algorithm = config.algorithm
+        self.blob_prefix = config.blob_prefix.strip("/")
+        # 保存済みであることが確認できたハッシュ値（存在確認の往復を省略するため）
+        # 長時間動作するプロセスでも増え続けないよう、LRUで上限を設ける
+        self._known_digests: OrderedDict[str, None] = OrderedDict()
+        self._max_known_digests = config.max_known_digests
+        # 壊れていると通知されたハッシュ値（次回の保存時にblobを書き直す）
+        self._corrupt_digests: set[str] = set()
+        self._lock = threading.Lock()
+
+    def exists(self, path: str) -> bool:
+        return self.backend.exists(path=path)
+
+    def save(
+        self, path: str, file: bytes, metadata: Mapping[str, str] | None = None
+    ) -> None:
+        digest = self.compute_digest(file)
+        blob_path = self.blob_path(digest)
+
+        # 同じ内容のblobが既に存在する場合は実体の保存を省略する（メタデータは最初の保存時のもの）
+        if digest not in self._corrupt_digests and self._has_blob(digest, blob_path):
+            # 参照も同じblobを指している場合は何も保存しない
+            if self._referenced_digest(path) == digest:
+                return
+        else:
+            self.backend.save(path=blob_path, file=file, metadata=metadata)
+            self._remember(digest)
+            with self._lock:
+                self._corrupt_digests.discard(digest)
+
+        reference = {
+            "algorithm": self.algorithm,
+            "digest": digest,
+            "size": len(file),
+            "blob": blob_path,
+        }
+        self.backend.save(path=path, file=json.dumps(reference).encode("utf-8"))
+
+    def read(self, path: str, offset: int = 0, length: int | None = None) -> bytes:
+        # 参照を解決してblobから読み込む
+        return self.backend.read(path=self.resolve(path), offset=offset, length=length)
+
+    def list_paths(self, prefix: str = "") -> Iterator[str]:
+        blob_root = f"{self.blob_prefix}/"
+        for path in self.backend.list_paths(prefix=prefix):
+            if not path.startswith(blob_root):
+                yield path
+
+    def read_metadata(self, path: str) -> dict[str, str]:
+        return self.backend.read_metadata(path=self.resolve(path))
+
+    def delete(self, path: str) -> None:
+        # blobは他の参照から共有されている可能性があるため、参照のみを削除する
+        self.backend.delete(path=path)
+
+    def move(self, source_path: str, target_path: str) -> None:
+        self.backend.move(source_path=source_path, target_path=target_path)
+
+    def when_durable(self, path: str, callback: Callable[[], None]) -> None:
+        # 参照とblobの両方の書き込みが確定した時点で呼び出す
+        digest = self._referenced_digest(path)
+        if digest is None:
+            self.backend.when_durable(path=path, callback=callback)
+            return
+        blob_path = self.blob_path(digest)
+        self.backend.when_durable(
+            path=path,
+            callback=lambda: self.backend.when_durable(
+                path=blob_path, callback=callback
+            ),
+        )
+
+    def mark_corrupt(self, path: str) -> None:
+        # 参照先のblobは同じハッシュ値でも書き直す（存在確認では壊れていることを判別できないため）
+        # 参照自体が壊れている場合は、次回の保存で参照が書き直される
+        digest = self._referenced_digest(path)
+        self.backend.mark_corrupt(path=path)
+        if digest is None:
+            return
+        self.backend.mark_corrupt(path=self.blob_path(digest))
+        with self._lock:
+            _ = self._known_digests.pop(digest, None)
+            self._corrupt_digests.add(digest)
+
+    def flush(self) -> None:
+        self.backend.flush()
+
+    def close(self) -> None:
+        self.backend.close()
+
+    def resolve(self, path: str) -> str:
+        """書類のパスに保存された参照からblobのパスを取得する"""
+        reference = json.loads(self.backend.read(path=path))
+        return str(reference["blob"])
+
+    def blob_path(self, digest: str) -> str:
+        # 1ディレクトリ（prefix）に大量のblobが集中しないよう、先頭4文字で2階層に分ける
+        return (
+            f"{self.blob_prefix}/{self.algorithm}/{digest[:2]}/{digest[2:4]}/{digest}"
+        )
+
+    def compute_digest(self, file: bytes) -> str:
+        """コピーを作らずにチャンク単位でハッシュ値を計算する"""
+        hasher = hashlib.new(self.algorithm)
+        view = memoryview(file)
+        for offset in range(0, len(view), _HASH_CHUNK_SIZE):
+            hasher.update(view[offset : offset + _HASH_CHUNK_SIZE])
+        return hasher.hexdigest()
+
+    def _has_blob(self, digest: str, blob_path: str) -> bool:
+        with self._lock:
+            if digest in self._known_digests:
+                self._known_digests.move_to_end(digest)
+                return True
+        if self.backend.exists(path=blob_path):
+            self._remember(digest)
+            return True
+        return False
+
+    def _remember(self, digest: str) -> None:
+        with self._lock:
+            self._known_digests[digest] = None
+            self._known_digests.move_to_end(digest)
+            while len(self._known_digests) > self._max_known_digests:
+                _ = self._known_digests.popitem(last=False)
+
+    def _referenced_digest(self, path: str) -> str | None:
+        """書類のパスに保存済みの参照が指すハッシュ値（参照がない場合はNone）"""
+        try:
+            reference = json.loads(self.backend.read(path=path))
+        except (FileNotFoundError, ValueError):
+            return None
+        digest = reference.get("digest") if isinstance(reference, dict) else None
+        return str(digest) if digest is not None else None
@@ -0,0 +1,155 @@
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+from fino_ingestor.interface.config.storage import FanOutStorageConfig
+from fino_ingestor.interface.port.storage import StoragePort
+
+T = TypeVar("T")
+
+
+class FanOutStorage(StoragePort):
+    """
+    複数のストレージへ同時に保存するストレージ
+    - saveはすべての保存先に並列に書き込む（上書き）
+    - save_if_absentは保存先ごとに存在確認を行い、まだ存在しない保存先にのみ並列に書き込む
+      （一部の保存先への書き込みに失敗した書類を収集し直す際に、保存済みの保存先への転送を省く）
+    - consistencyに応じて、全保存先（all）もしくは過半数（quorum）の成功を保存完了とする
+    """
+
+    def __init__(
+        self, backends: list[StoragePort], config: FanOutStorageConfig
+    ) -> None:
+        if len(backends) < 2:
+            raise ValueError("FanOutStorage requires at least 2 backends")
+        self.backends = backends
+        self.consistency = config.consistency
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(backends), thread_name_prefix="fino-fan-out"
+        )
+
+    @property
+    def required_count(self) -> int:
+        """保存完了・保存済みとみなすために必要な保存先の数"""
+        if self.consistency == "all":
+            return len(self.backends)
+        return len(self.backends) // 2 + 1
+
+    def exists(self, path: str) -> bool:
+        results = self._map(lambda backend: backend.exists(path=path))
+        found = sum(1 for result in results if result is True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if found >= self.required_count:
+            return True
+        # 存在確認に失敗した保存先がある場合、未保存とは判断できない
+        if errors and found + len(errors) >= self.required_count:
+            raise errors[0]
+        return False
+
+    def save(
+        self, path: str, file: bytes, metadata: Mapping[str, str] | None = None
+    ) -> None:
+        self._save_all(
+            path, lambda backend: backend.save(path=path, file=file, metadata=metadata)
+        )
+
+    def save_if_absent(
+        self, path: str, file: bytes, metadata: Mapping[str, str] | None = None
+    ) -> bool:
+        def save_if_absent(backend: StoragePort) -> bool:
+            if backend.exists(path=path):
+                return False
+            backend.save(path=path, file=file, metadata=metadata)
+            return True
+
+        return any(result is True for result in self._save_all(path, save_if_absent))
+
+    def when_durable(self, path: str, callback: Callable[[], None]) -> None:
+        # 保存に成功する必要がある数の保存先で確定した時点で呼び出す
+        remaining = self.required_count
+        lock = threading.Lock()
+
+        def on_backend_durable() -> None:
+            nonlocal remaining
+            with lock:
+                remaining -= 1
+                durable = remaining == 0
+            if durable:
+                callback()
+
+        for backend in self.backends:
+            backend.when_durable(path=path, callback=on_backend_durable)
+
+    def _save_all(
+        self, path: str, save: Callable[[StoragePort], T]
+    ) -> list[T | BaseException]:
+        results = self._map(save)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        succeeded = len(results) - len(errors)
+        if succeeded < self.required_count:
+            raise IOError(
+                f"Failed to save file to {len(errors)}/{len(self.backends)} backends "
+                f"(consistency={self.consistency}): {path}"
+            ) from errors[0]
+        return results
+
+    def read(self, path: str, offset: int = 0, length: int | None = None) -> bytes:
+        # 先頭の保存先から順に参照する（ローカルディスクを先頭に置くことを想定）
+        for backend in self.backends:
+            try:
+                return backend.read(path=path, offset=offset, length=length)
+            except FileNotFoundError:
+                continue
+        raise FileNotFoundError(f"File not found in any backend: {path}")
+
+    def read_metadata(self, path: str) -> dict[str, str]:
+        for backend in self.backends:
+            try:
+                return backend.read_metadata(path=path)
+            except FileNotFoundError:
+                continue
+        raise FileNotFoundError(f"File not found in any backend: {path}")
+
+    def list_paths(self, prefix: str = "") -> Iterator[str]:
+        paths: set[str] = set()
+        for backend in self.backends:
+            paths.update(backend.list_paths(prefix=prefix))
+        yield from sorted(paths)
+
+    def delete(self, path: str) -> None:
+        def delete_if_exists(backend: StoragePort) -> None:
+            if backend.exists(path=path):
+                backend.delete(path=path)
+
+        for result in self._map(delete_if_exists):
+            if isinstance(result, BaseException):
+                raise result
+
+    def mark_corrupt(self, path: str) -> None:
+        for result in self._map(lambda backend: backend.mark_corrupt(path=path)):
+            if isinstance(result, BaseException):
+                raise result
+
+    def flush(self) -> None:
+        for result in self._map(lambda backend: backend.flush()):
+            if isinstance(result, BaseException):
+                raise result
+
+    def close(self) -> None:
+        """すべての保存先を閉じてから並列書き込みのワーカーを終了する"""
+        try:
+            for result in self._map(lambda backend: backend.close()):
+                if isinstance(result, BaseException):
+                    raise result
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def _map(self, func: Callable[[StoragePort], T]) -> list[T | BaseException]:
+        """全保存先に並列に適用し、保存先ごとの結果もしくは例外を返す"""
+        futures = [self._executor.submit(func, backend) for backend in self.backends]
+        results: list[T | BaseException] = []
+        for future in futures:
+            error = future.exception()
+            results.append(error if error is not None else future.result())
+        return results
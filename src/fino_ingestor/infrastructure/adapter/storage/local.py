@@ -1,26 +1,398 @@
+import errno
+import mmap
+import os
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from pathlib import Path
+from typing import BinaryIO
 
 from fino_ingestor.interface.config.storage import LocalStorageConfig
 from fino_ingestor.interface.port.storage import StoragePort
 
+# 書き込み途中の一時ファイルの接尾辞（list_pathsでは列挙しない）
+TEMP_FILE_SUFFIX = ".fino-tmp"
+# メタデータを保存する拡張属性の接頭辞
+XATTR_PREFIX = "user.fino."
+
+
+def fsync_directory(directory: Path) -> None:
+    """リネームを永続化するため、ディレクトリエントリをfsyncする"""
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    except OSError as e:
+        # NFSなど、ディレクトリのfsyncに対応していないファイルシステムでは無視する
+        if e.errno not in (errno.EINVAL, errno.ENOTSUP, errno.EBADF):
+            raise
+    finally:
+        os.close(fd)
+
+
+def _write_xattrs(fd: int, metadata: Mapping[str, str]) -> None:
+    """メタデータを拡張属性として書き込む（対応していない環境では保存しない）"""
+    if not hasattr(os, "setxattr"):
+        return
+    for key, value in metadata.items():
+        try:
+            os.setxattr(fd, f"{XATTR_PREFIX}{key}", value.encode())
+        except OSError as e:
+            if e.errno == errno.ENOTSUP:
+                return
+            raise
+
+
+class GroupCommitter:
+    """
+    一時ファイルを保留し、まとめてfsync・リネームする
+    - max_files件に達した時点、もしくは最初の保留からinterval秒経過した時点で確定する
+    - ディレクトリのfsyncは確定単位ごとにディレクトリ1回のみ行う
+    - 確定に失敗した場合、未確定のファイルを保留に戻し、次の確定（タイマー・commit）で再試行する
+    - on_commitで登録したコールバックは、そのファイルを確定した時点で呼び出す
+    """
+
+    def __init__(self, max_files: int, interval: float) -> None:
+        self.max_files = max_files
+        self.interval = interval
+        self._lock = threading.Lock()
+        # 確定待ち / 確定処理中の (最終パス → 一時ファイル)
+        self._pending: dict[Path, Path] = {}
+        self._committing: dict[Path, Path] = {}
+        # 一時ファイル → 確定時に呼び出すコールバック
+        self._callbacks: dict[Path, list[Callable[[], None]]] = {}
+        self._timer: threading.Timer | None = None
+
+    def add(self, target: Path, temp: Path) -> None:
+        with self._lock:
+            replaced = self._pending.pop(target, None)
+            self._pending[target] = temp
+            # 置き換えた書き込みのコールバックは、新しい書き込みの確定時に呼び出す
+            if replaced is not None and replaced in self._callbacks:
+                self._callbacks.setdefault(temp, []).extend(
+                    self._callbacks.pop(replaced)
+                )
+            commit_now = len(self._pending) >= self.max_files
+            if not commit_now:
+                self._schedule()
+        if replaced is not None:
+            replaced.unlink(missing_ok=True)
+        if commit_now:
+            self.commit()
+
+    def lookup(self, target: Path) -> Path | None:
+        """確定前のファイルの場合、その一時ファイルを返す"""
+        with self._lock:
+            return self._pending.get(target) or self._committing.get(target)
+
+    def on_commit(self, target: Path, callback: Callable[[], None]) -> bool:
+        """
+        確定前のファイルの場合、確定した時点でcallbackを呼び出すよう登録してTrueを返す
+        確定済みの場合はFalseを返す（呼び出し側ですぐにcallbackを呼び出す）。
+        """
+        with self._lock:
+            temp = self._pending.get(target) or self._committing.get(target)
+            if temp is None:
+                return False
+            self._callbacks.setdefault(temp, []).append(callback)
+            return True
+
+    def pending_paths(self) -> list[Path]:
+        with self._lock:
+            return [*self._pending, *self._committing]
+
+    def commit(self) -> None:
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            self._committing.update(batch)
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        try:
+            if batch:
+                self._commit(batch.items())
+        except Exception:
+            self._requeue(batch)
+            raise
+        finally:
+            with self._lock:
+                for target in batch:
+                    if self._committing.get(target) == batch[target]:
+                        del self._committing[target]
+        self._run_callbacks(batch.values())
+
+    def _run_callbacks(self, temps: Iterable[Path]) -> None:
+        """確定した一時ファイルのコールバックを呼び出す"""
+        with self._lock:
+            callbacks = [
+                callback for temp in temps for callback in self._callbacks.pop(temp, [])
+            ]
+        for callback in callbacks:
+            callback()
+
+    def _commit_by_timer(self) -> None:
+        try:
+            self.commit()
+        except (
+            Exception
+        ):  # 未確定のファイルは保留に戻り、次のタイマーかcommitで再試行される
+            return
+
+    def _requeue(self, batch: dict[Path, Path]) -> None:
+        """確定できなかった一時ファイルを保留に戻す（リネーム済みのファイルは除く）"""
+        stale: list[Path] = []
+        committed: list[Path] = []
+        with self._lock:
+            for target, temp in batch.items():
+                if not temp.exists():
+                    # リネーム済みのファイル
+                    committed.append(temp)
+                    continue
+                if target in self._pending:
+                    # 確定処理中に同じパスへ新しく書き込まれた場合はそちらを優先する
+                    stale.append(temp)
+                    if temp in self._callbacks:
+                        self._callbacks.setdefault(self._pending[target], []).extend(
+                            self._callbacks.pop(temp)
+                        )
+                    continue
+                self._pending[target] = temp
+            if self._pending:
+                self._schedule()
+        for temp in stale:
+            temp.unlink(missing_ok=True)
+        self._run_callbacks(committed)
+
+    def _schedule(self) -> None:
+        """確定のタイマーを開始する（ロックを取得した状態で呼び出す）"""
+        if self._timer is None:
+            self._timer = threading.Timer(self.interval, self._commit_by_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    @staticmethod
+    def _commit(batch: Iterable[tuple[Path, Path]]) -> None:
+        directories: set[Path] = set()
+        for target, temp in batch:
+            fd = os.open(temp, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(temp, target)
+            directories.add(target.parent)
+        for directory in directories:
+            fsync_directory(directory)
+
 
 class LocalStorage(StoragePort):
     def __init__(self, config: LocalStorageConfig) -> None:
         self.base_dir = self._normalize_base_dir(config.base_dir)
+        self.durability = config.durability
+        self.group_committer: GroupCommitter | None = None
+        if self.durability == "group":
+            self.group_committer = GroupCommitter(
+                max_files=config.group_commit_files,
+                interval=config.group_commit_interval_ms / 1000,
+            )
+        if config.stale_temp_file_seconds is not None:
+            self._sweep_temp_files(config.stale_temp_file_seconds)
 
     def exists(self, path: str) -> bool:
         target_path = self._resolve_path(path)
+        if self._pending_temp_of(target_path) is not None:
+            return True
         return target_path.exists()
 
-    def save(self, path: str, file: bytes) -> None:
+    def save(
+        self, path: str, file: bytes, metadata: Mapping[str, str] | None = None
+    ) -> None:
         target_path = self._resolve_path(path)
         target_path.parent.mkdir(parents=True, exist_ok=True)
-        saved_bytes = target_path.write_bytes(file)
+        # 一時ファイルに書き切ってからリネームし、書きかけのファイルを最終パスに残さない
+        temp_path = self._write_temp_file(
+            target_path, file, fsync=self.durability == "file", metadata=metadata
+        )
+
+        if self.group_committer is not None:
+            self.group_committer.add(target_path, temp_path)
+            return
+
+        os.replace(temp_path, target_path)
+        if self.durability == "file":
+            fsync_directory(target_path.parent)
+
+    def delete(self, path: str) -> None:
+        target_path = self._resolve_path(path)
+        # 確定前のファイルは確定してから削除する
+        if self._pending_temp_of(target_path) is not None:
+            self.flush()
+        target_path.unlink()
+        self._prune_empty_directories(target_path.parent)
+
+    def move(self, source_path: str, target_path: str) -> None:
+        source = self._resolve_path(source_path)
+        target = self._resolve_path(target_path)
+        if self._pending_temp_of(source) is not None:
+            self.flush()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(source, target)
+        if self.durability != "none":
+            fsync_directory(target.parent)
+            fsync_directory(source.parent)
+        self._prune_empty_directories(source.parent)
+
+    def when_durable(self, path: str, callback: Callable[[], None]) -> None:
+        # グループコミットで確定待ちのファイルは確定時に呼び出す
+        if self.group_committer is not None and self.group_committer.on_commit(
+            self._resolve_path(path), callback
+        ):
+            return
+        callback()
+
+    def flush(self) -> None:
+        if self.group_committer is not None:
+            self.group_committer.commit()
 
-        if saved_bytes != len(file):
-            raise IOError(
-                f"Incomplete write detected: {saved_bytes} != {len(file)}: {path}"
+    def read(self, path: str, offset: int = 0, length: int | None = None) -> bytes:
+        with self._open_file(self._resolve_path(path)) as f:
+            if offset < 0:
+                # 末尾から読み込む（ファイルサイズより大きい場合は先頭から）
+                size = f.seek(0, 2)
+                _ = f.seek(max(size + offset, 0))
+                return f.read()
+            _ = f.seek(offset)
+            return f.read() if length is None else f.read(length)
+
+    def read_metadata(self, path: str) -> dict[str, str]:
+        """
+        拡張属性に保存したメタデータを読み込む
+        拡張属性に対応していないOS・ファイルシステムでは空のdictを返す。
+        """
+        with self._open_file(self._resolve_path(path)) as f:
+            if not hasattr(os, "listxattr"):
+                return {}
+            fd = f.fileno()
+            try:
+                names = os.listxattr(fd)
+            except OSError as e:
+                if e.errno == errno.ENOTSUP:
+                    return {}
+                raise
+            return {
+                name.removeprefix(XATTR_PREFIX): os.getxattr(fd, name).decode()
+                for name in names
+                if name.startswith(XATTR_PREFIX)
+            }
+
+    @contextmanager
+    def open(self, path: str) -> Iterator[memoryview]:
+        """ファイルをコピーせず、読み取り専用のメモリマップとして参照する"""
+        with self._open_file(self._resolve_path(path)) as f:
+            # 空ファイルはメモリマップできない
+            if os.fstat(f.fileno()).st_size == 0:
+                yield memoryview(b"")
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    yield view
+                finally:
+                    view.release()
+
+    def list_paths(self, prefix: str = "") -> Iterator[str]:
+        root = self._resolve_path(prefix) if prefix.strip("/") else self.base_dir
+        targets: set[Path] = set()
+        if self.group_committer is not None:
+            targets.update(
+                p
+                for p in self.group_committer.pending_paths()
+                if p == root or p.is_relative_to(root)
             )
+        if root.is_file():
+            targets.add(root)
+        elif root.exists():
+            targets.update(
+                p
+                for p in root.rglob("*")
+                if p.is_file() and not p.name.endswith(TEMP_FILE_SUFFIX)
+            )
+        for target in sorted(targets):
+            yield target.relative_to(self.base_dir).as_posix()
+
+    def _sweep_temp_files(self, max_age_seconds: float) -> None:
+        """クラッシュなどで確定されずに残った古い一時ファイルを削除する"""
+        threshold = time.time() - max_age_seconds
+        for temp_path in self.base_dir.rglob(f"*{TEMP_FILE_SUFFIX}"):
+            try:
+                if temp_path.is_file() and temp_path.stat().st_mtime < threshold:
+                    temp_path.unlink()
+            except FileNotFoundError:
+                # 他のプロセスが確定・削除済みの場合
+                continue
+
+    def _prune_empty_directories(self, directory: Path) -> None:
+        """削除・移動で空になったディレクトリをbase_dirの手前まで削除する"""
+        while directory != self.base_dir and directory.is_relative_to(self.base_dir):
+            try:
+                directory.rmdir()
+            except OSError:
+                # 空でない（もしくは他のスレッドが削除済み）場合はそこで止める
+                return
+            directory = directory.parent
+
+    def _pending_temp_of(self, target_path: Path) -> Path | None:
+        if self.group_committer is None:
+            return None
+        return self.group_committer.lookup(target_path)
+
+    def _open_file(self, target_path: Path) -> BinaryIO:
+        """
+        確定前の一時ファイルがある場合はそれを、ない場合は最終パスのファイルを開く
+        一時ファイルは確認した直後に確定（リネーム）される可能性があるため、
+        見つからない場合は最終パスを開き直す（開いた後のリネームは読み込みに影響しない）。
+        """
+        temp_path = self._pending_temp_of(target_path)
+        if temp_path is not None:
+            try:
+                return temp_path.open("rb")
+            except FileNotFoundError:
+                pass
+        return target_path.open("rb")
+
+    @staticmethod
+    def _write_temp_file(
+        target_path: Path,
+        file: bytes,
+        fsync: bool,
+        metadata: Mapping[str, str] | None = None,
+    ) -> Path:
+        temp_path = target_path.with_name(
+            f".{target_path.name}.{uuid.uuid4().hex[:12]}{TEMP_FILE_SUFFIX}"
+        )
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            view = memoryview(file)
+            written = 0
+            while written < len(view):
+                saved_bytes = os.write(fd, view[written:])
+                if saved_bytes == 0:
+                    raise IOError(
+                        f"Incomplete write detected: {written} != {len(file)}: {target_path}"
+                    )
+                written += saved_bytes
+            if metadata:
+                _write_xattrs(fd, metadata)
+            if fsync:
+                os.fsync(fd)
+        except BaseException:
+            os.close(fd)
+            temp_path.unlink(missing_ok=True)
+            raise
+        os.close(fd)
+        return temp_path
 
     def _normalize_base_dir(self, base_dir: str) -> Path:
         if not base_dir:
@@ -0,0 +1,191 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import AbstractContextManager, ExitStack, contextmanager
+
+from fino_ingestor.infrastructure.adapter.storage.local import LocalStorage
+from fino_ingestor.interface.config.storage import ReadCacheStorageConfig
+from fino_ingestor.interface.port.storage import StoragePort
+
+
+class ReadCacheStorage(StoragePort):
+    """
+    ローカルディスクを読み込みキャッシュとして前段に置くストレージ
+    - ファイル全体の読み込み時にキャッシュへ保存し、以降はローカルから読み込む（レンジ読み込みはキャッシュ済みの場合のみ利用する）
+    - キャッシュの合計サイズがmax_bytesを超えた場合、最も古く参照されたファイルから削除する（LRU）
+    - 書き込み・削除はbackendへそのまま行い、該当するキャッシュを破棄する
+    """
+
+    def __init__(
+        self, backend: StoragePort, cache: LocalStorage, config: ReadCacheStorageConfig
+    ) -> None:
+        self.backend = backend
+        self.cache = cache
+        self.max_bytes = config.max_bytes
+        self._lock = threading.Lock()
+        # キャッシュ済みのパス → サイズ（末尾ほど最近参照された）
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        # backendから読み込み中のパスごとの (読み込み中の数, 破棄回数)
+        # 読み込んでいる間に破棄（上書き・削除）された場合、読み込んだ古い内容をキャッシュしない
+        self._reading: dict[str, tuple[int, int]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._load_entries()
+
+    @property
+    def cached_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes
+
+    def exists(self, path: str) -> bool:
+        with self._lock:
+            if path in self._entries:
+                return True
+        return self.backend.exists(path=path)
+
+    def save(
+        self, path: str, file: bytes, metadata: Mapping[str, str] | None = None
+    ) -> None:
+        self.backend.save(path=path, file=file, metadata=metadata)
+        self._invalidate(path)
+
+    def read_metadata(self, path: str) -> dict[str, str]:
+        return self.backend.read_metadata(path=path)
+
+    def read(self, path: str, offset: int = 0, length: int | None = None) -> bytes:
+        if self._touch(path):
+            try:
+                return self.cache.read(path=path, offset=offset, length=length)
+            except FileNotFoundError:
+                # 確認した直後に破棄・追い出しされた場合はbackendから読み込む
+                pass
+        if offset != 0 or length is not None:
+            return self.backend.read(path=path, offset=offset, length=length)
+
+        return self._read_through(path)
+
+    def open(self, path: str) -> AbstractContextManager[memoryview]:
+        # キャッシュ済みのファイルはメモリマップで参照する
+        if not self._touch(path):
+            _ = self._read_through(path)
+        if self._contains(path):
+            return self._open_cached(path)
+        return super().open(path)
+
+    def list_paths(self, prefix: str = "") -> Iterator[str]:
+        return self.backend.list_paths(prefix=prefix)
+
+    def delete(self, path: str) -> None:
+        self.backend.delete(path=path)
+        self._invalidate(path)
+
+    def move(self, source_path: str, target_path: str) -> None:
+        self.backend.move(source_path=source_path, target_path=target_path)
+        self._invalidate(source_path)
+        self._invalidate(target_path)
+
+    def when_durable(self, path: str, callback: Callable[[], None]) -> None:
+        self.backend.when_durable(path=path, callback=callback)
+
+    def mark_corrupt(self, path: str) -> None:
+        self.backend.mark_corrupt(path=path)
+        self._invalidate(path)
+
+    def flush(self) -> None:
+        self.backend.flush()
+
+    def close(self) -> None:
+        with ExitStack() as stack:
+            _ = stack.callback(self.cache.close)
+            self.backend.close()
+
+    def _load_entries(self) -> None:
+        """前回までにキャッシュしたファイルを更新日時の古い順に登録する"""
+        entries: list[tuple[float, str, int]] = []
+        for path in self.cache.list_paths():
+            stat = (self.cache.base_dir / path).stat()
+            entries.append((stat.st_mtime, path, stat.st_size))
+        for _, path, size in sorted(entries):
+            self._entries[path] = size
+            self._total_bytes += size
+        self._evict()
+
+    def _touch(self, path: str) -> bool:
+        with self._lock:
+            if path not in self._entries:
+                self.misses += 1
+                return False
+            self._entries.move_to_end(path)
+            self.hits += 1
+            return True
+
+    def _contains(self, path: str) -> bool:
+        with self._lock:
+            return path in self._entries
+
+    @contextmanager
+    def _open_cached(self, path: str) -> Iterator[memoryview]:
+        with ExitStack() as stack:
+            try:
+                view = stack.enter_context(self.cache.open(path=path))
+            except FileNotFoundError:
+                # 確認した直後に破棄・追い出しされた場合はbackendから読み込む
+                view = memoryview(self.backend.read(path=path))
+            yield view
+
+    def _read_through(self, path: str) -> bytes:
+        """backendから読み込み、読み込み中に破棄されていなければキャッシュする"""
+        with self._lock:
+            readers, generation = self._reading.get(path, (0, 0))
+            self._reading[path] = (readers + 1, generation)
+        try:
+            file = self.backend.read(path=path)
+            self._fill(path, file, generation)
+        finally:
+            with self._lock:
+                readers, current = self._reading[path]
+                if readers > 1:
+                    self._reading[path] = (readers - 1, current)
+                else:
+                    del self._reading[path]
+        return file
+
+    def _fill(self, path: str, file: bytes, generation: int) -> None:
+        # 上限を超えるファイルはキャッシュしない
+        if len(file) > self.max_bytes:
+            return
+        # 破棄との競合を避けるため、キャッシュへの書き込みもロック内で行う
+        with self._lock:
+            _, current = self._reading.get(path, (0, generation))
+            if current != generation:
+                return
+            self.cache.save(path=path, file=file)
+            self._total_bytes += len(file) - self._entries.get(path, 0)
+            self._entries[path] = len(file)
+            self._entries.move_to_end(path)
+            self._evict()
+
+    def _evict(self) -> None:
+        """上限を超えている間、最も古く参照されたファイルを削除する（_lockを保持した状態で呼び出す）"""
+        while self._total_bytes > self.max_bytes and self._entries:
+            path, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                self.cache.delete(path=path)
+            except FileNotFoundError:
+                pass
+
+    def _invalidate(self, path: str) -> None:
+        with self._lock:
+            if path in self._reading:
+                readers, generation = self._reading[path]
+                self._reading[path] = (readers, generation + 1)
+            size = self._entries.pop(path, None)
+            if size is None:
+                return
+            self._total_bytes -= size
+            try:
+                self.cache.delete(path=path)
+            except FileNotFoundError:
+                pass
@@ -1,16 +1,45 @@
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING
+
 import boto3
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
+from fino_ingestor.infrastructure.adapter.storage.s3_multipart import (
+    S3MultipartUploader,
+)
+from fino_ingestor.infrastructure.scheduler.bandwidth import BandwidthLimiter
 from fino_ingestor.interface.config.storage import S3StorageConfig
 from fino_ingestor.interface.port.storage import StoragePort
-from mypy_boto3_s3.client import S3Client
+
+if TYPE_CHECKING:
+    # 型スタブ専用パッケージのため実行時には読み込まない
+    from mypy_boto3_s3.client import S3Client
+
+
+def create_s3_client(region: str) -> "S3Client":
+    return boto3.client("s3", region_name=region)  # type: ignore[reportUnknownMemberType]
 
 
 class S3Storage(StoragePort):
-    def __init__(self, config: S3StorageConfig) -> None:
+    def __init__(
+        self,
+        config: S3StorageConfig,
+        s3_client: "S3Client | None" = None,
+        bandwidth_limiter: BandwidthLimiter | None = None,
+    ) -> None:
         self.bucket_name = config.bucket_name
         self.region = config.region
         self.prefix = self._normalize_prefix(config.prefix or "")
-        self.s3_client: S3Client = boto3.client("s3", region_name=self.region)  # type: ignore[reportUnknownMemberType]
+        # クライアントが渡された場合は共有クライアントとして再利用する
+        self.s3_client: "S3Client" = s3_client or create_s3_client(self.region)
+        self.multipart_threshold = config.transfer.multipart_threshold
+        # 指定した場合、アップロードで帯域を消費する（マルチパートの場合はパート単位）
+        self.bandwidth_limiter = bandwidth_limiter
+        self.multipart_uploader = S3MultipartUploader(
+            self.s3_client,
+            self.bucket_name,
+            config.transfer,
+            bandwidth_limiter=bandwidth_limiter,
+        )
 
     def exists(self, path: str) -> bool:
         key = self._resolve_key(path)
@@ -23,17 +52,101 @@ class S3Storage(StoragePort):
                 return False
             raise
 
-    def save(self, path: str, file: bytes) -> None:
+    def save(
+        self, path: str, file: bytes, metadata: Mapping[str, str] | None = None
+    ) -> None:
         key = self._resolve_key(path)
+        if len(file) >= self.multipart_threshold:
+            try:
+                self.multipart_uploader.upload(key, file, metadata=metadata)
+            except (ClientError, BotoCoreError) as e:
+                raise IOError(f"Failed to save file to S3: {path}") from e
+            return
+
+        if self.bandwidth_limiter is not None:
+            self.bandwidth_limiter.consume(len(file))
         try:
             response = self.s3_client.put_object(
-                Bucket=self.bucket_name, Key=key, Body=file
+                Bucket=self.bucket_name,
+                Key=key,
+                Body=file,
+                Metadata=dict(metadata or {}),
             )
             if "ETag" not in response:
                 raise IOError(f"Failed to save file to S3: {path}")
         except ClientError as e:
             raise IOError(f"Failed to save file to S3: {path}") from e
 
+    def read(self, path: str, offset: int = 0, length: int | None = None) -> bytes:
+        key = self._resolve_key(path)
+        byte_range = self._build_range(offset, length)
+        try:
+            if byte_range is None:
+                response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+            else:
+                response = self.s3_client.get_object(
+                    Bucket=self.bucket_name, Key=key, Range=byte_range
+                )
+            return response["Body"].read()
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            if error_code in ("404", "NoSuchKey"):
+                raise FileNotFoundError(f"File not found in S3: {path}") from e
+            raise IOError(f"Failed to read file from S3: {path}") from e
+
+    def read_metadata(self, path: str) -> dict[str, str]:
+        key = self._resolve_key(path)
+        try:
+            response = self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            if error_code in ("404", "NoSuchKey"):
+                raise FileNotFoundError(f"File not found in S3: {path}") from e
+            raise IOError(f"Failed to read metadata from S3: {path}") from e
+        return dict(response.get("Metadata", {}))
+
+    def delete(self, path: str) -> None:
+        key = self._resolve_key(path)
+        try:
+            _ = self.s3_client.delete_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as e:
+            raise IOError(f"Failed to delete file from S3: {path}") from e
+
+    def move(self, source_path: str, target_path: str) -> None:
+        # S3にはリネームがないため、サーバーサイドコピー後に削除する
+        source_key = self._resolve_key(source_path)
+        target_key = self._resolve_key(target_path)
+        try:
+            _ = self.s3_client.copy_object(
+                Bucket=self.bucket_name,
+                Key=target_key,
+                CopySource={"Bucket": self.bucket_name, "Key": source_key},
+            )
+        except ClientError as e:
+            raise IOError(
+                f"Failed to move file in S3: {source_path} -> {target_path}"
+            ) from e
+        self.delete(path=source_path)
+
+    def list_paths(self, prefix: str = "") -> Iterator[str]:
+        key_prefix = self._resolve_key(prefix) if prefix.strip("/") else self.prefix
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=key_prefix):
+            for content in page.get("Contents", []):
+                # _resolve_keyと対になるよう、storageのprefixを取り除いたパスを返す
+                yield content["Key"][len(self.prefix) :]
+
+    @staticmethod
+    def _build_range(offset: int, length: int | None) -> str | None:
+        """HTTP Rangeヘッダーの値を生成する（範囲指定がない場合はNone）"""
+        if offset < 0:
+            return f"bytes={offset}"
+        if length is None:
+            return f"bytes={offset}-" if offset > 0 else None
+        if length <= 0:
+            raise ValueError("length must be greater than 0")
+        return f"bytes={offset}-{offset + length - 1}"
+
     def _normalize_prefix(self, prefix: str) -> str:
         prefix = prefix.strip("/")
 
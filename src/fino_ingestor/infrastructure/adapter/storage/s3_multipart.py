@@ -0,0 +1,181 @@
+import hashlib
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from botocore.exceptions import ClientError
+from fino_ingestor.infrastructure.scheduler.bandwidth import BandwidthLimiter
+from fino_ingestor.interface.config.storage import S3TransferConfig
+from fino_ingestor.util.retry import call_with_retry
+
+if TYPE_CHECKING:
+    from mypy_boto3_s3.client import S3Client
+    from mypy_boto3_s3.type_defs import CompletedPartTypeDef
+
+
+@dataclass(frozen=True, slots=True)
+class UploadedPart:
+    part_number: int
+    etag: str
+    size: int
+
+
+class S3MultipartUploader:
+    """
+    S3への並列マルチパートアップロード
+    - パートごとにリトライし、失敗したパートのみを再送する
+    - bandwidth_limiterを指定した場合、パートの送信ごとに帯域を消費する
+    - resumeが有効な場合、失敗時はアップロードを中断（abort）せずに残し、次回の同じキーへの保存時に
+      内容（MD5）が一致するアップロード済みパートを再利用して再開する
+      再開するのはこのインスタンスが開始したアップロードのみで、他の書き込み元のアップロードは再利用しない
+      （プロセスの終了で残ったアップロードはバケットのライフサイクルルールで削除する想定）
+    - resumeが無効な場合、失敗したアップロードは中断し、アップロード済みパートを削除する
+    - メタデータはアップロードの開始時に指定するため、再開したアップロードのメタデータが異なる場合は
+      完了後にサーバーサイドコピーでメタデータを置き換える
+    """
+
+    def __init__(
+        self,
+        s3_client: "S3Client",
+        bucket_name: str,
+        config: S3TransferConfig,
+        bandwidth_limiter: BandwidthLimiter | None = None,
+    ) -> None:
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.part_size = config.part_size
+        self.max_concurrency = config.max_concurrency
+        self.max_attempts = config.max_attempts
+        self.resume = config.resume
+        self.bandwidth_limiter = bandwidth_limiter
+        # 失敗して残したアップロード（キー → (アップロードID, 開始時のメタデータ)）
+        # 再開時は取り出して占有し、同じキーへの並行した保存と共有しないようにする
+        self._lock = threading.Lock()
+        self._incomplete_uploads: dict[str, tuple[str, dict[str, str]]] = {}
+
+    def upload(
+        self, key: str, file: bytes, metadata: Mapping[str, str] | None = None
+    ) -> None:
+        upload_id, uploaded, started_metadata = self._start_or_resume(key, metadata)
+        try:
+            self._upload_parts(key, upload_id, uploaded, file)
+        except Exception:
+            self._handle_failure(key, upload_id, started_metadata)
+            raise
+        if started_metadata != dict(metadata or {}):
+            _ = self.s3_client.copy_object(
+                Bucket=self.bucket_name,
+                Key=key,
+                CopySource={"Bucket": self.bucket_name, "Key": key},
+                Metadata=dict(metadata or {}),
+                MetadataDirective="REPLACE",
+            )
+
+    def _upload_parts(
+        self,
+        key: str,
+        upload_id: str,
+        uploaded: dict[int, UploadedPart],
+        file: bytes,
+    ) -> None:
+        view = memoryview(file)
+        ranges = [
+            (part_number, offset, min(offset + self.part_size, len(file)))
+            for part_number, offset in enumerate(
+                range(0, len(file), self.part_size), start=1
+            )
+        ]
+
+        def upload_part(part_number: int, start: int, end: int) -> UploadedPart:
+            body = view[start:end]
+            # S3のパートのETagはパートのMD5のため、アップロード済みパートとの照合に使う
+            etag = f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+            existing = uploaded.get(part_number)
+            if existing is not None and existing.etag == etag:
+                return existing
+
+            def send() -> UploadedPart:
+                # 再送も回線を使用するため、送信のたびに消費する
+                if self.bandwidth_limiter is not None:
+                    self.bandwidth_limiter.consume(end - start)
+                response = self.s3_client.upload_part(
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=body.tobytes(),
+                )
+                return UploadedPart(
+                    part_number=part_number, etag=response["ETag"], size=end - start
+                )
+
+            return call_with_retry(send, max_attempts=self.max_attempts)
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="fino-s3-upload"
+        ) as executor:
+            futures = [executor.submit(upload_part, *r) for r in ranges]
+            parts = [future.result() for future in futures]
+
+        completed: "list[CompletedPartTypeDef]" = [
+            {"PartNumber": part.part_number, "ETag": part.etag} for part in parts
+        ]
+        _ = self.s3_client.complete_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": completed},
+        )
+
+    def _handle_failure(
+        self, key: str, upload_id: str, started_metadata: dict[str, str]
+    ) -> None:
+        if self.resume:
+            with self._lock:
+                self._incomplete_uploads[key] = (upload_id, started_metadata)
+            return
+        try:
+            _ = self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket_name, Key=key, UploadId=upload_id
+            )
+        except ClientError:
+            # 中断に失敗した場合もアップロードの失敗を優先して送出する
+            pass
+
+    def _start_or_resume(
+        self, key: str, metadata: Mapping[str, str] | None
+    ) -> tuple[str, dict[int, UploadedPart], dict[str, str]]:
+        """(アップロードID, アップロード済みパート, アップロード開始時のメタデータ) を返す"""
+        if self.resume:
+            with self._lock:
+                incomplete = self._incomplete_uploads.pop(key, None)
+            if incomplete is not None:
+                upload_id, started_metadata = incomplete
+                try:
+                    uploaded = self._list_uploaded_parts(key, upload_id)
+                except ClientError:
+                    # ライフサイクルルールなどで削除済みの場合は新しく開始する
+                    pass
+                else:
+                    return upload_id, uploaded, started_metadata
+
+        response = self.s3_client.create_multipart_upload(
+            Bucket=self.bucket_name, Key=key, Metadata=dict(metadata or {})
+        )
+        return response["UploadId"], {}, dict(metadata or {})
+
+    def _list_uploaded_parts(self, key: str, upload_id: str) -> dict[int, UploadedPart]:
+        parts: dict[int, UploadedPart] = {}
+        paginator = self.s3_client.get_paginator("list_parts")
+        for page in paginator.paginate(
+            Bucket=self.bucket_name, Key=key, UploadId=upload_id
+        ):
+            for part in page.get("Parts", []):
+                parts[part["PartNumber"]] = UploadedPart(
+                    part_number=part["PartNumber"],
+                    etag=part["ETag"],
+                    size=part["Size"],
+                )
+        return parts
@@ -0,0 +1,242 @@
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
+from fino_ingestor.infrastructure.scheduler.concurrency import (
+    AdaptiveConcurrencyLimiter,
+)
+from fino_ingestor.interface.config.storage import TieredStorageConfig
+from fino_ingestor.interface.port.storage import StoragePort
+from fino_ingestor.util.retry import call_with_retry
+
+
+class TieredStorage(StoragePort):
+    """
+    ライトビハインド形式のストレージ
+    - saveはステージング領域への書き込みが完了した時点で戻り、backendへはバックグラウンドでアップロードする
+    - アップロードが完了したファイルはステージング領域から削除する
+    - 起動時にステージング領域に残っているファイル（前回の未アップロード分）を再度アップロードする
+    - 同じパスのアップロードは並列に行わず、アップロード中に更新された場合は完了後に再アップロードする
+    """
+
+    def __init__(
+        self, staging: StoragePort, backend: StoragePort, config: TieredStorageConfig
+    ) -> None:
+        self.staging = staging
+        self.backend = backend
+        self.max_pending_uploads = config.max_pending_uploads
+        self.max_attempts = config.max_attempts
+
+        self._condition = threading.Condition()
+        # アップロード中のパスと、アップロード中に更新されたパス
+        self._inflight: set[str] = set()
+        self._dirty: set[str] = set()
+        # パスごとの更新回数（アップロード中に更新されたかの判定に使う）
+        self._generations: dict[str, int] = {}
+        # ステージング領域へ書き込み中のパス（書き込み中の件数）
+        # 書き込み中のファイルをアップロード完了時に削除しないようにする
+        self._writing: dict[str, int] = {}
+        self._errors: dict[str, BaseException] = {}
+        # パス → (登録時の更新回数, アップロード完了時に呼び出すコールバック)
+        self._callbacks: dict[str, list[tuple[int, Callable[[], None]]]] = {}
+        # upload_concurrencyを指定した場合、アップロードの並列数をリミッターで自動調整する
+        self.upload_limiter = (
+            AdaptiveConcurrencyLimiter(config.upload_concurrency)
+            if config.upload_concurrency is not None
+            else None
+        )
+        max_workers = (
+            config.upload_concurrency.max_limit
+            if config.upload_concurrency is not None
+            else config.max_concurrency
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="fino-tiered-upload"
+        )
+        self.recover()
+
+    @property
+    def pending_uploads(self) -> int:
+        with self._condition:
+            return len(self._inflight)
+
+    def exists(self, path: str) -> bool:
+        return self.staging.exists(path=path) or self.backend.exists(path=path)
+
+    def save(
+        self, path: str, file: bytes, metadata: Mapping[str, str] | None = None
+    ) -> None:
+        with self._condition:
+            # アップロード待ちが上限に達している場合は空きができるまで待つ（バックプレッシャー）
+            while (
+                path not in self._inflight
+                and len(self._inflight) >= self.max_pending_uploads
+            ):
+                _ = self._condition.wait()
+            self._generations[path] = self._generations.get(path, 0) + 1
+            self._writing[path] = self._writing.get(path, 0) + 1
+        try:
+            # メタデータはステージング領域に保存し、アップロード時にbackendへ引き継ぐ
+            self.staging.save(path=path, file=file, metadata=metadata)
+        except BaseException:
+            with self._condition:
+                self._finish_writing(path)
+            raise
+        # 書き込み中の解除とアップロードの登録は同じロック内で行う
+        self._enqueue(path, written=True)
+
+    def read(self, path: str, offset: int = 0, length: int | None = None) -> bytes:
+        try:
+            return self.staging.read(path=path, offset=offset, length=length)
+        except FileNotFoundError:
+            return self.backend.read(path=path, offset=offset, length=length)
+
+    def read_metadata(self, path: str) -> dict[str, str]:
+        try:
+            return self.staging.read_metadata(path=path)
+        except FileNotFoundError:
+            return self.backend.read_metadata(path=path)
+
+    def list_paths(self, prefix: str = "") -> Iterator[str]:
+        paths = set(self.staging.list_paths(prefix=prefix))
+        paths.update(self.backend.list_paths(prefix=prefix))
+        yield from sorted(paths)
+
+    def delete(self, path: str) -> None:
+        self.flush_path(path)
+        found = False
+        if self.staging.exists(path=path):
+            # アップロードに失敗してステージング領域に残っている場合
+            self.staging.delete(path=path)
+            found = True
+        if self.backend.exists(path=path):
+            self.backend.delete(path=path)
+            found = True
+        if not found:
+            raise FileNotFoundError(f"File not found: {path}")
+
+    def when_durable(self, path: str, callback: Callable[[], None]) -> None:
+        # アップロード待ち・アップロード中の場合は、backendへのアップロードが完了した時点で呼び出す
+        with self._condition:
+            if path in self._inflight or path in self._errors:
+                self._callbacks.setdefault(path, []).append(
+                    (self._generations.get(path, 0), callback)
+                )
+                return
+        self.backend.when_durable(path=path, callback=callback)
+
+    def mark_corrupt(self, path: str) -> None:
+        self.staging.mark_corrupt(path=path)
+        self.backend.mark_corrupt(path=path)
+
+    def flush(self) -> None:
+        """アップロード待ちのファイルがなくなるまで待ち、失敗したアップロードがあれば例外を送出する"""
+        self.staging.flush()
+        with self._condition:
+            while self._inflight:
+                _ = self._condition.wait()
+            errors, self._errors = self._errors, {}
+        self.backend.flush()
+        if errors:
+            path, error = next(iter(errors.items()))
+            raise IOError(
+                f"Failed to upload {len(errors)} file(s) to backend (first: {path})"
+            ) from error
+
+    def flush_path(self, path: str) -> None:
+        """指定したパスのアップロード完了を待つ"""
+        with self._condition:
+            while path in self._inflight:
+                _ = self._condition.wait()
+
+    def recover(self) -> None:
+        """ステージング領域に残っているファイルをアップロードし直す"""
+        for path in self.staging.list_paths():
+            self._enqueue(path)
+
+    def close(self) -> None:
+        """アップロード待ちのファイルをすべてアップロードしてから、ステージング領域と保存先を閉じる"""
+        with ExitStack() as stack:
+            _ = stack.callback(self.backend.close)
+            _ = stack.callback(self.staging.close)
+            _ = stack.callback(self._executor.shutdown, wait=True)
+            self.flush()
+
+    def _enqueue(self, path: str, written: bool = False) -> None:
+        with self._condition:
+            if written:
+                self._finish_writing(path)
+            if path in self._inflight:
+                self._dirty.add(path)
+                return
+            self._inflight.add(path)
+            _ = self._errors.pop(path, None)
+        _ = self._executor.submit(self._upload, path)
+
+    def _upload(self, path: str) -> None:
+        with self._condition:
+            generation = self._generations.get(path, 0)
+        try:
+            file = self.staging.read(path=path)
+            metadata = self.staging.read_metadata(path=path) or None
+            call_with_retry(
+                lambda: self._save_to_backend(path, file, metadata),
+                max_attempts=self.max_attempts,
+            )
+        except BaseException as e:
+            # 失敗した場合、コールバックは再アップロードが完了するまで保持する
+            with self._condition:
+                self._errors[path] = e
+                self._finish(path)
+            return
+
+        with self._condition:
+            _ = self._errors.pop(path, None)
+            # 今回アップロードした内容までに登録されたコールバックを取り出す
+            callbacks = self._callbacks.pop(path, [])
+            remaining = [c for c in callbacks if c[0] > generation]
+            if remaining:
+                self._callbacks[path] = remaining
+            # アップロード中に更新されておらず、書き込み中でもない場合のみステージング領域から削除する
+            if (
+                self._generations.get(path, 0) == generation
+                and path not in self._dirty
+                and path not in self._writing
+            ):
+                try:
+                    self.staging.delete(path=path)
+                except FileNotFoundError:
+                    pass
+                _ = self._generations.pop(path, None)
+            self._finish(path)
+        for registered, callback in callbacks:
+            if registered <= generation:
+                self.backend.when_durable(path=path, callback=callback)
+
+    def _save_to_backend(
+        self, path: str, file: bytes, metadata: Mapping[str, str] | None
+    ) -> None:
+        if self.upload_limiter is None:
+            self.backend.save(path=path, file=file, metadata=metadata)
+            return
+        # 試行ごとに枠を確保し、スロットリングやレイテンシの急増を並列数に反映する
+        with self.upload_limiter.slot():
+            self.backend.save(path=path, file=file, metadata=metadata)
+
+    def _finish_writing(self, path: str) -> None:
+        """ステージング領域への書き込みの完了処理（_conditionを保持した状態で呼び出す）"""
+        remaining = self._writing.get(path, 0) - 1
+        if remaining > 0:
+            self._writing[path] = remaining
+        else:
+            _ = self._writing.pop(path, None)
+
+    def _finish(self, path: str) -> None:
+        """アップロードの完了処理（_conditionを保持した状態で呼び出す）"""
+        if path in self._dirty:
+            self._dirty.discard(path)
+            _ = self._executor.submit(self._upload, path)
+            return
+        self._inflight.discard(path)
+        self._condition.notify_all()
@@ -0,0 +1,34 @@
+from typing import Literal
+
+from fino_ingestor.infrastructure.factory.client_registry import (
+    ClientRegistry,
+    default_client_registry,
+)
+from fino_ingestor.infrastructure.scheduler.bandwidth import BandwidthLimiter
+from fino_ingestor.interface.config.concurrency import BandwidthConfig
+
+
+def create_bandwidth_limiter(
+    config: BandwidthConfig,
+    direction: Literal["download", "upload"],
+    client_registry: ClientRegistry | None = default_client_registry,
+) -> BandwidthLimiter | None:
+    """
+    設定に応じた転送方向ごとの帯域リミッターを生成する（上限を指定していない場合はNone）。
+    client_registryを指定した場合、同じ方向・同じ上限のリミッターをプロセス内で共有する。
+    """
+    bytes_per_second = (
+        config.download_bytes_per_second
+        if direction == "download"
+        else config.upload_bytes_per_second
+    )
+    if bytes_per_second is None:
+        return None
+
+    burst_bytes = int(bytes_per_second * config.burst_seconds)
+    if client_registry is None:
+        return BandwidthLimiter(bytes_per_second, burst_bytes=burst_bytes)
+    return client_registry.get_or_create(
+        ("bandwidth", direction, bytes_per_second, burst_bytes),
+        lambda: BandwidthLimiter(bytes_per_second, burst_bytes=burst_bytes),
+    )
@@ -0,0 +1,142 @@
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar, cast
+
+T = TypeVar("T")
+
+
+class ClientRegistry:
+    """
+    外部サービスのクライアントをプロセス内で共有するレジストリ
+    - 設定から導出したキー単位でクライアントを1つだけ生成し、以降は同じインスタンスを返す
+    - 生成・破棄はロックで保護されるため、複数スレッドから安全に利用できる
+    - get_or_createの呼び出しごとに参照数を数え、releaseで参照がなくなったクライアントを破棄する
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: dict[Hashable, Any] = {}
+        self._closers: dict[Hashable, Callable[[Any], None]] = {}
+        self._references: dict[Hashable, int] = {}
+
+    def get_or_create(
+        self,
+        key: Hashable,
+        factory: Callable[[], T],
+        close: Callable[[T], None] | None = None,
+    ) -> T:
+        with self._lock:
+            if key in self._clients:
+                self._references[key] += 1
+                return cast(T, self._clients[key])
+
+            # クライアント生成（認証情報の解決など）もロック内で行い、二重生成を防ぐ
+            client = factory()
+            self._clients[key] = client
+            self._references[key] = 1
+            if close is not None:
+                self._closers[key] = cast(Callable[[Any], None], close)
+            return client
+
+    def release(self, key: Hashable) -> None:
+        """get_or_createで取得した参照を1つ返却し、参照がなくなったクライアントを破棄する"""
+        with self._lock:
+            if key not in self._clients:
+                return
+            self._references[key] -= 1
+            if self._references[key] > 0:
+                return
+        self.close(key)
+
+    def close(self, key: Hashable) -> None:
+        """指定したキーのクライアントを破棄する（参照が残っていても破棄する）"""
+        with self._lock:
+            client = self._clients.pop(key, None)
+            closer = self._closers.pop(key, None)
+            _ = self._references.pop(key, None)
+        if client is not None and closer is not None:
+            closer(client)
+
+    def shutdown(self) -> None:
+        """登録されているすべてのクライアントを破棄する"""
+        with self._lock:
+            clients = list(self._clients.items())
+            closers = dict(self._closers)
+            self._clients.clear()
+            self._closers.clear()
+            self._references.clear()
+
+        errors: list[Exception] = []
+        for key, client in clients:
+            closer = closers.get(key)
+            if closer is None:
+                continue
+            try:
+                closer(client)
+            except Exception as e:  # すべてのクライアントの破棄を試みる
+                errors.append(e)
+        if errors:
+            raise errors[0]
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._clients
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+
+class ClientLease(ClientRegistry):
+    """
+    共有のレジストリからクライアントを借りるレジストリ
+    - 同じキーのクライアントは共有のレジストリから1回だけ取得し、以降は同じインスタンスを返す
+    - shutdownでは、このリースが取得したクライアントの参照だけを共有のレジストリに返却する
+      （他の利用者が参照しているクライアントは破棄されない）
+    """
+
+    def __init__(self, registry: ClientRegistry) -> None:
+        super().__init__()
+        self.registry = registry
+
+    def get_or_create(
+        self,
+        key: Hashable,
+        factory: Callable[[], T],
+        close: Callable[[T], None] | None = None,
+    ) -> T:
+        with self._lock:
+            if key in self._clients:
+                return cast(T, self._clients[key])
+            client = self.registry.get_or_create(key, factory, close)
+            self._clients[key] = client
+            return client
+
+    def release(self, key: Hashable) -> None:
+        self.close(key)
+
+    def close(self, key: Hashable) -> None:
+        """指定したキーのクライアントの参照を共有のレジストリに返却する"""
+        with self._lock:
+            if self._clients.pop(key, None) is None:
+                return
+        self.registry.release(key)
+
+    def shutdown(self) -> None:
+        """このリースが取得したすべてのクライアントの参照を返却する"""
+        with self._lock:
+            keys = list(self._clients)
+            self._clients.clear()
+
+        errors: list[Exception] = []
+        for key in keys:
+            try:
+                self.registry.release(key)
+            except Exception as e:  # すべての参照の返却を試みる
+                errors.append(e)
+        if errors:
+            raise errors[0]
+
+
+default_client_registry = ClientRegistry()
+"""プロセス全体で共有するクライアントレジストリ"""
@@ -1,12 +1,36 @@
 from fino_ingestor.infrastructure.adapter.disclosure_source.edinet import (
     EdinetAdapter,
     EdinetDocumentSearchCriteria,
+    create_edinet_client,
 )
+from fino_ingestor.infrastructure.factory.client_registry import (
+    ClientRegistry,
+    default_client_registry,
+)
+from fino_ingestor.infrastructure.scheduler.bandwidth import BandwidthLimiter
 from fino_ingestor.interface.config.disclosure import EdinetConfig
-from fino_ingestor.interface.port.disclosure_source import DisclosureSourcePort
+from fino_ingestor.interface.port.disclosure_source import (
+    WatchableDisclosureSourcePort,
+)
 
 
 def create_disclosure_source(
     config: EdinetConfig,
-) -> DisclosureSourcePort[EdinetDocumentSearchCriteria]:
-    return EdinetAdapter(config=config)
+    client_registry: ClientRegistry | None = default_client_registry,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+) -> WatchableDisclosureSourcePort[EdinetDocumentSearchCriteria]:
+    """
+    設定に応じた開示ソースを生成する。
+    client_registryを指定した場合、同じAPIキーのEDINETクライアントを共有する（Noneの場合は毎回生成）。
+    bandwidth_limiterを指定した場合、書類のダウンロードをその帯域の上限内に抑える。
+    """
+    if client_registry is None:
+        return EdinetAdapter(config=config, bandwidth_limiter=bandwidth_limiter)
+
+    api_key = config.api_key
+    client = client_registry.get_or_create(
+        ("edinet", api_key), lambda: create_edinet_client(api_key)
+    )
+    return EdinetAdapter(
+        config=config, client=client, bandwidth_limiter=bandwidth_limiter
+    )
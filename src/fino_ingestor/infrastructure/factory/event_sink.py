@@ -0,0 +1,21 @@
+from fino_ingestor.interface.config.event import (
+    EventSinkConfig,
+    JournalEventSinkConfig,
+)
+from fino_ingestor.interface.port.event_sink import EventSinkPort
+
+
+def create_event_sink(config: EventSinkConfig) -> EventSinkPort:
+    """設定に応じた保存イベントの通知先を生成する"""
+    if isinstance(config, JournalEventSinkConfig):
+        from fino_ingestor.infrastructure.adapter.event_sink.journal import (
+            JournalEventSink,
+        )
+
+        return JournalEventSink(config=config)
+    else:
+        from fino_ingestor.infrastructure.adapter.event_sink.unix_socket import (
+            UnixSocketEventSink,
+        )
+
+        return UnixSocketEventSink(config=config)
@@ -1,11 +1,99 @@
-from fino_ingestor.infrastructure.adapter.storage.local import LocalStorage
-from fino_ingestor.infrastructure.adapter.storage.s3 import S3Storage
-from fino_ingestor.interface.config.storage import LocalStorageConfig, S3StorageConfig
+from fino_ingestor.infrastructure.factory.client_registry import (
+    ClientRegistry,
+    default_client_registry,
+)
+from fino_ingestor.infrastructure.scheduler.bandwidth import BandwidthLimiter
+from fino_ingestor.interface.config.storage import (
+    ContentAddressedStorageConfig,
+    FanOutStorageConfig,
+    LocalStorageConfig,
+    ReadCacheStorageConfig,
+    StorageConfig,
+    TieredStorageConfig,
+)
 from fino_ingestor.interface.port.storage import StoragePort
 
 
-def create_storage(config: LocalStorageConfig | S3StorageConfig) -> StoragePort:
+def create_storage(
+    config: StorageConfig,
+    client_registry: ClientRegistry | None = default_client_registry,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+) -> StoragePort:
+    """
+    設定に応じたストレージを生成する。
+    client_registryを指定した場合、同じ設定のS3クライアントを共有する（Noneの場合は毎回生成）。
+    bandwidth_limiterを指定した場合、S3へのアップロードをその帯域の上限内に抑える。
+    """
+    # 利用するバックエンドのみを読み込む（boto3などの重い依存を遅延させるため）
     if isinstance(config, LocalStorageConfig):
+        from fino_ingestor.infrastructure.adapter.storage.local import LocalStorage
+
         return LocalStorage(config=config)
+    elif isinstance(config, ContentAddressedStorageConfig):
+        from fino_ingestor.infrastructure.adapter.storage.content_addressed import (
+            ContentAddressedStorage,
+        )
+
+        backend = create_storage(
+            config.backend,
+            client_registry=client_registry,
+            bandwidth_limiter=bandwidth_limiter,
+        )
+        return ContentAddressedStorage(backend=backend, config=config)
+    elif isinstance(config, TieredStorageConfig):
+        from fino_ingestor.infrastructure.adapter.storage.local import LocalStorage
+        from fino_ingestor.infrastructure.adapter.storage.tiered import TieredStorage
+
+        backend = create_storage(
+            config.backend,
+            client_registry=client_registry,
+            bandwidth_limiter=bandwidth_limiter,
+        )
+        return TieredStorage(
+            staging=LocalStorage(config=config.staging), backend=backend, config=config
+        )
+    elif isinstance(config, ReadCacheStorageConfig):
+        from fino_ingestor.infrastructure.adapter.storage.local import LocalStorage
+        from fino_ingestor.infrastructure.adapter.storage.read_cache import (
+            ReadCacheStorage,
+        )
+
+        backend = create_storage(
+            config.backend,
+            client_registry=client_registry,
+            bandwidth_limiter=bandwidth_limiter,
+        )
+        cache = LocalStorage(config=LocalStorageConfig(base_dir=config.cache_dir))
+        return ReadCacheStorage(backend=backend, cache=cache, config=config)
+    elif isinstance(config, FanOutStorageConfig):
+        from fino_ingestor.infrastructure.adapter.storage.fan_out import (
+            FanOutStorage,
+        )
+
+        backends = [
+            create_storage(
+                backend,
+                client_registry=client_registry,
+                bandwidth_limiter=bandwidth_limiter,
+            )
+            for backend in config.backends
+        ]
+        return FanOutStorage(backends=backends, config=config)
     else:
-        return S3Storage(config=config)
+        from fino_ingestor.infrastructure.adapter.storage.s3 import (
+            S3Storage,
+            create_s3_client,
+        )
+
+        if client_registry is None:
+            return S3Storage(config=config, bandwidth_limiter=bandwidth_limiter)
+
+        region = config.region
+        s3_client = client_registry.get_or_create(
+            ("s3", region),
+            lambda: create_s3_client(region),
+            close=lambda client: client.close(),
+        )
+        return S3Storage(
+            config=config, s3_client=s3_client, bandwidth_limiter=bandwidth_limiter
+        )
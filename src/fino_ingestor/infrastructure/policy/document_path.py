@@ -1,21 +1,211 @@
+import hashlib
 import zipfile
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from datetime import date
 from pathlib import Path
+from typing import ClassVar, Self
 
 from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.value.disclosure_source import DisclosureSource
+from fino_ingestor.interface.config.repository import PathLayout
+
+ZIP_SUFFIX = ".zip"
 
 
-# Finoのデータレイクストレージのパス構造に合わせたポリシー
-# @see: .cursor/rules/project.mdc#Storage Rules
 @dataclass(frozen=True, slots=True)
-class DocumentPathPolicy:
-    """文書のパスを生成するポリシー"""
+class DocumentPathKey:
+    """パスの生成・解析に必要な書類の属性"""
+
+    source: str
+    ticker: str
+    disclosure_type: str
+    document_id: str
+    disclosure_date: date
+    format_type: str
+
+    @classmethod
+    def from_document(cls, document: Document) -> Self:
+        return cls(
+            source=document.disclosure_source.value,
+            ticker=document.ticker.value,
+            disclosure_type=document.disclosure_type.value,
+            document_id=document.document_id.value,
+            disclosure_date=document.disclosure_date.value,
+            format_type=document.filing_format.value,
+        )
+
+    @property
+    def file_stem(self) -> str:
+        return (
+            f"{self.document_id}_{self.disclosure_date.isoformat()}_{self.format_type}"
+        )
+
+
+class PathPolicy(ABC):
+    """
+    文書のパスを生成・解析するポリシー
+    parse_pathはgenerate_pathの逆変換で、レイアウト間の移行に使用する。
+    """
+
+    layout: ClassVar[PathLayout]
+    directory_depth: ClassVar[int]
+    """ファイル名より前のディレクトリ階層数"""
+
+    def generate_path(self, document: Document, is_zip: bool = False) -> str:
+        return self.build_path(DocumentPathKey.from_document(document), is_zip=is_zip)
+
+    def build_path(self, key: DocumentPathKey, is_zip: bool = False) -> str:
+        zip_suffix = ZIP_SUFFIX if is_zip else ""
+        directories = "/".join(self._build_directories(key))
+        return f"{directories}/{key.file_stem}{zip_suffix}"
+
+    def parse_path(self, path: str) -> tuple[DocumentPathKey, str] | None:
+        """
+        パスを (書類の属性, 接尾辞) に分解する
+        接尾辞はzipの場合は".zip"、members形式の場合は"/<メンバー名>"となる。
+        このレイアウトのパスでない場合はNoneを返す。
+        """
+        parts = path.strip("/").split("/")
+        if len(parts) <= self.directory_depth:
+            return None
+        file_name = parts[self.directory_depth]
+        members = parts[self.directory_depth + 1 :]
+        if members:
+            stem, suffix = file_name, "/" + "/".join(members)
+        elif file_name.endswith(ZIP_SUFFIX):
+            stem, suffix = file_name.removesuffix(ZIP_SUFFIX), ZIP_SUFFIX
+        else:
+            return None
+
+        stem_parts = stem.rsplit("_", 2)
+        if len(stem_parts) != 3:
+            return None
+        document_id, raw_date, format_type = stem_parts
+        try:
+            disclosure_date = date.fromisoformat(raw_date)
+        except ValueError:
+            return None
+
+        directories = self._parse_directories(parts[: self.directory_depth])
+        if directories is None:
+            return None
+        source, ticker, disclosure_type = directories
+        key = DocumentPathKey(
+            source=source,
+            ticker=ticker,
+            disclosure_type=disclosure_type,
+            document_id=document_id,
+            disclosure_date=disclosure_date,
+            format_type=format_type,
+        )
+        # 生成し直したパスと一致する場合のみ、このレイアウトのパスとみなす
+        if self.build_path(key) + suffix != path.strip("/"):
+            return None
+        return key, suffix
+
+    @abstractmethod
+    def _build_directories(self, key: DocumentPathKey) -> list[str]: ...
+
+    @abstractmethod
+    def _parse_directories(self, directories: list[str]) -> tuple[str, str, str] | None:
+        """ディレクトリから (source, ticker, disclosure_type) を取り出す"""
 
     @staticmethod
-    def generate_path(document: Document, is_zip: bool = False) -> str:
-        zip_suffix = ".zip" if is_zip else ""
-        return f"{document.disclosure_source.value}/{document.ticker.value}/{document.disclosure_type.value}/{document.document_id.value}_{document.disclosure_date.value.isoformat()}_{document.filing_format.value}{zip_suffix}"  # noqa: E501
+    def generate_bundle_prefix(source: DisclosureSource, disclosure_date: date) -> str:
+        """日単位のバンドルを保存するprefix"""
+        return f"{source.value}/_bundles/{disclosure_date.isoformat()}/"
 
     @staticmethod
     def is_zip(file_path: Path) -> bool:
         return zipfile.is_zipfile(file_path)
+
+
+# Finoのデータレイクストレージのパス構造に合わせたポリシー
+# @see: .cursor/rules/project.mdc#Storage Rules
+@dataclass(frozen=True, slots=True)
+class DocumentPathPolicy(PathPolicy):
+    """
+    ティッカー単位のレイアウト（デフォルト）
+    > EDINET/12345/ANNUAL_REPORT/<document_id>_<date>_<format>.zip
+    """
+
+    layout: ClassVar[PathLayout] = "ticker"
+    directory_depth: ClassVar[int] = 3
+
+    def _build_directories(self, key: DocumentPathKey) -> list[str]:
+        return [key.source, key.ticker, key.disclosure_type]
+
+    def _parse_directories(self, directories: list[str]) -> tuple[str, str, str] | None:
+        source, ticker, disclosure_type = directories
+        return source, ticker, disclosure_type
+
+
+@dataclass(frozen=True, slots=True)
+class HivePartitionedPathPolicy(PathPolicy):
+    """
+    開示日で分割したHive形式のレイアウト
+    月単位のprefixで一覧を取得でき、Athenaなどからパーティションとして参照できる。
+    > source=EDINET/year=2024/month=03/ticker=12345/type=ANNUAL_REPORT/<document_id>_<date>_<format>.zip
+    """
+
+    layout: ClassVar[PathLayout] = "hive"
+    directory_depth: ClassVar[int] = 5
+
+    def _build_directories(self, key: DocumentPathKey) -> list[str]:
+        return [
+            f"source={key.source}",
+            f"year={key.disclosure_date.year:04d}",
+            f"month={key.disclosure_date.month:02d}",
+            f"ticker={key.ticker}",
+            f"type={key.disclosure_type}",
+        ]
+
+    def _parse_directories(self, directories: list[str]) -> tuple[str, str, str] | None:
+        values: dict[str, str] = {}
+        for directory in directories:
+            name, sep, value = directory.partition("=")
+            if not sep:
+                return None
+            values[name] = value
+        try:
+            return values["source"], values["ticker"], values["type"]
+        except KeyError:
+            return None
+
+    @staticmethod
+    def generate_month_prefix(source: DisclosureSource, year: int, month: int) -> str:
+        """指定した月に開示された書類のprefix"""
+        return f"source={source.value}/year={year:04d}/month={month:02d}/"
+
+
+@dataclass(frozen=True, slots=True)
+class HashedShardPathPolicy(PathPolicy):
+    """
+    書類IDのハッシュで分散させたレイアウト
+    1ディレクトリ内のファイル数を抑えるため、ローカルディスク向け。
+    > EDINET/ab/cd/12345/ANNUAL_REPORT/<document_id>_<date>_<format>.zip
+    """
+
+    layout: ClassVar[PathLayout] = "hashed"
+    directory_depth: ClassVar[int] = 5
+
+    def _build_directories(self, key: DocumentPathKey) -> list[str]:
+        digest = hashlib.sha1(key.document_id.encode("utf-8"), usedforsecurity=False)
+        shard = digest.hexdigest()
+        return [key.source, shard[:2], shard[2:4], key.ticker, key.disclosure_type]
+
+    def _parse_directories(self, directories: list[str]) -> tuple[str, str, str] | None:
+        source, _, _, ticker, disclosure_type = directories
+        return source, ticker, disclosure_type
+
+
+_PATH_POLICIES: dict[PathLayout, PathPolicy] = {
+    "ticker": DocumentPathPolicy(),
+    "hive": HivePartitionedPathPolicy(),
+    "hashed": HashedShardPathPolicy(),
+}
+
+
+def create_path_policy(layout: PathLayout) -> PathPolicy:
+    return _PATH_POLICIES[layout]
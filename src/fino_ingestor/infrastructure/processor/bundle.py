@@ -0,0 +1,76 @@
+import json
+import struct
+from dataclasses import dataclass, field
+
+# バンドル末尾のフッター: マジックナンバー / インデックスの開始位置 / インデックスのバイト数
+BUNDLE_MAGIC = b"FINOBNDL"
+_FOOTER_FORMAT = ">8sQQ"
+BUNDLE_FOOTER_SIZE = struct.calcsize(_FOOTER_FORMAT)
+
+
+@dataclass(frozen=True, slots=True)
+class BundleEntry:
+    offset: int
+    """バンドル内の開始位置"""
+    length: int
+    """メンバーのバイト数"""
+
+
+@dataclass(slots=True)
+class BundleWriter:
+    """
+    小さな書類を1つのバンドルオブジェクトにまとめる
+    [メンバー1][メンバー2]...[インデックス(JSON)][フッター] の形式で書き出すため、
+    読み込み時はフッター → インデックス → メンバーの順にレンジ読み込みで取得できる。
+    """
+
+    _members: dict[str, bytes] = field(default_factory=lambda: {})
+    _index: dict[str, BundleEntry] = field(default_factory=lambda: {})
+    size: int = 0
+    """メンバーの合計バイト数"""
+
+    def add(self, key: str, data: bytes) -> None:
+        if key in self._index:
+            raise ValueError(f"Duplicate bundle member: {key}")
+        self._index[key] = BundleEntry(offset=self.size, length=len(data))
+        self._members[key] = data
+        self.size += len(data)
+
+    def get(self, key: str) -> bytes | None:
+        return self._members.get(key)
+
+    @property
+    def index(self) -> dict[str, BundleEntry]:
+        return dict(self._index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def build(self) -> bytes:
+        index = json.dumps(
+            {key: [entry.offset, entry.length] for key, entry in self._index.items()},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        footer = struct.pack(_FOOTER_FORMAT, BUNDLE_MAGIC, self.size, len(index))
+        return b"".join([*self._members.values(), index, footer])
+
+
+def parse_bundle_footer(footer: bytes) -> tuple[int, int]:
+    """フッターからインデックスの (開始位置, バイト数) を取得する"""
+    if len(footer) != BUNDLE_FOOTER_SIZE:
+        raise ValueError("Invalid bundle footer size")
+    magic, index_offset, index_length = struct.unpack(_FOOTER_FORMAT, footer)
+    if magic != BUNDLE_MAGIC:
+        raise ValueError("Invalid bundle magic number")
+    return index_offset, index_length
+
+
+def parse_bundle_index(index: bytes) -> dict[str, BundleEntry]:
+    raw: dict[str, list[int]] = json.loads(index)
+    return {
+        key: BundleEntry(offset=offset, length=length)
+        for key, (offset, length) in raw.items()
+    }
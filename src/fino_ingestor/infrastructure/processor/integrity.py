@@ -0,0 +1,121 @@
+import hashlib
+import io
+import zipfile
+import zlib
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.value.format_type import FormatTypeEnum
+from fino_ingestor.infrastructure.scheduler.concurrency import excluded_from_latency
+from fino_ingestor.interface.config.integrity import IntegrityConfig
+from fino_ingestor.util.retry import call_with_retry
+
+# CRC検査でzipメンバーを読み出す際のチャンクサイズ
+_READ_CHUNK_SIZE = 1024 * 1024
+# PDFの終端マーカーを探す末尾の範囲（仕様上、%%EOFは末尾1024バイト以内にある）
+_PDF_TRAILER_SIZE = 1024
+# EDINETがzipパッケージで提供するフォーマット
+_ZIP_FORMATS = frozenset({FormatTypeEnum.XBRL, FormatTypeEnum.CSV})
+
+
+class CorruptPackageError(IOError):
+    """ダウンロードした書類が壊れている（途中で切れている・形式が異なるなど）"""
+
+
+@dataclass(frozen=True, slots=True)
+class VerifiedPackage:
+    sha256: str
+    """内容のSHA-256（16進数）"""
+    size: int
+    """バイト数"""
+
+
+class PackageVerifier:
+    """
+    ダウンロードした書類を保存前に検証する
+    - zip: セントラルディレクトリを解析し、全メンバーを展開してCRCを検査する
+    - PDF: ヘッダーと終端マーカー（%%EOF）の有無を確認する
+    CRC検査とハッシュ計算はワーカープールで並列に行う（zlib・hashlibはGILを解放する）。
+    """
+
+    def __init__(self, config: IntegrityConfig) -> None:
+        self.max_workers = config.max_workers
+        self.max_attempts = config.max_attempts
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.max_workers, thread_name_prefix="fino-verify"
+        )
+
+    def verify(self, document: Document, file: bytes) -> VerifiedPackage:
+        """書類を検証してハッシュを返す。壊れている場合はCorruptPackageErrorを送出する"""
+        digest = self._executor.submit(_sha256, file)
+        format_type = document.filing_format.enum
+        if format_type in _ZIP_FORMATS:
+            self._verify_zip(file)
+        elif format_type is FormatTypeEnum.PDF:
+            self._verify_pdf(file)
+        return VerifiedPackage(sha256=digest.result(), size=len(file))
+
+    def fetch_verified(
+        self, document: Document, download: Callable[[], bytes]
+    ) -> tuple[bytes, VerifiedPackage]:
+        """
+        downloadで取得した書類を検証して返す
+        途中で切れたレスポンスなどは保存させず、max_attempts回までダウンロードし直す。
+        """
+
+        def attempt() -> tuple[bytes, VerifiedPackage]:
+            file = download()
+            # 検証（CRC検査など）の時間はダウンロードのレイテンシに含めない
+            with excluded_from_latency():
+                return file, self.verify(document, file)
+
+        return call_with_retry(
+            attempt, max_attempts=self.max_attempts, retry_on=(CorruptPackageError,)
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def _verify_zip(self, file: bytes) -> None:
+        try:
+            # 末尾のセントラルディレクトリを解析する（途中で切れている場合はここで失敗する）
+            archive = zipfile.ZipFile(io.BytesIO(file))
+        except zipfile.BadZipFile as e:
+            raise CorruptPackageError(f"Invalid zip package: {e}") from e
+
+        with archive:
+            # メンバーをワーカー数に分けて展開する（ZipFileは複数スレッドからの読み出しに対応している）
+            infos = [info for info in archive.infolist() if not info.is_dir()]
+            groups = [infos[i :: self.max_workers] for i in range(self.max_workers)]
+            futures: list[Future[None]] = [
+                self._executor.submit(_check_crc, archive, group)
+                for group in groups
+                if group
+            ]
+            errors = [e for future in futures if (e := future.exception()) is not None]
+        if errors:
+            raise errors[0]
+
+    @staticmethod
+    def _verify_pdf(file: bytes) -> None:
+        if not file.startswith(b"%PDF-"):
+            raise CorruptPackageError("Invalid PDF header")
+        if b"%%EOF" not in file[-_PDF_TRAILER_SIZE:]:
+            raise CorruptPackageError("PDF trailer not found (truncated)")
+
+
+def _sha256(file: bytes) -> str:
+    return hashlib.sha256(file).hexdigest()
+
+
+def _check_crc(archive: zipfile.ZipFile, infos: list[zipfile.ZipInfo]) -> None:
+    """メンバーを読み切り、CRCを検査する（不一致の場合はBadZipFileが送出される）"""
+    for info in infos:
+        try:
+            with archive.open(info) as stream:
+                while stream.read(_READ_CHUNK_SIZE):
+                    pass
+        except (zipfile.BadZipFile, zlib.error, EOFError) as e:
+            raise CorruptPackageError(f"Corrupt zip member {info.filename}: {e}") from e
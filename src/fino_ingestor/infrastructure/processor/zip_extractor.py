@@ -0,0 +1,87 @@
+import io
+import zipfile
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from pathlib import PurePosixPath
+
+from fino_ingestor.interface.config.repository import ZipExtractionConfig
+
+# zipメンバーを読み出す際のチャンクサイズ
+_READ_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class ZipMember:
+    name: str
+    """zip内のメンバー名"""
+    data: bytes
+    """展開済みのメンバーデータ"""
+
+
+class ZipExtractor:
+    """
+    EDINETのzipパッケージから必要なメンバーのみを抽出する
+    インスタンス文書やリンクベースなど、パターンに一致するメンバーのみを対象とする。
+    """
+
+    def __init__(self, config: ZipExtractionConfig) -> None:
+        self.include_patterns = tuple(config.include_patterns)
+
+    @staticmethod
+    def is_zip(file: bytes) -> bool:
+        return zipfile.is_zipfile(io.BytesIO(file))
+
+    @staticmethod
+    def normalize_name(name: str) -> str | None:
+        """
+        メンバー名を正規化する（絶対パスや".."を含む名前など、展開先の外を指す場合はNone）
+        fnmatchの"*"は"/"や".."にも一致するため、パターンとの照合前に検証する。
+        """
+        path = PurePosixPath(name)
+        if path.is_absolute() or ".." in path.parts or "\\" in name:
+            return None
+        normalized = str(path)
+        return normalized if normalized not in ("", ".") else None
+
+    def matches(self, name: str) -> bool:
+        normalized = self.normalize_name(name)
+        if normalized is None:
+            return False
+        return any(
+            fnmatchcase(normalized, pattern) for pattern in self.include_patterns
+        )
+
+    def extract(self, file: bytes) -> list[ZipMember]:
+        """パターンに一致するメンバーをzipの格納順に展開する（メンバー名は正規化して返す）"""
+        members: list[ZipMember] = []
+        with zipfile.ZipFile(io.BytesIO(file)) as archive:
+            for info in archive.infolist():
+                if info.is_dir() or not self.matches(info.filename):
+                    continue
+                name = self.normalize_name(info.filename)
+                assert name is not None  # noqa: S101
+                members.append(
+                    ZipMember(name=name, data=self._read_member(archive, info))
+                )
+        return members
+
+    def repack(self, members: list[ZipMember]) -> bytes:
+        """抽出したメンバーのみを含むzipを作成する"""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(
+            buffer, mode="w", compression=zipfile.ZIP_DEFLATED
+        ) as archive:
+            for member in members:
+                if self.normalize_name(member.name) != member.name:
+                    raise ValueError(f"Unsafe zip member name: {member.name!r}")
+                archive.writestr(member.name, member.data)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _read_member(archive: zipfile.ZipFile, info: zipfile.ZipInfo) -> bytes:
+        # メンバー単位でストリーミング展開する（CRCは読み切り時に検証される）
+        chunks: list[bytes] = []
+        with archive.open(info) as stream:
+            while chunk := stream.read(_READ_CHUNK_SIZE):
+                chunks.append(chunk)
+        return b"".join(chunks)
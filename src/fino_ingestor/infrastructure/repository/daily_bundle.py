@@ -0,0 +1,161 @@
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from datetime import date
+
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.value.disclosure_source import DisclosureSource
+from fino_ingestor.infrastructure.policy.document_path import (
+    DocumentPathPolicy,
+    PathPolicy,
+)
+from fino_ingestor.infrastructure.processor.bundle import (
+    BUNDLE_FOOTER_SIZE,
+    BundleEntry,
+    BundleWriter,
+    parse_bundle_footer,
+    parse_bundle_index,
+)
+from fino_ingestor.interface.config.repository import BundlingConfig
+from fino_ingestor.interface.port.storage import StoragePort
+
+# バンドルの単位（開示ソース, 開示日）
+BundleKey = tuple[DisclosureSource, date]
+
+
+class DailyBundler:
+    """
+    小さな書類を開示日単位のバンドルにまとめて保存する
+    - 書き込み: 同じ日の書類をメモリ上で束ね、上限サイズに達した時点かflush時に1オブジェクトとして保存する
+      優先度順・並列の収集では開示日が入り混じるため、開示日ごとに書き込み待ちのバンドルを保持する
+    - 読み込み: バンドル末尾のインデックスをレンジ読み込みで取得し、メンバー単位でレンジ読み込みする
+    """
+
+    def __init__(
+        self,
+        storage: StoragePort,
+        config: BundlingConfig,
+        path_policy: PathPolicy | None = None,
+    ) -> None:
+        self._storage = storage
+        self._path_policy = path_policy or DocumentPathPolicy()
+        self.max_member_bytes = config.max_member_bytes
+        self.max_bundle_bytes = config.max_bundle_bytes
+        self.max_buffered_bytes = config.max_buffered_bytes
+
+        self._lock = threading.RLock()
+        # 書き込み待ちのバンドル
+        self._pending: dict[BundleKey, BundleWriter] = {}
+        # 保存済みバンドルのインデックス（書類のパス → (バンドルのパス, 位置)）
+        self._indexes: dict[BundleKey, dict[str, tuple[str, BundleEntry]]] = {}
+        # 書き込み待ちのバンドルの合計バイト数
+        self._buffered_bytes = 0
+        # 書き込み待ちのバンドルの書類を保存した時点で呼び出すコールバック
+        self._on_stored: dict[BundleKey, list[Callable[[], None]]] = {}
+
+    def accepts(self, file: bytes) -> bool:
+        return len(file) <= self.max_member_bytes
+
+    def add(
+        self,
+        document: Document,
+        path: str,
+        file: bytes,
+        on_stored: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        書類をバンドルに追加する
+        on_storedは書類を含むバンドルの書き込みが確定した時点で呼び出す（書き込み待ちのバンドルに
+        同じパスの書類が含まれている場合は追加せず、呼び出さない）。
+        """
+        key = self._key_of(document)
+        with self._lock:
+            writer = self._pending.setdefault(key, BundleWriter())
+            if path not in writer:
+                writer.add(path, file)
+                self._buffered_bytes += len(file)
+                if on_stored is not None:
+                    self._on_stored.setdefault(key, []).append(on_stored)
+            if writer.size >= self.max_bundle_bytes:
+                self._write(key)
+            # メモリ上の合計が上限を超えた場合は、大きいバンドルから保存する
+            while self._buffered_bytes > self.max_buffered_bytes and self._pending:
+                self._write(max(self._pending, key=lambda k: self._pending[k].size))
+
+    def contains(self, document: Document, path: str) -> bool:
+        key = self._key_of(document)
+        with self._lock:
+            writer = self._pending.get(key)
+            if writer is not None and path in writer:
+                return True
+            return path in self._load_index(key)
+
+    def read(self, document: Document, path: str) -> bytes | None:
+        """バンドルに含まれる書類を読み込む。含まれない場合はNoneを返す"""
+        key = self._key_of(document)
+        with self._lock:
+            writer = self._pending.get(key)
+            if writer is not None and path in writer:
+                return writer.get(path)
+            located = self._load_index(key).get(path)
+        if located is None:
+            return None
+
+        bundle_path, entry = located
+        return self._storage.read(
+            path=bundle_path, offset=entry.offset, length=entry.length
+        )
+
+    def flush(self) -> None:
+        with self._lock:
+            for key in list(self._pending):
+                self._write(key)
+
+    def _write(self, key: BundleKey) -> None:
+        writer = self._pending.get(key)
+        if writer is None or len(writer) == 0:
+            _ = self._pending.pop(key, None)
+            return
+
+        source, disclosure_date = key
+        prefix = self._path_policy.generate_bundle_prefix(source, disclosure_date)
+        # 複数プロセスから同じ日のバンドルを書き込んでも衝突しない名前にする
+        bundle_path = (
+            f"{prefix}{int(time.time() * 1000):013d}-{uuid.uuid4().hex[:8]}.bundle"
+        )
+        # 保存に失敗した場合は書き込み待ちのまま残し、次回のflushで再度保存する
+        self._storage.save(path=bundle_path, file=writer.build())
+        del self._pending[key]
+        self._buffered_bytes -= writer.size
+
+        index = self._load_index(key)
+        for member_path, entry in writer.index.items():
+            index[member_path] = (bundle_path, entry)
+        for on_stored in self._on_stored.pop(key, []):
+            self._storage.when_durable(path=bundle_path, callback=on_stored)
+
+    def _load_index(self, key: BundleKey) -> dict[str, tuple[str, BundleEntry]]:
+        """保存済みバンドルのインデックスを読み込む（日単位で1度だけ）"""
+        index = self._indexes.get(key)
+        if index is not None:
+            return index
+
+        index = {}
+        source, disclosure_date = key
+        prefix = self._path_policy.generate_bundle_prefix(source, disclosure_date)
+        for bundle_path in self._storage.list_paths(prefix=prefix):
+            footer = self._storage.read(path=bundle_path, offset=-BUNDLE_FOOTER_SIZE)
+            index_offset, index_length = parse_bundle_footer(footer)
+            raw_index = self._storage.read(
+                path=bundle_path, offset=index_offset, length=index_length
+            )
+            for member_path, entry in parse_bundle_index(raw_index).items():
+                index[member_path] = (bundle_path, entry)
+
+        self._indexes[key] = index
+        return index
+
+    @staticmethod
+    def _key_of(document: Document) -> BundleKey:
+        return document.disclosure_source, document.disclosure_date.value
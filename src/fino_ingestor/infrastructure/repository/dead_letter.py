@@ -0,0 +1,99 @@
+import json
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+
+from fino_ingestor.domain.entity.dead_letter import DeadLetter
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.repository.dead_letter import DeadLetterRepository
+from fino_ingestor.interface.port.storage import StoragePort
+
+DEAD_LETTER_PREFIX = "_dead_letters"
+"""デッドレターの保存先（書類のレイアウトとは別の階層に保存する）"""
+_RECORD_SUFFIX = ".json"
+
+
+class DeadLetterRepositoryImpl(DeadLetterRepository):
+    """
+    失敗した書類を書類と同じストレージにJSONとして保存する
+    {prefix}/{開示元}/{書類ID}.json に1書類1オブジェクトで保存するため、
+    プロセスが異常終了しても記録が残り、次回の実行から再取得できる。
+    """
+
+    def __init__(
+        self,
+        storage: StoragePort,
+        prefix: str = DEAD_LETTER_PREFIX,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self.storage = storage
+        self.prefix = prefix.strip("/")
+        self._clock = clock
+        # 同じ書類の失敗回数の読み込み・更新が競合しないよう、書類ごとにロックする
+        # （異なる書類の記録はストレージへの往復を並列に行う）
+        # パス -> (ロック, ロックを待っているスレッド数)
+        self._locks: dict[str, tuple[threading.Lock, int]] = {}
+        self._locks_lock = threading.Lock()
+
+    def record(self, document: Document, error: Exception) -> DeadLetter:
+        path = self._path(document)
+        now = self._clock()
+        with self._locked(path):
+            previous = self._read(path) if self.storage.exists(path=path) else None
+            dead_letter = DeadLetter(
+                document=document,
+                error_type=f"{type(error).__module__}.{type(error).__qualname__}",
+                error_message=str(error),
+                attempts=previous.attempts + 1 if previous is not None else 1,
+                first_failed_at=(
+                    previous.first_failed_at if previous is not None else now
+                ),
+                last_failed_at=now,
+            )
+            record = json.dumps(dead_letter.to_dict(), ensure_ascii=False)
+            self.storage.save(path=path, file=record.encode("utf-8"))
+        return dead_letter
+
+    def list_dead_letters(self) -> list[DeadLetter]:
+        """記録済みの書類を最初に失敗した順に返す"""
+        dead_letters = [
+            self._read(path)
+            for path in self.storage.list_paths(prefix=f"{self.prefix}/")
+            if path.endswith(_RECORD_SUFFIX)
+        ]
+        return sorted(dead_letters, key=lambda d: d.first_failed_at)
+
+    def remove(self, document: Document) -> None:
+        path = self._path(document)
+        with self._locked(path):
+            self.storage.delete(path=path)
+
+    def flush(self) -> None:
+        self.storage.flush()
+
+    def _path(self, document: Document) -> str:
+        return (
+            f"{self.prefix}/{document.disclosure_source.value}/"
+            f"{document.document_id.value}{_RECORD_SUFFIX}"
+        )
+
+    def _read(self, path: str) -> DeadLetter:
+        return DeadLetter.from_dict(json.loads(self.storage.read(path=path)))
+
+    @contextmanager
+    def _locked(self, path: str) -> Iterator[None]:
+        """pathの書類のロックを取得する（待っているスレッドがなくなったロックは破棄する）"""
+        with self._locks_lock:
+            lock, waiters = self._locks.get(path, (threading.Lock(), 0))
+            self._locks[path] = (lock, waiters + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._locks_lock:
+                lock, waiters = self._locks[path]
+                if waiters == 1:
+                    del self._locks[path]
+                else:
+                    self._locks[path] = (lock, waiters - 1)
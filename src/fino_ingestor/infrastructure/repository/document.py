@@ -1,18 +1,387 @@
+import hashlib
+import json
+import logging
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import AbstractContextManager, nullcontext
+from datetime import UTC, datetime
+
 from fino_ingestor.domain.entity.document import Document
-from fino_ingestor.domain.repository.document import DocumentRepository
-from fino_ingestor.infrastructure.policy.document_path import DocumentPathPolicy
+from fino_ingestor.domain.event.document_stored import DocumentStoredEvent
+from fino_ingestor.domain.repository.document import (
+    DocumentRepository,
+    DocumentStoreError,
+)
+from fino_ingestor.infrastructure.policy.document_path import (
+    PathPolicy,
+    create_path_policy,
+)
+from fino_ingestor.infrastructure.processor.zip_extractor import ZipExtractor, ZipMember
+from fino_ingestor.infrastructure.repository.daily_bundle import DailyBundler
+from fino_ingestor.infrastructure.repository.existence_cache import ExistenceCache
+from fino_ingestor.interface.config.repository import RepositoryConfig
+from fino_ingestor.interface.port.event_sink import EventSinkPort
 from fino_ingestor.interface.port.storage import StoragePort
 
+# members形式で保存する際の完了マーカー（最後に書き込む）
+MANIFEST_FILE_NAME = "manifest.json"
+# 保存したオブジェクトの内容のハッシュを記録するメタデータのキー
+SHA256_METADATA_KEY = "sha256"
+
+logger = logging.getLogger(__name__)
+
 
 class DocumentRepositoryImpl(DocumentRepository):
-    def __init__(self, storage: StoragePort) -> None:
+    def __init__(
+        self,
+        storage: StoragePort,
+        config: RepositoryConfig | None = None,
+        event_sinks: Sequence[EventSinkPort] = (),
+    ) -> None:
         self._storage = storage
-        self._path_policy = DocumentPathPolicy
+        self._config = config or RepositoryConfig()
+        self._event_sinks = tuple(event_sinks)
+        # 保存イベントは、書類ごとにストレージへの書き込みが確定した時点で通知する
+        # （TieredStorageのアップロードやグループコミット、バンドルの保存を待つため）
+        self._path_policy = create_path_policy(self._config.path_layout)
+        # 保存済みの書類を探す順序（保存先のレイアウトを優先する）
+        self._lookup_policies: list[PathPolicy] = [self._path_policy]
+        for layout in self._config.fallback_layouts:
+            policy = create_path_policy(layout)
+            if policy not in self._lookup_policies:
+                self._lookup_policies.append(policy)
+
+        extraction = self._config.extraction
+        self._extractor = ZipExtractor(extraction) if extraction else None
+        self._store_members = extraction is not None and extraction.output == "members"
+        bundling = self._config.bundling
+        self._bundler = (
+            DailyBundler(storage, bundling, path_policy=self._path_policy)
+            if bundling
+            else None
+        )
+
+        cache_config = self._config.existence_cache
+        self._existence_cache = (
+            ExistenceCache(
+                max_entries=cache_config.max_entries,
+                ttl_seconds=cache_config.ttl_seconds,
+            )
+            if cache_config
+            else None
+        )
+        self._cache_missing = cache_config is not None and cache_config.cache_missing
+
+        # zip処理はワーカープールで行い、ダウンロード処理を止めないようにする
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: list[tuple[Document, Future[None]]] = []
+        self._pending_lock = threading.Lock()
+        # 処理待ちのファイルを保持しすぎないよう、投入数に上限を設ける
+        self._slots = threading.BoundedSemaphore(
+            extraction.max_workers * 2 if extraction else 1
+        )
+        if extraction is not None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=extraction.max_workers,
+                thread_name_prefix="fino-zip-extract",
+            )
 
     def exists(self, document: Document) -> bool:
-        path = self._path_policy.generate_path(document, is_zip=True)
-        return self._storage.exists(path=path)
+        if self._existence_cache is None:
+            return self._locate(document) is not None
+
+        key = document.document_id.value
+        cached = self._existence_cache.get(key)
+        if cached is not None:
+            return cached
+        exists = self._locate(document) is not None
+        if exists or self._cache_missing:
+            self._existence_cache.put(key, exists)
+        return exists
+
+    @property
+    def existence_cache(self) -> ExistenceCache | None:
+        return self._existence_cache
+
+    def read(self, document: Document) -> bytes:
+        located = self._locate(document)
+        if located is None:
+            raise FileNotFoundError(f"Document not found: {document.document_id.value}")
+        policy, path = located
+        if self._bundler is not None:
+            data = self._bundler.read(document, path)
+            if data is not None:
+                return data
+
+        if not self._store_members:
+            return self._storage.read(path=path)
+
+        # members形式の場合はマニフェストに従ってzipに組み立て直す
+        assert self._extractor is not None  # noqa: S101
+        base_path = policy.generate_path(document, is_zip=False)
+        manifest = json.loads(self._storage.read(path=path))
+        members = [
+            ZipMember(name=name, data=self._storage.read(path=f"{base_path}/{name}"))
+            for name in manifest["members"]
+        ]
+        return self._extractor.repack(members)
+
+    def open(self, document: Document) -> AbstractContextManager[memoryview]:
+        """
+        書類の内容をmemoryviewとして参照する
+        ストレージに単体で保存されている場合はストレージのopenを使用する（LocalStorageではメモリマップ）。
+        """
+        located = self._locate(document)
+        if located is None:
+            raise FileNotFoundError(f"Document not found: {document.document_id.value}")
+        _, path = located
+        bundled = self._bundler is not None and self._bundler.contains(document, path)
+        if self._store_members or bundled:
+            return nullcontext(memoryview(self.read(document)))
+        return self._storage.open(path=path)
+
+    def iter_documents(
+        self, documents: Iterable[Document], max_workers: int = 4
+    ) -> Iterator[tuple[Document, bytes]]:
+        """
+        保存済みの書類を (書類, 内容) として順に返す（保存されていない書類は読み飛ばす）
+        先読みをワーカープールで行い、ストレージの往復待ちを隠蔽する。
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="fino-read"
+        )
+        iterator = iter(documents)
+        pending: deque[tuple[Document, Future[bytes]]] = deque()
+
+        def submit_next() -> None:
+            document = next(iterator, None)
+            if document is not None:
+                pending.append((document, executor.submit(self.read, document)))
+
+        try:
+            # 先読みする書類数はワーカー数の2倍までとする
+            for _ in range(max_workers * 2):
+                submit_next()
+            while pending:
+                document, future = pending.popleft()
+                submit_next()
+                try:
+                    data = future.result()
+                except FileNotFoundError:
+                    continue
+                yield document, data
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def save(
+        self,
+        document: Document,
+        file: bytes,
+        sha256: str | None = None,
+        overwrite: bool = True,
+        on_done: Callable[[], None] | None = None,
+    ) -> None:
+        # 書き込みと同時にキャッシュを更新する（保存に失敗した場合は破棄する）
+        if self._existence_cache is not None:
+            self._existence_cache.put(document.document_id.value, True)
+
+        if self._executor is None:
+            try:
+                self._store_or_invalidate(document, file, sha256, overwrite)
+            finally:
+                if on_done is not None:
+                    on_done()
+            return
+
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(
+                self._store_or_invalidate, document, file, sha256, overwrite
+            )
+        except BaseException:
+            self._release_slot(on_done)
+            if self._existence_cache is not None:
+                self._existence_cache.invalidate(document.document_id.value)
+            raise
+        # ワーカーでの保存が終わるまでfileを保持しているため、完了時に解放する
+        future.add_done_callback(lambda _: self._release_slot(on_done))
+        with self._pending_lock:
+            self._pending.append((document, future))
+
+    def delete_stale_copy(self, document: Document, path: str) -> None:
+        if path == self._stored_path(document, self._path_policy):
+            return
+        if self._storage.exists(path=path):
+            self._storage.delete(path=path)
 
-    def save(self, document: Document, file: bytes) -> None:
+    def mark_corrupt(self, document: Document, path: str) -> None:
+        self._storage.mark_corrupt(path=path)
+
+    def _release_slot(self, on_done: Callable[[], None] | None) -> None:
+        self._slots.release()
+        if on_done is not None:
+            on_done()
+
+    def flush(self) -> None:
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        failures: list[tuple[Document, Exception]] = []
+        if pending:
+            _ = wait([future for _, future in pending])
+            for document, future in pending:
+                error = future.exception()
+                if error is None:
+                    continue
+                if not isinstance(error, Exception):
+                    raise error
+                failures.append((document, error))
+
+        # 失敗した書類があっても、保存できた書類の書き込みは確定させる
+        if self._bundler is not None:
+            self._bundler.flush()
+        self._storage.flush()
+
+        if failures:
+            raise DocumentStoreError(failures)
+
+    def close(self) -> None:
+        """処理中のzip処理の完了を待ってワーカーを終了する（確定はflushで行う）"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def _store_or_invalidate(
+        self, document: Document, file: bytes, sha256: str | None, overwrite: bool
+    ) -> None:
+        try:
+            self._store(document, file, sha256, overwrite)
+        except BaseException:
+            if self._existence_cache is not None:
+                self._existence_cache.invalidate(document.document_id.value)
+            raise
+
+    def _store(
+        self, document: Document, file: bytes, sha256: str | None, overwrite: bool
+    ) -> None:
         path = self._path_policy.generate_path(document, is_zip=True)
-        self._storage.save(path=path, file=file)
+
+        if self._store_members:
+            manifest_path = self._store_members_of(document, file, sha256)
+            self._notify_stored(document, manifest_path, file, sha256)
+            return
+
+        # zipでない書類（PDFなど）はそのまま保存する
+        if self._extractor is not None and self._extractor.is_zip(file):
+            file = self._extractor.repack(self._extractor.extract(file))
+            # 保存する内容が変わるため、ハッシュを計算し直す
+            if sha256 is not None:
+                sha256 = hashlib.sha256(file).hexdigest()
+
+        if self._bundler is not None and self._bundler.accepts(file):
+            # バンドルの書き込みが確定した時点で通知する
+            self._bundler.add(
+                document,
+                path,
+                file,
+                on_stored=self._publisher_of(document, path, file, sha256),
+            )
+            return
+        metadata = {SHA256_METADATA_KEY: sha256} if sha256 is not None else None
+        if overwrite:
+            self._storage.save(path=path, file=file, metadata=metadata)
+        elif not self._storage.save_if_absent(path=path, file=file, metadata=metadata):
+            # すべての保存先に保存済みで書き込まなかった場合は通知しない
+            return
+        self._notify_stored(document, path, file, sha256)
+
+    def _notify_stored(
+        self, document: Document, path: str, file: bytes, sha256: str | None
+    ) -> None:
+        """pathへの書き込みが確定した時点で保存イベントを通知する"""
+        publish = self._publisher_of(document, path, file, sha256)
+        if publish is not None:
+            self._storage.when_durable(path=path, callback=publish)
+
+    def _publisher_of(
+        self, document: Document, path: str, file: bytes, sha256: str | None
+    ) -> Callable[[], None] | None:
+        # 通知先がない場合はハッシュの計算を省略する
+        if not self._event_sinks:
+            return None
+        event = self._stored_event(document, path, file, sha256)
+        return lambda: self._publish(event)
+
+    def _stored_event(
+        self, document: Document, path: str, file: bytes, sha256: str | None
+    ) -> DocumentStoredEvent:
+        return DocumentStoredEvent(
+            document=document,
+            path=path,
+            size=len(file),
+            sha256=sha256 or hashlib.sha256(file).hexdigest(),
+            stored_at=datetime.now(UTC),
+        )
+
+    def _publish(self, event: DocumentStoredEvent) -> None:
+        # 書類は保存済みのため、通知先の失敗は保存の失敗として扱わない（他の通知先への通知も続ける）
+        for sink in self._event_sinks:
+            try:
+                sink.publish(event)
+            except Exception:
+                logger.exception(
+                    "Failed to publish stored event: %s",
+                    event.document.document_id.value,
+                )
+
+    def _store_members_of(
+        self, document: Document, file: bytes, sha256: str | None
+    ) -> str:
+        """抽出したメンバーを個別に保存し、最後にマニフェストを書き込む（マニフェストのパスを返す）"""
+        assert self._extractor is not None  # noqa: S101
+        base_path = self._path_policy.generate_path(document, is_zip=False)
+
+        if self._extractor.is_zip(file):
+            members = [(m.name, m.data) for m in self._extractor.extract(file)]
+        else:
+            # zipでない書類はそのまま1メンバーとして扱う
+            name = self._path_policy.generate_path(document, is_zip=True).rsplit(
+                "/", 1
+            )[-1]
+            members = [(name, file)]
+
+        for name, data in members:
+            # メンバー名が書類のディレクトリの外を指す場合は保存しない（他の書類の上書きを防ぐ）
+            if self._extractor.normalize_name(name) != name:
+                raise ValueError(f"Unsafe zip member name: {name!r}")
+            self._storage.save(path=f"{base_path}/{name}", file=data)
+
+        manifest = {
+            "document_id": document.document_id.value,
+            "members": [name for name, _ in members],
+        }
+        if sha256 is not None:
+            # 展開前のパッケージのハッシュを記録する
+            manifest["sha256"] = sha256
+        manifest_path = f"{base_path}/{MANIFEST_FILE_NAME}"
+        self._storage.save(
+            path=manifest_path,
+            file=json.dumps(manifest, ensure_ascii=False).encode("utf-8"),
+        )
+        return manifest_path
+
+    def _locate(self, document: Document) -> tuple[PathPolicy, str] | None:
+        """保存済みの書類を各レイアウトから探し、(ポリシー, パス) を返す"""
+        for policy in self._lookup_policies:
+            path = self._stored_path(document, policy)
+            if self._bundler is not None and self._bundler.contains(document, path):
+                return policy, path
+            if self._storage.exists(path=path):
+                return policy, path
+        return None
+
+    def _stored_path(self, document: Document, policy: PathPolicy) -> str:
+        if self._store_members:
+            base_path = policy.generate_path(document, is_zip=False)
+            return f"{base_path}/{MANIFEST_FILE_NAME}"
+        return policy.generate_path(document, is_zip=True)
@@ -0,0 +1,62 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+
+class ExistenceCache:
+    """
+    書類の存在確認結果のキャッシュ（LRU + TTL）
+    - 上限件数を超えた場合は最も古く参照されたエントリから破棄する
+    - TTLを過ぎたエントリは参照時に破棄し、ストレージに問い合わせ直す
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        # キー → (存在するか, 有効期限)
+        self._entries: OrderedDict[str, tuple[bool, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> bool | None:
+        """キャッシュ済みの結果を返す（未キャッシュ・期限切れの場合はNone）"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            exists, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return exists
+
+    def put(self, key: str, exists: bool) -> None:
+        with self._lock:
+            self._entries[key] = (exists, self._clock() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                _ = self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            _ = self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,99 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from fino_ingestor.infrastructure.policy.document_path import (
+    DocumentPathKey,
+    PathPolicy,
+)
+from fino_ingestor.infrastructure.repository.document import MANIFEST_FILE_NAME
+from fino_ingestor.interface.port.storage import StoragePort
+
+
+@dataclass(slots=True)
+class LayoutMigrationResult:
+    moved: list[tuple[str, str]] = field(default_factory=list)
+    """移動した (移動元, 移動先)"""
+    skipped: list[str] = field(default_factory=list)
+    """移動元のレイアウトとして解釈できなかったパス（バンドルなど）"""
+    failed: list[tuple[str, str]] = field(default_factory=list)
+    """移動に失敗した (移動元, エラーメッセージ)"""
+
+
+class LayoutMigrator:
+    """
+    保存済みの書類を別のパスレイアウトへ移動する
+    - 書類単位で並列に移動し、members形式の場合はマニフェストを最後に移動する
+    - 中断した場合も、再実行すれば移動元に残っているファイルのみを移動する
+    - バンドル内の書類は移動しない（fallback_layoutsで旧レイアウトを参照する）
+    """
+
+    def __init__(
+        self,
+        storage: StoragePort,
+        source: PathPolicy,
+        target: PathPolicy,
+        max_workers: int = 8,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be greater than or equal to 1")
+        self._storage = storage
+        self._source = source
+        self._target = target
+        self._max_workers = max_workers
+
+    def plan(
+        self, prefix: str = ""
+    ) -> tuple[dict[DocumentPathKey, list[tuple[str, str]]], list[str]]:
+        """書類ごとの (移動元, 移動先) の一覧と、対象外のパスを返す"""
+        moves: dict[DocumentPathKey, list[tuple[str, str]]] = {}
+        skipped: list[str] = []
+        for path in self._storage.list_paths(prefix=prefix):
+            parsed = self._source.parse_path(path)
+            if parsed is None:
+                skipped.append(path)
+                continue
+            key, suffix = parsed
+            target_path = self._target.build_path(key) + suffix
+            if target_path != path:
+                moves.setdefault(key, []).append((path, target_path))
+
+        for document_moves in moves.values():
+            # 完了マーカーであるマニフェストを最後に移動する
+            document_moves.sort(key=lambda move: move[0].endswith(MANIFEST_FILE_NAME))
+        return moves, skipped
+
+    def migrate(self, prefix: str = "", dry_run: bool = False) -> LayoutMigrationResult:
+        moves, skipped = self.plan(prefix=prefix)
+        result = LayoutMigrationResult(skipped=skipped)
+        if dry_run:
+            result.moved = [move for document in moves.values() for move in document]
+            return result
+
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="fino-migrate"
+        ) as executor:
+            outcomes = executor.map(self._move_document, moves.values())
+            for moved, failed in outcomes:
+                result.moved.extend(moved)
+                result.failed.extend(failed)
+
+        self._storage.flush()
+        return result
+
+    def _move_document(
+        self, document_moves: list[tuple[str, str]]
+    ) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+        moved: list[tuple[str, str]] = []
+        for index, (source_path, target_path) in enumerate(document_moves):
+            try:
+                self._storage.move(source_path=source_path, target_path=target_path)
+            except Exception as e:  # 他の書類の移動は継続する
+                # 残りのファイル（マニフェストを含む）は移動せず、再実行に任せる
+                failed = [(source_path, str(e))]
+                failed.extend(
+                    (path, "aborted: a previous file of the document failed to move")
+                    for path, _ in document_moves[index + 1 :]
+                )
+                return moved, failed
+            moved.append((source_path, target_path))
+        return moved, []
@@ -0,0 +1,182 @@
+import hashlib
+import struct
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Literal, TypeAlias
+
+from fino_ingestor.domain.value.format_type import FormatTypeEnum
+from fino_ingestor.infrastructure.policy.document_path import (
+    ZIP_SUFFIX,
+    DocumentPathKey,
+    PathPolicy,
+)
+from fino_ingestor.infrastructure.repository.document import SHA256_METADATA_KEY
+from fino_ingestor.interface.port.storage import StoragePort
+
+AuditProblem: TypeAlias = Literal[
+    "missing", "truncated", "mislabeled", "invalid", "hash_mismatch", "unreadable"
+]
+"""
+検出した問題の種類
+- missing: 書類一覧にあるが保存されていない
+- truncated: zipの終端レコード・セントラルディレクトリ、PDFの終端マーカーが見つからない
+- mislabeled: フォーマットと内容が一致しない（PDFをzipとして保存しているなど）
+- invalid: zipでもPDFでもない内容（APIのエラーレスポンスなど）
+- hash_mismatch: メタデータのハッシュと内容が一致しない
+- unreadable: 読み込みに失敗した
+"""
+
+_ZIP_LOCAL_HEADER = b"PK\x03\x04"
+_ZIP_CENTRAL_HEADER = b"PK\x01\x02"
+_ZIP_EOCD_SIGNATURE = b"PK\x05\x06"
+_ZIP_EOCD_FORMAT = "<4sHHHHIIH"
+_ZIP_EOCD_SIZE = struct.calcsize(_ZIP_EOCD_FORMAT)
+# 終端レコードの後ろにあるコメントの最大長
+_ZIP_MAX_COMMENT = 0xFFFF
+# Zip64の場合、終端レコードの値はこの値になる（Zip64のレコードは検証しない）
+_ZIP64_MARKER = 0xFFFFFFFF
+_PDF_HEADER = b"%PDF-"
+_PDF_TRAILER_SIZE = 1024
+_HEAD_SIZE = 8
+_ZIP_FORMATS = frozenset({FormatTypeEnum.XBRL.value, FormatTypeEnum.CSV.value})
+
+
+@dataclass(frozen=True, slots=True)
+class AuditFinding:
+    path: str
+    """問題のあるオブジェクトのパス"""
+    key: DocumentPathKey
+    problem: AuditProblem
+    detail: str
+
+
+@dataclass(slots=True)
+class StorageAuditResult:
+    checked: int = 0
+    """検証したオブジェクト数"""
+    skipped: list[str] = field(default_factory=list)
+    """書類として解釈できなかった、もしくは検証対象外のパス（バンドル・members形式など）"""
+    findings: list[AuditFinding] = field(default_factory=list)
+
+
+class StorageAuditor:
+    """
+    保存済みの書類オブジェクトを並列に検証する
+    - 全体を読み込まず、先頭と末尾のレンジ読み込みでzipの終端レコード・セントラルディレクトリ、PDFのヘッダー・終端を確認する
+    - verify_hashesを指定した場合、メタデータにハッシュがあるオブジェクトは全体を読み込んで照合する
+    - バンドル内の書類とmembers形式の書類は対象外とする
+    """
+
+    def __init__(
+        self,
+        storage: StoragePort,
+        path_policies: Sequence[PathPolicy],
+        max_workers: int = 8,
+        verify_hashes: bool = False,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be greater than or equal to 1")
+        self._storage = storage
+        self._path_policies = tuple(path_policies)
+        self.max_workers = max_workers
+        self.verify_hashes = verify_hashes
+
+    def scan(self, prefix: str = "") -> StorageAuditResult:
+        result = StorageAuditResult()
+        targets: list[tuple[str, DocumentPathKey]] = []
+        for path in self._storage.list_paths(prefix=prefix):
+            key = self._parse(path)
+            if key is None:
+                result.skipped.append(path)
+                continue
+            targets.append((path, key))
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="fino-audit"
+        ) as executor:
+            for finding in executor.map(lambda target: self.check(*target), targets):
+                result.checked += 1
+                if finding is not None:
+                    result.findings.append(finding)
+        return result
+
+    def check(self, path: str, key: DocumentPathKey) -> AuditFinding | None:
+        """オブジェクトを1つ検証し、問題がある場合はその内容を返す"""
+        try:
+            problem = self._check(path, key)
+        except Exception as e:  # 他のオブジェクトの検証は継続する
+            return AuditFinding(path=path, key=key, problem="unreadable", detail=str(e))
+        if problem is None:
+            return None
+        kind, detail = problem
+        return AuditFinding(path=path, key=key, problem=kind, detail=detail)
+
+    def _parse(self, path: str) -> DocumentPathKey | None:
+        for policy in self._path_policies:
+            parsed = policy.parse_path(path)
+            if parsed is not None:
+                key, suffix = parsed
+                return key if suffix == ZIP_SUFFIX else None
+        return None
+
+    def _check(
+        self, path: str, key: DocumentPathKey
+    ) -> tuple[AuditProblem, str] | None:
+        head = self._storage.read(path=path, offset=0, length=_HEAD_SIZE)
+        is_zip = head.startswith((_ZIP_LOCAL_HEADER, _ZIP_EOCD_SIGNATURE))
+        is_pdf = head.startswith(_PDF_HEADER)
+        if not is_zip and not is_pdf:
+            if key.format_type in _ZIP_FORMATS or key.format_type == "PDF":
+                return "invalid", f"unexpected content: {head!r}"
+            return self._check_hash(path)
+
+        expects_zip = key.format_type in _ZIP_FORMATS
+        if (expects_zip and is_pdf) or (key.format_type == "PDF" and is_zip):
+            actual = "zip" if is_zip else "PDF"
+            return "mislabeled", f"{key.format_type} document contains {actual}"
+
+        problem = self._check_zip(path) if is_zip else self._check_pdf(path)
+        return problem or self._check_hash(path)
+
+    def _check_zip(self, path: str) -> tuple[AuditProblem, str] | None:
+        # コメントのない終端レコードを先に探し、見つからない場合のみコメントの最大長まで広げる
+        tail = self._storage.read(path=path, offset=-(_ZIP_EOCD_SIZE + 1024))
+        index = tail.rfind(_ZIP_EOCD_SIGNATURE)
+        if index < 0:
+            tail = self._storage.read(
+                path=path, offset=-(_ZIP_EOCD_SIZE + _ZIP_MAX_COMMENT)
+            )
+            index = tail.rfind(_ZIP_EOCD_SIGNATURE)
+        if index < 0 or len(tail) - index < _ZIP_EOCD_SIZE:
+            return "truncated", "zip end of central directory not found"
+
+        _, _, _, _, entries, cd_size, cd_offset, comment_length = struct.unpack(
+            _ZIP_EOCD_FORMAT, tail[index : index + _ZIP_EOCD_SIZE]
+        )
+        if index + _ZIP_EOCD_SIZE + comment_length != len(tail):
+            return "truncated", "zip comment length does not match"
+        if entries == 0 or cd_offset == _ZIP64_MARKER:
+            return None
+
+        central = self._storage.read(path=path, offset=cd_offset, length=cd_size)
+        if len(central) != cd_size or not central.startswith(_ZIP_CENTRAL_HEADER):
+            return "truncated", "zip central directory is broken"
+        return None
+
+    def _check_pdf(self, path: str) -> tuple[AuditProblem, str] | None:
+        tail = self._storage.read(path=path, offset=-_PDF_TRAILER_SIZE)
+        if b"%%EOF" not in tail:
+            return "truncated", "PDF trailer not found"
+        return None
+
+    def _check_hash(self, path: str) -> tuple[AuditProblem, str] | None:
+        if not self.verify_hashes:
+            return None
+        expected = self._storage.read_metadata(path=path).get(SHA256_METADATA_KEY)
+        if expected is None:
+            return None
+        actual = hashlib.sha256(self._storage.read(path=path)).hexdigest()
+        if actual != expected:
+            return "hash_mismatch", f"sha256 {actual} != {expected}"
+        return None
@@ -0,0 +1,110 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+
+from fino_ingestor.infrastructure.scheduler.concurrency import excluded_from_latency
+
+# 実効スループットを算出する直近の期間
+_THROUGHPUT_WINDOW_SECONDS = 10.0
+
+
+@dataclass(frozen=True, slots=True)
+class BandwidthMetrics:
+    limit_bytes_per_second: int
+    """帯域の上限"""
+    total_bytes: int
+    """これまでに転送したバイト数"""
+    throughput_bytes_per_second: float
+    """直近の実効スループット"""
+    throttled_seconds: float
+    """上限により待機した合計秒数"""
+
+
+class BandwidthLimiter:
+    """
+    トークンバケットによる転送帯域の制限
+    - 1秒あたり bytes_per_second のトークンが補充され、burst_bytes まで貯められる
+    - consume(n) は nバイト分のトークンが補充されるまで呼び出し元のスレッドを待機させる
+    - 1つのインスタンスを複数スレッドで共有すると、合計の転送量が上限以下に抑えられる
+
+    Examples
+    --------
+    >>> limiter = BandwidthLimiter(bytes_per_second=10 * 1024 * 1024)
+    >>> for chunk in limiter.throttle(response.iter_content(64 * 1024)):
+    ...     buffer.write(chunk)
+    """
+
+    def __init__(
+        self,
+        bytes_per_second: int,
+        burst_bytes: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if bytes_per_second < 1:
+            raise ValueError("bytes_per_second must be greater than or equal to 1")
+        self.bytes_per_second = bytes_per_second
+        self.burst_bytes = max(1, burst_bytes or bytes_per_second)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst_bytes)
+        self._started_at = self._updated_at = clock()
+        self._total_bytes = 0
+        self._throttled_seconds = 0.0
+        # 直近の転送記録（転送が許可された時刻, バイト数）
+        self._recent: deque[tuple[float, int]] = deque()
+
+    def consume(self, size: int) -> None:
+        """sizeバイトを転送できるまで待機する"""
+        if size <= 0:
+            return
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            # 不足分は負のトークンとして持ち越すため、後続の呼び出しは到着順に待機する
+            self._tokens -= size
+            wait = -self._tokens / self.bytes_per_second if self._tokens < 0 else 0.0
+            self._total_bytes += size
+            self._throttled_seconds += wait
+            self._recent.append((now + wait, size))
+            # metricsが呼ばれない場合も転送記録が増え続けないよう、ここで古い記録を捨てる
+            self._prune(now)
+        if wait > 0:
+            with excluded_from_latency():
+                self._sleep(wait)
+
+    def throttle(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """チャンクごとに帯域を消費しながら受け渡す"""
+        for chunk in chunks:
+            self.consume(len(chunk))
+            yield chunk
+
+    def metrics(self) -> BandwidthMetrics:
+        with self._lock:
+            now = self._clock()
+            self._prune(now)
+            window = min(_THROUGHPUT_WINDOW_SECONDS, now - self._started_at)
+            recent_bytes = sum(size for at, size in self._recent if at <= now)
+            return BandwidthMetrics(
+                limit_bytes_per_second=self.bytes_per_second,
+                total_bytes=self._total_bytes,
+                throughput_bytes_per_second=recent_bytes / window
+                if window > 0
+                else 0.0,
+                throttled_seconds=self._throttled_seconds,
+            )
+
+    def _prune(self, now: float) -> None:
+        """スループットの算出期間より古い転送記録を捨てる"""
+        while self._recent and self._recent[0][0] < now - _THROUGHPUT_WINDOW_SECONDS:
+            _ = self._recent.popleft()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(
+            float(self.burst_bytes), self._tokens + elapsed * self.bytes_per_second
+        )
+        self._updated_at = now
@@ -0,0 +1,107 @@
+import threading
+from types import TracebackType
+
+from fino_ingestor.infrastructure.scheduler.concurrency import excluded_from_latency
+
+
+class ByteBudget:
+    """
+    処理中のバイト数の上限を管理する
+    - 新規の予約は、合計が上限を超える間は待機する（処理中のものがない場合は上限を超えても許可する）
+    - 予約の拡大も同様に待機するが、他の予約がすべて拡大待ちの場合は待たずに許可する（デッドロック防止）
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be greater than or equal to 1")
+        self.max_bytes = max_bytes
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._holders = 0
+        self._growing = 0
+        self.waits = 0
+        """予約・拡大で待機した回数"""
+
+    @property
+    def in_flight_bytes(self) -> int:
+        with self._condition:
+            return self._in_flight
+
+    def reserve(self, size: int) -> "ByteReservation":
+        """sizeバイトを予約する（空きができるまで待機する）"""
+        with self._condition:
+            if self._in_flight > 0 and self._in_flight + size > self.max_bytes:
+                self.waits += 1
+                with excluded_from_latency():
+                    while (
+                        self._in_flight > 0 and self._in_flight + size > self.max_bytes
+                    ):
+                        _ = self._condition.wait()
+            self._in_flight += size
+            self._holders += 1
+        return ByteReservation(self, size)
+
+    def _grow(self, delta: int) -> None:
+        with self._condition:
+            self._growing += 1
+            # 他の拡大待ちが「全員が拡大待ち」になったかを再判定できるよう通知する
+            self._condition.notify_all()
+            try:
+                if self._in_flight + delta > self.max_bytes:
+                    self.waits += 1
+                with excluded_from_latency():
+                    while (
+                        self._in_flight + delta > self.max_bytes
+                        and self._holders > self._growing
+                    ):
+                        _ = self._condition.wait()
+            finally:
+                self._growing -= 1
+            self._in_flight += delta
+
+    def _shrink(self, delta: int, release_holder: bool = False) -> None:
+        with self._condition:
+            self._in_flight -= delta
+            if release_holder:
+                self._holders -= 1
+            self._condition.notify_all()
+
+
+class ByteReservation:
+    """ByteBudgetから予約したバイト数"""
+
+    def __init__(self, budget: ByteBudget, size: int) -> None:
+        self._budget = budget
+        self._lock = threading.Lock()
+        self._released = False
+        self.size = size
+
+    def resize(self, size: int) -> None:
+        """予約を実際のサイズに合わせる（拡大する場合は空きができるまで待機する）"""
+        with self._lock:
+            if self._released:
+                return
+            delta = size - self.size
+            if delta > 0:
+                self._budget._grow(delta)
+            elif delta < 0:
+                self._budget._shrink(-delta)
+            self.size = size
+
+    def release(self) -> None:
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+            self._budget._shrink(self.size, release_holder=True)
+
+    def __enter__(self) -> "ByteReservation":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.release()
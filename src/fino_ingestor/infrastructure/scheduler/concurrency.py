@@ -0,0 +1,212 @@
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from fino_ingestor.interface.config.concurrency import ConcurrencyConfig
+
+# 過負荷を表すエラーコード（S3などのAWS APIが返すもの）
+_OVERLOAD_ERROR_CODES = frozenset(
+    {
+        "SlowDown",
+        "Throttling",
+        "ThrottlingException",
+        "RequestLimitExceeded",
+        "TooManyRequests",
+        "ServiceUnavailable",
+        "InternalError",
+    }
+)
+# レイテンシの移動平均の平滑化係数
+_LATENCY_ALPHA = 0.2
+# スレッドごとの計測中の処理（measure()の中でのみ設定される）
+_measuring = threading.local()
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """
+    並列数を減らすべきエラー（429/5xx・タイムアウトなど）かを判定する
+    requests / botocore を読み込まずに判定するため、レスポンスの属性から判断する。
+    """
+    # 5xx・不完全なレスポンスなど（overloaded属性を持つRetryableDownloadErrorなど）
+    if getattr(error, "overloaded", False) is True or isinstance(error, TimeoutError):
+        return True
+
+    response: Any = getattr(error, "response", None)
+    # requests.HTTPError
+    status_code = getattr(response, "status_code", None)
+    # botocore.exceptions.ClientError
+    if isinstance(response, dict):
+        error_code = response.get("Error", {}).get("Code")
+        if error_code in _OVERLOAD_ERROR_CODES:
+            return True
+        status_code = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return isinstance(status_code, int) and (status_code == 429 or status_code >= 500)
+
+
+class _Measurement:
+    """measure()で計測中の処理と、レイテンシから除く待ち時間の合計"""
+
+    __slots__ = ("clock", "excluded", "excluding")
+
+    def __init__(self, clock: Callable[[], float]) -> None:
+        self.clock = clock
+        self.excluded = 0.0
+        self.excluding = False
+
+
+@contextmanager
+def excluded_from_latency() -> Iterator[None]:
+    """
+    囲んだ処理の所要時間を、同じスレッドで計測中のレイテンシから除く
+    帯域制限やメモリ予算の待機、CRC検査などネットワーク以外の時間で並列数を減らさないようにする。
+    計測中でない場合は何もしない。
+    """
+    measurement: _Measurement | None = getattr(_measuring, "current", None)
+    if measurement is None or measurement.excluding:
+        yield
+        return
+    measurement.excluding = True
+    start = measurement.clock()
+    try:
+        yield
+    finally:
+        measurement.excluded += measurement.clock() - start
+        measurement.excluding = False
+
+
+@dataclass(frozen=True, slots=True)
+class ConcurrencyMetrics:
+    limit: int
+    """現在の並列数の上限"""
+    in_flight: int
+    """実行中の処理数"""
+    latency_seconds: float | None
+    """レイテンシの移動平均"""
+    decreases: int
+    """並列数を減らした回数"""
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    レイテンシとエラーを観測して並列数の上限を調整するリミッター（AIMD）
+    slot() で囲んだ処理の所要時間と例外から、次に許可する並列数を決める。
+
+    Examples
+    --------
+    >>> limiter = AdaptiveConcurrencyLimiter(ConcurrencyConfig())
+    >>> with limiter.slot():
+    ...     download()
+    """
+
+    def __init__(
+        self, config: ConcurrencyConfig, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.config = config
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._limit = float(config.initial_limit)
+        self._in_flight = 0
+        self._latency: float | None = None
+        self._last_decrease = -math.inf
+        self._decreases = 0
+
+    @property
+    def limit(self) -> int:
+        with self._condition:
+            return int(self._limit)
+
+    @property
+    def max_limit(self) -> int:
+        return self.config.max_limit
+
+    def metrics(self) -> ConcurrencyMetrics:
+        with self._condition:
+            return ConcurrencyMetrics(
+                limit=int(self._limit),
+                in_flight=self._in_flight,
+                latency_seconds=self._latency,
+                decreases=self._decreases,
+            )
+
+    def acquire(self) -> None:
+        """実行中の処理数が上限を下回るまで待つ"""
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                _ = self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, latency: float | None, overloaded: bool = False) -> None:
+        """
+        処理の完了を記録して並列数を調整する
+        latencyがNoneの場合（過負荷以外のエラーなど）は並列数を変更しない。
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if overloaded or (latency is not None and self._is_spike(latency)):
+                self._decrease()
+            elif latency is not None:
+                # limit件の成功でおよそ increase_step 増える
+                self._limit = min(
+                    float(self.config.max_limit),
+                    self._limit + self.config.increase_step / self._limit,
+                )
+            if latency is not None and not overloaded:
+                self._latency = (
+                    latency
+                    if self._latency is None
+                    else self._latency + _LATENCY_ALPHA * (latency - self._latency)
+                )
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """並列数の枠を確保して処理を実行する"""
+        self.acquire()
+        with self.measure():
+            yield
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        """
+        acquire済みの枠で処理を実行し、所要時間と結果を記録して枠を解放する
+        excluded_from_latency()で囲まれた待ち時間は所要時間に含めない。
+        """
+        measurement = _Measurement(self._clock)
+        previous: _Measurement | None = getattr(_measuring, "current", None)
+        _measuring.current = measurement
+        start = self._clock()
+
+        def latency() -> float:
+            return max(0.0, self._clock() - start - measurement.excluded)
+
+        try:
+            yield
+        except BaseException as e:
+            overloaded = isinstance(e, Exception) and is_overload_error(e)
+            self.release(latency() if overloaded else None, overloaded=overloaded)
+            raise
+        finally:
+            _measuring.current = previous
+        self.release(latency())
+
+    def _is_spike(self, latency: float) -> bool:
+        if self.config.latency_target_seconds is not None:
+            return latency > self.config.latency_target_seconds
+        return (
+            self._latency is not None
+            and latency > self._latency * self.config.latency_tolerance
+        )
+
+    def _decrease(self) -> None:
+        now = self._clock()
+        if now - self._last_decrease < self.config.cooldown_seconds:
+            return
+        self._limit = max(
+            float(self.config.min_limit), self._limit * self.config.decrease_factor
+        )
+        self._last_decrease = now
+        self._decreases += 1
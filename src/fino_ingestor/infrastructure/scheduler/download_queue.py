@@ -0,0 +1,87 @@
+import heapq
+import itertools
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import date
+
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.interface.config.priority import PriorityConfig
+
+
+class DownloadPriorityPolicy:
+    """書類の優先度を開示書類の種類・ウォッチリスト・新しさから算出する"""
+
+    def __init__(
+        self, config: PriorityConfig, today: Callable[[], date] = date.today
+    ) -> None:
+        self.config = config
+        self._watchlist = frozenset(config.watchlist)
+        self._today = today
+
+    def score(self, document: Document) -> float:
+        config = self.config
+        score = config.disclosure_type_weights.get(document.disclosure_type.enum, 0.0)
+        if document.ticker.value in self._watchlist:
+            score += config.watchlist_weight
+
+        age_days = (self._today() - document.disclosure_date.value).days
+        recency = max(0.0, 1.0 - age_days / config.recency_days)
+        return score + config.recency_weight * recency
+
+
+@dataclass(frozen=True, slots=True)
+class QueuedDocument:
+    document: Document
+    priority: float
+
+
+class DownloadQueue:
+    """
+    ダウンロード待ちの書類を優先度順に取り出すキュー
+    同じ優先度の書類は追加順に取り出す。収集中に別スレッドから snapshot で状況を確認できる。
+    """
+
+    def __init__(self, policy: DownloadPriorityPolicy) -> None:
+        self.policy = policy
+        self._lock = threading.Lock()
+        # (-優先度, 追加順, 書類) のヒープ
+        self._heap: list[tuple[float, int, Document]] = []
+        self._sequence = itertools.count()
+
+    def push(self, documents: Iterable[Document]) -> None:
+        entries = [
+            (-self.policy.score(document), next(self._sequence), document)
+            for document in documents
+        ]
+        with self._lock:
+            for entry in entries:
+                heapq.heappush(self._heap, entry)
+
+    def pop(self) -> QueuedDocument | None:
+        with self._lock:
+            if not self._heap:
+                return None
+            priority, _, document = heapq.heappop(self._heap)
+        return QueuedDocument(document=document, priority=-priority)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._heap.clear()
+
+    def snapshot(self, limit: int | None = None) -> list[QueuedDocument]:
+        """キューに残っている書類を取り出される順に返す（監視用）"""
+        with self._lock:
+            entries = (
+                heapq.nsmallest(limit, self._heap)
+                if limit is not None
+                else sorted(self._heap)
+            )
+        return [
+            QueuedDocument(document=document, priority=-priority)
+            for priority, _, document in entries
+        ]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._heap)
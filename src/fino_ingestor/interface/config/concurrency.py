@@ -0,0 +1,64 @@
+from pydantic import BaseModel, Field, model_validator
+
+
+class ConcurrencyConfig(BaseModel):
+    """
+    レイテンシとエラーに応じて並列数を自動調整する設定（AIMD）
+    - 成功が続く間は、limit件の成功ごとに increase_step ずつ並列数を増やす（加算増加）
+    - 429/5xx などの過負荷エラーやレイテンシの急増を検出した場合は decrease_factor 倍に減らす（乗算減少）
+    """
+
+    initial_limit: int = Field(default=4, ge=1)
+    """開始時の並列数"""
+    min_limit: int = Field(default=1, ge=1)
+    """並列数の下限"""
+    max_limit: int = Field(default=16, ge=1)
+    """並列数の上限"""
+    increase_step: float = Field(default=1.0, gt=0)
+    """limit件の成功ごとに増やす並列数"""
+    decrease_factor: float = Field(default=0.5, gt=0, lt=1)
+    """過負荷を検出した際に並列数に掛ける倍率"""
+    latency_tolerance: float = Field(default=2.0, gt=1)
+    """レイテンシの移動平均に対してこの倍率を超えた場合をレイテンシの急増とみなす"""
+    latency_target_seconds: float | None = Field(default=None, gt=0)
+    """指定した場合、移動平均ではなくこの値を超えた場合をレイテンシの急増とみなす"""
+    cooldown_seconds: float = Field(default=1.0, ge=0)
+    """減少後、次に減少させるまでの最短間隔（同時に失敗したリクエストで減らしすぎないため）"""
+
+    @model_validator(mode="after")
+    def validate_limits(self) -> "ConcurrencyConfig":
+        if not self.min_limit <= self.initial_limit <= self.max_limit:
+            raise ValueError(
+                "limits must satisfy min_limit <= initial_limit <= max_limit"
+            )
+        return self
+
+
+class BackpressureConfig(BaseModel):
+    """
+    ダウンロード → 加工 → 保存 の間でメモリ上に保持する書類のバイト数の上限
+    上限に達している間は新しいダウンロードを開始しない。download_concurrencyと併用する。
+    """
+
+    max_in_flight_bytes: int = Field(default=512 * 1024 * 1024, ge=1)
+    """処理中の書類の合計バイト数の上限"""
+    default_document_bytes: int = Field(default=8 * 1024 * 1024, ge=1)
+    """
+    ダウンロード開始時に予約するバイト数
+    Content-Lengthなどでサイズが判明した時点、ダウンロード完了時点で実際のサイズに合わせる。
+    """
+
+
+class BandwidthConfig(BaseModel):
+    """
+    転送帯域の上限（バイト/秒）
+    ダウンロード（EDINET）とアップロード（S3）で別々に指定でき、プロセス内のすべてのワーカーで共有する。
+    Noneの場合はその方向の転送を制限しない。
+    """
+
+    download_bytes_per_second: int | None = Field(default=None, ge=1)
+    """ダウンロードの合計帯域の上限"""
+    upload_bytes_per_second: int | None = Field(default=None, ge=1)
+    """アップロードの合計帯域の上限"""
+    burst_seconds: float = Field(default=1.0, gt=0)
+    """上限を超えて一度に転送できる量（上限の何秒分か）"""
@@ -1,5 +1,35 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+_MIB = 1024 * 1024
+
+
+class DownloadConfig(BaseModel):
+    """
+    書類ダウンロードの転送設定
+    配信元がHTTP Rangeリクエストに対応している場合、閾値を超える書類を並列に分割ダウンロードする。
+    """
+
+    range_threshold: int = Field(default=8 * _MIB, ge=1)
+    """このサイズを超える書類を分割ダウンロードする"""
+    part_size: int = Field(default=4 * _MIB, ge=1)
+    """1リクエストで取得するバイト数"""
+    max_concurrency: int = Field(default=4, ge=1)
+    """並列に取得するパート数"""
+    max_attempts: int = Field(default=3, ge=1)
+    """パート単位の最大試行回数"""
+    resume_dir: str | None = None
+    """指定した場合、取得途中のパートをこのディレクトリに保存し、次回のダウンロードで再開する"""
 
 
 class EdinetConfig(BaseModel):
     api_key: str
+    count_probe: bool = False
+    """
+    書類一覧取得を2段階で行うかどうか
+    Trueの場合、まず件数のみ（withdocs=False）を取得し、書類が存在する日、
+    もしくはキャッシュ済みの件数から変化した日のみ書類一覧を取得する。
+    """
+    api_base_url: str = "https://api.edinet-fsa.go.jp/api/v2/"
+    """書類取得APIのベースURL（downloadを指定した場合に使用する）"""
+    download: DownloadConfig | None = None
+    """指定した場合、書類取得をHTTP Rangeによる分割・再開可能なダウンロードで行う"""
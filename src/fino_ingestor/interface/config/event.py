@@ -0,0 +1,30 @@
+from typing import TypeAlias
+
+from pydantic import BaseModel, Field
+
+
+class JournalEventSinkConfig(BaseModel):
+    """
+    保存イベントを追記専用のJSONLファイルに記録する
+    各行のバイト位置をオフセットとして扱い、コンシューマは再起動後に続きから読み込める。
+    """
+
+    path: str
+    """ジャーナルファイルのパス"""
+    fsync: bool = False
+    """Trueの場合、1イベントごとにfsyncする"""
+
+
+class UnixSocketEventSinkConfig(BaseModel):
+    """
+    保存イベントをUnixドメインソケットで待ち受けているコンシューマへJSON行として送信する
+    コンシューマが接続できない間のイベントは破棄する（取りこぼしはジャーナルから再取得する）。
+    """
+
+    socket_path: str
+    """コンシューマが待ち受けているソケットのパス"""
+    timeout_seconds: float = Field(default=1.0, gt=0)
+    """接続・送信のタイムアウト"""
+
+
+EventSinkConfig: TypeAlias = JournalEventSinkConfig | UnixSocketEventSinkConfig
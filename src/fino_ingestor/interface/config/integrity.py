@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+
+
+class IntegrityConfig(BaseModel):
+    """
+    ダウンロードした書類の検証設定
+    保存前にハッシュの計算とzip/PDFの構造の検証を行い、壊れている場合はダウンロードし直す。
+    """
+
+    max_workers: int = Field(default=4, ge=1)
+    """zipメンバーのCRC検査とハッシュ計算を並列に行うワーカー数"""
+    max_attempts: int = Field(default=3, ge=1)
+    """検証に失敗した書類をダウンロードする最大回数"""
@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field
+
+from fino_ingestor.domain.value.format_type import FormatTypeEnum
+
+_KIB = 1024
+
+
+class PlanConfig(BaseModel):
+    """
+    収集計画（plan）の見積もりに使用する前提値
+    EDINETの書類一覧にはファイルサイズが含まれないため、転送量はフォーマットごとの平均サイズから見積もる。
+    """
+
+    average_document_bytes: dict[FormatTypeEnum, int] = Field(
+        default_factory=lambda: {
+            FormatTypeEnum.XBRL: 600 * _KIB,
+            FormatTypeEnum.PDF: 900 * _KIB,
+            FormatTypeEnum.CSV: 150 * _KIB,
+            FormatTypeEnum.OTHER: 500 * _KIB,
+        }
+    )
+    """フォーマットごとの書類の平均バイト数"""
+    requests_per_second: float = Field(default=1.0, gt=0)
+    """EDINET APIへのリクエスト数の上限（書類一覧・書類取得の合計）"""
+    bytes_per_second: float | None = Field(default=None, gt=0)
+    """指定した場合、転送帯域の上限として所要時間の見積もりに使用する"""
+    max_workers: int = Field(default=8, ge=1)
+    """保存済み書類の存在確認を並列に行うスレッド数"""
@@ -0,0 +1,29 @@
+from pydantic import BaseModel, Field
+
+from fino_ingestor.domain.value.disclosure_type import DisclosureTypeEnum
+
+
+class PriorityConfig(BaseModel):
+    """
+    書類のダウンロード順序を決める優先度の設定
+    優先度 = 開示書類の種類の重み + ウォッチリストの加点 + 新しさの加点 とし、値が大きい書類から取得する。
+    """
+
+    disclosure_type_weights: dict[DisclosureTypeEnum, float] = Field(
+        default_factory=lambda: {
+            DisclosureTypeEnum.ANNUAL_REPORT: 30.0,
+            DisclosureTypeEnum.SEMI_ANNUAL_REPORT: 20.0,
+            DisclosureTypeEnum.QUARTERLY_REPORT: 20.0,
+            DisclosureTypeEnum.AMENDED_ANNUAL_REPORT: 10.0,
+            DisclosureTypeEnum.AMENDED_SEMI_ANNUAL_REPORT: 5.0,
+            DisclosureTypeEnum.AMENDED_QUARTERLY_REPORT: 5.0,
+        }
+    )
+    """開示書類の種類ごとの重み（指定のない種類は0）"""
+    watchlist: list[str] = Field(default_factory=list)
+    """優先して取得するティッカー"""
+    watchlist_weight: float = 100.0
+    """ウォッチリストに含まれる書類への加点"""
+    recency_weight: float = 10.0
+    """当日の書類への加点（recency_days日前にかけて線形に0まで減衰する）"""
+    recency_days: int = Field(default=365, ge=1)
@@ -0,0 +1,85 @@
+from typing import Literal, TypeAlias
+
+from pydantic import BaseModel, Field, model_validator
+
+
+PathLayout: TypeAlias = Literal["ticker", "hive", "hashed"]
+"""
+書類の保存パスのレイアウト
+- ticker: <source>/<ticker>/<type>/<file>（デフォルト）
+- hive: source=<source>/year=<yyyy>/month=<mm>/ticker=<ticker>/type=<type>/<file>
+- hashed: <source>/<hash[:2]>/<hash[2:4]>/<ticker>/<type>/<file>
+"""
+
+
+class ZipExtractionConfig(BaseModel):
+    include_patterns: list[str] = Field(
+        default_factory=lambda: [
+            "XBRL/PublicDoc/*.xbrl",
+            "XBRL/PublicDoc/*_lab.xml",
+            "XBRL/PublicDoc/*_pre.xml",
+        ]
+    )
+    """保存対象とするzipメンバーのパターン（fnmatch形式）"""
+    output: Literal["repack", "members"] = "repack"
+    """
+    抽出結果の保存形式
+    - repack: 対象メンバーのみを含む軽量なzipとして元のパスに保存する
+    - members: 対象メンバーを個別のファイルとして保存する
+    """
+    max_workers: int = Field(default=2, ge=1)
+    """zip処理を行うワーカー数"""
+
+
+class BundlingConfig(BaseModel):
+    max_member_bytes: int = Field(default=256 * 1024, ge=1)
+    """このサイズ以下の書類をバンドルの対象とする"""
+    max_bundle_bytes: int = Field(default=64 * 1024 * 1024, ge=1)
+    """バンドルがこのサイズに達した時点で保存する"""
+    max_buffered_bytes: int = Field(default=256 * 1024 * 1024, ge=1)
+    """
+    書き込み待ちのバンドルの合計サイズの上限
+    超えた場合は最も大きいバンドルから保存する（多くの開示日を並行して収集する場合に備えて）
+    """
+
+
+class ExistenceCacheConfig(BaseModel):
+    max_entries: int = Field(default=100_000, ge=1)
+    """キャッシュする書類数の上限（超えた場合はLRUで破棄する）"""
+    ttl_seconds: float = Field(default=600.0, gt=0)
+    """キャッシュの有効期間。他のプロセスによる保存・削除はこの期間内は反映されない"""
+    cache_missing: bool = True
+    """存在しなかった結果もキャッシュするかどうか"""
+
+
+class RepositoryConfig(BaseModel):
+    extraction: ZipExtractionConfig | None = None
+    """指定した場合、保存前にzipから必要なメンバーのみを抽出する"""
+    path_layout: PathLayout = "ticker"
+    """書類を保存するパスのレイアウト"""
+    fallback_layouts: list[PathLayout] = Field(default_factory=list)
+    """
+    保存済みの書類を探す際に、path_layoutに加えて確認するレイアウト
+    レイアウトの移行中も、旧レイアウトに保存済みの書類を再取得しないようにするため。
+    """
+    existence_cache: ExistenceCacheConfig | None = None
+    """
+    指定した場合、存在確認の結果をキャッシュする（保存時にも更新する）
+    list_documentとcollect_documentで同じ書類の存在確認を繰り返さないようにするため。
+    他のプロセスが同じストレージに保存する場合、ttl_secondsの間は結果が古くなることがある。
+    """
+    bundling: BundlingConfig | None = None
+    """
+    指定した場合、小さな書類を開示日単位のバンドルにまとめて保存する
+    オブジェクト数とPUTリクエスト数を削減するため。members形式の抽出とは併用できない。
+    """
+
+    @model_validator(mode="after")
+    def validate_bundling(self) -> "RepositoryConfig":
+        if (
+            self.bundling is not None
+            and self.extraction is not None
+            and self.extraction.output == "members"
+        ):
+            raise ValueError("bundling cannot be combined with members extraction")
+        return self
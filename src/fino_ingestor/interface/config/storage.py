@@ -1,14 +1,62 @@
-from pydantic import BaseModel, field_validator
+from typing import Literal, TypeAlias
+
+from pydantic import BaseModel, Field, field_validator
+
+from fino_ingestor.interface.config.concurrency import ConcurrencyConfig
+
+_MIB = 1024 * 1024
 
 
 class LocalStorageConfig(BaseModel):
     base_dir: str
+    durability: Literal["none", "file", "group"] = "none"
+    """
+    書き込みの永続化（fsync）方式
+    いずれの方式でも一時ファイルに書き込んでからリネームするため、書きかけのファイルは参照されない。
+    - none: fsyncしない（OSのキャッシュに任せる）
+    - file: ファイルごとにファイルとディレクトリをfsyncする
+    - group: 一時ファイルのまま保留し、group_commit_files件ごと、もしくは
+      group_commit_interval_ms経過ごとにまとめてfsync・リネームする
+    """
+    group_commit_files: int = Field(default=256, ge=1)
+    """group方式で、まとめて確定するファイル数"""
+    group_commit_interval_ms: int = Field(default=1000, ge=1)
+    """group方式で、最初の保留から確定までの最大待ち時間"""
+    stale_temp_file_seconds: float | None = Field(default=None, gt=0)
+    """
+    起動時に、この秒数より前に更新された一時ファイル（クラッシュで残ったもの）を削除する
+    base_dir配下をすべて走査するため、ファイル数が多い場合は起動に時間がかかる。
+    同じディレクトリに書き込み中の他のプロセスの一時ファイルを消さないよう、十分に長い時間を指定する。
+    None（デフォルト）の場合は削除しない。
+    """
+
+
+class S3TransferConfig(BaseModel):
+    """
+    S3への転送設定
+    閾値を超えるファイルはパートに分割し、並列にマルチパートアップロードする。
+    """
+
+    multipart_threshold: int = Field(default=64 * _MIB, ge=5 * _MIB)
+    """このサイズ以上のファイルをマルチパートアップロードする"""
+    part_size: int = Field(default=16 * _MIB, ge=5 * _MIB)
+    """1パートのバイト数（S3の制約により5MiB以上）"""
+    max_concurrency: int = Field(default=4, ge=1)
+    """並列にアップロードするパート数"""
+    max_attempts: int = Field(default=3, ge=1)
+    """パート単位の最大試行回数"""
+    resume: bool = True
+    """
+    失敗したマルチパートアップロードを残し、同じストレージからの同じキーへの次回の保存で
+    内容が一致するアップロード済みパートを再利用して再開する（無効の場合は失敗時に中断する）
+    """
 
 
 class S3StorageConfig(BaseModel):
     bucket_name: str
     region: str
     prefix: str | None = None
+    transfer: S3TransferConfig = Field(default_factory=S3TransferConfig)
 
     @field_validator("prefix", mode="before")
     @classmethod
@@ -16,3 +64,88 @@ class S3StorageConfig(BaseModel):
         if v is None:
             return ""
         return v
+
+
+class ContentAddressedStorageConfig(BaseModel):
+    """
+    コンテンツアドレス形式のストレージ設定
+    実体（blob）はハッシュ値をキーに1度だけ保存し、書類のパスにはblobへの参照のみを保存する。
+    """
+
+    backend: LocalStorageConfig | S3StorageConfig
+    """blobと参照を保存するストレージ"""
+    algorithm: Literal["sha256"] = "sha256"
+    """ハッシュアルゴリズム"""
+    blob_prefix: str = "blobs"
+    """blobを保存するパスのprefix"""
+    max_known_digests: int = Field(default=100_000, ge=1)
+    """保存済みであることを記憶しておくハッシュ値の数の上限（超えた場合はLRUで破棄する）"""
+
+
+class TieredStorageConfig(BaseModel):
+    """
+    ローカルのステージング領域を前段に置くライトビハインド形式のストレージ設定
+    保存はステージング領域への書き込み完了時点で完了とし、backendへはバックグラウンドでアップロードする。
+    """
+
+    staging: LocalStorageConfig
+    """
+    アップロード待ちのファイルを置くローカルディレクトリ
+    クラッシュ後も未アップロードのファイルを失わないよう、durabilityは"file"か"group"を推奨する。
+    """
+    backend: LocalStorageConfig | S3StorageConfig
+    """最終的な保存先"""
+    max_concurrency: int = Field(default=4, ge=1)
+    """並列にアップロードするファイル数"""
+    upload_concurrency: ConcurrencyConfig | None = None
+    """指定した場合、max_concurrencyの代わりにレイテンシとエラーに応じて並列数を自動調整する"""
+    max_pending_uploads: int = Field(default=1000, ge=1)
+    """アップロード待ちのファイル数の上限（超えた場合は保存を待機させる）"""
+    max_attempts: int = Field(default=3, ge=1)
+    """ファイル単位の最大試行回数"""
+
+
+class ReadCacheStorageConfig(BaseModel):
+    """
+    ローカルディスクを読み込みキャッシュとして前段に置くストレージ設定
+    同じ書類を繰り返し読み込む場合に、S3からの再ダウンロードを避けるため。
+    """
+
+    backend: S3StorageConfig | ContentAddressedStorageConfig
+    """キャッシュする対象のストレージ"""
+    cache_dir: str
+    """キャッシュを保存するローカルディレクトリ"""
+    max_bytes: int = Field(default=10 * 1024 * _MIB, ge=1)
+    """キャッシュの合計サイズの上限（超えた場合は最も古く参照されたファイルから削除する）"""
+
+
+class FanOutStorageConfig(BaseModel):
+    """
+    複数のストレージへ同時に保存するストレージ設定
+    1度ダウンロードした書類を、ローカルディスクとS3など複数の保存先へ並列に書き込む。
+    """
+
+    backends: list[
+        LocalStorageConfig
+        | S3StorageConfig
+        | ContentAddressedStorageConfig
+        | TieredStorageConfig
+    ] = Field(min_length=2)
+    """保存先（readは先頭から順に参照する）"""
+    consistency: Literal["all", "quorum"] = "all"
+    """
+    保存・存在確認の整合性
+    - all: すべての保存先への保存を成功とし、すべてに存在する場合のみ保存済みとみなす
+    - quorum: 過半数の保存先への保存を成功とし、過半数に存在する場合に保存済みとみなす
+    """
+
+
+StorageConfig: TypeAlias = (
+    LocalStorageConfig
+    | S3StorageConfig
+    | ContentAddressedStorageConfig
+    | TieredStorageConfig
+    | ReadCacheStorageConfig
+    | FanOutStorageConfig
+)
+"""DocumentCollectorに指定できるストレージ設定"""
@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field, model_validator
+
+
+class WatchConfig(BaseModel):
+    """
+    当日の書類一覧を監視する際のポーリング設定
+    新着書類が見つかった直後は短い間隔でポーリングし、
+    見つからない間は backoff_factor 倍ずつ max_interval_seconds まで間隔を広げる。
+    """
+
+    min_interval_seconds: float = Field(default=60.0, gt=0)
+    """ポーリング間隔の下限（新着書類が見つかった直後の間隔）"""
+    max_interval_seconds: float = Field(default=900.0, gt=0)
+    """ポーリング間隔の上限"""
+    backoff_factor: float = Field(default=2.0, ge=1.0)
+    """新着書類が見つからなかった場合に間隔へ掛ける倍率"""
+    lookback_days: int = Field(default=3, ge=0)
+    """遅れて公開された書類を拾うために再確認する過去の日数"""
+    lookback_interval_seconds: float = Field(default=3600.0, gt=0)
+    """過去日の再確認を行う間隔"""
+
+    @model_validator(mode="after")
+    def validate_interval(self) -> "WatchConfig":
+        if self.min_interval_seconds > self.max_interval_seconds:
+            raise ValueError(
+                "min_interval_seconds must be less than or equal to max_interval_seconds"
+            )
+        return self
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from typing import Generic, Protocol, TypeVar
 
 from fino_ingestor.domain.entity.document import Document
@@ -18,6 +19,21 @@ class DisclosureSourcePort(Protocol, Generic[TCriteria]):
 
     """ドキュメントを一覧取得する。"""
 
-    def download_document(self, document: Document) -> bytes: ...
+    def download_document(
+        self, document: Document, on_size: Callable[[int], None] | None = None
+    ) -> bytes: ...
 
-    """ドキュメントをダウンロードする。"""
+    """
+    ドキュメントをダウンロードする。
+    on_sizeを指定した場合、ダウンロード完了前にサイズが判明した時点（Content-Lengthなど）で呼び出す。
+    """
+
+
+class WatchableDisclosureSourcePort(DisclosureSourcePort[TCriteria], Protocol):
+    """新着書類の監視に対応した開示ソースのポート"""
+
+    def list_updated_documents(
+        self, criteria: TCriteria, seen: dict[str, str]
+    ) -> list[Document]: ...
+
+    """seenに記録されていない、もしくは変化した書類のみを一覧取得する。"""
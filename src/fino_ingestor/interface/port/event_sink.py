@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+from fino_ingestor.domain.event.document_stored import DocumentStoredEvent
+
+
+class EventSinkPort(ABC):
+    """
+    書類の保存イベントの通知先
+    publishは書類ごとにストレージへの書き込みが確定した時点で呼び出される
+    （アップロードやグループコミットを行うスレッドから呼び出される場合がある）。
+    複数のスレッドから並行して呼び出されるため、スレッドセーフに実装すること。
+    publishで発生した例外は書類の保存を失敗させない。
+    """
+
+    @abstractmethod
+    def publish(self, event: DocumentStoredEvent) -> None: ...
+
+    def close(self) -> None:
+        """保持しているファイルや接続を解放する"""
+        return None
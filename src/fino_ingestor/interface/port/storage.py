@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import AbstractContextManager, contextmanager
 
 
 class StoragePort(ABC):
@@ -6,4 +8,94 @@ class StoragePort(ABC):
     def exists(self, path: str) -> bool: ...
 
     @abstractmethod
-    def save(self, path: str, file: bytes) -> None: ...
+    def save(
+        self, path: str, file: bytes, metadata: Mapping[str, str] | None = None
+    ) -> None:
+        """
+        ファイルを保存する。
+        metadataを指定した場合、オブジェクトのメタデータ（S3のユーザー定義メタデータ、ローカルの拡張属性）として保存する。
+        """
+        ...
+
+    def save_if_absent(
+        self, path: str, file: bytes, metadata: Mapping[str, str] | None = None
+    ) -> bool:
+        """
+        呼び出し側が存在しないことを確認済みのファイルを保存する。
+        既定ではsaveと同じ（存在確認のリクエストを重ねて発行しない）。
+        複数の保存先を持つストレージでは、保存先ごとに存在しない場合のみ保存する
+        （一部の保存先にのみ保存済みのファイルを、保存済みの保存先に転送し直さないため）。
+        いずれかの保存先に書き込んだ場合はTrue、すべての保存先に保存済みだった場合はFalseを返す。
+        """
+        self.save(path=path, file=file, metadata=metadata)
+        return True
+
+    def read(self, path: str, offset: int = 0, length: int | None = None) -> bytes:
+        """
+        ファイルを読み込む。
+        offsetとlengthを指定した場合はその範囲のみを読み込む（レンジ読み込み）。
+        offsetが負の場合は末尾から-offsetバイトを読み込む。
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support read")
+
+    def read_metadata(self, path: str) -> dict[str, str]:
+        """
+        保存時に指定したメタデータを読み込む。
+        メタデータに対応していないストレージでは空のdictを返す。
+        """
+        return {}
+
+    def open(self, path: str) -> AbstractContextManager[memoryview]:
+        """
+        ファイルの内容をmemoryviewとして参照する。
+        ローカルファイルの場合はメモリマップを返すため、withブロックの外にviewを持ち出さないこと。
+        """
+        return _open_as_copy(self, path)
+
+    def list_paths(self, prefix: str = "") -> Iterator[str]:
+        """prefix配下に保存されているファイルのパスを列挙する"""
+        raise NotImplementedError(f"{type(self).__name__} does not support list_paths")
+
+    def delete(self, path: str) -> None:
+        """ファイルを削除する"""
+        raise NotImplementedError(f"{type(self).__name__} does not support delete")
+
+    def move(self, source_path: str, target_path: str) -> None:
+        """
+        ファイルを移動する。
+        バックエンドがリネームやサーバーサイドコピーに対応している場合はそれを使用する。
+        """
+        self.save(
+            path=target_path,
+            file=self.read(path=source_path),
+            metadata=self.read_metadata(path=source_path) or None,
+        )
+        self.delete(path=source_path)
+
+    def when_durable(self, path: str, callback: Callable[[], None]) -> None:
+        """
+        saveしたpathへの書き込みが確定した時点でcallbackを呼び出す。
+        既定ではsaveから戻った時点で確定しているため、すぐに呼び出す。
+        書き込みを遅延するストレージでは、確定処理（アップロードなど）を行うスレッドから呼び出し、
+        確定に失敗した場合は再試行で確定するまで呼び出さない。
+        """
+        callback()
+
+    def mark_corrupt(self, path: str) -> None:
+        """
+        pathのファイルが壊れていることを通知し、次回のsaveで内容から書き直されるようにする。
+        既定では何もしない（saveが常に内容を書き込むため）。
+        """
+
+    def flush(self) -> None:
+        """書き込みを遅延・バッファリングしている場合、保留中の書き込みを確定する"""
+        return None
+
+    def close(self) -> None:
+        """保留中の書き込みを確定し、保持しているワーカーなどを解放する"""
+        self.flush()
+
+
+@contextmanager
+def _open_as_copy(storage: StoragePort, path: str) -> Iterator[memoryview]:
+    yield memoryview(storage.read(path=path))
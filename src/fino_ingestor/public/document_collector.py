@@ -1,38 +1,228 @@
-from typing import Literal, Optional
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, ExitStack, contextmanager
+from typing import Any, Literal, Optional, TypedDict
 
+from fino_ingestor.application.input.audit_storage import AuditStorageInput
 from fino_ingestor.application.input.collect_document import CollectDocumentInput
 from fino_ingestor.application.input.list_document import ListDocumentInput
+from fino_ingestor.application.input.plan_document import PlanDocumentInput
+from fino_ingestor.application.input.repair_document import RepairDocumentInput
+from fino_ingestor.application.input.retry_failed_document import (
+    RetryFailedDocumentInput,
+)
+from fino_ingestor.application.input.watch_document import WatchDocumentInput
+from fino_ingestor.application.interactor.audit_storage import AuditStorageUseCase
 from fino_ingestor.application.interactor.collect_document import CollectDocumentUseCase
 from fino_ingestor.application.interactor.list_document import ListDocumentUseCase
+from fino_ingestor.application.interactor.plan_document import PlanDocumentUseCase
+from fino_ingestor.application.interactor.repair_document import RepairDocumentUseCase
+from fino_ingestor.application.interactor.retry_failed_document import (
+    RetryFailedDocumentUseCase,
+)
+from fino_ingestor.application.output.audit_storage import (
+    AuditStorageOutput,
+    RepairPlan,
+)
+from fino_ingestor.application.output.plan_document import PlanDocumentOutput
+from fino_ingestor.application.interactor.watch_document import WatchDocumentUseCase
+from fino_ingestor.domain.entity.dead_letter import DeadLetter
 from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.event.document_stored import DocumentStoredEvent
 from fino_ingestor.domain.value.format_type import FormatType, FormatTypeEnum
 from fino_ingestor.infrastructure.adapter.disclosure_source.edinet import (
     EdinetDocumentSearchCriteria,
 )
+from fino_ingestor.infrastructure.adapter.event_sink.callback import (
+    CallbackEventSink,
+)
+from fino_ingestor.infrastructure.factory.bandwidth import create_bandwidth_limiter
+from fino_ingestor.infrastructure.factory.client_registry import (
+    ClientLease,
+    default_client_registry,
+)
 from fino_ingestor.infrastructure.factory.disclosure_source import (
     create_disclosure_source,
 )
+from fino_ingestor.infrastructure.factory.event_sink import create_event_sink
 from fino_ingestor.infrastructure.factory.storage import create_storage
+from fino_ingestor.infrastructure.policy.document_path import create_path_policy
+from fino_ingestor.infrastructure.processor.integrity import PackageVerifier
+from fino_ingestor.infrastructure.repository.dead_letter import (
+    DeadLetterRepositoryImpl,
+)
 from fino_ingestor.infrastructure.repository.document import DocumentRepositoryImpl
+from fino_ingestor.infrastructure.repository.layout_migration import LayoutMigrator
+from fino_ingestor.infrastructure.repository.storage_audit import StorageAuditor
+from fino_ingestor.infrastructure.adapter.storage.tiered import TieredStorage
+from fino_ingestor.infrastructure.scheduler.bandwidth import (
+    BandwidthLimiter,
+    BandwidthMetrics,
+)
+from fino_ingestor.infrastructure.scheduler.byte_budget import ByteBudget
+from fino_ingestor.infrastructure.scheduler.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyMetrics,
+)
+from fino_ingestor.infrastructure.scheduler.download_queue import (
+    DownloadPriorityPolicy,
+    DownloadQueue,
+    QueuedDocument,
+)
+from fino_ingestor.interface.config.concurrency import (
+    BackpressureConfig,
+    BandwidthConfig,
+    ConcurrencyConfig,
+)
 from fino_ingestor.interface.config.disclosure import EdinetConfig
-from fino_ingestor.interface.config.storage import LocalStorageConfig, S3StorageConfig
-from fino_ingestor.util.timescope import TimeScope
+from fino_ingestor.interface.config.event import EventSinkConfig
+from fino_ingestor.interface.config.integrity import IntegrityConfig
+from fino_ingestor.interface.config.plan import PlanConfig
+from fino_ingestor.interface.config.priority import PriorityConfig
+from fino_ingestor.interface.config.repository import PathLayout, RepositoryConfig
+from fino_ingestor.interface.config.storage import StorageConfig
+from fino_ingestor.interface.config.watch import WatchConfig
+from fino_ingestor.interface.port.event_sink import EventSinkPort
+from fino_ingestor.util.business_calendar import BusinessCalendar
+from fino_ingestor.util.date_range import DateScope
+
+
+class CollectResult(TypedDict):
+    """collect_document・retry_failedの結果"""
+
+    collected_document_list: list[Document]
+    failed_document_list: list[DeadLetter]
+    """失敗してデッドレターに記録した書類"""
+
+
+class RepairResult(TypedDict):
+    """repairの結果"""
+
+    repaired_document_list: list[Document]
+    failed_document_list: list[DeadLetter]
+    """失敗してデッドレターに記録した書類"""
 
 
 class DocumentCollector:
     def __init__(
         self,
         disclosure_config: EdinetConfig,
-        storage_config: LocalStorageConfig | S3StorageConfig,
+        storage_config: StorageConfig,
+        share_clients: bool = True,
+        repository_config: Optional[RepositoryConfig] = None,
+        event_sinks: Optional[list[EventSinkConfig]] = None,
+        on_document_stored: Optional[Callable[[DocumentStoredEvent], None]] = None,
+        priority_config: Optional[PriorityConfig] = None,
+        download_concurrency: Optional[ConcurrencyConfig] = None,
+        backpressure: Optional[BackpressureConfig] = None,
+        bandwidth: Optional[BandwidthConfig] = None,
+        integrity: Optional[IntegrityConfig] = None,
     ) -> None:
-        storage = create_storage(storage_config)
-        self._document_repository = DocumentRepositoryImpl(storage)
-        self._disclosure_source = create_disclosure_source(disclosure_config)
+        if backpressure is not None and download_concurrency is None:
+            raise ValueError("backpressure requires download_concurrency")
+
+        # share_clientsが有効な場合、同じ設定のboto3/EDINETクライアントをプロセス内で共有する
+        # （closeでは、このインスタンスが取得したクライアントの参照だけを返却する）
+        self._client_lease = (
+            ClientLease(default_client_registry) if share_clients else None
+        )
+        client_registry = self._client_lease
+        # 指定した場合、ダウンロード・アップロードそれぞれの合計帯域を上限内に抑える
+        # （share_clientsが有効な場合、同じ上限のリミッターはプロセス内のすべての収集で共有する）
+        self._bandwidth_limiters: dict[
+            Literal["download", "upload"], BandwidthLimiter
+        ] = {}
+        if bandwidth is not None:
+            directions: tuple[Literal["download", "upload"], ...] = (
+                "download",
+                "upload",
+            )
+            for direction in directions:
+                limiter = create_bandwidth_limiter(
+                    bandwidth, direction, client_registry=client_registry
+                )
+                if limiter is not None:
+                    self._bandwidth_limiters[direction] = limiter
+        storage = create_storage(
+            storage_config,
+            client_registry=client_registry,
+            bandwidth_limiter=self._bandwidth_limiters.get("upload"),
+        )
+        self._storage = storage
+        self._repository_config = repository_config or RepositoryConfig()
+        # 書類の保存が確定するごとに保存イベントを通知する
+        self._event_sinks: list[EventSinkPort] = [
+            create_event_sink(config) for config in event_sinks or []
+        ]
+        if on_document_stored is not None:
+            self._event_sinks.append(CallbackEventSink(on_document_stored))
+        self._document_repository = DocumentRepositoryImpl(
+            storage, config=self._repository_config, event_sinks=self._event_sinks
+        )
+        # 失敗した書類は書類と同じストレージに記録し、retry_failedで再取得する
+        self._dead_letter_repository = DeadLetterRepositoryImpl(storage)
+        self._disclosure_source = create_disclosure_source(
+            disclosure_config,
+            client_registry=client_registry,
+            bandwidth_limiter=self._bandwidth_limiters.get("download"),
+        )
+        # 指定した場合、collect_documentは未取得の書類を優先度順にダウンロードする
+        self._priority_policy = (
+            DownloadPriorityPolicy(priority_config)
+            if priority_config is not None
+            else None
+        )
+        # 実行中の収集のダウンロード待ちキュー（queued_documentsの監視用）
+        self._download_queues: list[DownloadQueue] = []
+        self._download_queues_lock = threading.Lock()
+        # 指定した場合、collect_documentはレイテンシとエラーに応じた並列数でダウンロードする
+        self._download_limiter = (
+            AdaptiveConcurrencyLimiter(download_concurrency)
+            if download_concurrency is not None
+            else None
+        )
+        # 指定した場合、処理中の書類の合計バイト数が上限に達している間は新しいダウンロードを待機させる
+        self._backpressure = backpressure or BackpressureConfig()
+        self._byte_budget = (
+            ByteBudget(backpressure.max_in_flight_bytes)
+            if backpressure is not None
+            else None
+        )
+        # 指定した場合、ダウンロードした書類を保存前に検証し、内容のハッシュをメタデータとして保存する
+        self._package_verifier = (
+            PackageVerifier(integrity) if integrity is not None else None
+        )
+
+    @staticmethod
+    def shutdown_clients() -> None:
+        """プロセス内で共有しているクライアントをすべて破棄する（サービス終了時などに呼び出す）"""
+        default_client_registry.shutdown()
+
+    def close(self) -> None:
+        """
+        このインスタンスが保持しているものをすべて解放する
+        - 書類の保存処理・ストレージのワーカー（保留中の書き込みは確定・アップロードしてから終了する）
+        - 検証用のワーカー
+        - 取得した共有クライアントの参照（他のインスタンスが使用中のクライアントは破棄しない）
+        - 保存イベントの通知先（ジャーナルファイル・ソケット）
+        """
+        # 登録と逆順に閉じる（保存イベントの通知先は、書き込みの確定による通知が終わってから閉じる）
+        with ExitStack() as stack:
+            for sink in self._event_sinks:
+                _ = stack.callback(sink.close)
+            if self._client_lease is not None:
+                _ = stack.callback(self._client_lease.shutdown)
+            if self._package_verifier is not None:
+                _ = stack.callback(self._package_verifier.close)
+            _ = stack.callback(self._storage.close)
+            _ = stack.callback(self._document_repository.close)
 
     def list_document(
         self,
-        timescope: TimeScope,
+        timescope: DateScope,
         format_type: Optional[FormatTypeEnum] = FormatTypeEnum.XBRL,
+        calendar: Optional[BusinessCalendar] = None,
+        verify_non_business_days: bool = False,
     ) -> dict[
         Literal["available_document_list", "stored_document_list"], list[Document]
     ]:
@@ -47,6 +237,8 @@ class DocumentCollector:
         criteria = EdinetDocumentSearchCriteria(
             format_type=FormatType(enum=format_type),
             timescope=timescope,
+            calendar=calendar,
+            verify_non_business_days=verify_non_business_days,
         )
         input = ListDocumentInput(
             disclosure_source=self._disclosure_source, criteria=criteria
@@ -60,26 +252,318 @@ class DocumentCollector:
 
     def collect_document(
         self,
-        timescope: TimeScope,
+        timescope: DateScope,
         format_type: Optional[FormatTypeEnum] = FormatTypeEnum.XBRL,
-    ) -> dict[Literal["collected_document_list"], list[Document]]:
+        calendar: Optional[BusinessCalendar] = None,
+        verify_non_business_days: bool = False,
+    ) -> CollectResult:
+        """
+        timescopeの書類のうち未保存の書類を収集する
+        書類ごとのダウンロード・保存の失敗は収集を中断せずにデッドレターに記録し、
+        failed_document_listとして返す（retry_failedで再取得できる）。
+        """
         # validation
         if format_type is None:
             raise ValueError(
                 "format_type must not None. please specify format_type or use default value (XBRL)"
             )
 
-        usecase = CollectDocumentUseCase(self._document_repository)
-
         criteria = EdinetDocumentSearchCriteria(
             format_type=FormatType(enum=format_type),
             timescope=timescope,
+            calendar=calendar,
+            verify_non_business_days=verify_non_business_days,
         )
 
         input = CollectDocumentInput(
             disclosure_source=self._disclosure_source, criteria=criteria
         )
 
+        with self._collect_usecase() as usecase:
+            output = usecase.execute(input)
+
+        return {
+            "collected_document_list": output.collected_document_list,
+            "failed_document_list": output.failed_document_list,
+        }
+
+    def retry_failed(self) -> CollectResult:
+        """
+        collect_documentで失敗した書類（デッドレター）のみを再取得する
+
+        Examples
+        --------
+        >>> result = collector.retry_failed()
+        >>> [(d.document.document_id, d.attempts) for d in result["failed_document_list"]]
+        """
+        input = RetryFailedDocumentInput(disclosure_source=self._disclosure_source)
+        with self._collect_usecase() as collect_usecase:
+            usecase = RetryFailedDocumentUseCase(
+                collect_usecase, self._dead_letter_repository
+            )
+            output = usecase.execute(input)
+        return {
+            "collected_document_list": output.collected_document_list,
+            "failed_document_list": output.failed_document_list,
+        }
+
+    def failed_documents(self) -> list[DeadLetter]:
+        """デッドレターに記録されている書類を、最初に失敗した順に返す"""
+        return self._dead_letter_repository.list_dead_letters()
+
+    @contextmanager
+    def _collect_usecase(self) -> Iterator[CollectDocumentUseCase]:
+        # 同時に実行される収集どうしで書類を取り合わないよう、呼び出しごとにキューを作成する
+        download_queue = (
+            DownloadQueue(self._priority_policy)
+            if self._priority_policy is not None
+            else None
+        )
+        if download_queue is not None:
+            with self._download_queues_lock:
+                self._download_queues.append(download_queue)
+        try:
+            yield CollectDocumentUseCase(
+                self._document_repository,
+                download_queue=download_queue,
+                download_limiter=self._download_limiter,
+                byte_budget=self._byte_budget,
+                default_document_bytes=self._backpressure.default_document_bytes,
+                package_verifier=self._package_verifier,
+                dead_letter_repository=self._dead_letter_repository,
+            )
+        finally:
+            if download_queue is not None:
+                with self._download_queues_lock:
+                    self._download_queues.remove(download_queue)
+
+    def plan(
+        self,
+        timescope: DateScope,
+        format_types: Optional[list[FormatTypeEnum]] = None,
+        calendar: Optional[BusinessCalendar] = None,
+        verify_non_business_days: bool = False,
+        plan_config: Optional[PlanConfig] = None,
+    ) -> PlanDocumentOutput:
+        """
+        書類をダウンロードせずに、collect_documentで必要となる作業量と所要時間を見積もる
+        日付・フォーマット単位の残件数、推定転送量、PUT数、書類一覧APIの呼び出し回数を返す。
+
+        Examples
+        --------
+        >>> plan = collector.plan(DateRange(date(2015, 1, 1), date(2024, 12, 31)))
+        >>> plan.remaining_documents, plan.estimated_duration_seconds
+        """
+        usecase = PlanDocumentUseCase(
+            self._document_repository,
+            config=plan_config,
+            repository_config=self._repository_config,
+        )
+        input = PlanDocumentInput(
+            disclosure_source=self._disclosure_source,
+            timescope=timescope,
+            format_types=[
+                FormatType(enum=format_type)
+                for format_type in format_types or [FormatTypeEnum.XBRL]
+            ],
+            calendar=calendar,
+            verify_non_business_days=verify_non_business_days,
+        )
+        return usecase.execute(input)
+
+    def audit(
+        self,
+        timescope: DateScope,
+        format_type: FormatTypeEnum = FormatTypeEnum.XBRL,
+        prefix: str = "",
+        calendar: Optional[BusinessCalendar] = None,
+        verify_non_business_days: bool = False,
+        verify_hashes: bool = False,
+        max_workers: int = 8,
+    ) -> AuditStorageOutput:
+        """
+        prefix配下の保存済みの書類を並列に検証し、timescopeの書類一覧と突き合わせる
+        途中で切れた・フォーマットと内容が一致しない・保存されていない書類を検出し、
+        再取得が必要な書類をrepair_planとして返す。
+
+        Examples
+        --------
+        >>> result = collector.audit(TimeScope(year=2024, month=3), prefix="EDINET/")
+        >>> collector.repair(result.repair_plan)
+        """
+        policies = [
+            create_path_policy(layout)
+            for layout in dict.fromkeys(
+                [
+                    self._repository_config.path_layout,
+                    *self._repository_config.fallback_layouts,
+                ]
+            )
+        ]
+        usecase = AuditStorageUseCase(
+            self._document_repository,
+            auditor=StorageAuditor(
+                self._storage,
+                path_policies=policies,
+                max_workers=max_workers,
+                verify_hashes=verify_hashes,
+            ),
+        )
+        criteria = EdinetDocumentSearchCriteria(
+            format_type=FormatType(enum=format_type),
+            timescope=timescope,
+            calendar=calendar,
+            verify_non_business_days=verify_non_business_days,
+        )
+        input = AuditStorageInput(
+            disclosure_source=self._disclosure_source, criteria=criteria, prefix=prefix
+        )
+        return usecase.execute(input)
+
+    def repair(self, plan: RepairPlan) -> RepairResult:
+        """
+        auditで作成した修復計画の書類のみを再取得し、保存済みのオブジェクトを上書きする
+        書類ごとの失敗は修復を中断せずにデッドレターに記録し、failed_document_listとして返す。
+        """
+        usecase = RepairDocumentUseCase(
+            self._document_repository,
+            package_verifier=self._package_verifier,
+            dead_letter_repository=self._dead_letter_repository,
+        )
+        input = RepairDocumentInput(
+            disclosure_source=self._disclosure_source, plan=plan
+        )
         output = usecase.execute(input)
+        return {
+            "repaired_document_list": output.repaired_document_list,
+            "failed_document_list": output.failed_document_list,
+        }
 
-        return {"collected_document_list": output.collected_document_list}
+    def watch(
+        self,
+        format_type: FormatTypeEnum = FormatTypeEnum.XBRL,
+        watch_config: Optional[WatchConfig] = None,
+        calendar: Optional[BusinessCalendar] = None,
+        stop_event: Optional[threading.Event] = None,
+        on_collected: Optional[Callable[[list[Document]], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        """
+        当日の書類一覧を監視し、新着書類を収集し続ける（stop_eventがセットされるまでブロックする）
+        書類ごとの失敗は監視を中断せずにデッドレターに記録し、次回のポーリングで再度確認する。
+
+        Examples
+        --------
+        >>> stop_event = threading.Event()
+        >>> collector.watch(stop_event=stop_event, on_collected=print)
+        """
+        usecase = WatchDocumentUseCase(
+            self._document_repository,
+            config=watch_config,
+            package_verifier=self._package_verifier,
+            dead_letter_repository=self._dead_letter_repository,
+        )
+        input = WatchDocumentInput(
+            disclosure_source=self._disclosure_source,
+            format_type=FormatType(enum=format_type),
+            calendar=calendar,
+        )
+        usecase.run(
+            input, stop_event=stop_event, on_collected=on_collected, on_error=on_error
+        )
+
+    def queued_documents(self, limit: Optional[int] = None) -> list[QueuedDocument]:
+        """
+        収集中のcollect_documentでダウンロード待ちの書類を、優先度の高い順に返す（監視用）
+        複数の収集を同時に実行している場合は、すべての収集の書類をまとめて返す。
+        priority_configを指定していない場合は常に空のリストを返す。
+        """
+        with self._download_queues_lock:
+            download_queues = list(self._download_queues)
+        queued = sorted(
+            (
+                queued
+                for download_queue in download_queues
+                for queued in download_queue.snapshot(limit=limit)
+            ),
+            key=lambda queued: -queued.priority,
+        )
+        return queued[:limit] if limit is not None else queued
+
+    def concurrency_metrics(
+        self,
+    ) -> dict[Literal["download", "upload"], ConcurrencyMetrics]:
+        """自動調整している並列数の現在値を返す（メトリクスとしてエクスポートする用途）"""
+        metrics: dict[Literal["download", "upload"], ConcurrencyMetrics] = {}
+        if self._download_limiter is not None:
+            metrics["download"] = self._download_limiter.metrics()
+        if (
+            isinstance(self._storage, TieredStorage)
+            and self._storage.upload_limiter is not None
+        ):
+            metrics["upload"] = self._storage.upload_limiter.metrics()
+        return metrics
+
+    def bandwidth_metrics(
+        self,
+    ) -> dict[Literal["download", "upload"], BandwidthMetrics]:
+        """帯域の上限を指定した転送方向ごとに、実効スループットを返す"""
+        return {
+            direction: limiter.metrics()
+            for direction, limiter in self._bandwidth_limiters.items()
+        }
+
+    def read_document(self, document: Document) -> bytes:
+        """保存済みの書類を読み込む"""
+        return self._document_repository.read(document)
+
+    def open_document(self, document: Document) -> AbstractContextManager[memoryview]:
+        """
+        保存済みの書類をmemoryviewとして参照する（ローカルの場合はコピーせずメモリマップで参照する）
+
+        Examples
+        --------
+        >>> with collector.open_document(document) as view:
+        ...     zipfile.ZipFile(io.BytesIO(view))
+        """
+        return self._document_repository.open(document)
+
+    def iter_documents(
+        self,
+        timescope: DateScope,
+        format_type: Optional[FormatTypeEnum] = FormatTypeEnum.XBRL,
+        calendar: Optional[BusinessCalendar] = None,
+        max_workers: int = 4,
+    ) -> Iterator[tuple[Document, bytes]]:
+        """timescopeの書類のうち、保存済みの書類を (書類, 内容) として順に返す"""
+        listed = self.list_document(
+            timescope=timescope, format_type=format_type, calendar=calendar
+        )
+        return self._document_repository.iter_documents(
+            listed["stored_document_list"], max_workers=max_workers
+        )
+
+    def migrate_layout(
+        self,
+        from_layout: PathLayout,
+        prefix: str = "",
+        max_workers: int = 8,
+        dry_run: bool = False,
+    ) -> dict[Literal["moved", "skipped", "failed"], list[Any]]:
+        """
+        from_layoutで保存済みの書類を、repository_configのpath_layoutへ並列に移動する
+        移行中もlist/collectが旧レイアウトの書類を参照できるよう、
+        repository_configのfallback_layoutsにfrom_layoutを指定しておくこと。
+        """
+        migrator = LayoutMigrator(
+            self._storage,
+            source=create_path_policy(from_layout),
+            target=create_path_policy(self._repository_config.path_layout),
+            max_workers=max_workers,
+        )
+        result = migrator.migrate(prefix=prefix, dry_run=dry_run)
+        return {
+            "moved": result.moved,
+            "skipped": result.skipped,
+            "failed": result.failed,
+        }
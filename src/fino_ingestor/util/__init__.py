@@ -1,3 +1,13 @@
+from .business_calendar import BusinessCalendar, JapanMarketCalendar, WeekdayCalendar
+from .date_range import DateRange, DateRangeSet, DateScope
 from .timescope import TimeScope
 
-__all__ = ["TimeScope"]
+__all__ = [
+    "BusinessCalendar",
+    "DateRange",
+    "DateRangeSet",
+    "DateScope",
+    "JapanMarketCalendar",
+    "TimeScope",
+    "WeekdayCalendar",
+]
@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+from datetime import date
+
+from ._jp_holidays import (
+    JP_HOLIDAY_TABLE_FIRST_YEAR,
+    JP_HOLIDAY_TABLE_LAST_YEAR,
+    JP_NATIONAL_HOLIDAYS,
+)
+
+
+class BusinessCalendar(ABC):
+    """
+    営業日カレンダーの抽象クラス
+    開示ソースごとに休業日の定義が異なるため、ソースに応じた実装を差し替えて利用する。
+    """
+
+    @abstractmethod
+    def is_business_day(self, target: date) -> bool: ...
+
+    def is_holiday(self, target: date) -> bool:
+        return not self.is_business_day(target)
+
+
+class WeekdayCalendar(BusinessCalendar):
+    """土日のみを休業日とするカレンダー"""
+
+    def is_business_day(self, target: date) -> bool:
+        return target.weekday() < 5
+
+
+class JapanMarketCalendar(WeekdayCalendar):
+    """
+    日本市場の営業日カレンダー
+    - 土日
+    - 国民の祝日・振替休日・国民の休日（事前計算済みのテーブル）
+    - 年末年始の休業日（12/31, 1/2, 1/3）
+    を休業日とする。
+
+    祝日テーブルの範囲外の年は土日と年末年始のみを休業日として扱う。
+    """
+
+    # 東京証券取引所の年末年始休業日（1/1は国民の祝日に含まれる）
+    YEAR_END_HOLIDAYS: frozenset[tuple[int, int]] = frozenset(
+        {(12, 31), (1, 2), (1, 3)}
+    )
+
+    def is_business_day(self, target: date) -> bool:
+        if not super().is_business_day(target):
+            return False
+        if (target.month, target.day) in self.YEAR_END_HOLIDAYS:
+            return False
+        return target not in JP_NATIONAL_HOLIDAYS
+
+    @staticmethod
+    def covers(target: date) -> bool:
+        """祝日テーブルが対象日の年をカバーしているか"""
+        return JP_HOLIDAY_TABLE_FIRST_YEAR <= target.year <= JP_HOLIDAY_TABLE_LAST_YEAR
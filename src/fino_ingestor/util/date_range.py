@@ -0,0 +1,259 @@
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Self, TypeAlias
+
+from .business_calendar import BusinessCalendar
+from .timescope import TimeScope
+
+_ONE_DAY = timedelta(days=1)
+
+
+@dataclass(frozen=True, slots=True)
+class DateRange:
+    """
+    任意の [start, end] の日付レンジ（両端を含む閉区間）
+
+    Examples
+    --------
+    >>> last_45_days = DateRange.last_days(45, until=date(2024, 3, 31))
+    >>> last_45_days.start
+    datetime.date(2024, 2, 16)
+    """
+
+    start: date
+    end: date
+
+    def __post_init__(self) -> None:
+        if self.start > self.end:
+            raise ValueError(
+                f"start must be before or equal to end: {self.start} > {self.end}"
+            )
+
+    @classmethod
+    def last_days(cls, days: int, until: date | None = None) -> Self:
+        """untilを末尾とする直近days日間のレンジを生成する"""
+        if days < 1:
+            raise ValueError("days must be greater than or equal to 1")
+        end = until or date.today()
+        return cls(start=end - timedelta(days=days - 1), end=end)
+
+    @property
+    def days(self) -> int:
+        return (self.end - self.start).days + 1
+
+    def to_range(self) -> tuple[date, date]:
+        return self.start, self.end
+
+    def iterate_by_day(
+        self, calendar: BusinessCalendar | None = None
+    ) -> Iterator[date]:
+        current = self.start
+        while current <= self.end:
+            if calendar is None or calendar.is_business_day(current):
+                yield current
+            current += _ONE_DAY
+
+    def iterate_non_business_days(self, calendar: BusinessCalendar) -> Iterator[date]:
+        for target in self.iterate_by_day():
+            if calendar.is_holiday(target):
+                yield target
+
+
+class DateRangeSet:
+    """
+    日付レンジの集合
+    互いに重ならず隣接もしない DateRange を昇順に保持するよう正規化する。
+    和・積・差の集合演算と、シャードへの分割を提供する。
+
+    Examples
+    --------
+    >>> scope = DateRangeSet.from_timescope(TimeScope(year=2024))
+    >>> remaining = scope - completed_days  # 完了済みの日付集合を除外
+    >>> shards = remaining.chunk(max_days=30)
+    """
+
+    __slots__ = ("_ranges", "_starts")
+
+    def __init__(self, ranges: Iterable[DateRange] = ()) -> None:
+        self._ranges: tuple[DateRange, ...] = self._normalize(ranges)
+        # 日付の所属判定を二分探索で行うための開始日一覧
+        self._starts: tuple[date, ...] = tuple(r.start for r in self._ranges)
+
+    @classmethod
+    def from_timescope(cls, timescope: TimeScope) -> Self:
+        start, end = timescope.to_range()
+        return cls([DateRange(start=start, end=end)])
+
+    @classmethod
+    def from_dates(cls, dates: Iterable[date]) -> Self:
+        """日付の集合から、連続する日付をまとめたレンジ集合を生成する"""
+        ranges: list[DateRange] = []
+        for target in sorted(set(dates)):
+            if ranges and ranges[-1].end + _ONE_DAY == target:
+                ranges[-1] = DateRange(start=ranges[-1].start, end=target)
+            else:
+                ranges.append(DateRange(start=target, end=target))
+        return cls(ranges)
+
+    @property
+    def ranges(self) -> tuple[DateRange, ...]:
+        return self._ranges
+
+    def is_empty(self) -> bool:
+        return not self._ranges
+
+    def to_range(self) -> tuple[date, date]:
+        """集合全体を覆う [start, end] を返す"""
+        if not self._ranges:
+            raise ValueError("DateRangeSet is empty")
+        return self._ranges[0].start, self._ranges[-1].end
+
+    ########## 集合演算 ##########
+    def union(self, other: "DateScope | Iterable[date]") -> "DateRangeSet":
+        return DateRangeSet((*self._ranges, *_to_range_set(other).ranges))
+
+    def intersection(self, other: "DateScope | Iterable[date]") -> "DateRangeSet":
+        other_ranges = _to_range_set(other).ranges
+        result: list[DateRange] = []
+        i = j = 0
+        # 両方のレンジ列を昇順に走査して重なり部分を取り出す
+        while i < len(self._ranges) and j < len(other_ranges):
+            a, b = self._ranges[i], other_ranges[j]
+            start, end = max(a.start, b.start), min(a.end, b.end)
+            if start <= end:
+                result.append(DateRange(start=start, end=end))
+            if a.end < b.end:
+                i += 1
+            else:
+                j += 1
+        return DateRangeSet(result)
+
+    def difference(self, other: "DateScope | Iterable[date]") -> "DateRangeSet":
+        other_ranges = _to_range_set(other).ranges
+        result: list[DateRange] = []
+        j = 0
+        for r in self._ranges:
+            current = r.start
+            # rより前で終わる除外レンジは読み飛ばす
+            while j < len(other_ranges) and other_ranges[j].end < current:
+                j += 1
+            k = j
+            while k < len(other_ranges) and other_ranges[k].start <= r.end:
+                excluded = other_ranges[k]
+                if excluded.start > current:
+                    result.append(
+                        DateRange(start=current, end=excluded.start - _ONE_DAY)
+                    )
+                current = max(current, excluded.end + _ONE_DAY)
+                k += 1
+            if current <= r.end:
+                result.append(DateRange(start=current, end=r.end))
+        return DateRangeSet(result)
+
+    def __or__(self, other: "DateScope") -> "DateRangeSet":
+        return self.union(other)
+
+    def __and__(self, other: "DateScope") -> "DateRangeSet":
+        return self.intersection(other)
+
+    def __sub__(self, other: "DateScope | Iterable[date]") -> "DateRangeSet":
+        return self.difference(other)
+
+    ########## シャード分割 ##########
+    def chunk(self, max_days: int) -> list["DateRangeSet"]:
+        """
+        集合を昇順にmax_days日ずつのシャードへ分割する。
+        各シャードは複数のレンジにまたがることがある。
+        """
+        if max_days < 1:
+            raise ValueError("max_days must be greater than or equal to 1")
+
+        shards: list[DateRangeSet] = []
+        current: list[DateRange] = []
+        remaining = max_days
+        for r in self._ranges:
+            start = r.start
+            while start <= r.end:
+                end = min(r.end, start + timedelta(days=remaining - 1))
+                current.append(DateRange(start=start, end=end))
+                remaining -= (end - start).days + 1
+                start = end + _ONE_DAY
+                if remaining == 0:
+                    shards.append(DateRangeSet(current))
+                    current, remaining = [], max_days
+        if current:
+            shards.append(DateRangeSet(current))
+        return shards
+
+    def shard(self, count: int) -> list["DateRangeSet"]:
+        """集合を日数がほぼ均等なcount個以下のシャードへ分割する"""
+        if count < 1:
+            raise ValueError("count must be greater than or equal to 1")
+        if not self._ranges:
+            return []
+        return self.chunk(max_days=-(-len(self) // count))
+
+    ########## イテレーション ##########
+    def iterate_by_day(
+        self, calendar: BusinessCalendar | None = None
+    ) -> Iterator[date]:
+        for r in self._ranges:
+            yield from r.iterate_by_day(calendar=calendar)
+
+    def iterate_non_business_days(self, calendar: BusinessCalendar) -> Iterator[date]:
+        for r in self._ranges:
+            yield from r.iterate_non_business_days(calendar)
+
+    def __iter__(self) -> Iterator[date]:
+        return self.iterate_by_day()
+
+    def __len__(self) -> int:
+        return sum(r.days for r in self._ranges)
+
+    def __contains__(self, target: object) -> bool:
+        if not isinstance(target, date):
+            return False
+        index = bisect_right(self._starts, target) - 1
+        return index >= 0 and target <= self._ranges[index].end
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DateRangeSet):
+            return self._ranges == other._ranges
+        return False
+
+    def __hash__(self) -> int:
+        return hash(self._ranges)
+
+    def __repr__(self) -> str:
+        ranges = ", ".join(
+            f"{r.start.isoformat()}..{r.end.isoformat()}" for r in self._ranges
+        )
+        return f"DateRangeSet([{ranges}])"
+
+    @staticmethod
+    def _normalize(ranges: Iterable[DateRange]) -> tuple[DateRange, ...]:
+        """重なり・隣接するレンジを結合して昇順に並べる"""
+        merged: list[DateRange] = []
+        for r in sorted(ranges, key=lambda r: r.start):
+            if merged and r.start <= merged[-1].end + _ONE_DAY:
+                if r.end > merged[-1].end:
+                    merged[-1] = DateRange(start=merged[-1].start, end=r.end)
+            else:
+                merged.append(r)
+        return tuple(merged)
+
+
+DateScope: TypeAlias = TimeScope | DateRange | DateRangeSet
+"""書類一覧の取得対象として指定できる日付範囲"""
+
+
+def _to_range_set(value: DateScope | Iterable[date]) -> DateRangeSet:
+    if isinstance(value, DateRangeSet):
+        return value
+    if isinstance(value, DateRange):
+        return DateRangeSet([value])
+    if isinstance(value, TimeScope):
+        return DateRangeSet.from_timescope(value)
+    return DateRangeSet.from_dates(value)
@@ -0,0 +1,30 @@
+import time
+from collections.abc import Callable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def call_with_retry(
+    func: Callable[[], T],
+    max_attempts: int,
+    retry_on: tuple[type[BaseException], ...] = (Exception,),
+    base_delay: float = 0.2,
+    max_delay: float = 5.0,
+) -> T:
+    """
+    funcを最大max_attempts回まで呼び出す
+    retry_onに該当する例外の場合のみ、指数バックオフで待機して再試行する。
+    """
+    if max_attempts < 1:
+        raise ValueError("max_attempts must be greater than or equal to 1")
+
+    attempt = 1
+    while True:
+        try:
+            return func()
+        except retry_on:
+            if attempt >= max_attempts:
+                raise
+            time.sleep(min(max_delay, base_delay * 2 ** (attempt - 1)))
+            attempt += 1
@@ -1,10 +1,12 @@
+from calendar import monthrange
 from datetime import date, timedelta
 from enum import Enum, auto
 from typing import Iterator, Optional, Self, Tuple
 
-from dateutil.relativedelta import relativedelta
 from pydantic import BaseModel, Field, model_validator
 
+from .business_calendar import BusinessCalendar
+
 
 class Granularity(Enum):
     """期間の粒度を表す列挙型"""
@@ -67,9 +69,10 @@ class TimeScope(BaseModel):
         if self.granularity == Granularity.DAY:
             return date(self.year, self.month or 1, self.day or 1)
         elif self.granularity == Granularity.MONTH:
-            return date(self.year, self.month or 1, 1) + relativedelta(months=1) - timedelta(days=1)
+            month = self.month or 1
+            return date(self.year, month, monthrange(self.year, month)[1])
         else:
-            return date(self.year, 1, 1) + relativedelta(years=1) - timedelta(days=1)
+            return date(self.year, 12, 31)
 
     def to_range(self) -> Tuple[date, date]:
         """
@@ -99,19 +102,23 @@ class TimeScope(BaseModel):
             # granularityがMONTHの場合、monthはNoneではない
             assert self.month is not None  # noqa: S101
             start = date(self.year, self.month, 1)
-            end = start + relativedelta(months=1) - timedelta(days=1)
+            # 月末日はdateutilに依存せず標準ライブラリで算出する
+            end = date(self.year, self.month, monthrange(self.year, self.month)[1])
         else:
             start = date(self.year, 1, 1)
-            end = start + relativedelta(years=1) - timedelta(days=1)
+            end = date(self.year, 12, 31)
 
         return start, end
 
-    def iterate_by_day(self) -> Iterator[date]:
+    def iterate_by_day(
+        self, calendar: Optional[BusinessCalendar] = None
+    ) -> Iterator[date]:
         """
         TimeScopeを日単位でイテレートする
 
         期間内のすべての日を日単位でイテレートします。
         粒度に関係なく、常に日単位で処理します。
+        calendarを指定した場合は、そのカレンダーの営業日のみをイテレートします。
 
         Yields
         ------
@@ -131,10 +138,24 @@ class TimeScope(BaseModel):
         >>> dates = list(timescope.iterate_by_day())
         >>> len(dates)
         366  # 2024年はうるう年
+
+        >>> dates = list(timescope.iterate_by_day(calendar=JapanMarketCalendar()))
+        >>> len(dates)
+        245
         """
         start, end = self.to_range()
         current = start
 
         while current <= end:
-            yield current
+            if calendar is None or calendar.is_business_day(current):
+                yield current
             current += timedelta(days=1)
+
+    def iterate_non_business_days(self, calendar: BusinessCalendar) -> Iterator[date]:
+        """
+        TimeScope内の休業日を日単位でイテレートする
+        営業日のみを処理した後の検証（休業日に提出がないかの確認）に利用する。
+        """
+        for target in self.iterate_by_day():
+            if calendar.is_holiday(target):
+                yield target
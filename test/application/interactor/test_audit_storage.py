@@ -0,0 +1,286 @@
+import io
+import tempfile
+import zipfile
+from collections.abc import Generator
+from datetime import date
+from pathlib import Path
+
+import pytest
+from fino_ingestor.application.input.audit_storage import AuditStorageInput
+from fino_ingestor.application.input.repair_document import RepairDocumentInput
+from fino_ingestor.application.interactor.audit_storage import AuditStorageUseCase
+from fino_ingestor.application.interactor.repair_document import (
+    RepairDocumentUseCase,
+)
+from fino_ingestor.application.output.audit_storage import RepairPlan, RepairTarget
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.value.disclosure_date import DisclosureDate
+from fino_ingestor.domain.value.disclosure_source import (
+    DisclosureSource,
+    DisclosureSourceEnum,
+)
+from fino_ingestor.domain.value.disclosure_type import (
+    DisclosureType,
+    DisclosureTypeEnum,
+)
+from fino_ingestor.domain.value.document_id import DocumentId
+from fino_ingestor.domain.value.format_type import FormatType, FormatTypeEnum
+from fino_ingestor.domain.value.ticker import Ticker
+from fino_ingestor.infrastructure.adapter.disclosure_source.edinet import (
+    EdinetDocumentSearchCriteria,
+)
+from fino_ingestor.infrastructure.adapter.storage.content_addressed import (
+    ContentAddressedStorage,
+)
+from fino_ingestor.infrastructure.adapter.storage.local import LocalStorage
+from fino_ingestor.infrastructure.policy.document_path import create_path_policy
+from fino_ingestor.infrastructure.repository.dead_letter import (
+    DeadLetterRepositoryImpl,
+)
+from fino_ingestor.infrastructure.repository.document import DocumentRepositoryImpl
+from fino_ingestor.infrastructure.repository.storage_audit import StorageAuditor
+from fino_ingestor.interface.config.repository import RepositoryConfig
+from fino_ingestor.interface.config.storage import (
+    ContentAddressedStorageConfig,
+    LocalStorageConfig,
+)
+from fino_ingestor.util import DateRange
+
+
+def build_document(doc_id: str) -> Document:
+    return Document(
+        document_id=DocumentId(value=f"EDINET_{doc_id}_XBRL"),
+        filing_name="有価証券報告書",
+        ticker=Ticker(value="12345"),
+        disclosure_type=DisclosureType(enum=DisclosureTypeEnum.ANNUAL_REPORT),
+        disclosure_source=DisclosureSource(enum=DisclosureSourceEnum.EDINET),
+        disclosure_date=DisclosureDate(value=date(2024, 3, 15)),
+        filing_format=FormatType(enum=FormatTypeEnum.XBRL),
+    )
+
+
+def build_zip(members: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            # 同じ内容から同じバイト列を作るため、更新日時を固定する
+            zf.writestr(zipfile.ZipInfo(name, date_time=(2024, 3, 15, 0, 0, 0)), data)
+    return buffer.getvalue()
+
+
+class FakeDisclosureSource:
+    """固定の書類一覧を返し、ダウンロードした書類を記録する開示ソース"""
+
+    def __init__(self, doc_ids: list[str]) -> None:
+        self.documents = [build_document(doc_id) for doc_id in doc_ids]
+        self.downloaded: list[str] = []
+        self.failing: set[str] = set()
+
+    def list_available_documents(
+        self, criteria: EdinetDocumentSearchCriteria
+    ) -> list[Document]:
+        return list(self.documents)
+
+    def download_document(self, document: Document) -> bytes:
+        if document.document_id.value in self.failing:
+            raise OSError("download failed")
+        self.downloaded.append(document.document_id.value)
+        return build_zip({"a.xbrl": document.document_id.value.encode()})
+
+
+class TestAuditStorageUseCase:
+    @pytest.fixture
+    def storage(self) -> Generator[LocalStorage, None, None]:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield LocalStorage(config=LocalStorageConfig(base_dir=str(Path(tmpdir))))
+
+    @pytest.fixture
+    def repository(self, storage: LocalStorage) -> DocumentRepositoryImpl:
+        return DocumentRepositoryImpl(storage)
+
+    @pytest.fixture
+    def source(self) -> FakeDisclosureSource:
+        return FakeDisclosureSource(["S100A", "S100B", "S100C"])
+
+    def build_input(self, source: FakeDisclosureSource) -> AuditStorageInput:
+        return AuditStorageInput(
+            disclosure_source=source,
+            criteria=EdinetDocumentSearchCriteria(
+                format_type=FormatType(enum=FormatTypeEnum.XBRL),
+                timescope=DateRange(start=date(2024, 3, 15), end=date(2024, 3, 15)),
+            ),
+        )
+
+    def audit(
+        self,
+        storage: LocalStorage,
+        repository: DocumentRepositoryImpl,
+        source: FakeDisclosureSource,
+    ) -> AuditStorageUseCase:
+        auditor = StorageAuditor(
+            storage, path_policies=[create_path_policy("ticker")], max_workers=2
+        )
+        return AuditStorageUseCase(repository, auditor=auditor)
+
+    ########## execute method ##########
+    def test_execute_builds_repair_plan(
+        self,
+        storage: LocalStorage,
+        repository: DocumentRepositoryImpl,
+        source: FakeDisclosureSource,
+    ) -> None:
+        package = build_zip({"a.xbrl": b"x" * 1000})
+        repository.save(build_document("S100A"), package)
+        repository.save(build_document("S100B"), package[:100])
+        # 書類一覧に含まれない書類は再取得できない
+        repository.save(build_document("S100Z"), b"<html>error</html>")
+
+        usecase = self.audit(storage, repository, source)
+        output = usecase.execute(self.build_input(source))
+
+        assert output.checked == 3
+        assert [d.document_id.value for d in output.missing] == ["EDINET_S100C_XBRL"]
+        assert [f.key.document_id for f in output.unresolved] == ["EDINET_S100Z_XBRL"]
+        assert {
+            (t.document.document_id.value, t.problem)
+            for t in output.repair_plan.targets
+        } == {("EDINET_S100B_XBRL", "truncated"), ("EDINET_S100C_XBRL", "missing")}
+        assert len(output.repair_plan) == 2
+
+
+class TestRepairDocumentUseCase:
+    @pytest.fixture
+    def storage(self) -> Generator[LocalStorage, None, None]:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield LocalStorage(config=LocalStorageConfig(base_dir=str(Path(tmpdir))))
+
+    ########## execute method ##########
+    def test_execute_refetches_only_planned_documents(
+        self, storage: LocalStorage
+    ) -> None:
+        repository = DocumentRepositoryImpl(storage)
+        source = FakeDisclosureSource(["S100A", "S100B", "S100C"])
+        package = build_zip({"a.xbrl": b"x" * 1000})
+        repository.save(build_document("S100A"), package)
+        repository.save(build_document("S100B"), package[:100])
+        auditor = StorageAuditor(storage, path_policies=[create_path_policy("ticker")])
+        audit = AuditStorageUseCase(repository, auditor=auditor).execute(
+            AuditStorageInput(
+                disclosure_source=source,
+                criteria=EdinetDocumentSearchCriteria(
+                    format_type=FormatType(enum=FormatTypeEnum.XBRL),
+                    timescope=DateRange(start=date(2024, 3, 15), end=date(2024, 3, 15)),
+                ),
+            )
+        )
+
+        output = RepairDocumentUseCase(repository).execute(
+            RepairDocumentInput(disclosure_source=source, plan=audit.repair_plan)
+        )
+
+        assert sorted(source.downloaded) == ["EDINET_S100B_XBRL", "EDINET_S100C_XBRL"]
+        assert len(output.repaired_document_list) == 2
+        assert auditor.scan().findings == []
+        assert repository.exists(build_document("S100C"))
+
+    def test_execute_records_failures_and_continues(
+        self, storage: LocalStorage
+    ) -> None:
+        repository = DocumentRepositoryImpl(storage)
+        dead_letters = DeadLetterRepositoryImpl(storage)
+        source = FakeDisclosureSource(["S100A", "S100B"])
+        source.failing.add("EDINET_S100A_XBRL")
+        plan = RepairPlan(
+            targets=[
+                RepairTarget(document=document, problem="missing", path=None)
+                for document in source.documents
+            ]
+        )
+
+        output = RepairDocumentUseCase(
+            repository, dead_letter_repository=dead_letters
+        ).execute(RepairDocumentInput(disclosure_source=source, plan=plan))
+
+        assert [d.document_id.value for d in output.repaired_document_list] == [
+            "EDINET_S100B_XBRL"
+        ]
+        (failed,) = output.failed_document_list
+        assert failed.document.document_id.value == "EDINET_S100A_XBRL"
+        assert dead_letters.list_dead_letters() == [failed]
+
+    def test_execute_deletes_broken_object_in_fallback_layout(
+        self, storage: LocalStorage
+    ) -> None:
+        repository = DocumentRepositoryImpl(
+            storage,
+            config=RepositoryConfig(path_layout="ticker", fallback_layouts=["hive"]),
+        )
+        source = FakeDisclosureSource(["S100A"])
+        document = source.documents[0]
+        # 旧レイアウトに途中で切れたオブジェクトが残っている
+        stale_path = create_path_policy("hive").generate_path(document, is_zip=True)
+        storage.save(stale_path, build_zip({"a.xbrl": b"x" * 1000})[:100])
+        auditor = StorageAuditor(
+            storage,
+            path_policies=[create_path_policy("ticker"), create_path_policy("hive")],
+        )
+        audit = AuditStorageUseCase(repository, auditor=auditor).execute(
+            AuditStorageInput(
+                disclosure_source=source,
+                criteria=EdinetDocumentSearchCriteria(
+                    format_type=FormatType(enum=FormatTypeEnum.XBRL),
+                    timescope=DateRange(start=date(2024, 3, 15), end=date(2024, 3, 15)),
+                ),
+            )
+        )
+        assert [t.path for t in audit.repair_plan.targets] == [stale_path]
+
+        output = RepairDocumentUseCase(repository).execute(
+            RepairDocumentInput(disclosure_source=source, plan=audit.repair_plan)
+        )
+
+        assert len(output.repaired_document_list) == 1
+        assert not storage.exists(stale_path)
+        assert storage.exists(
+            create_path_policy("ticker").generate_path(document, is_zip=True)
+        )
+        assert auditor.scan().findings == []
+
+    def test_execute_rewrites_corrupt_content_addressed_blob(
+        self, storage: LocalStorage
+    ) -> None:
+        cas = ContentAddressedStorage(
+            storage,
+            config=ContentAddressedStorageConfig(
+                backend=LocalStorageConfig(base_dir=str(storage.base_dir))
+            ),
+        )
+        repository = DocumentRepositoryImpl(cas)
+        source = FakeDisclosureSource(["S100A"])
+        document = source.documents[0]
+        package = source.download_document(document)
+        repository.save(document, package)
+        # blobの実体が途中で切れている（参照は正しい）
+        path = create_path_policy("ticker").generate_path(document, is_zip=True)
+        blob = storage.base_dir / cas.resolve(path)
+        _ = blob.write_bytes(package[:100])
+        auditor = StorageAuditor(cas, path_policies=[create_path_policy("ticker")])
+        audit = AuditStorageUseCase(repository, auditor=auditor).execute(
+            AuditStorageInput(
+                disclosure_source=source,
+                criteria=EdinetDocumentSearchCriteria(
+                    format_type=FormatType(enum=FormatTypeEnum.XBRL),
+                    timescope=DateRange(start=date(2024, 3, 15), end=date(2024, 3, 15)),
+                ),
+            )
+        )
+        assert [t.problem for t in audit.repair_plan.targets] == ["truncated"]
+
+        output = RepairDocumentUseCase(repository).execute(
+            RepairDocumentInput(disclosure_source=source, plan=audit.repair_plan)
+        )
+
+        assert len(output.repaired_document_list) == 1
+        # 再取得した内容は同じハッシュ値でも、blobを書き直す
+        assert blob.read_bytes() == package
+        assert auditor.scan().findings == []
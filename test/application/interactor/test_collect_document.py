@@ -0,0 +1,481 @@
+import hashlib
+import io
+import tempfile
+import zipfile
+import threading
+import time
+from collections.abc import Callable, Generator, Mapping
+from datetime import date
+from pathlib import Path
+
+import pytest
+from fino_ingestor.application.input.collect_document import CollectDocumentInput
+from fino_ingestor.application.input.retry_failed_document import (
+    RetryFailedDocumentInput,
+)
+from fino_ingestor.application.interactor.collect_document import (
+    CollectDocumentUseCase,
+)
+from fino_ingestor.application.interactor.retry_failed_document import (
+    RetryFailedDocumentUseCase,
+)
+from fino_ingestor.domain.entity.dead_letter import DeadLetter
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.value.disclosure_date import DisclosureDate
+from fino_ingestor.domain.value.disclosure_source import (
+    DisclosureSource,
+    DisclosureSourceEnum,
+)
+from fino_ingestor.domain.value.disclosure_type import (
+    DisclosureType,
+    DisclosureTypeEnum,
+)
+from fino_ingestor.domain.value.document_id import DocumentId
+from fino_ingestor.domain.value.format_type import FormatType, FormatTypeEnum
+from fino_ingestor.domain.value.ticker import Ticker
+from fino_ingestor.infrastructure.adapter.disclosure_source.edinet import (
+    EdinetDocumentSearchCriteria,
+)
+from fino_ingestor.infrastructure.adapter.storage.local import LocalStorage
+from fino_ingestor.infrastructure.processor.integrity import (
+    CorruptPackageError,
+    PackageVerifier,
+)
+from fino_ingestor.infrastructure.repository.dead_letter import (
+    DeadLetterRepositoryImpl,
+)
+from fino_ingestor.infrastructure.repository.document import DocumentRepositoryImpl
+from fino_ingestor.infrastructure.scheduler.byte_budget import ByteBudget
+from fino_ingestor.infrastructure.scheduler.concurrency import (
+    AdaptiveConcurrencyLimiter,
+)
+from fino_ingestor.infrastructure.scheduler.download_queue import (
+    DownloadPriorityPolicy,
+    DownloadQueue,
+)
+from fino_ingestor.interface.config.concurrency import ConcurrencyConfig
+from fino_ingestor.interface.config.integrity import IntegrityConfig
+from fino_ingestor.interface.config.priority import PriorityConfig
+from fino_ingestor.interface.config.repository import (
+    RepositoryConfig,
+    ZipExtractionConfig,
+)
+from fino_ingestor.interface.config.storage import LocalStorageConfig
+from fino_ingestor.util import TimeScope
+
+
+def build_document(doc_id: str, disclosure_type: DisclosureTypeEnum) -> Document:
+    return Document(
+        document_id=DocumentId(value=f"EDINET_{doc_id}_XBRL"),
+        filing_name="有価証券報告書",
+        ticker=Ticker(value="12345"),
+        disclosure_type=DisclosureType(enum=disclosure_type),
+        disclosure_source=DisclosureSource(enum=DisclosureSourceEnum.EDINET),
+        disclosure_date=DisclosureDate(value=date(2024, 3, 15)),
+        filing_format=FormatType(enum=FormatTypeEnum.XBRL),
+    )
+
+
+def build_zip(members: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+class FakeDisclosureSource:
+    def __init__(self, documents: list[Document]) -> None:
+        self.documents = documents
+        self.downloaded: list[str] = []
+        self.failing: set[str] = set()
+        self._lock = threading.Lock()
+
+    def list_available_documents(
+        self, criteria: EdinetDocumentSearchCriteria
+    ) -> list[Document]:
+        return self.documents
+
+    def download_document(
+        self, document: Document, on_size: Callable[[int], None] | None = None
+    ) -> bytes:
+        if document.document_id.value in self.failing:
+            raise OSError("download failed")
+        if on_size is not None:
+            on_size(len(b"data"))
+        with self._lock:
+            self.downloaded.append(document.document_id.value)
+        return b"data"
+
+
+class TestCollectDocumentUseCase:
+    @pytest.fixture
+    def repository(self) -> Generator[DocumentRepositoryImpl, None, None]:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = LocalStorage(
+                config=LocalStorageConfig(base_dir=str(Path(tmpdir)))
+            )
+            yield DocumentRepositoryImpl(storage)
+
+    @pytest.fixture
+    def source(self) -> FakeDisclosureSource:
+        return FakeDisclosureSource(
+            [
+                build_document("S100A", DisclosureTypeEnum.MATERIAL_EVENT_REPORT),
+                build_document("S100B", DisclosureTypeEnum.ANNUAL_REPORT),
+                build_document("S100C", DisclosureTypeEnum.QUARTERLY_REPORT),
+            ]
+        )
+
+    def build_input(self, source: FakeDisclosureSource) -> CollectDocumentInput:
+        criteria = EdinetDocumentSearchCriteria(
+            format_type=FormatType(enum=FormatTypeEnum.XBRL),
+            timescope=TimeScope(year=2024, month=3, day=15),
+        )
+        return CollectDocumentInput(disclosure_source=source, criteria=criteria)
+
+    ########## execute method ##########
+    def test_execute_downloads_in_listing_order(
+        self, repository: DocumentRepositoryImpl, source: FakeDisclosureSource
+    ) -> None:
+        _ = CollectDocumentUseCase(repository).execute(self.build_input(source))
+        assert source.downloaded == [
+            "EDINET_S100A_XBRL",
+            "EDINET_S100B_XBRL",
+            "EDINET_S100C_XBRL",
+        ]
+
+    def test_execute_downloads_by_priority(
+        self, repository: DocumentRepositoryImpl, source: FakeDisclosureSource
+    ) -> None:
+        queue = DownloadQueue(DownloadPriorityPolicy(PriorityConfig()))
+        output = CollectDocumentUseCase(repository, download_queue=queue).execute(
+            self.build_input(source)
+        )
+
+        assert source.downloaded == [
+            "EDINET_S100B_XBRL",
+            "EDINET_S100C_XBRL",
+            "EDINET_S100A_XBRL",
+        ]
+        assert len(output.collected_document_list) == 3
+        assert len(queue) == 0
+
+    def test_execute_downloads_concurrently(
+        self, repository: DocumentRepositoryImpl, source: FakeDisclosureSource
+    ) -> None:
+        limiter = AdaptiveConcurrencyLimiter(ConcurrencyConfig(initial_limit=2))
+        output = CollectDocumentUseCase(repository, download_limiter=limiter).execute(
+            self.build_input(source)
+        )
+
+        assert [d.document_id.value for d in output.collected_document_list] == [
+            "EDINET_S100A_XBRL",
+            "EDINET_S100B_XBRL",
+            "EDINET_S100C_XBRL",
+        ]
+        assert all(repository.exists(d) for d in source.documents)
+        assert limiter.metrics().in_flight == 0
+
+    def test_concurrent_download_raises_failure(
+        self, repository: DocumentRepositoryImpl, source: FakeDisclosureSource
+    ) -> None:
+        source.failing.add("EDINET_S100A_XBRL")
+        limiter = AdaptiveConcurrencyLimiter(
+            ConcurrencyConfig(initial_limit=1, max_limit=1)
+        )
+        with pytest.raises(OSError, match="download failed"):
+            _ = CollectDocumentUseCase(repository, download_limiter=limiter).execute(
+                self.build_input(source)
+            )
+        # 失敗後は新たな書類を投入しない
+        assert source.downloaded == []
+        assert limiter.metrics().in_flight == 0
+
+    def test_concurrent_download_releases_byte_budget(
+        self, repository: DocumentRepositoryImpl, source: FakeDisclosureSource
+    ) -> None:
+        budget = ByteBudget(max_bytes=100)
+        output = CollectDocumentUseCase(
+            repository,
+            download_limiter=AdaptiveConcurrencyLimiter(ConcurrencyConfig()),
+            byte_budget=budget,
+            default_document_bytes=60,
+        ).execute(self.build_input(source))
+
+        assert len(output.collected_document_list) == 3
+        # 保存の完了ごとに予約が解放される
+        assert budget.in_flight_bytes == 0
+
+    def test_concurrent_download_holds_byte_budget_until_stored(
+        self, source: FakeDisclosureSource
+    ) -> None:
+        """リポジトリが非同期で保存する場合、保存が終わるまで予約を解放しない"""
+        budget = ByteBudget(max_bytes=100)
+        held: list[int] = []
+
+        class SlowStorage(LocalStorage):
+            def save(
+                self, path: str, file: bytes, metadata: Mapping[str, str] | None = None
+            ) -> None:
+                # 予約が解放されるまで（最大0.5秒）保存を遅らせる
+                deadline = time.monotonic() + 0.5
+                while budget.in_flight_bytes > 0 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                held.append(budget.in_flight_bytes)
+                super().save(path, file, metadata)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = SlowStorage(config=LocalStorageConfig(base_dir=tmpdir))
+            repository = DocumentRepositoryImpl(
+                storage, config=RepositoryConfig(extraction=ZipExtractionConfig())
+            )
+            output = CollectDocumentUseCase(
+                repository,
+                download_limiter=AdaptiveConcurrencyLimiter(
+                    ConcurrencyConfig(initial_limit=1, max_limit=1)
+                ),
+                byte_budget=budget,
+                default_document_bytes=60,
+            ).execute(self.build_input(FakeDisclosureSource(source.documents[:1])))
+
+        assert len(output.collected_document_list) == 1
+        assert held == [len(b"data")]
+        assert budget.in_flight_bytes == 0
+
+    def test_byte_budget_requires_limiter(
+        self, repository: DocumentRepositoryImpl
+    ) -> None:
+        with pytest.raises(ValueError, match="download_limiter"):
+            _ = CollectDocumentUseCase(repository, byte_budget=ByteBudget(100))
+
+    ########## integrity ##########
+    @pytest.fixture
+    def verifier(self) -> Generator[PackageVerifier, None, None]:
+        verifier = PackageVerifier(IntegrityConfig(max_attempts=2))
+        yield verifier
+        verifier.close()
+
+    def test_execute_redownloads_corrupt_package(
+        self,
+        repository: DocumentRepositoryImpl,
+        verifier: PackageVerifier,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr("fino_ingestor.util.retry.time.sleep", lambda _: None)
+        package = build_zip({"XBRL/PublicDoc/instance.xbrl": b"<xbrl/>"})
+        document = build_document("S100A", DisclosureTypeEnum.ANNUAL_REPORT)
+        source = FakeDisclosureSource([document])
+        # 1回目は途中で切れたレスポンスを返す
+        responses = [package[:-20], package]
+        monkeypatch.setattr(
+            source, "download_document", lambda document, **_: responses.pop(0)
+        )
+
+        output = CollectDocumentUseCase(repository, package_verifier=verifier).execute(
+            self.build_input(source)
+        )
+
+        assert output.collected_document_list == [document]
+        assert responses == []
+        assert repository.read(document) == package
+
+    def test_execute_does_not_store_corrupt_package(
+        self,
+        repository: DocumentRepositoryImpl,
+        verifier: PackageVerifier,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr("fino_ingestor.util.retry.time.sleep", lambda _: None)
+        document = build_document("S100A", DisclosureTypeEnum.ANNUAL_REPORT)
+        source = FakeDisclosureSource([document])
+
+        with pytest.raises(CorruptPackageError):
+            _ = CollectDocumentUseCase(repository, package_verifier=verifier).execute(
+                self.build_input(source)
+            )
+        assert repository.exists(document) is False
+        assert source.downloaded == ["EDINET_S100A_XBRL"] * 2
+
+    def test_execute_stores_verified_hash_as_metadata(
+        self, verifier: PackageVerifier, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        package = build_zip({"XBRL/PublicDoc/instance.xbrl": b"<xbrl/>"})
+        document = build_document("S100A", DisclosureTypeEnum.ANNUAL_REPORT)
+        source = FakeDisclosureSource([document])
+        monkeypatch.setattr(source, "download_document", lambda document, **_: package)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = LocalStorage(config=LocalStorageConfig(base_dir=tmpdir))
+            repository = DocumentRepositoryImpl(storage)
+            _ = CollectDocumentUseCase(repository, package_verifier=verifier).execute(
+                self.build_input(source)
+            )
+
+            (path,) = list(storage.list_paths())
+            assert storage.read_metadata(path) == {
+                "sha256": hashlib.sha256(package).hexdigest()
+            }
+
+    ########## dead letter ##########
+    @pytest.fixture
+    def storage(self) -> Generator[LocalStorage, None, None]:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield LocalStorage(config=LocalStorageConfig(base_dir=tmpdir))
+
+    @pytest.mark.parametrize("concurrent", [False, True])
+    def test_execute_records_failures_and_continues(
+        self, storage: LocalStorage, source: FakeDisclosureSource, concurrent: bool
+    ) -> None:
+        source.failing.add("EDINET_S100B_XBRL")
+        repository = DocumentRepositoryImpl(storage)
+        dead_letters = DeadLetterRepositoryImpl(storage)
+        limiter = (
+            AdaptiveConcurrencyLimiter(ConcurrencyConfig(initial_limit=1, max_limit=1))
+            if concurrent
+            else None
+        )
+        output = CollectDocumentUseCase(
+            repository, download_limiter=limiter, dead_letter_repository=dead_letters
+        ).execute(self.build_input(source))
+
+        assert [d.document_id.value for d in output.collected_document_list] == [
+            "EDINET_S100A_XBRL",
+            "EDINET_S100C_XBRL",
+        ]
+        (failed,) = output.failed_document_list
+        assert failed.document.document_id.value == "EDINET_S100B_XBRL"
+        assert (failed.error_type, failed.error_message) == (
+            "builtins.OSError",
+            "download failed",
+        )
+        assert failed.attempts == 1
+        assert dead_letters.list_dead_letters() == [failed]
+
+    @pytest.mark.parametrize("concurrent", [False, True])
+    def test_execute_records_async_store_failures(
+        self, source: FakeDisclosureSource, concurrent: bool
+    ) -> None:
+        """zip処理をワーカーで行う場合も、保存に失敗した書類をそれぞれデッドレターに記録する"""
+
+        class FailingStorage(LocalStorage):
+            def save(
+                self, path: str, file: bytes, metadata: Mapping[str, str] | None = None
+            ) -> None:
+                if "S100A" in path or "S100C" in path:
+                    raise OSError("disk full")
+                super().save(path, file, metadata)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = FailingStorage(config=LocalStorageConfig(base_dir=tmpdir))
+            repository = DocumentRepositoryImpl(
+                storage, config=RepositoryConfig(extraction=ZipExtractionConfig())
+            )
+            dead_letters = DeadLetterRepositoryImpl(
+                LocalStorage(config=LocalStorageConfig(base_dir=tmpdir))
+            )
+            limiter = (
+                AdaptiveConcurrencyLimiter(ConcurrencyConfig(initial_limit=2))
+                if concurrent
+                else None
+            )
+            output = CollectDocumentUseCase(
+                repository,
+                download_limiter=limiter,
+                dead_letter_repository=dead_letters,
+            ).execute(self.build_input(source))
+
+            assert [d.document_id.value for d in output.collected_document_list] == [
+                "EDINET_S100B_XBRL"
+            ]
+            assert sorted(
+                d.document.document_id.value for d in output.failed_document_list
+            ) == ["EDINET_S100A_XBRL", "EDINET_S100C_XBRL"]
+            assert all(
+                d.error_message == "disk full" for d in output.failed_document_list
+            )
+            assert len(dead_letters.list_dead_letters()) == 2
+
+    def test_execute_records_flush_failures(self, source: FakeDisclosureSource) -> None:
+        """書き込みの確定に失敗した場合は、収集した書類をすべてデッドレターに記録する"""
+
+        class FailingFlushStorage(LocalStorage):
+            def flush(self) -> None:
+                raise IOError("upload failed")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repository = DocumentRepositoryImpl(
+                FailingFlushStorage(config=LocalStorageConfig(base_dir=tmpdir))
+            )
+            dead_letters = DeadLetterRepositoryImpl(
+                LocalStorage(config=LocalStorageConfig(base_dir=tmpdir))
+            )
+            output = CollectDocumentUseCase(
+                repository, dead_letter_repository=dead_letters
+            ).execute(self.build_input(source))
+
+            assert output.collected_document_list == []
+            assert [
+                d.document.document_id.value for d in output.failed_document_list
+            ] == ["EDINET_S100A_XBRL", "EDINET_S100B_XBRL", "EDINET_S100C_XBRL"]
+            assert all(
+                d.error_message == "upload failed" for d in output.failed_document_list
+            )
+            assert len(dead_letters.list_dead_letters()) == 3
+
+    def test_execute_continues_when_dead_letter_record_fails(
+        self, storage: LocalStorage, source: FakeDisclosureSource
+    ) -> None:
+        class FailingDeadLetterRepository(DeadLetterRepositoryImpl):
+            def record(self, document: Document, error: Exception) -> DeadLetter:
+                raise OSError("dead letter storage unavailable")
+
+        source.failing.add("EDINET_S100B_XBRL")
+        output = CollectDocumentUseCase(
+            DocumentRepositoryImpl(storage),
+            dead_letter_repository=FailingDeadLetterRepository(storage),
+        ).execute(self.build_input(source))
+
+        assert [d.document_id.value for d in output.collected_document_list] == [
+            "EDINET_S100A_XBRL",
+            "EDINET_S100C_XBRL",
+        ]
+        (failed,) = output.failed_document_list
+        assert failed.document.document_id.value == "EDINET_S100B_XBRL"
+        assert failed.error_message == "download failed"
+
+    def test_execute_skips_stored_documents_only(
+        self, storage: LocalStorage, source: FakeDisclosureSource
+    ) -> None:
+        repository = DocumentRepositoryImpl(storage)
+        repository.save(source.documents[0], b"data")
+
+        output = CollectDocumentUseCase(repository).execute(self.build_input(source))
+
+        assert source.downloaded == ["EDINET_S100B_XBRL", "EDINET_S100C_XBRL"]
+        assert len(output.collected_document_list) == 2
+
+    def test_retry_failed_downloads_only_dead_letters(
+        self, storage: LocalStorage, source: FakeDisclosureSource
+    ) -> None:
+        source.failing.update({"EDINET_S100A_XBRL", "EDINET_S100C_XBRL"})
+        repository = DocumentRepositoryImpl(storage)
+        dead_letters = DeadLetterRepositoryImpl(storage)
+        collect = CollectDocumentUseCase(
+            repository, dead_letter_repository=dead_letters
+        )
+        _ = collect.execute(self.build_input(source))
+        source.downloaded.clear()
+        source.failing.discard("EDINET_S100A_XBRL")
+
+        retry = RetryFailedDocumentUseCase(collect, dead_letters)
+        output = retry.execute(RetryFailedDocumentInput(disclosure_source=source))
+
+        assert source.downloaded == ["EDINET_S100A_XBRL"]
+        assert [d.document_id.value for d in output.collected_document_list] == [
+            "EDINET_S100A_XBRL"
+        ]
+        (remaining,) = dead_letters.list_dead_letters()
+        assert remaining.document.document_id.value == "EDINET_S100C_XBRL"
+        assert remaining.attempts == 2
+        assert output.failed_document_list == [remaining]
@@ -0,0 +1,194 @@
+import tempfile
+import threading
+from collections.abc import Generator
+from datetime import date
+from pathlib import Path
+
+import pytest
+from fino_ingestor.application.input.plan_document import PlanDocumentInput
+from fino_ingestor.application.interactor.plan_document import PlanDocumentUseCase
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.value.disclosure_date import DisclosureDate
+from fino_ingestor.domain.value.disclosure_source import (
+    DisclosureSource,
+    DisclosureSourceEnum,
+)
+from fino_ingestor.domain.value.disclosure_type import (
+    DisclosureType,
+    DisclosureTypeEnum,
+)
+from fino_ingestor.domain.value.document_id import DocumentId
+from fino_ingestor.domain.value.format_type import FormatType, FormatTypeEnum
+from fino_ingestor.domain.value.ticker import Ticker
+from fino_ingestor.infrastructure.adapter.disclosure_source.edinet import (
+    EdinetDocumentSearchCriteria,
+)
+from fino_ingestor.infrastructure.adapter.storage.local import LocalStorage
+from fino_ingestor.infrastructure.repository.document import DocumentRepositoryImpl
+from fino_ingestor.interface.config.plan import PlanConfig
+from fino_ingestor.interface.config.repository import (
+    BundlingConfig,
+    RepositoryConfig,
+)
+from fino_ingestor.interface.config.storage import LocalStorageConfig
+from fino_ingestor.util import DateRange
+
+
+def build_document(
+    doc_id: str, disclosure_date: date, format_type: FormatTypeEnum
+) -> Document:
+    return Document(
+        document_id=DocumentId(value=f"EDINET_{doc_id}_{format_type.value}"),
+        filing_name="有価証券報告書",
+        ticker=Ticker(value="12345"),
+        disclosure_type=DisclosureType(enum=DisclosureTypeEnum.ANNUAL_REPORT),
+        disclosure_source=DisclosureSource(enum=DisclosureSourceEnum.EDINET),
+        disclosure_date=DisclosureDate(value=disclosure_date),
+        filing_format=FormatType(enum=format_type),
+    )
+
+
+class FakeDisclosureSource:
+    """日付ごとの書類一覧を返し、ダウンロードは禁止する開示ソース"""
+
+    def __init__(self, doc_ids: dict[date, list[str]]) -> None:
+        self.doc_ids = doc_ids
+        self.list_calls = 0
+
+    def list_available_documents(
+        self, criteria: EdinetDocumentSearchCriteria
+    ) -> list[Document]:
+        self.list_calls += 1
+        return [
+            build_document(doc_id, target, criteria.format_type.enum)
+            for target in criteria.timescope.iterate_by_day()
+            for doc_id in self.doc_ids.get(target, [])
+        ]
+
+    def download_document(self, document: Document) -> bytes:
+        raise AssertionError("plan must not download documents")
+
+
+class TestPlanDocumentUseCase:
+    @pytest.fixture
+    def storage(self) -> Generator[LocalStorage, None, None]:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield LocalStorage(config=LocalStorageConfig(base_dir=str(Path(tmpdir))))
+
+    @pytest.fixture
+    def source(self) -> FakeDisclosureSource:
+        return FakeDisclosureSource(
+            {
+                date(2024, 3, 14): ["S100A", "S100B"],
+                date(2024, 3, 15): ["S100C"],
+            }
+        )
+
+    def build_input(
+        self, source: FakeDisclosureSource, *format_types: FormatTypeEnum
+    ) -> PlanDocumentInput:
+        return PlanDocumentInput(
+            disclosure_source=source,
+            timescope=DateRange(start=date(2024, 3, 14), end=date(2024, 3, 16)),
+            format_types=[FormatType(enum=f) for f in format_types],
+        )
+
+    ########## execute method ##########
+    def test_plan_excludes_stored_documents(
+        self, storage: LocalStorage, source: FakeDisclosureSource
+    ) -> None:
+        repository = DocumentRepositoryImpl(storage)
+        repository.save(
+            build_document("S100A", date(2024, 3, 14), FormatTypeEnum.XBRL), b"x"
+        )
+        usecase = PlanDocumentUseCase(
+            repository,
+            config=PlanConfig(
+                average_document_bytes={FormatTypeEnum.XBRL: 1000},
+                requests_per_second=2,
+            ),
+        )
+
+        plan = usecase.execute(self.build_input(source, FormatTypeEnum.XBRL))
+
+        assert [day.target_date for day in plan.days] == [
+            date(2024, 3, 14),
+            date(2024, 3, 15),
+            date(2024, 3, 16),
+        ]
+        first_day = plan.days[0].formats[FormatTypeEnum.XBRL]
+        assert (first_day.available, first_day.stored, first_day.remaining) == (
+            2,
+            1,
+            1,
+        )
+        assert plan.list_calls == 3
+        assert plan.remaining_documents == 2
+        assert plan.estimated_bytes == 2000
+        assert plan.puts == 2
+        # (一覧3回 + 取得2回) / 2req/s
+        assert plan.estimated_duration_seconds == 2.5
+
+    def test_plan_breaks_down_by_format(
+        self, storage: LocalStorage, source: FakeDisclosureSource
+    ) -> None:
+        usecase = PlanDocumentUseCase(DocumentRepositoryImpl(storage))
+
+        plan = usecase.execute(
+            self.build_input(source, FormatTypeEnum.XBRL, FormatTypeEnum.CSV)
+        )
+
+        assert set(plan.days[0].formats) == {FormatTypeEnum.XBRL, FormatTypeEnum.CSV}
+        assert plan.days[0].list_calls == 1
+        assert plan.list_calls == 3
+        assert plan.remaining_documents == 6
+
+    def test_plan_checks_existence_in_parallel(
+        self, storage: LocalStorage, source: FakeDisclosureSource
+    ) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+
+        class ParallelRepository(DocumentRepositoryImpl):
+            def exists(self, document: Document) -> bool:
+                # 2件の確認が同時に実行されない場合はタイムアウトする
+                if document.disclosure_date.value == date(2024, 3, 14):
+                    _ = barrier.wait()
+                return super().exists(document)
+
+        usecase = PlanDocumentUseCase(
+            ParallelRepository(storage), config=PlanConfig(max_workers=2)
+        )
+        plan = usecase.execute(self.build_input(source, FormatTypeEnum.XBRL))
+
+        assert plan.days[0].formats[FormatTypeEnum.XBRL].remaining == 2
+
+    def test_duration_is_bound_by_bandwidth(
+        self, storage: LocalStorage, source: FakeDisclosureSource
+    ) -> None:
+        usecase = PlanDocumentUseCase(
+            DocumentRepositoryImpl(storage),
+            config=PlanConfig(
+                average_document_bytes={FormatTypeEnum.XBRL: 1000},
+                requests_per_second=100,
+                bytes_per_second=100,
+            ),
+        )
+        plan = usecase.execute(self.build_input(source, FormatTypeEnum.XBRL))
+        assert plan.estimated_duration_seconds == 30
+
+    def test_bundled_documents_share_puts(
+        self, storage: LocalStorage, source: FakeDisclosureSource
+    ) -> None:
+        repository_config = RepositoryConfig(
+            bundling=BundlingConfig(max_member_bytes=2000, max_bundle_bytes=10_000)
+        )
+        usecase = PlanDocumentUseCase(
+            DocumentRepositoryImpl(storage, config=repository_config),
+            config=PlanConfig(average_document_bytes={FormatTypeEnum.XBRL: 1000}),
+            repository_config=repository_config,
+        )
+        plan = usecase.execute(self.build_input(source, FormatTypeEnum.XBRL))
+
+        # 日ごとに1バンドル
+        assert plan.puts == 2
+        assert plan.remaining_documents == 3
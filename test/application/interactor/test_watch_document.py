@@ -0,0 +1,345 @@
+import tempfile
+import threading
+from collections.abc import Generator, Mapping
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+from fino_ingestor.application.input.watch_document import WatchDocumentInput
+from fino_ingestor.application.interactor.watch_document import WatchDocumentUseCase
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.repository.document import DocumentStoreError
+from fino_ingestor.domain.value.disclosure_date import DisclosureDate
+from fino_ingestor.domain.value.disclosure_source import (
+    DisclosureSource,
+    DisclosureSourceEnum,
+)
+from fino_ingestor.domain.value.disclosure_type import (
+    DisclosureType,
+    DisclosureTypeEnum,
+)
+from fino_ingestor.domain.value.document_id import DocumentId
+from fino_ingestor.domain.value.format_type import FormatType, FormatTypeEnum
+from fino_ingestor.domain.value.ticker import Ticker
+from fino_ingestor.infrastructure.adapter.disclosure_source.edinet import (
+    EdinetDocumentSearchCriteria,
+)
+from fino_ingestor.infrastructure.adapter.storage.local import LocalStorage
+from fino_ingestor.infrastructure.repository.dead_letter import (
+    DeadLetterRepositoryImpl,
+)
+from fino_ingestor.infrastructure.repository.document import DocumentRepositoryImpl
+from fino_ingestor.interface.config.repository import (
+    RepositoryConfig,
+    ZipExtractionConfig,
+)
+from fino_ingestor.interface.config.storage import LocalStorageConfig
+from fino_ingestor.interface.config.watch import WatchConfig
+
+TODAY = date(2024, 3, 15)
+
+
+def build_document(doc_id: str, disclosure_date: date = TODAY) -> Document:
+    return Document(
+        document_id=DocumentId(value=f"EDINET_{doc_id}_XBRL"),
+        filing_name="有価証券報告書",
+        ticker=Ticker(value="12345"),
+        disclosure_type=DisclosureType(enum=DisclosureTypeEnum.ANNUAL_REPORT),
+        disclosure_source=DisclosureSource(enum=DisclosureSourceEnum.EDINET),
+        disclosure_date=DisclosureDate(value=disclosure_date),
+        filing_format=FormatType(enum=FormatTypeEnum.XBRL),
+    )
+
+
+class FakeDisclosureSource:
+    """日付ごとの書類一覧を保持し、確認済みの書類を除いて返す開示ソース"""
+
+    def __init__(self) -> None:
+        self.listings: dict[date, list[Document]] = {}
+        self.listed_dates: list[date] = []
+        self.downloaded: list[str] = []
+        self.fail_downloads = False
+        self.failing: set[str] = set()
+
+    def list_available_documents(
+        self, criteria: EdinetDocumentSearchCriteria
+    ) -> list[Document]:
+        raise NotImplementedError
+
+    def list_updated_documents(
+        self, criteria: EdinetDocumentSearchCriteria, seen: dict[str, str]
+    ) -> list[Document]:
+        updated: list[Document] = []
+        for target in criteria.timescope.iterate_by_day():
+            self.listed_dates.append(target)
+            for document in self.listings.get(target, []):
+                if document.document_id.value not in seen:
+                    seen[document.document_id.value] = ""
+                    updated.append(document)
+        return updated
+
+    def download_document(self, document: Document) -> bytes:
+        if self.fail_downloads or document.document_id.value in self.failing:
+            raise OSError("download failed")
+        self.downloaded.append(document.document_id.value)
+        return document.document_id.value.encode()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestWatchDocumentUseCase:
+    @pytest.fixture
+    def repository(self) -> Generator[DocumentRepositoryImpl, None, None]:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = LocalStorage(
+                config=LocalStorageConfig(base_dir=str(Path(tmpdir)))
+            )
+            yield DocumentRepositoryImpl(storage)
+
+    @pytest.fixture
+    def source(self) -> FakeDisclosureSource:
+        return FakeDisclosureSource()
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def usecase(
+        self, repository: DocumentRepositoryImpl, clock: FakeClock
+    ) -> WatchDocumentUseCase:
+        config = WatchConfig(
+            min_interval_seconds=10,
+            max_interval_seconds=40,
+            lookback_days=2,
+            lookback_interval_seconds=100,
+        )
+        return WatchDocumentUseCase(
+            repository, config=config, clock=clock, today=lambda: TODAY
+        )
+
+    def build_input(self, source: FakeDisclosureSource) -> WatchDocumentInput:
+        return WatchDocumentInput(
+            disclosure_source=source, format_type=FormatType(enum=FormatTypeEnum.XBRL)
+        )
+
+    ########## poll method ##########
+    def test_poll_collects_only_new_documents(
+        self, usecase: WatchDocumentUseCase, source: FakeDisclosureSource
+    ) -> None:
+        source.listings[TODAY] = [build_document("S100A")]
+        first = usecase.poll(self.build_input(source))
+
+        source.listings[TODAY].append(build_document("S100B"))
+        second = usecase.poll(self.build_input(source))
+
+        assert [d.document_id.value for d in first.collected_document_list] == [
+            "EDINET_S100A_XBRL"
+        ]
+        assert [d.document_id.value for d in second.collected_document_list] == [
+            "EDINET_S100B_XBRL"
+        ]
+        assert source.downloaded == ["EDINET_S100A_XBRL", "EDINET_S100B_XBRL"]
+
+    def test_poll_does_not_download_stored_documents(
+        self,
+        usecase: WatchDocumentUseCase,
+        source: FakeDisclosureSource,
+        repository: DocumentRepositoryImpl,
+    ) -> None:
+        document = build_document("S100A")
+        repository.save(document, b"stored")
+        source.listings[TODAY] = [document]
+
+        output = usecase.poll(self.build_input(source))
+
+        assert output.collected_document_list == []
+        assert source.downloaded == []
+
+    def test_interval_backs_off_and_resets(
+        self, usecase: WatchDocumentUseCase, source: FakeDisclosureSource
+    ) -> None:
+        intervals = [
+            usecase.poll(self.build_input(source)).next_interval for _ in range(4)
+        ]
+        assert intervals == [20, 40, 40, 40]
+
+        source.listings[TODAY] = [build_document("S100A")]
+        assert usecase.poll(self.build_input(source)).next_interval == 10
+
+    def test_lookback_runs_on_slower_cadence(
+        self,
+        usecase: WatchDocumentUseCase,
+        source: FakeDisclosureSource,
+        clock: FakeClock,
+    ) -> None:
+        yesterday = TODAY - timedelta(days=1)
+        first = usecase.poll(self.build_input(source))
+        assert first.polled_dates == [TODAY, yesterday, TODAY - timedelta(days=2)]
+
+        # 遅れて公開された書類は再確認の間隔が経過するまで取得しない
+        source.listings[yesterday] = [build_document("S100LATE", yesterday)]
+        clock.now = 50
+        second = usecase.poll(self.build_input(source))
+        assert second.polled_dates == [TODAY]
+        assert second.collected_document_list == []
+
+        clock.now = 100
+        third = usecase.poll(self.build_input(source))
+        assert [d.document_id.value for d in third.collected_document_list] == [
+            "EDINET_S100LATE_XBRL"
+        ]
+
+    def test_failed_download_is_retried_on_next_poll(
+        self, usecase: WatchDocumentUseCase, source: FakeDisclosureSource
+    ) -> None:
+        source.listings[TODAY] = [build_document("S100A")]
+        source.fail_downloads = True
+        with pytest.raises(OSError, match="download failed"):
+            _ = usecase.poll(self.build_input(source))
+
+        source.fail_downloads = False
+        output = usecase.poll(self.build_input(source))
+        assert len(output.collected_document_list) == 1
+
+    def test_failed_async_store_is_retried_on_next_poll(
+        self, source: FakeDisclosureSource, clock: FakeClock
+    ) -> None:
+        failures = ["disk full"]
+
+        class FlakyStorage(LocalStorage):
+            def save(
+                self, path: str, file: bytes, metadata: Mapping[str, str] | None = None
+            ) -> None:
+                if failures:
+                    raise OSError(failures.pop())
+                super().save(path, file, metadata)
+
+        source.listings[TODAY] = [build_document("S100A")]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repository = DocumentRepositoryImpl(
+                FlakyStorage(config=LocalStorageConfig(base_dir=tmpdir)),
+                config=RepositoryConfig(extraction=ZipExtractionConfig()),
+            )
+            usecase = WatchDocumentUseCase(repository, clock=clock, today=lambda: TODAY)
+            with pytest.raises(DocumentStoreError, match="EDINET_S100A_XBRL"):
+                _ = usecase.poll(self.build_input(source))
+
+            output = usecase.poll(self.build_input(source))
+            assert [d.document_id.value for d in output.collected_document_list] == [
+                "EDINET_S100A_XBRL"
+            ]
+            assert repository.exists(build_document("S100A"))
+
+    def test_failed_document_does_not_block_others(
+        self, source: FakeDisclosureSource, clock: FakeClock
+    ) -> None:
+        source.listings[TODAY] = [
+            build_document("S100A"),
+            build_document("S100B"),
+            build_document("S100C"),
+        ]
+        source.failing.add("EDINET_S100B_XBRL")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = LocalStorage(config=LocalStorageConfig(base_dir=tmpdir))
+            dead_letters = DeadLetterRepositoryImpl(storage)
+            usecase = WatchDocumentUseCase(
+                DocumentRepositoryImpl(storage),
+                clock=clock,
+                today=lambda: TODAY,
+                dead_letter_repository=dead_letters,
+            )
+            first = usecase.poll(self.build_input(source))
+
+            assert [d.document_id.value for d in first.collected_document_list] == [
+                "EDINET_S100A_XBRL",
+                "EDINET_S100C_XBRL",
+            ]
+            (failed,) = first.failed_document_list
+            assert failed.document.document_id.value == "EDINET_S100B_XBRL"
+            assert dead_letters.list_dead_letters() == [failed]
+
+            # 失敗した書類のみを次回のポーリングで再度確認する
+            source.failing.clear()
+            source.downloaded.clear()
+            second = usecase.poll(self.build_input(source))
+            assert source.downloaded == ["EDINET_S100B_XBRL"]
+            assert [d.document_id.value for d in second.collected_document_list] == [
+                "EDINET_S100B_XBRL"
+            ]
+
+    def test_failed_async_store_is_recorded_as_dead_letter(
+        self, source: FakeDisclosureSource, clock: FakeClock
+    ) -> None:
+        failures = ["disk full"]
+
+        class FlakyStorage(LocalStorage):
+            def save(
+                self, path: str, file: bytes, metadata: Mapping[str, str] | None = None
+            ) -> None:
+                if failures and "S100A" in path:
+                    raise OSError(failures.pop())
+                super().save(path, file, metadata)
+
+        source.listings[TODAY] = [build_document("S100A"), build_document("S100B")]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = FlakyStorage(config=LocalStorageConfig(base_dir=tmpdir))
+            repository = DocumentRepositoryImpl(
+                storage, config=RepositoryConfig(extraction=ZipExtractionConfig())
+            )
+            usecase = WatchDocumentUseCase(
+                repository,
+                clock=clock,
+                today=lambda: TODAY,
+                dead_letter_repository=DeadLetterRepositoryImpl(storage),
+            )
+            first = usecase.poll(self.build_input(source))
+            assert [d.document_id.value for d in first.collected_document_list] == [
+                "EDINET_S100B_XBRL"
+            ]
+            assert [
+                d.document.document_id.value for d in first.failed_document_list
+            ] == ["EDINET_S100A_XBRL"]
+
+            second = usecase.poll(self.build_input(source))
+            assert [d.document_id.value for d in second.collected_document_list] == [
+                "EDINET_S100A_XBRL"
+            ]
+
+    ########## run method ##########
+    def test_run_stops_when_event_is_set(
+        self, usecase: WatchDocumentUseCase, source: FakeDisclosureSource
+    ) -> None:
+        source.listings[TODAY] = [build_document("S100A")]
+        stop_event = threading.Event()
+        collected: list[Document] = []
+
+        def on_collected(documents: list[Document]) -> None:
+            collected.extend(documents)
+            stop_event.set()
+
+        usecase.run(
+            self.build_input(source), stop_event=stop_event, on_collected=on_collected
+        )
+        assert len(collected) == 1
+
+    def test_run_continues_after_error_with_handler(
+        self, usecase: WatchDocumentUseCase, source: FakeDisclosureSource
+    ) -> None:
+        source.listings[TODAY] = [build_document("S100A")]
+        source.fail_downloads = True
+        stop_event = threading.Event()
+        errors: list[Exception] = []
+
+        def on_error(error: Exception) -> None:
+            errors.append(error)
+            stop_event.set()
+
+        usecase.run(self.build_input(source), stop_event=stop_event, on_error=on_error)
+        assert len(errors) == 1
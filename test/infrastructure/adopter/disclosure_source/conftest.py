@@ -0,0 +1,104 @@
+import re
+import threading
+from collections.abc import Generator
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+_RANGE_PATTERN = re.compile(r"bytes=(\d+)-(\d+)?")
+
+
+@dataclass
+class FakeEdinetServer:
+    """
+    書類取得API（documents/{docID}）のみを再現するローカルのEDINETサーバー
+    Rangeリクエストへの対応有無や、一時的なエラーを切り替えられる。
+    """
+
+    documents: dict[str, bytes] = field(default_factory=dict)
+    support_range: bool = True
+    failures: dict[int, int] = field(default_factory=dict)
+    """Rangeの開始位置 → 503を返す残り回数"""
+    requests: list[tuple[str, str | None]] = field(default_factory=list)
+    """受け付けたリクエストの (docID, Rangeヘッダー)"""
+    base_url: str = ""
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def handle(self, handler: BaseHTTPRequestHandler) -> None:
+        url = urlparse(handler.path)
+        doc_id = url.path.rsplit("/", 1)[-1]
+        byte_range = handler.headers.get("Range")
+        match = _RANGE_PATTERN.fullmatch(byte_range or "")
+        with self._lock:
+            self.requests.append((doc_id, byte_range))
+            start = int(match.group(1)) if match else 0
+            fail = self.failures.get(start, 0) > 0
+            if fail:
+                self.failures[start] -= 1
+
+        if parse_qs(url.query).get("Subscription-Key") != ["test_api_key"]:
+            handler.send_response(401)
+            handler.end_headers()
+            return
+        if fail:
+            handler.send_response(503)
+            handler.end_headers()
+            return
+
+        content = self.documents.get(doc_id)
+        if content is None:
+            handler.send_response(404)
+            handler.end_headers()
+            return
+
+        if not self.support_range or match is None:
+            self._send(handler, 200, content)
+            return
+
+        end = min(int(match.group(2) or len(content) - 1), len(content) - 1)
+        self._send(
+            handler,
+            206,
+            content[start : end + 1],
+            {"Content-Range": f"bytes {start}-{end}/{len(content)}"},
+        )
+
+    @staticmethod
+    def _send(
+        handler: BaseHTTPRequestHandler,
+        status: int,
+        body: bytes,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/octet-stream")
+        handler.send_header("Content-Length", str(len(body)))
+        handler.send_header("ETag", '"fake-etag"')
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        _ = handler.wfile.write(body)
+
+
+@pytest.fixture
+def fake_edinet_server() -> Generator[FakeEdinetServer, None, None]:
+    fake = FakeEdinetServer()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            fake.handle(self)
+
+        def log_message(self, format: str, *args: object) -> None:
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    fake.base_url = f"http://127.0.0.1:{server.server_address[1]}/api/v2/"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield fake
+    finally:
+        server.shutdown()
+        server.server_close()
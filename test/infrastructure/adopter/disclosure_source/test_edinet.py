@@ -21,7 +21,7 @@ from fino_ingestor.infrastructure.adapter.disclosure_source.edinet import (
     EdinetDocumentSearchCriteria,
 )
 from fino_ingestor.interface.config.disclosure import EdinetConfig
-from fino_ingestor.util import TimeScope
+from fino_ingestor.util import JapanMarketCalendar, TimeScope
 
 
 class TestEdinetAdapter:
@@ -305,6 +305,203 @@ class TestEdinetAdapter:
             # 無効なデータは除外される
             assert len(documents) == 0
 
+    ########## list_available_documents (calendar) ##########
+    def test_list_available_documents_skips_non_business_days(
+        self, adapter: EdinetAdapter
+    ) -> None:
+        """calendar指定時は休業日の書類一覧を取得しない"""
+        criteria = EdinetDocumentSearchCriteria(
+            format_type=FormatType(enum=FormatTypeEnum.XBRL),
+            timescope=TimeScope(year=2024, month=3),
+            calendar=JapanMarketCalendar(),
+        )
+        empty_response: dict[str, list[Any]] = {"results": []}
+
+        with patch.object(
+            adapter.client, "get_document_list", return_value=empty_response
+        ) as mock_get_list:
+            _ = adapter.list_available_documents(criteria)
+
+            # 2024年3月の営業日数（31日 - 土日10日 - 春分の日）
+            assert mock_get_list.call_count == 20
+
+    def test_list_available_documents_defers_non_business_days(
+        self, adapter: EdinetAdapter
+    ) -> None:
+        """検証スイープ有効時は休業日を営業日の後にまとめて取得する"""
+        criteria = EdinetDocumentSearchCriteria(
+            format_type=FormatType(enum=FormatTypeEnum.XBRL),
+            timescope=TimeScope(year=2024, month=3),
+            calendar=JapanMarketCalendar(),
+            verify_non_business_days=True,
+        )
+        empty_response: dict[str, list[Any]] = {"results": []}
+
+        with patch.object(
+            adapter.client, "get_document_list", return_value=empty_response
+        ) as mock_get_list:
+            _ = adapter.list_available_documents(criteria)
+
+            requested = [
+                call.kwargs["date"].date() for call in mock_get_list.mock_calls
+            ]
+            assert len(requested) == 31
+            # 休業日（土日・祝日）は後回しになる
+            assert requested[:20] == sorted(requested[:20])
+            assert date(2024, 3, 20) in requested[20:]
+            assert date(2024, 3, 2) in requested[20:]
+
+    ########## list_available_documents (count_probe) ##########
+    @pytest.fixture
+    def probe_adapter(self) -> EdinetAdapter:
+        return EdinetAdapter(
+            config=EdinetConfig(api_key="test_api_key", count_probe=True)
+        )
+
+    def test_count_probe_skips_full_listing_on_empty_day(
+        self, probe_adapter: EdinetAdapter
+    ) -> None:
+        """件数が0件の日は書類一覧を取得しない"""
+        criteria = EdinetDocumentSearchCriteria(
+            format_type=FormatType(enum=FormatTypeEnum.XBRL),
+            timescope=TimeScope(year=2024, month=3, day=16),
+        )
+        count_response = {"metadata": {"resultset": {"count": 0}}}
+
+        with patch.object(
+            probe_adapter.client, "get_document_list", return_value=count_response
+        ) as mock_get_list:
+            documents = probe_adapter.list_available_documents(criteria)
+
+            assert len(documents) == 0
+            mock_get_list.assert_called_once()
+            assert mock_get_list.call_args.kwargs["withdocs"] is False
+
+    def test_count_probe_reuses_cache_when_count_unchanged(
+        self, probe_adapter: EdinetAdapter, mock_edinet_document: dict[str, Any]
+    ) -> None:
+        """件数が変化していない日はキャッシュ済みの書類一覧を再利用する"""
+        criteria = EdinetDocumentSearchCriteria(
+            format_type=FormatType(enum=FormatTypeEnum.XBRL),
+            timescope=TimeScope(year=2024, month=3, day=15),
+        )
+        count_response = {"metadata": {"resultset": {"count": 1}}}
+        full_response = {"results": [mock_edinet_document]}
+
+        with patch.object(probe_adapter.client, "get_document_list") as mock_get_list:
+            mock_get_list.side_effect = [count_response, full_response, count_response]
+
+            first = probe_adapter.list_available_documents(criteria)
+            second = probe_adapter.list_available_documents(criteria)
+
+            # 1回目: 件数 + 書類一覧、2回目: 件数のみ
+            assert mock_get_list.call_count == 3
+            assert len(first) == 1
+            assert len(second) == 1
+            assert second[0].document_id.value == "EDINET_S100TEST_XBRL"
+
+    def test_count_probe_refetches_when_count_changed(
+        self, probe_adapter: EdinetAdapter, mock_edinet_document: dict[str, Any]
+    ) -> None:
+        """件数が変化した日は書類一覧を再取得する"""
+        criteria = EdinetDocumentSearchCriteria(
+            format_type=FormatType(enum=FormatTypeEnum.XBRL),
+            timescope=TimeScope(year=2024, month=3, day=15),
+        )
+        added_document = {**mock_edinet_document, "docID": "S100TEST2"}
+
+        with patch.object(probe_adapter.client, "get_document_list") as mock_get_list:
+            mock_get_list.side_effect = [
+                {"metadata": {"resultset": {"count": 1}}},
+                {"results": [mock_edinet_document]},
+                {"metadata": {"resultset": {"count": 2}}},
+                {"results": [mock_edinet_document, added_document]},
+            ]
+
+            _ = probe_adapter.list_available_documents(criteria)
+            documents = probe_adapter.list_available_documents(criteria)
+
+            assert mock_get_list.call_count == 4
+            assert len(documents) == 2
+
+    ########## list_updated_documents ##########
+    def test_list_updated_documents_skips_seen_rows(
+        self, adapter: EdinetAdapter, mock_edinet_document: dict[str, Any]
+    ) -> None:
+        criteria = EdinetDocumentSearchCriteria(
+            format_type=FormatType(enum=FormatTypeEnum.XBRL),
+            timescope=TimeScope(year=2024, month=3, day=15),
+        )
+        added_document = {**mock_edinet_document, "docID": "S100TEST2"}
+        seen: dict[str, str] = {}
+
+        with patch.object(adapter.client, "get_document_list") as mock_get_list:
+            mock_get_list.side_effect = [
+                {"results": [mock_edinet_document]},
+                {"results": [mock_edinet_document, added_document]},
+            ]
+            with patch.object(
+                adapter, "_convert_to_document", wraps=adapter._convert_to_document
+            ) as mock_convert:
+                first = adapter.list_updated_documents(criteria, seen=seen)
+                second = adapter.list_updated_documents(criteria, seen=seen)
+
+                # 2回目は新しい行のみ変換される
+                assert mock_convert.call_count == 2
+
+        assert [d.document_id.value for d in first] == ["EDINET_S100TEST_XBRL"]
+        assert [d.document_id.value for d in second] == ["EDINET_S100TEST2_XBRL"]
+        assert set(seen) == {"S100TEST", "S100TEST2"}
+
+    def test_list_updated_documents_returns_changed_rows(
+        self, adapter: EdinetAdapter, mock_edinet_document: dict[str, Any]
+    ) -> None:
+        """フラグが後から変化した行は再度変換される"""
+        criteria = EdinetDocumentSearchCriteria(
+            format_type=FormatType(enum=FormatTypeEnum.CSV),
+            timescope=TimeScope(year=2024, month=3, day=15),
+        )
+        csv_ready = {**mock_edinet_document, "csvFlag": "1"}
+        seen: dict[str, str] = {}
+
+        with patch.object(adapter.client, "get_document_list") as mock_get_list:
+            mock_get_list.side_effect = [
+                {"results": [mock_edinet_document]},
+                {"results": [csv_ready]},
+            ]
+            first = adapter.list_updated_documents(criteria, seen=seen)
+            second = adapter.list_updated_documents(criteria, seen=seen)
+
+        assert first == []
+        assert [d.document_id.value for d in second] == ["EDINET_S100TEST_CSV"]
+
+    def test_list_updated_documents_detects_changes_with_count_probe(
+        self, probe_adapter: EdinetAdapter, mock_edinet_document: dict[str, Any]
+    ) -> None:
+        """件数が変化しなくても行の更新を検出する"""
+        criteria = EdinetDocumentSearchCriteria(
+            format_type=FormatType(enum=FormatTypeEnum.CSV),
+            timescope=TimeScope(year=2024, month=3, day=15),
+        )
+        csv_ready = {**mock_edinet_document, "csvFlag": "1"}
+        count_response = {"metadata": {"resultset": {"count": 1}}}
+        seen: dict[str, str] = {}
+
+        with patch.object(probe_adapter.client, "get_document_list") as mock_get_list:
+            mock_get_list.side_effect = [
+                count_response,
+                {"results": [mock_edinet_document]},
+                count_response,
+                {"results": [csv_ready]},
+            ]
+            first = probe_adapter.list_updated_documents(criteria, seen=seen)
+            second = probe_adapter.list_updated_documents(criteria, seen=seen)
+
+            assert mock_get_list.call_count == 4
+
+        assert first == []
+        assert [d.document_id.value for d in second] == ["EDINET_S100TEST_CSV"]
+
     ########## download_document ##########
     def test_download_document_xbrl(self, adapter: EdinetAdapter) -> None:
         document = Document(
@@ -0,0 +1,175 @@
+from datetime import date
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+import requests
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.value.disclosure_date import DisclosureDate
+from fino_ingestor.domain.value.disclosure_source import (
+    DisclosureSource,
+    DisclosureSourceEnum,
+)
+from fino_ingestor.domain.value.disclosure_type import (
+    DisclosureType,
+    DisclosureTypeEnum,
+)
+from fino_ingestor.domain.value.document_id import DocumentId
+from fino_ingestor.domain.value.format_type import FormatType, FormatTypeEnum
+from fino_ingestor.domain.value.ticker import Ticker
+from fino_ingestor.infrastructure.adapter.disclosure_source.edinet import EdinetAdapter
+from fino_ingestor.infrastructure.scheduler.bandwidth import BandwidthLimiter
+from fino_ingestor.interface.config.disclosure import DownloadConfig, EdinetConfig
+
+if TYPE_CHECKING:
+    from conftest import FakeEdinetServer
+
+CONTENT = bytes(range(256)) * 40  # 10240 bytes
+
+
+def build_document(doc_id: str = "S100TEST") -> Document:
+    return Document(
+        document_id=DocumentId(value=f"EDINET_{doc_id}_XBRL"),
+        filing_name="有価証券報告書",
+        ticker=Ticker(value="12345"),
+        disclosure_type=DisclosureType(enum=DisclosureTypeEnum.ANNUAL_REPORT),
+        disclosure_source=DisclosureSource(enum=DisclosureSourceEnum.EDINET),
+        disclosure_date=DisclosureDate(value=date(2024, 3, 15)),
+        filing_format=FormatType(enum=FormatTypeEnum.XBRL),
+    )
+
+
+def build_adapter(
+    server: "FakeEdinetServer",
+    bandwidth_limiter: BandwidthLimiter | None = None,
+    **download: object,
+) -> EdinetAdapter:
+    options: dict[str, object] = {
+        "range_threshold": 2048,
+        "part_size": 1024,
+        "max_concurrency": 4,
+        "max_attempts": 2,
+        **download,
+    }
+    return EdinetAdapter(
+        config=EdinetConfig(
+            api_key="test_api_key",
+            api_base_url=server.base_url,
+            download=DownloadConfig.model_validate(options),
+        ),
+        bandwidth_limiter=bandwidth_limiter,
+    )
+
+
+class TestRangedDownload:
+    @pytest.fixture(autouse=True)
+    def no_retry_wait(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("fino_ingestor.util.retry.time.sleep", lambda _: None)
+
+    ########## ranged download ##########
+    def test_download_in_parallel_parts(
+        self, fake_edinet_server: "FakeEdinetServer"
+    ) -> None:
+        fake_edinet_server.documents["S100TEST"] = CONTENT
+        adapter = build_adapter(fake_edinet_server)
+
+        assert adapter.download_document(build_document()) == CONTENT
+        ranges = sorted(r for _, r in fake_edinet_server.requests if r)
+        assert len(ranges) == 10
+        assert "bytes=9216-10239" in ranges
+
+    def test_download_small_document_with_single_rest_request(
+        self, fake_edinet_server: "FakeEdinetServer"
+    ) -> None:
+        fake_edinet_server.documents["S100TEST"] = CONTENT[:2000]
+        adapter = build_adapter(fake_edinet_server)
+
+        assert adapter.download_document(build_document()) == CONTENT[:2000]
+        assert len(fake_edinet_server.requests) == 2
+
+    def test_download_without_range_support(
+        self, fake_edinet_server: "FakeEdinetServer"
+    ) -> None:
+        fake_edinet_server.documents["S100TEST"] = CONTENT
+        fake_edinet_server.support_range = False
+        adapter = build_adapter(fake_edinet_server)
+
+        assert adapter.download_document(build_document()) == CONTENT
+        assert len(fake_edinet_server.requests) == 1
+
+    def test_download_reports_size_before_fetching_parts(
+        self, fake_edinet_server: "FakeEdinetServer"
+    ) -> None:
+        fake_edinet_server.documents["S100TEST"] = CONTENT
+        adapter = build_adapter(fake_edinet_server)
+        reported: list[tuple[int, int]] = []
+
+        def on_size(size: int) -> None:
+            reported.append((size, len(fake_edinet_server.requests)))
+
+        assert adapter.download_document(build_document(), on_size=on_size) == CONTENT
+        # 最初のパートを取得した時点で全体のサイズを通知する
+        assert reported == [(len(CONTENT), 1)]
+
+    def test_download_retries_failed_part(
+        self, fake_edinet_server: "FakeEdinetServer"
+    ) -> None:
+        fake_edinet_server.documents["S100TEST"] = CONTENT
+        fake_edinet_server.failures[4096] = 1
+        adapter = build_adapter(fake_edinet_server)
+
+        assert adapter.download_document(build_document()) == CONTENT
+        assert fake_edinet_server.failures[4096] == 0
+
+    def test_download_resumes_from_completed_parts(
+        self, fake_edinet_server: "FakeEdinetServer", tmp_path: Path
+    ) -> None:
+        fake_edinet_server.documents["S100TEST"] = CONTENT
+        fake_edinet_server.failures[8192] = 2
+        adapter = build_adapter(
+            fake_edinet_server, max_concurrency=1, resume_dir=str(tmp_path)
+        )
+
+        with pytest.raises(IOError, match="Server error"):
+            _ = adapter.download_document(build_document())
+        assert (tmp_path / "S100TEST_1.part.json").exists()
+
+        # 2回目は先頭パートと失敗したパートのみを取得する
+        fake_edinet_server.requests.clear()
+        assert adapter.download_document(build_document()) == CONTENT
+        ranges = [r for _, r in fake_edinet_server.requests]
+        assert ranges == ["bytes=0-1023", "bytes=8192-9215"]
+        assert list(tmp_path.iterdir()) == []
+
+    def test_download_raises_error_on_missing_document(
+        self, fake_edinet_server: "FakeEdinetServer"
+    ) -> None:
+        adapter = build_adapter(fake_edinet_server)
+        with pytest.raises(requests.HTTPError):
+            _ = adapter.download_document(build_document("S100MISSING"))
+        assert len(fake_edinet_server.requests) == 1
+
+    ########## bandwidth ##########
+    def test_download_consumes_bandwidth_per_chunk(
+        self, fake_edinet_server: "FakeEdinetServer"
+    ) -> None:
+        fake_edinet_server.documents["S100TEST"] = CONTENT
+        sleeps: list[float] = []
+        limiter = BandwidthLimiter(1024 * 1024, burst_bytes=1024, sleep=sleeps.append)
+        adapter = build_adapter(fake_edinet_server, bandwidth_limiter=limiter)
+
+        assert adapter.download_document(build_document()) == CONTENT
+        assert limiter.metrics().total_bytes == len(CONTENT)
+        # バーストを超えた分は上限に従って待機する
+        assert sleeps
+
+    def test_download_without_range_support_consumes_bandwidth(
+        self, fake_edinet_server: "FakeEdinetServer"
+    ) -> None:
+        fake_edinet_server.documents["S100TEST"] = CONTENT
+        fake_edinet_server.support_range = False
+        limiter = BandwidthLimiter(1024 * 1024, sleep=lambda _: None)
+        adapter = build_adapter(fake_edinet_server, bandwidth_limiter=limiter)
+
+        assert adapter.download_document(build_document()) == CONTENT
+        assert limiter.metrics().total_bytes == len(CONTENT)
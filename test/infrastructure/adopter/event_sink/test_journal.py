@@ -0,0 +1,113 @@
+import tempfile
+import threading
+from collections.abc import Generator
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+import pytest
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.event.document_stored import DocumentStoredEvent
+from fino_ingestor.domain.value.disclosure_date import DisclosureDate
+from fino_ingestor.domain.value.disclosure_source import (
+    DisclosureSource,
+    DisclosureSourceEnum,
+)
+from fino_ingestor.domain.value.disclosure_type import (
+    DisclosureType,
+    DisclosureTypeEnum,
+)
+from fino_ingestor.domain.value.document_id import DocumentId
+from fino_ingestor.domain.value.format_type import FormatType, FormatTypeEnum
+from fino_ingestor.domain.value.ticker import Ticker
+from fino_ingestor.infrastructure.adapter.event_sink.journal import (
+    JournalEventSink,
+    read_event_journal,
+)
+from fino_ingestor.interface.config.event import JournalEventSinkConfig
+
+
+def build_event(doc_id: str = "S100TEST") -> DocumentStoredEvent:
+    document = Document(
+        document_id=DocumentId(value=f"EDINET_{doc_id}_XBRL"),
+        filing_name="有価証券報告書",
+        ticker=Ticker(value="12345"),
+        disclosure_type=DisclosureType(enum=DisclosureTypeEnum.ANNUAL_REPORT),
+        disclosure_source=DisclosureSource(enum=DisclosureSourceEnum.EDINET),
+        disclosure_date=DisclosureDate(value=date(2024, 3, 15)),
+        filing_format=FormatType(enum=FormatTypeEnum.XBRL),
+    )
+    return DocumentStoredEvent(
+        document=document,
+        path=f"EDINET/12345/ANNUAL_REPORT/{doc_id}.zip",
+        size=4,
+        sha256="0" * 64,
+        stored_at=datetime(2024, 3, 15, 9, 0, tzinfo=UTC),
+    )
+
+
+class TestJournalEventSink:
+    @pytest.fixture
+    def journal_path(self) -> Generator[Path, None, None]:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir) / "events" / "stored.jsonl"
+
+    @pytest.fixture
+    def sink(self, journal_path: Path) -> Generator[JournalEventSink, None, None]:
+        sink = JournalEventSink(JournalEventSinkConfig(path=str(journal_path)))
+        yield sink
+        sink.close()
+
+    ########## publish method ##########
+    def test_publish_appends_event(
+        self, sink: JournalEventSink, journal_path: Path
+    ) -> None:
+        sink.publish(build_event("S100A"))
+        sink.publish(build_event("S100B"))
+
+        records = list(read_event_journal(journal_path))
+        assert [r.event.document.document_id.value for r in records] == [
+            "EDINET_S100A_XBRL",
+            "EDINET_S100B_XBRL",
+        ]
+        assert records[0].offset == 0
+        assert records[1].offset == records[0].next_offset
+        assert records[0].event == build_event("S100A")
+
+    def test_concurrent_publish_keeps_lines_intact(
+        self, sink: JournalEventSink, journal_path: Path
+    ) -> None:
+        threads = [
+            threading.Thread(target=sink.publish, args=(build_event(f"S100{i}"),))
+            for i in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(list(read_event_journal(journal_path))) == 20
+
+    ########## read_event_journal ##########
+    def test_read_resumes_from_offset(
+        self, sink: JournalEventSink, journal_path: Path
+    ) -> None:
+        sink.publish(build_event("S100A"))
+        offset = next(read_event_journal(journal_path)).next_offset
+        sink.publish(build_event("S100B"))
+
+        records = list(read_event_journal(journal_path, offset=offset))
+        assert [r.event.document.document_id.value for r in records] == [
+            "EDINET_S100B_XBRL"
+        ]
+
+    def test_read_ignores_incomplete_last_line(
+        self, sink: JournalEventSink, journal_path: Path
+    ) -> None:
+        sink.publish(build_event("S100A"))
+        with journal_path.open("ab") as file:
+            _ = file.write(b'{"document_id": "EDINET_S100B')
+
+        assert len(list(read_event_journal(journal_path))) == 1
+
+    def test_read_missing_journal(self, journal_path: Path) -> None:
+        assert list(read_event_journal(journal_path)) == []
@@ -0,0 +1,116 @@
+import json
+import socket
+import tempfile
+import threading
+from collections.abc import Generator
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+import pytest
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.event.document_stored import DocumentStoredEvent
+from fino_ingestor.domain.value.disclosure_date import DisclosureDate
+from fino_ingestor.domain.value.disclosure_source import (
+    DisclosureSource,
+    DisclosureSourceEnum,
+)
+from fino_ingestor.domain.value.disclosure_type import (
+    DisclosureType,
+    DisclosureTypeEnum,
+)
+from fino_ingestor.domain.value.document_id import DocumentId
+from fino_ingestor.domain.value.format_type import FormatType, FormatTypeEnum
+from fino_ingestor.domain.value.ticker import Ticker
+from fino_ingestor.infrastructure.adapter.event_sink.unix_socket import (
+    UnixSocketEventSink,
+)
+from fino_ingestor.interface.config.event import UnixSocketEventSinkConfig
+
+
+def build_event(
+    doc_id: str = "S100TEST", filing_name: str = "有価証券報告書"
+) -> DocumentStoredEvent:
+    document = Document(
+        document_id=DocumentId(value=f"EDINET_{doc_id}_XBRL"),
+        filing_name=filing_name,
+        ticker=Ticker(value="12345"),
+        disclosure_type=DisclosureType(enum=DisclosureTypeEnum.ANNUAL_REPORT),
+        disclosure_source=DisclosureSource(enum=DisclosureSourceEnum.EDINET),
+        disclosure_date=DisclosureDate(value=date(2024, 3, 15)),
+        filing_format=FormatType(enum=FormatTypeEnum.XBRL),
+    )
+    return DocumentStoredEvent(
+        document=document,
+        path=f"EDINET/12345/ANNUAL_REPORT/{doc_id}.zip",
+        size=4,
+        sha256="0" * 64,
+        stored_at=datetime(2024, 3, 15, 9, 0, tzinfo=UTC),
+    )
+
+
+class TestUnixSocketEventSink:
+    @pytest.fixture
+    def socket_path(self) -> Generator[Path, None, None]:
+        # AF_UNIXのパス長制限を避けるため短いディレクトリを使用する
+        with tempfile.TemporaryDirectory(dir="/tmp") as tmpdir:
+            yield Path(tmpdir) / "events.sock"
+
+    ########## publish method ##########
+    def test_publish_sends_json_line(self, socket_path: Path) -> None:
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(socket_path))
+        server.listen(1)
+        received: list[bytes] = []
+
+        def serve() -> None:
+            conn, _ = server.accept()
+            with conn, conn.makefile("rb") as stream:
+                received.extend(stream.readline() for _ in range(2))
+
+        thread = threading.Thread(target=serve)
+        thread.start()
+
+        sink = UnixSocketEventSink(
+            UnixSocketEventSinkConfig(socket_path=str(socket_path))
+        )
+        sink.publish(build_event("S100A"))
+        sink.publish(build_event("S100B"))
+        thread.join(timeout=5)
+        sink.close()
+        server.close()
+
+        assert [json.loads(line)["document_id"] for line in received] == [
+            "EDINET_S100A_XBRL",
+            "EDINET_S100B_XBRL",
+        ]
+
+    def test_publish_drops_event_when_consumer_is_absent(
+        self, socket_path: Path
+    ) -> None:
+        sink = UnixSocketEventSink(
+            UnixSocketEventSinkConfig(socket_path=str(socket_path))
+        )
+        sink.publish(build_event())
+        assert sink.dropped == 1
+
+    def test_publish_closes_connection_after_partial_send(
+        self, socket_path: Path
+    ) -> None:
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(socket_path))
+        server.listen(1)
+        sink = UnixSocketEventSink(
+            UnixSocketEventSinkConfig(socket_path=str(socket_path), timeout_seconds=0.1)
+        )
+        # コンシューマが読み込まない間に、ソケットのバッファを超えるイベントを送信する
+        sink.publish(build_event(filing_name="x" * 8 * 1024 * 1024))
+        assert sink.dropped == 1
+
+        conn, _ = server.accept()
+        with conn, conn.makefile("rb") as stream:
+            received = stream.read()
+        sink.close()
+        server.close()
+
+        # 途中まで送信した行の後で接続が閉じられるため、改行で終わらない末尾の行として破棄できる
+        assert 0 < len(received) and not received.endswith(b"\n")
@@ -0,0 +1,134 @@
+import hashlib
+import json
+import tempfile
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fino_ingestor.infrastructure.adapter.storage.content_addressed import (
+    ContentAddressedStorage,
+)
+from fino_ingestor.infrastructure.adapter.storage.local import LocalStorage
+from fino_ingestor.infrastructure.factory.storage import create_storage
+from fino_ingestor.interface.config.storage import (
+    ContentAddressedStorageConfig,
+    LocalStorageConfig,
+)
+from fino_ingestor.interface.port.storage import StoragePort
+
+
+class TestContentAddressedStorage:
+    @pytest.fixture
+    def temp_dir(self) -> Generator[Path, None, None]:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def config(self, temp_dir: Path) -> ContentAddressedStorageConfig:
+        return ContentAddressedStorageConfig(
+            backend=LocalStorageConfig(base_dir=str(temp_dir))
+        )
+
+    @pytest.fixture
+    def storage(self, config: ContentAddressedStorageConfig) -> ContentAddressedStorage:
+        storage = create_storage(config, client_registry=None)
+        assert isinstance(storage, ContentAddressedStorage)
+        return storage
+
+    ########## instance check ##########
+    def test_instance_success(self, storage: ContentAddressedStorage) -> None:
+        assert isinstance(storage, StoragePort)
+        assert isinstance(storage.backend, LocalStorage)
+
+    ########## save method ##########
+    def test_save_stores_blob_and_reference(
+        self, storage: ContentAddressedStorage, temp_dir: Path
+    ) -> None:
+        content = b"test content"
+        digest = hashlib.sha256(content).hexdigest()
+
+        storage.save("doc/a.zip", content)
+
+        blob = temp_dir / "blobs" / "sha256" / digest[:2] / digest[2:4] / digest
+        assert blob.read_bytes() == content
+        reference = json.loads((temp_dir / "doc" / "a.zip").read_text())
+        assert reference["digest"] == digest
+        assert reference["size"] == len(content)
+        assert storage.exists("doc/a.zip") is True
+
+    def test_save_skips_existing_blob(
+        self, storage: ContentAddressedStorage, temp_dir: Path
+    ) -> None:
+        content = b"same content"
+        storage.save("doc/a.zip", content)
+
+        with patch.object(
+            storage.backend, "save", wraps=storage.backend.save
+        ) as mock_save:
+            storage.save("doc/b.zip", content)
+            # 参照のみが保存され、blobは再保存されない
+            mock_save.assert_called_once()
+            assert mock_save.call_args.kwargs["path"] == "doc/b.zip"
+
+    def test_save_skips_blob_written_by_another_process(
+        self, config: ContentAddressedStorageConfig
+    ) -> None:
+        """別プロセスで保存済みのblobも再保存しない"""
+        content = b"same content"
+        first = create_storage(config, client_registry=None)
+        first.save("doc/a.zip", content)
+
+        second = create_storage(config, client_registry=None)
+        assert isinstance(second, ContentAddressedStorage)
+        with patch.object(
+            second.backend, "save", wraps=second.backend.save
+        ) as mock_save:
+            second.save("doc/b.zip", content)
+            mock_save.assert_called_once()
+
+    def test_save_is_noop_when_reference_points_at_same_blob(
+        self, storage: ContentAddressedStorage
+    ) -> None:
+        content = b"same content"
+        storage.save("doc/a.zip", content)
+
+        with patch.object(
+            storage.backend, "save", wraps=storage.backend.save
+        ) as mock_save:
+            storage.save("doc/a.zip", content)
+            mock_save.assert_not_called()
+            # 内容が変わった場合は参照を書き換える
+            storage.save("doc/a.zip", b"new content")
+        assert storage.read("doc/a.zip") == b"new content"
+
+    def test_known_digests_are_bounded(self, temp_dir: Path) -> None:
+        storage = ContentAddressedStorage(
+            LocalStorage(LocalStorageConfig(base_dir=str(temp_dir))),
+            ContentAddressedStorageConfig(
+                backend=LocalStorageConfig(base_dir=str(temp_dir)),
+                max_known_digests=2,
+            ),
+        )
+        for i in range(5):
+            storage.save(f"doc/{i}.zip", f"content {i}".encode())
+
+        assert len(storage._known_digests) == 2
+
+    def test_compute_digest_matches_hashlib(
+        self, storage: ContentAddressedStorage
+    ) -> None:
+        content = b"x" * (3 * 1024 * 1024 + 7)
+        assert storage.compute_digest(content) == hashlib.sha256(content).hexdigest()
+
+    ########## read / list_paths method ##########
+    def test_read_resolves_reference(self, storage: ContentAddressedStorage) -> None:
+        storage.save("doc/a.zip", b"0123456789")
+        assert storage.read("doc/a.zip") == b"0123456789"
+        assert storage.read("doc/a.zip", offset=-3) == b"789"
+        assert storage.read("doc/a.zip", offset=2, length=3) == b"234"
+
+    def test_list_paths_excludes_blobs(self, storage: ContentAddressedStorage) -> None:
+        storage.save("doc/a.zip", b"a")
+        storage.save("doc/b.zip", b"b")
+        assert list(storage.list_paths()) == ["doc/a.zip", "doc/b.zip"]
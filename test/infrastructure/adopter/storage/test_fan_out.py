@@ -0,0 +1,154 @@
+import tempfile
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fino_ingestor.infrastructure.adapter.storage.fan_out import FanOutStorage
+from fino_ingestor.infrastructure.adapter.storage.local import LocalStorage
+from fino_ingestor.infrastructure.factory.storage import create_storage
+from fino_ingestor.interface.config.storage import (
+    FanOutStorageConfig,
+    LocalStorageConfig,
+)
+from fino_ingestor.interface.port.storage import StoragePort
+
+
+class TestFanOutStorage:
+    @pytest.fixture
+    def temp_dir(self) -> Generator[Path, None, None]:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    def build_config(
+        self, temp_dir: Path, count: int = 2, consistency: str = "all"
+    ) -> FanOutStorageConfig:
+        return FanOutStorageConfig.model_validate(
+            {
+                "backends": [
+                    LocalStorageConfig(base_dir=str(temp_dir / f"backend{i}"))
+                    for i in range(count)
+                ],
+                "consistency": consistency,
+            }
+        )
+
+    def build_storage(self, config: FanOutStorageConfig) -> FanOutStorage:
+        storage = create_storage(config, client_registry=None)
+        assert isinstance(storage, FanOutStorage)
+        return storage
+
+    ########## instance check ##########
+    def test_instance_success(self, temp_dir: Path) -> None:
+        storage = self.build_storage(self.build_config(temp_dir))
+        assert isinstance(storage, StoragePort)
+        assert all(isinstance(b, LocalStorage) for b in storage.backends)
+
+    def test_config_requires_multiple_backends(self, temp_dir: Path) -> None:
+        with pytest.raises(ValueError):
+            _ = self.build_config(temp_dir, count=1)
+
+    ########## save method ##########
+    def test_save_writes_to_all_backends(self, temp_dir: Path) -> None:
+        storage = self.build_storage(self.build_config(temp_dir))
+        storage.save("doc/a.zip", b"content")
+
+        for i in range(2):
+            assert (temp_dir / f"backend{i}/doc/a.zip").read_bytes() == b"content"
+        assert storage.exists("doc/a.zip") is True
+
+    def test_save_overwrites_backends_that_already_have_file(
+        self, temp_dir: Path
+    ) -> None:
+        storage = self.build_storage(self.build_config(temp_dir))
+        storage.save("doc/a.zip", b"truncated")
+        storage.save("doc/a.zip", b"good content")
+
+        for i in range(2):
+            assert (temp_dir / f"backend{i}/doc/a.zip").read_bytes() == b"good content"
+        assert storage.read("doc/a.zip") == b"good content"
+
+    def test_save_if_absent_skips_backends_that_already_have_file(
+        self, temp_dir: Path
+    ) -> None:
+        storage = self.build_storage(self.build_config(temp_dir))
+        storage.backends[0].save("doc/a.zip", b"content")
+        assert storage.exists("doc/a.zip") is False
+
+        with (
+            patch.object(
+                storage.backends[0], "save", wraps=storage.backends[0].save
+            ) as mock_first,
+            patch.object(
+                storage.backends[1], "save", wraps=storage.backends[1].save
+            ) as mock_second,
+        ):
+            assert storage.save_if_absent("doc/a.zip", b"content") is True
+            mock_first.assert_not_called()
+            mock_second.assert_called_once()
+        assert storage.exists("doc/a.zip") is True
+        # すべての保存先に保存済みの場合は書き込まない
+        assert storage.save_if_absent("doc/a.zip", b"content") is False
+
+    def test_save_raises_error_when_any_backend_fails_with_all(
+        self, temp_dir: Path
+    ) -> None:
+        storage = self.build_storage(self.build_config(temp_dir))
+        with patch.object(storage.backends[1], "save", side_effect=OSError("down")):
+            with pytest.raises(IOError, match="Failed to save file to 1/2 backends"):
+                storage.save("doc/a.zip", b"content")
+
+    def test_save_succeeds_with_quorum(self, temp_dir: Path) -> None:
+        storage = self.build_storage(
+            self.build_config(temp_dir, count=3, consistency="quorum")
+        )
+        with patch.object(storage.backends[2], "save", side_effect=OSError("down")):
+            storage.save("doc/a.zip", b"content")
+
+        assert storage.required_count == 2
+        assert storage.exists("doc/a.zip") is True
+
+        with (
+            patch.object(storage.backends[1], "save", side_effect=OSError("down")),
+            patch.object(storage.backends[2], "save", side_effect=OSError("down")),
+        ):
+            with pytest.raises(IOError, match="2/3 backends \\(consistency=quorum\\)"):
+                storage.save("doc/b.zip", b"content")
+
+    ########## read / list_paths method ##########
+    def test_read_falls_back_to_next_backend(self, temp_dir: Path) -> None:
+        storage = self.build_storage(self.build_config(temp_dir))
+        storage.backends[1].save("doc/a.zip", b"content")
+
+        assert storage.read("doc/a.zip") == b"content"
+        with pytest.raises(FileNotFoundError):
+            _ = storage.read("doc/missing.zip")
+
+    def test_list_paths_returns_union(self, temp_dir: Path) -> None:
+        storage = self.build_storage(self.build_config(temp_dir))
+        storage.backends[0].save("doc/a.zip", b"a")
+        storage.backends[1].save("doc/b.zip", b"b")
+
+        assert list(storage.list_paths("doc/")) == ["doc/a.zip", "doc/b.zip"]
+
+    ########## close method ##########
+    def test_close_commits_backends_and_stops_workers(self, temp_dir: Path) -> None:
+        config = FanOutStorageConfig(
+            backends=[
+                LocalStorageConfig(
+                    base_dir=str(temp_dir / f"backend{i}"),
+                    durability="group",
+                    group_commit_interval_ms=60_000,
+                )
+                for i in range(2)
+            ]
+        )
+        storage = self.build_storage(config)
+        storage.save("doc/a.zip", b"content")
+
+        storage.close()
+
+        for i in range(2):
+            assert (temp_dir / f"backend{i}/doc/a.zip").read_bytes() == b"content"
+        with pytest.raises(RuntimeError):
+            storage.save("doc/b.zip", b"content")
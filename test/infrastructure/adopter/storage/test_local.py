@@ -1,7 +1,9 @@
 import os
 import tempfile
 from collections.abc import Generator
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from fino_ingestor.infrastructure.adapter.storage.local import LocalStorage
@@ -151,3 +153,267 @@ class TestLocalStorage:
         # with nested path
         with pytest.raises(ValueError, match="Path traversal detected"):
             storage.save("subdir/../../outside.txt", b"content")
+
+    ########## read method ##########
+    def test_read_returns_whole_file(self, storage: LocalStorage) -> None:
+        storage.save("subdir/test.txt", b"0123456789")
+        assert storage.read("subdir/test.txt") == b"0123456789"
+
+    def test_read_returns_range(self, storage: LocalStorage) -> None:
+        storage.save("test.txt", b"0123456789")
+        assert storage.read("test.txt", offset=2, length=3) == b"234"
+        assert storage.read("test.txt", offset=7) == b"789"
+
+    def test_read_returns_tail_with_negative_offset(
+        self, storage: LocalStorage
+    ) -> None:
+        storage.save("test.txt", b"0123456789")
+        assert storage.read("test.txt", offset=-4) == b"6789"
+
+    def test_read_raises_error_when_file_not_exists(
+        self, storage: LocalStorage
+    ) -> None:
+        with pytest.raises(FileNotFoundError):
+            _ = storage.read("missing.txt")
+
+    ########## list_paths method ##########
+    def test_list_paths_returns_files_under_prefix(self, storage: LocalStorage) -> None:
+        storage.save("a/2.txt", b"2")
+        storage.save("a/1.txt", b"1")
+        storage.save("a/nested/3.txt", b"3")
+        storage.save("b/4.txt", b"4")
+
+        assert list(storage.list_paths("a/")) == [
+            "a/1.txt",
+            "a/2.txt",
+            "a/nested/3.txt",
+        ]
+
+    def test_list_paths_returns_empty_when_prefix_not_exists(
+        self, storage: LocalStorage
+    ) -> None:
+        assert list(storage.list_paths("missing/")) == []
+
+    ########## atomic write ##########
+    def test_save_leaves_no_temp_file(
+        self, storage: LocalStorage, temp_dir: Path
+    ) -> None:
+        storage.save("subdir/test.txt", b"content")
+        assert [p.name for p in (temp_dir / "subdir").iterdir()] == ["test.txt"]
+
+    def test_save_does_not_leave_partial_file_on_failure(
+        self, storage: LocalStorage, temp_dir: Path
+    ) -> None:
+        storage.save("test.txt", b"initial")
+        with patch("os.write", side_effect=OSError("disk full")):
+            with pytest.raises(OSError, match="disk full"):
+                storage.save("test.txt", b"updated")
+
+        # 書き込みに失敗しても既存のファイルは壊れず、一時ファイルも残らない
+        assert (temp_dir / "test.txt").read_bytes() == b"initial"
+        assert [p.name for p in temp_dir.iterdir()] == ["test.txt"]
+
+    def test_save_fsyncs_each_file_in_file_mode(self, temp_dir: Path) -> None:
+        storage = LocalStorage(
+            config=LocalStorageConfig(base_dir=str(temp_dir), durability="file")
+        )
+        with patch("os.fsync", wraps=os.fsync) as mock_fsync:
+            storage.save("a.txt", b"a")
+            storage.save("b.txt", b"b")
+            # ファイルとディレクトリをそれぞれfsyncする
+            assert mock_fsync.call_count == 4
+
+    ########## group commit ##########
+    def test_group_commit_defers_files_until_flush(self, temp_dir: Path) -> None:
+        storage = LocalStorage(
+            config=LocalStorageConfig(
+                base_dir=str(temp_dir),
+                durability="group",
+                group_commit_interval_ms=60_000,
+            )
+        )
+        storage.save("subdir/a.txt", b"a")
+
+        assert not (temp_dir / "subdir" / "a.txt").exists()
+        assert storage.exists("subdir/a.txt") is True
+        assert storage.read("subdir/a.txt") == b"a"
+        assert list(storage.list_paths("subdir/")) == ["subdir/a.txt"]
+
+        storage.flush()
+        assert (temp_dir / "subdir" / "a.txt").read_bytes() == b"a"
+        assert [p.name for p in (temp_dir / "subdir").iterdir()] == ["a.txt"]
+
+    def test_group_commit_commits_every_n_files(self, temp_dir: Path) -> None:
+        storage = LocalStorage(
+            config=LocalStorageConfig(
+                base_dir=str(temp_dir),
+                durability="group",
+                group_commit_files=3,
+                group_commit_interval_ms=60_000,
+            )
+        )
+        with patch("os.fsync", wraps=os.fsync) as mock_fsync:
+            for name in ("a", "b", "c"):
+                storage.save(f"subdir/{name}.txt", name.encode())
+            # 3ファイル + ディレクトリ1回
+            assert mock_fsync.call_count == 4
+
+        assert sorted(p.name for p in (temp_dir / "subdir").iterdir()) == [
+            "a.txt",
+            "b.txt",
+            "c.txt",
+        ]
+
+    def test_group_commit_commits_after_interval(self, temp_dir: Path) -> None:
+        storage = LocalStorage(
+            config=LocalStorageConfig(
+                base_dir=str(temp_dir),
+                durability="group",
+                group_commit_interval_ms=10,
+            )
+        )
+        storage.save("a.txt", b"a")
+
+        deadline = time.monotonic() + 5
+        while not (temp_dir / "a.txt").exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert (temp_dir / "a.txt").read_bytes() == b"a"
+
+    def test_group_commit_retries_failed_timer_commit(self, temp_dir: Path) -> None:
+        storage = LocalStorage(
+            config=LocalStorageConfig(
+                base_dir=str(temp_dir),
+                durability="group",
+                group_commit_interval_ms=10,
+            )
+        )
+        replace = os.replace
+        failures: list[str] = []
+
+        def failing_replace(source: Path, target: Path) -> None:
+            # 最初の確定のみ失敗させる
+            if not failures:
+                failures.append(str(target))
+                raise OSError("disk full")
+            replace(source, target)
+
+        with patch("os.replace", side_effect=failing_replace):
+            storage.save("a.txt", b"a")
+            deadline = time.monotonic() + 5
+            while not (temp_dir / "a.txt").exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        assert failures == [str(temp_dir / "a.txt")]
+        assert (temp_dir / "a.txt").read_bytes() == b"a"
+
+    def test_flush_requeues_files_when_commit_fails(self, temp_dir: Path) -> None:
+        storage = LocalStorage(
+            config=LocalStorageConfig(
+                base_dir=str(temp_dir),
+                durability="group",
+                group_commit_interval_ms=60_000,
+            )
+        )
+        storage.save("a.txt", b"a")
+        with patch("os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError, match="disk full"):
+                storage.flush()
+
+        assert storage.read("a.txt") == b"a"
+        storage.flush()
+        assert (temp_dir / "a.txt").read_bytes() == b"a"
+
+    def test_read_falls_back_when_temp_file_is_committed(self, temp_dir: Path) -> None:
+        storage = LocalStorage(
+            config=LocalStorageConfig(
+                base_dir=str(temp_dir),
+                durability="group",
+                group_commit_interval_ms=60_000,
+            )
+        )
+        storage.save("a.txt", b"content", metadata={"sha256": "abc"})
+        assert storage.group_committer is not None
+        temp_path = storage.group_committer.lookup(temp_dir / "a.txt")
+        storage.flush()
+
+        # 一時ファイルを確認した直後に確定（リネーム）された場合も、最終パスから読み込む
+        with patch.object(storage.group_committer, "lookup", return_value=temp_path):
+            assert storage.read("a.txt") == b"content"
+            assert storage.read_metadata("a.txt") == {"sha256": "abc"}
+            with storage.open("a.txt") as view:
+                assert bytes(view) == b"content"
+
+    ########## temp file sweep ##########
+    def test_init_removes_stale_temp_files(self, temp_dir: Path) -> None:
+        (temp_dir / "subdir").mkdir()
+        stale = temp_dir / "subdir" / ".a.txt.0123456789ab.fino-tmp"
+        fresh = temp_dir / "subdir" / ".b.txt.0123456789ab.fino-tmp"
+        stale.write_bytes(b"partial")
+        fresh.write_bytes(b"writing")
+        two_hours_ago = time.time() - 7200
+        os.utime(stale, (two_hours_ago, two_hours_ago))
+
+        _ = LocalStorage(
+            config=LocalStorageConfig(
+                base_dir=str(temp_dir), stale_temp_file_seconds=3600
+            )
+        )
+
+        assert not stale.exists()
+        # 他のプロセスが書き込み中の可能性がある新しい一時ファイルは残す
+        assert fresh.exists()
+
+    def test_init_does_not_sweep_by_default(self, temp_dir: Path) -> None:
+        stale = temp_dir / ".a.txt.0123456789ab.fino-tmp"
+        stale.write_bytes(b"partial")
+        two_hours_ago = time.time() - 7200
+        os.utime(stale, (two_hours_ago, two_hours_ago))
+
+        _ = LocalStorage(config=LocalStorageConfig(base_dir=str(temp_dir)))
+
+        assert stale.exists()
+
+    ########## delete / move method ##########
+    def test_delete_removes_file(self, storage: LocalStorage) -> None:
+        storage.save("test.txt", b"content")
+        storage.delete("test.txt")
+        assert storage.exists("test.txt") is False
+
+    def test_move_renames_file(self, storage: LocalStorage, temp_dir: Path) -> None:
+        storage.save("a/test.txt", b"content")
+        storage.move("a/test.txt", "b/nested/test.txt")
+        assert not (temp_dir / "a" / "test.txt").exists()
+        assert (temp_dir / "b" / "nested" / "test.txt").read_bytes() == b"content"
+
+    ########## metadata ##########
+    def test_save_stores_metadata_as_xattr(self, storage: LocalStorage) -> None:
+        storage.save("test.txt", b"content", metadata={"sha256": "abc"})
+        assert storage.read_metadata("test.txt") == {"sha256": "abc"}
+
+    def test_read_metadata_without_metadata(self, storage: LocalStorage) -> None:
+        storage.save("test.txt", b"content")
+        assert storage.read_metadata("test.txt") == {}
+
+    def test_read_metadata_raises_error_when_file_not_exists(
+        self, storage: LocalStorage
+    ) -> None:
+        with pytest.raises(FileNotFoundError):
+            _ = storage.read_metadata("missing.txt")
+
+    def test_move_keeps_metadata(self, storage: LocalStorage) -> None:
+        storage.save("a/test.txt", b"content", metadata={"sha256": "abc"})
+        storage.move("a/test.txt", "b/test.txt")
+        assert storage.read_metadata("b/test.txt") == {"sha256": "abc"}
+
+    ########## open method ##########
+    def test_open_returns_memory_mapped_view(self, storage: LocalStorage) -> None:
+        storage.save("test.txt", b"0123456789")
+        with storage.open("test.txt") as view:
+            assert isinstance(view, memoryview)
+            assert view.readonly is True
+            assert bytes(view[2:5]) == b"234"
+
+    def test_open_empty_file(self, storage: LocalStorage) -> None:
+        storage.save("empty.txt", b"")
+        with storage.open("empty.txt") as view:
+            assert bytes(view) == b""
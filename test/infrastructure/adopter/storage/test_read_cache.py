@@ -0,0 +1,142 @@
+import tempfile
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fino_ingestor.infrastructure.adapter.storage.local import LocalStorage
+from fino_ingestor.infrastructure.adapter.storage.read_cache import ReadCacheStorage
+from fino_ingestor.interface.config.storage import (
+    LocalStorageConfig,
+    ReadCacheStorageConfig,
+    S3StorageConfig,
+)
+
+
+class TestReadCacheStorage:
+    @pytest.fixture
+    def temp_dir(self) -> Generator[Path, None, None]:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def backend(self, temp_dir: Path) -> LocalStorage:
+        # S3の代わりにローカルストレージをbackendとして使用する
+        return LocalStorage(config=LocalStorageConfig(base_dir=str(temp_dir / "s3")))
+
+    def build_storage(
+        self, temp_dir: Path, backend: LocalStorage, max_bytes: int = 1024
+    ) -> ReadCacheStorage:
+        config = ReadCacheStorageConfig(
+            backend=S3StorageConfig(bucket_name="test-bucket", region="us-east-1"),
+            cache_dir=str(temp_dir / "cache"),
+            max_bytes=max_bytes,
+        )
+        cache = LocalStorage(config=LocalStorageConfig(base_dir=config.cache_dir))
+        return ReadCacheStorage(backend=backend, cache=cache, config=config)
+
+    ########## read method ##########
+    def test_read_is_served_from_cache(
+        self, temp_dir: Path, backend: LocalStorage
+    ) -> None:
+        backend.save("doc/a.zip", b"content")
+        storage = self.build_storage(temp_dir, backend)
+
+        with patch.object(backend, "read", wraps=backend.read) as mock_read:
+            assert storage.read("doc/a.zip") == b"content"
+            assert storage.read("doc/a.zip") == b"content"
+            assert storage.read("doc/a.zip", offset=-3) == b"ent"
+            mock_read.assert_called_once()
+        assert (storage.hits, storage.misses) == (2, 1)
+        assert (temp_dir / "cache/doc/a.zip").read_bytes() == b"content"
+
+    def test_ranged_read_passes_through_when_not_cached(
+        self, temp_dir: Path, backend: LocalStorage
+    ) -> None:
+        backend.save("doc/a.zip", b"content")
+        storage = self.build_storage(temp_dir, backend)
+
+        assert storage.read("doc/a.zip", offset=1, length=2) == b"on"
+        assert storage.cached_bytes == 0
+
+    def test_open_returns_cached_view(
+        self, temp_dir: Path, backend: LocalStorage
+    ) -> None:
+        backend.save("doc/a.zip", b"content")
+        storage = self.build_storage(temp_dir, backend)
+
+        with storage.open("doc/a.zip") as view:
+            assert bytes(view) == b"content"
+        assert storage.cached_bytes == len(b"content")
+
+    def test_read_does_not_cache_content_invalidated_during_read(
+        self, temp_dir: Path, backend: LocalStorage
+    ) -> None:
+        backend.save("doc/a.zip", b"old")
+        storage = self.build_storage(temp_dir, backend)
+        read = backend.read
+
+        def read_then_overwrite(path: str, **kwargs: int | None) -> bytes:
+            file = read(path, **kwargs)
+            # backendから読み込んでいる間に、他のスレッドが上書きした
+            if file == b"old":
+                storage.save(path, b"new")
+            return file
+
+        with patch.object(backend, "read", side_effect=read_then_overwrite):
+            assert storage.read("doc/a.zip") == b"old"
+        assert storage.cached_bytes == 0
+        assert storage.read("doc/a.zip") == b"new"
+
+    def test_read_falls_back_when_cached_file_disappears(
+        self, temp_dir: Path, backend: LocalStorage
+    ) -> None:
+        backend.save("doc/a.zip", b"content")
+        storage = self.build_storage(temp_dir, backend)
+        _ = storage.read("doc/a.zip")
+
+        # 確認した直後に追い出された場合も、backendから読み込む
+        (temp_dir / "cache/doc/a.zip").unlink()
+        assert storage.read("doc/a.zip") == b"content"
+        (temp_dir / "cache/doc/a.zip").unlink()
+        with storage.open("doc/a.zip") as view:
+            assert bytes(view) == b"content"
+
+    ########## eviction ##########
+    def test_least_recently_used_file_is_evicted(
+        self, temp_dir: Path, backend: LocalStorage
+    ) -> None:
+        for name in ("a", "b", "c"):
+            backend.save(f"doc/{name}.zip", name.encode() * 400)
+        storage = self.build_storage(temp_dir, backend, max_bytes=1000)
+
+        _ = storage.read("doc/a.zip")
+        _ = storage.read("doc/b.zip")
+        _ = storage.read("doc/a.zip")
+        _ = storage.read("doc/c.zip")
+
+        assert storage.cached_bytes == 800
+        assert not (temp_dir / "cache/doc/b.zip").exists()
+        assert (temp_dir / "cache/doc/a.zip").exists()
+
+    def test_cache_is_restored_on_restart(
+        self, temp_dir: Path, backend: LocalStorage
+    ) -> None:
+        backend.save("doc/a.zip", b"content")
+        _ = self.build_storage(temp_dir, backend).read("doc/a.zip")
+
+        storage = self.build_storage(temp_dir, backend)
+        with patch.object(backend, "read", wraps=backend.read) as mock_read:
+            assert storage.read("doc/a.zip") == b"content"
+            mock_read.assert_not_called()
+
+    ########## save method ##########
+    def test_save_invalidates_cache(
+        self, temp_dir: Path, backend: LocalStorage
+    ) -> None:
+        backend.save("doc/a.zip", b"old")
+        storage = self.build_storage(temp_dir, backend)
+        _ = storage.read("doc/a.zip")
+
+        storage.save("doc/a.zip", b"new")
+        assert storage.read("doc/a.zip") == b"new"
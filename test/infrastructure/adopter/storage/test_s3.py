@@ -5,11 +5,14 @@ import boto3
 import pytest
 from botocore.exceptions import ClientError
 from fino_ingestor.infrastructure.adapter.storage.s3 import S3Storage
-from fino_ingestor.interface.config.storage import S3StorageConfig
+from fino_ingestor.infrastructure.scheduler.bandwidth import BandwidthLimiter
+from fino_ingestor.interface.config.storage import S3StorageConfig, S3TransferConfig
 from fino_ingestor.interface.port.storage import StoragePort
 from moto import mock_aws
 from mypy_boto3_s3.client import S3Client
 
+MIB = 1024 * 1024
+
 
 class TestS3Storage:
     @pytest.fixture
@@ -39,6 +42,18 @@ class TestS3Storage:
             )
         )
 
+    @pytest.fixture
+    def multipart_storage(self, bucket_name: str) -> S3Storage:
+        return S3Storage(
+            config=S3StorageConfig(
+                bucket_name=bucket_name,
+                region="us-east-1",
+                transfer=S3TransferConfig(
+                    multipart_threshold=5 * MIB, part_size=5 * MIB, max_attempts=2
+                ),
+            )
+        )
+
     @pytest.fixture(autouse=True)
     def setup_mock_aws(self):
         """すべてのテストでmock_awsを有効化"""
@@ -221,6 +236,252 @@ class TestS3Storage:
                 storage.save("test.txt", b"content")
             mock_put.assert_called_once()
 
+    ########## read method ##########
+    def test_read_returns_whole_object(
+        self, storage: S3Storage, s3_bucket: str
+    ) -> None:
+        storage.save("test.txt", b"0123456789")
+        assert storage.read("test.txt") == b"0123456789"
+
+    def test_read_returns_range(self, storage: S3Storage, s3_bucket: str) -> None:
+        storage.save("test.txt", b"0123456789")
+        assert storage.read("test.txt", offset=2, length=3) == b"234"
+        assert storage.read("test.txt", offset=7) == b"789"
+        assert storage.read("test.txt", offset=-4) == b"6789"
+
+    def test_read_raises_error_when_object_not_exists(
+        self, storage: S3Storage, s3_bucket: str
+    ) -> None:
+        with pytest.raises(FileNotFoundError):
+            _ = storage.read("missing.txt")
+
+    ########## list_paths method ##########
+    def test_list_paths_returns_keys_under_prefix(
+        self, storage_with_prefix: S3Storage, s3_bucket: str
+    ) -> None:
+        storage_with_prefix.save("a/1.txt", b"1")
+        storage_with_prefix.save("a/nested/2.txt", b"2")
+        storage_with_prefix.save("b/3.txt", b"3")
+
+        assert list(storage_with_prefix.list_paths("a/")) == [
+            "a/1.txt",
+            "a/nested/2.txt",
+        ]
+
+    ########## delete / move method ##########
+    def test_delete_removes_object(self, storage: S3Storage, s3_bucket: str) -> None:
+        storage.save("test.txt", b"content")
+        storage.delete("test.txt")
+        assert storage.exists("test.txt") is False
+
+    def test_move_copies_and_deletes_object(
+        self, storage: S3Storage, s3_bucket: str
+    ) -> None:
+        storage.save("a/test.txt", b"content")
+        storage.move("a/test.txt", "b/test.txt")
+        assert storage.exists("a/test.txt") is False
+        assert storage.read("b/test.txt") == b"content"
+
+    ########## multipart upload ##########
+    def test_save_uses_multipart_upload_for_large_file(
+        self, multipart_storage: S3Storage, s3_client: S3Client, s3_bucket: str
+    ) -> None:
+        content = bytes(range(256)) * (11 * MIB // 256)
+        with patch.object(
+            multipart_storage.s3_client,
+            "upload_part",
+            wraps=multipart_storage.s3_client.upload_part,
+        ) as mock_upload_part:
+            multipart_storage.save("large.zip", content)
+            assert mock_upload_part.call_count == 3
+
+        response = s3_client.get_object(Bucket=s3_bucket, Key="large.zip")
+        assert response["Body"].read() == content  # type: ignore[reportUnknownMemberType]
+
+    def test_save_uses_put_object_below_threshold(
+        self, multipart_storage: S3Storage, s3_bucket: str
+    ) -> None:
+        with patch.object(
+            multipart_storage.s3_client,
+            "create_multipart_upload",
+            wraps=multipart_storage.s3_client.create_multipart_upload,
+        ) as mock_create:
+            multipart_storage.save("small.zip", b"small")
+            mock_create.assert_not_called()
+
+    def test_save_consumes_bandwidth_per_part(
+        self, bucket_name: str, s3_bucket: str
+    ) -> None:
+        sleeps: list[float] = []
+        limiter = BandwidthLimiter(5 * MIB, sleep=sleeps.append)
+        storage = S3Storage(
+            config=S3StorageConfig(
+                bucket_name=bucket_name,
+                region="us-east-1",
+                transfer=S3TransferConfig(
+                    multipart_threshold=5 * MIB, part_size=5 * MIB, max_concurrency=1
+                ),
+            ),
+            bandwidth_limiter=limiter,
+        )
+
+        storage.save("large.zip", b"x" * (11 * MIB))
+        storage.save("small.zip", b"small")
+        assert limiter.metrics().total_bytes == 11 * MIB + len(b"small")
+        # 2パート目以降は上限に従って待機する
+        assert len(sleeps) == 3
+
+    def test_save_retries_failed_part(
+        self,
+        multipart_storage: S3Storage,
+        s3_client: S3Client,
+        s3_bucket: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr("fino_ingestor.util.retry.time.sleep", lambda _: None)
+        content = b"x" * (11 * MIB)
+        upload_part = multipart_storage.s3_client.upload_part
+        failed: list[int] = []
+
+        def flaky_upload_part(**kwargs: object) -> object:
+            if kwargs["PartNumber"] == 2 and not failed:
+                failed.append(2)
+                raise ClientError({"Error": {"Code": "SlowDown"}}, "UploadPart")
+            return upload_part(**kwargs)  # type: ignore[arg-type]
+
+        with patch.object(
+            multipart_storage.s3_client, "upload_part", side_effect=flaky_upload_part
+        ):
+            multipart_storage.save("large.zip", content)
+
+        assert failed == [2]
+        response = s3_client.get_object(Bucket=s3_bucket, Key="large.zip")
+        assert response["Body"].read() == content  # type: ignore[reportUnknownMemberType]
+
+    def test_save_resumes_incomplete_multipart_upload(
+        self,
+        multipart_storage: S3Storage,
+        s3_client: S3Client,
+        s3_bucket: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr("fino_ingestor.util.retry.time.sleep", lambda _: None)
+        content = bytes(range(256)) * (11 * MIB // 256)
+        upload_part = multipart_storage.s3_client.upload_part
+
+        def failing_upload_part(**kwargs: object) -> object:
+            if kwargs["PartNumber"] == 3:
+                raise ClientError({"Error": {"Code": "InternalError"}}, "UploadPart")
+            return upload_part(**kwargs)  # type: ignore[arg-type]
+
+        with patch.object(
+            multipart_storage.s3_client, "upload_part", side_effect=failing_upload_part
+        ):
+            with pytest.raises(IOError, match="Failed to save file to S3"):
+                multipart_storage.save("large.zip", content)
+
+        # 2回目はアップロード済みのパート1, 2を再利用し、パート3のみを送信する
+        with patch.object(
+            multipart_storage.s3_client, "upload_part", wraps=upload_part
+        ) as mock_upload_part:
+            multipart_storage.save("large.zip", content)
+            assert [
+                c.kwargs["PartNumber"] for c in mock_upload_part.call_args_list
+            ] == [3]
+
+        response = s3_client.get_object(Bucket=s3_bucket, Key="large.zip")
+        assert response["Body"].read() == content  # type: ignore[reportUnknownMemberType]
+
+    def test_save_does_not_adopt_foreign_multipart_upload(
+        self, multipart_storage: S3Storage, s3_client: S3Client, s3_bucket: str
+    ) -> None:
+        # 他の書き込み元が進行中のアップロードは再利用しない
+        foreign = s3_client.create_multipart_upload(Bucket=s3_bucket, Key="large.zip")
+        content = b"x" * (6 * MIB)
+        multipart_storage.save("large.zip", content)
+
+        assert multipart_storage.read("large.zip") == content
+        uploads = s3_client.list_multipart_uploads(Bucket=s3_bucket).get("Uploads", [])
+        assert [u.get("UploadId") for u in uploads] == [foreign["UploadId"]]
+
+    def test_save_aborts_failed_upload_without_resume(
+        self,
+        bucket_name: str,
+        s3_client: S3Client,
+        s3_bucket: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr("fino_ingestor.util.retry.time.sleep", lambda _: None)
+        storage = S3Storage(
+            config=S3StorageConfig(
+                bucket_name=bucket_name,
+                region="us-east-1",
+                transfer=S3TransferConfig(
+                    multipart_threshold=5 * MIB,
+                    part_size=5 * MIB,
+                    max_attempts=1,
+                    resume=False,
+                ),
+            )
+        )
+        with patch.object(
+            storage.s3_client,
+            "upload_part",
+            side_effect=ClientError({"Error": {"Code": "InternalError"}}, "UploadPart"),
+        ):
+            with pytest.raises(IOError):
+                storage.save("large.zip", b"x" * (6 * MIB))
+
+        assert s3_client.list_multipart_uploads(Bucket=s3_bucket).get("Uploads") in (
+            None,
+            [],
+        )
+
+    ########## metadata ##########
+    def test_save_stores_metadata(self, storage: S3Storage, s3_bucket: str) -> None:
+        storage.save("test.zip", b"content", metadata={"sha256": "abc"})
+        assert storage.read_metadata("test.zip") == {"sha256": "abc"}
+
+    def test_multipart_upload_stores_metadata(
+        self, multipart_storage: S3Storage, s3_bucket: str
+    ) -> None:
+        multipart_storage.save(
+            "large.zip", b"x" * (6 * MIB), metadata={"sha256": "abc"}
+        )
+        assert multipart_storage.read_metadata("large.zip") == {"sha256": "abc"}
+
+    def test_resumed_multipart_upload_replaces_metadata(
+        self,
+        multipart_storage: S3Storage,
+        s3_bucket: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr("fino_ingestor.util.retry.time.sleep", lambda _: None)
+        content = b"x" * (11 * MIB)
+        upload_part = multipart_storage.s3_client.upload_part
+
+        def failing_upload_part(**kwargs: object) -> object:
+            if kwargs["PartNumber"] == 3:
+                raise ClientError({"Error": {"Code": "InternalError"}}, "UploadPart")
+            return upload_part(**kwargs)  # type: ignore[arg-type]
+
+        with patch.object(
+            multipart_storage.s3_client, "upload_part", side_effect=failing_upload_part
+        ):
+            with pytest.raises(IOError):
+                multipart_storage.save("large.zip", content, metadata={"sha256": "old"})
+
+        # 別のメタデータで開始したアップロードを再開する
+        multipart_storage.save("large.zip", content, metadata={"sha256": "abc"})
+        assert multipart_storage.read_metadata("large.zip") == {"sha256": "abc"}
+        assert multipart_storage.read("large.zip") == content
+
+    def test_read_metadata_raises_error_when_object_not_exists(
+        self, storage: S3Storage, s3_bucket: str
+    ) -> None:
+        with pytest.raises(FileNotFoundError):
+            _ = storage.read_metadata("missing.zip")
+
     ########## save method ERROR ##########
     def test_save_raises_error_on_absolute_path(self, storage: S3Storage) -> None:
         with pytest.raises(ValueError, match="Absolute path is not allowed"):
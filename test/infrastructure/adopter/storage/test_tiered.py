@@ -0,0 +1,295 @@
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Generator, Mapping
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fino_ingestor.infrastructure.adapter.storage.local import LocalStorage
+from fino_ingestor.infrastructure.adapter.storage.tiered import TieredStorage
+from fino_ingestor.infrastructure.factory.storage import create_storage
+from fino_ingestor.interface.config.concurrency import ConcurrencyConfig
+from fino_ingestor.interface.config.storage import (
+    LocalStorageConfig,
+    TieredStorageConfig,
+)
+from fino_ingestor.interface.port.storage import StoragePort
+
+
+class BlockingStorage(LocalStorage):
+    """releaseされるまでsaveを待機させるバックエンド"""
+
+    def __init__(self, config: LocalStorageConfig) -> None:
+        super().__init__(config)
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.fail = False
+
+    def save(
+        self, path: str, file: bytes, metadata: Mapping[str, str] | None = None
+    ) -> None:
+        self.started.set()
+        _ = self.release.wait(timeout=5)
+        if self.fail:
+            raise OSError("backend unavailable")
+        super().save(path, file, metadata=metadata)
+
+
+class HookedStorage(LocalStorage):
+    """保存の完了後にフックを呼び出すステージング領域"""
+
+    def __init__(self, config: LocalStorageConfig) -> None:
+        super().__init__(config)
+        self.on_saved: Callable[[str, bytes], None] | None = None
+
+    def save(
+        self, path: str, file: bytes, metadata: Mapping[str, str] | None = None
+    ) -> None:
+        super().save(path, file, metadata=metadata)
+        if self.on_saved is not None:
+            self.on_saved(path, file)
+
+
+class ClosingStorage(LocalStorage):
+    """closeの呼び出しを記録するストレージ"""
+
+    closed = False
+
+    def close(self) -> None:
+        self.closed = True
+        super().close()
+
+
+class TestTieredStorage:
+    @pytest.fixture
+    def temp_dir(self) -> Generator[Path, None, None]:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def config(self, temp_dir: Path) -> TieredStorageConfig:
+        return TieredStorageConfig(
+            staging=LocalStorageConfig(base_dir=str(temp_dir / "staging")),
+            backend=LocalStorageConfig(base_dir=str(temp_dir / "backend")),
+            max_attempts=1,
+        )
+
+    @pytest.fixture
+    def backend(self, config: TieredStorageConfig) -> BlockingStorage:
+        assert isinstance(config.backend, LocalStorageConfig)
+        return BlockingStorage(config.backend)
+
+    def build_storage(
+        self, config: TieredStorageConfig, backend: StoragePort
+    ) -> TieredStorage:
+        return TieredStorage(
+            staging=LocalStorage(config.staging), backend=backend, config=config
+        )
+
+    ########## instance check ##########
+    def test_create_storage_builds_tiered_storage(
+        self, config: TieredStorageConfig
+    ) -> None:
+        storage = create_storage(config, client_registry=None)
+        assert isinstance(storage, TieredStorage)
+        assert isinstance(storage.backend, LocalStorage)
+
+    ########## write-behind ##########
+    def test_save_returns_before_upload(
+        self, config: TieredStorageConfig, backend: BlockingStorage, temp_dir: Path
+    ) -> None:
+        storage = self.build_storage(config, backend)
+
+        storage.save("doc/a.zip", b"content")
+        assert backend.started.wait(timeout=5)
+        assert (temp_dir / "staging/doc/a.zip").read_bytes() == b"content"
+        assert storage.exists("doc/a.zip") is True
+        assert storage.read("doc/a.zip") == b"content"
+        assert storage.pending_uploads == 1
+
+        backend.release.set()
+        storage.flush()
+        assert (temp_dir / "backend/doc/a.zip").read_bytes() == b"content"
+        assert not (temp_dir / "staging/doc/a.zip").exists()
+        assert storage.pending_uploads == 0
+        assert storage.read("doc/a.zip") == b"content"
+
+    def test_save_if_absent_does_not_query_backend(
+        self, config: TieredStorageConfig, backend: BlockingStorage
+    ) -> None:
+        """呼び出し側が存在確認済みのため、バックエンドへの存在確認で保存を待たせない"""
+        storage = self.build_storage(config, backend)
+        backend.release.set()
+
+        with patch.object(backend, "exists", wraps=backend.exists) as mock_exists:
+            storage.save_if_absent("doc/a.zip", b"content")
+            storage.flush()
+            mock_exists.assert_not_called()
+        assert backend.read("doc/a.zip") == b"content"
+
+    def test_upload_carries_metadata_to_backend(
+        self, config: TieredStorageConfig, backend: BlockingStorage
+    ) -> None:
+        storage = self.build_storage(config, backend)
+        backend.release.set()
+
+        storage.save("doc/a.zip", b"content", metadata={"sha256": "abc"})
+        storage.flush()
+        assert backend.read_metadata("doc/a.zip") == {"sha256": "abc"}
+        assert storage.read_metadata("doc/a.zip") == {"sha256": "abc"}
+
+    def test_update_during_upload_is_uploaded_again(
+        self, config: TieredStorageConfig, backend: BlockingStorage, temp_dir: Path
+    ) -> None:
+        storage = self.build_storage(config, backend)
+
+        storage.save("doc/a.zip", b"v1")
+        assert backend.started.wait(timeout=5)
+        storage.save("doc/a.zip", b"v2")
+        backend.release.set()
+        storage.flush()
+
+        assert (temp_dir / "backend/doc/a.zip").read_bytes() == b"v2"
+        assert not (temp_dir / "staging/doc/a.zip").exists()
+
+    def test_upload_does_not_delete_file_being_written(
+        self, config: TieredStorageConfig, backend: BlockingStorage, temp_dir: Path
+    ) -> None:
+        config = config.model_copy(update={"max_concurrency": 1})
+        staging = HookedStorage(config.staging)
+        storage = TieredStorage(staging=staging, backend=backend, config=config)
+
+        # 1つのワーカーを塞ぎ、v1のアップロードをv2の書き込み中に開始させる
+        storage.save("doc/b.zip", b"b")
+        assert backend.started.wait(timeout=5)
+        storage.save("doc/a.zip", b"v1")
+
+        def release_uploads(path: str, file: bytes) -> None:
+            if file != b"v2":
+                return
+            backend.release.set()
+            deadline = time.monotonic() + 5
+            while storage.pending_uploads > 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        staging.on_saved = release_uploads
+        storage.save("doc/a.zip", b"v2")
+        storage.flush()
+
+        assert (temp_dir / "backend/doc/a.zip").read_bytes() == b"v2"
+        assert not (temp_dir / "staging/doc/a.zip").exists()
+
+    def test_save_waits_when_pending_uploads_reach_limit(
+        self, config: TieredStorageConfig, backend: BlockingStorage
+    ) -> None:
+        config = config.model_copy(update={"max_pending_uploads": 1})
+        storage = self.build_storage(config, backend)
+        storage.save("doc/a.zip", b"a")
+
+        second = threading.Thread(target=storage.save, args=("doc/b.zip", b"b"))
+        second.start()
+        second.join(timeout=0.2)
+        assert second.is_alive()
+
+        backend.release.set()
+        second.join(timeout=5)
+        assert not second.is_alive()
+        storage.flush()
+
+    def test_when_durable_waits_for_upload(
+        self, config: TieredStorageConfig, backend: BlockingStorage
+    ) -> None:
+        storage = self.build_storage(config, backend)
+        durable = threading.Event()
+
+        storage.save("doc/a.zip", b"content")
+        storage.when_durable("doc/a.zip", durable.set)
+        assert backend.started.wait(timeout=5)
+        # ステージング領域への書き込みのみでは確定とみなさない
+        assert not durable.is_set()
+
+        backend.release.set()
+        assert durable.wait(timeout=5)
+        assert backend.read("doc/a.zip") == b"content"
+
+    def test_when_durable_waits_for_retried_upload(
+        self, config: TieredStorageConfig, backend: BlockingStorage
+    ) -> None:
+        backend.fail = True
+        backend.release.set()
+        storage = self.build_storage(config, backend)
+        durable = threading.Event()
+
+        storage.save("doc/a.zip", b"content")
+        storage.when_durable("doc/a.zip", durable.set)
+        with pytest.raises(IOError):
+            storage.flush()
+        assert not durable.is_set()
+
+        # アップロードし直して確定した時点で呼び出す
+        backend.fail = False
+        storage.recover()
+        storage.flush()
+        assert durable.is_set()
+
+    ########## adaptive concurrency ##########
+    def test_upload_limiter_limits_concurrent_uploads(
+        self, config: TieredStorageConfig, backend: BlockingStorage
+    ) -> None:
+        config.upload_concurrency = ConcurrencyConfig(
+            initial_limit=1, min_limit=1, max_limit=4
+        )
+        storage = self.build_storage(config, backend)
+        assert storage.upload_limiter is not None
+
+        storage.save("a.txt", b"a")
+        storage.save("b.txt", b"b")
+        assert backend.started.wait(timeout=5)
+        # 並列数の上限が1のため、2件目のアップロードは待機する
+        assert storage.upload_limiter.metrics().in_flight == 1
+
+        backend.release.set()
+        storage.flush()
+        assert backend.exists("a.txt") and backend.exists("b.txt")
+        assert storage.upload_limiter.metrics().in_flight == 0
+
+    ########## failure / recovery ##########
+    def test_flush_raises_upload_error_and_keeps_staged_file(
+        self, config: TieredStorageConfig, backend: BlockingStorage, temp_dir: Path
+    ) -> None:
+        backend.fail = True
+        backend.release.set()
+        storage = self.build_storage(config, backend)
+
+        storage.save("doc/a.zip", b"content")
+        with pytest.raises(IOError, match="Failed to upload 1 file"):
+            storage.flush()
+        assert (temp_dir / "staging/doc/a.zip").read_bytes() == b"content"
+
+    def test_close_uploads_and_closes_backend(
+        self, config: TieredStorageConfig, temp_dir: Path
+    ) -> None:
+        assert isinstance(config.backend, LocalStorageConfig)
+        backend = ClosingStorage(config.backend)
+        storage = self.build_storage(config, backend)
+        storage.save("doc/a.zip", b"content")
+
+        storage.close()
+
+        assert (temp_dir / "backend/doc/a.zip").read_bytes() == b"content"
+        assert list(storage.staging.list_paths()) == []
+        assert backend.closed is True
+
+    def test_recovers_staged_files_on_restart(
+        self, config: TieredStorageConfig, backend: BlockingStorage, temp_dir: Path
+    ) -> None:
+        # 前回のプロセスでアップロードされずに残ったファイル
+        LocalStorage(config.staging).save("doc/a.zip", b"left over")
+        backend.release.set()
+
+        storage = self.build_storage(config, backend)
+        storage.flush()
+
+        assert (temp_dir / "backend/doc/a.zip").read_bytes() == b"left over"
+        assert list(storage.staging.list_paths()) == []
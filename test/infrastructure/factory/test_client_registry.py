@@ -0,0 +1,146 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from fino_ingestor.infrastructure.adapter.storage.s3 import S3Storage
+from fino_ingestor.infrastructure.factory.client_registry import (
+    ClientLease,
+    ClientRegistry,
+)
+from fino_ingestor.infrastructure.factory.disclosure_source import (
+    create_disclosure_source,
+)
+from fino_ingestor.infrastructure.factory.storage import create_storage
+from fino_ingestor.interface.config.disclosure import EdinetConfig
+from fino_ingestor.interface.config.storage import S3StorageConfig
+
+
+class TestClientRegistry:
+    @pytest.fixture
+    def registry(self) -> ClientRegistry:
+        return ClientRegistry()
+
+    ########## get_or_create ##########
+    def test_get_or_create_returns_same_instance(
+        self, registry: ClientRegistry
+    ) -> None:
+        factory = MagicMock(side_effect=lambda: object())
+        first = registry.get_or_create("key", factory)
+        second = registry.get_or_create("key", factory)
+        assert first is second
+        factory.assert_called_once()
+
+    def test_get_or_create_separates_keys(self, registry: ClientRegistry) -> None:
+        first = registry.get_or_create("key1", object)
+        second = registry.get_or_create("key2", object)
+        assert first is not second
+        assert len(registry) == 2
+
+    def test_get_or_create_is_thread_safe(self, registry: ClientRegistry) -> None:
+        created: list[object] = []
+
+        def factory() -> object:
+            # 生成に時間がかかる場合でも二重生成されないことを確認する
+            time.sleep(0.01)
+            client = object()
+            created.append(client)
+            return client
+
+        results: list[object] = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(registry.get_or_create("key", factory))
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(created) == 1
+        assert all(result is created[0] for result in results)
+
+    ########## close / shutdown ##########
+    def test_close_invokes_closer(self, registry: ClientRegistry) -> None:
+        closer = MagicMock()
+        client = registry.get_or_create("key", object, close=closer)
+        registry.close("key")
+        closer.assert_called_once_with(client)
+        assert "key" not in registry
+
+    def test_shutdown_closes_all_clients(self, registry: ClientRegistry) -> None:
+        closer = MagicMock()
+        _ = registry.get_or_create("key1", object, close=closer)
+        _ = registry.get_or_create("key2", object, close=closer)
+        registry.shutdown()
+        assert closer.call_count == 2
+        assert len(registry) == 0
+
+    def test_release_closes_client_without_references(
+        self, registry: ClientRegistry
+    ) -> None:
+        closer = MagicMock()
+        client = registry.get_or_create("key", object, close=closer)
+        _ = registry.get_or_create("key", object, close=closer)
+
+        registry.release("key")
+        closer.assert_not_called()
+        assert "key" in registry
+
+        registry.release("key")
+        closer.assert_called_once_with(client)
+        assert "key" not in registry
+
+    def test_lease_shutdown_releases_only_its_clients(
+        self, registry: ClientRegistry
+    ) -> None:
+        closer = MagicMock()
+        first = ClientLease(registry)
+        second = ClientLease(registry)
+        shared = first.get_or_create("shared", object, close=closer)
+        # 同じリースからの2回目の取得では参照を増やさない
+        _ = first.get_or_create("shared", object, close=closer)
+        assert second.get_or_create("shared", object, close=closer) is shared
+        own = first.get_or_create("own", object, close=closer)
+
+        first.shutdown()
+        closer.assert_called_once_with(own)
+        assert "shared" in registry
+
+        second.shutdown()
+        assert closer.call_count == 2
+        assert len(registry) == 0
+
+    ########## factory ##########
+    def test_create_storage_shares_s3_client(self, registry: ClientRegistry) -> None:
+        config = S3StorageConfig(bucket_name="bucket-a", region="us-east-1")
+        other_bucket = S3StorageConfig(bucket_name="bucket-b", region="us-east-1")
+
+        first = create_storage(config, client_registry=registry)
+        second = create_storage(other_bucket, client_registry=registry)
+
+        assert isinstance(first, S3Storage)
+        assert isinstance(second, S3Storage)
+        assert first.s3_client is second.s3_client
+
+    def test_create_storage_without_registry(self, registry: ClientRegistry) -> None:
+        config = S3StorageConfig(bucket_name="bucket", region="us-east-1")
+
+        first = create_storage(config, client_registry=None)
+        second = create_storage(config, client_registry=None)
+
+        assert isinstance(first, S3Storage)
+        assert isinstance(second, S3Storage)
+        assert first.s3_client is not second.s3_client
+
+    def test_create_disclosure_source_shares_edinet_client(
+        self, registry: ClientRegistry
+    ) -> None:
+        config = EdinetConfig(api_key="test_api_key")
+
+        first = create_disclosure_source(config, client_registry=registry)
+        second = create_disclosure_source(config, client_registry=registry)
+
+        assert first.client is second.client  # type: ignore[attr-defined]
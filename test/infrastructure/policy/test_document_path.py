@@ -0,0 +1,107 @@
+from datetime import date
+
+import pytest
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.value.disclosure_date import DisclosureDate
+from fino_ingestor.domain.value.disclosure_source import (
+    DisclosureSource,
+    DisclosureSourceEnum,
+)
+from fino_ingestor.domain.value.disclosure_type import (
+    DisclosureType,
+    DisclosureTypeEnum,
+)
+from fino_ingestor.domain.value.document_id import DocumentId
+from fino_ingestor.domain.value.format_type import FormatType, FormatTypeEnum
+from fino_ingestor.domain.value.ticker import Ticker
+from fino_ingestor.infrastructure.policy.document_path import (
+    DocumentPathKey,
+    DocumentPathPolicy,
+    HashedShardPathPolicy,
+    HivePartitionedPathPolicy,
+    PathPolicy,
+    create_path_policy,
+)
+from fino_ingestor.interface.config.repository import PathLayout
+
+
+@pytest.fixture
+def document() -> Document:
+    return Document(
+        document_id=DocumentId(value="EDINET_S100TEST_XBRL"),
+        filing_name="有価証券報告書",
+        ticker=Ticker(value="12345"),
+        disclosure_type=DisclosureType(enum=DisclosureTypeEnum.ANNUAL_REPORT),
+        disclosure_source=DisclosureSource(enum=DisclosureSourceEnum.EDINET),
+        disclosure_date=DisclosureDate(value=date(2024, 3, 15)),
+        filing_format=FormatType(enum=FormatTypeEnum.XBRL),
+    )
+
+
+class TestPathPolicy:
+    ########## generate_path ##########
+    def test_ticker_layout(self, document: Document) -> None:
+        assert (
+            DocumentPathPolicy().generate_path(document, is_zip=True)
+            == "EDINET/12345/ANNUAL_REPORT/EDINET_S100TEST_XBRL_2024-03-15_XBRL.zip"
+        )
+
+    def test_hive_layout(self, document: Document) -> None:
+        assert HivePartitionedPathPolicy().generate_path(document, is_zip=True) == (
+            "source=EDINET/year=2024/month=03/ticker=12345/type=ANNUAL_REPORT/"
+            "EDINET_S100TEST_XBRL_2024-03-15_XBRL.zip"
+        )
+
+    def test_hive_month_prefix_matches_generated_path(self, document: Document) -> None:
+        prefix = HivePartitionedPathPolicy.generate_month_prefix(
+            document.disclosure_source, 2024, 3
+        )
+        path = HivePartitionedPathPolicy().generate_path(document, is_zip=True)
+        assert path.startswith(prefix)
+
+    def test_hashed_layout_is_stable(self, document: Document) -> None:
+        path = HashedShardPathPolicy().generate_path(document, is_zip=True)
+        parts = path.split("/")
+        assert parts[0] == "EDINET"
+        assert len(parts[1]) == 2 and len(parts[2]) == 2
+        assert parts[3:] == [
+            "12345",
+            "ANNUAL_REPORT",
+            "EDINET_S100TEST_XBRL_2024-03-15_XBRL.zip",
+        ]
+        assert HashedShardPathPolicy().generate_path(document, is_zip=True) == path
+
+    ########## parse_path ##########
+    @pytest.mark.parametrize("layout", ["ticker", "hive", "hashed"])
+    def test_parse_path_round_trip(
+        self, document: Document, layout: PathLayout
+    ) -> None:
+        policy = create_path_policy(layout)
+        key = DocumentPathKey.from_document(document)
+
+        assert policy.parse_path(policy.build_path(key, is_zip=True)) == (key, ".zip")
+        member = policy.build_path(key) + "/XBRL/PublicDoc/instance.xbrl"
+        assert policy.parse_path(member) == (key, "/XBRL/PublicDoc/instance.xbrl")
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "EDINET/_bundles/2024-03-15/0001.bundle",
+            "EDINET/12345/ANNUAL_REPORT/unknown.zip",
+            "EDINET/12345/ANNUAL_REPORT/EDINET_S100TEST_XBRL_2024-13-01_XBRL.zip",
+        ],
+    )
+    def test_parse_path_returns_none_for_other_paths(self, path: str) -> None:
+        assert DocumentPathPolicy().parse_path(path) is None
+
+    def test_parse_path_rejects_other_layout(self, document: Document) -> None:
+        hive_path = HivePartitionedPathPolicy().generate_path(document, is_zip=True)
+        hashed_path = HashedShardPathPolicy().generate_path(document, is_zip=True)
+
+        assert DocumentPathPolicy().parse_path(hive_path) is None
+        assert DocumentPathPolicy().parse_path(hashed_path) is None
+        assert HashedShardPathPolicy().parse_path(hive_path) is None
+
+    def test_create_path_policy(self) -> None:
+        assert isinstance(create_path_policy("ticker"), DocumentPathPolicy)
+        assert isinstance(create_path_policy("hive"), PathPolicy)
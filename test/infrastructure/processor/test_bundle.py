@@ -0,0 +1,50 @@
+import pytest
+from fino_ingestor.infrastructure.processor.bundle import (
+    BUNDLE_FOOTER_SIZE,
+    BundleEntry,
+    BundleWriter,
+    parse_bundle_footer,
+    parse_bundle_index,
+)
+
+
+class TestBundleWriter:
+    def test_add_records_offsets(self) -> None:
+        writer = BundleWriter()
+        writer.add("a.zip", b"aaa")
+        writer.add("b.zip", b"bb")
+
+        assert writer.index == {
+            "a.zip": BundleEntry(offset=0, length=3),
+            "b.zip": BundleEntry(offset=3, length=2),
+        }
+        assert writer.size == 5
+        assert len(writer) == 2
+        assert "a.zip" in writer
+        assert writer.get("b.zip") == b"bb"
+
+    def test_add_raises_error_on_duplicate_key(self) -> None:
+        writer = BundleWriter()
+        writer.add("a.zip", b"aaa")
+        with pytest.raises(ValueError, match="Duplicate bundle member"):
+            writer.add("a.zip", b"aaa")
+
+    def test_build_can_be_read_by_ranges(self) -> None:
+        writer = BundleWriter()
+        writer.add("a.zip", b"aaa")
+        writer.add("書類/b.zip", b"bb")
+        bundle = writer.build()
+
+        index_offset, index_length = parse_bundle_footer(bundle[-BUNDLE_FOOTER_SIZE:])
+        index = parse_bundle_index(bundle[index_offset : index_offset + index_length])
+
+        entry = index["書類/b.zip"]
+        assert bundle[entry.offset : entry.offset + entry.length] == b"bb"
+
+    def test_parse_bundle_footer_raises_error_on_invalid_magic(self) -> None:
+        with pytest.raises(ValueError, match="Invalid bundle magic number"):
+            _ = parse_bundle_footer(b"\x00" * BUNDLE_FOOTER_SIZE)
+
+    def test_parse_bundle_footer_raises_error_on_invalid_size(self) -> None:
+        with pytest.raises(ValueError, match="Invalid bundle footer size"):
+            _ = parse_bundle_footer(b"short")
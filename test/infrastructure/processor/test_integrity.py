@@ -0,0 +1,153 @@
+import hashlib
+import io
+import zipfile
+from collections.abc import Generator
+from datetime import date
+
+import pytest
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.value.disclosure_date import DisclosureDate
+from fino_ingestor.domain.value.disclosure_source import (
+    DisclosureSource,
+    DisclosureSourceEnum,
+)
+from fino_ingestor.domain.value.disclosure_type import (
+    DisclosureType,
+    DisclosureTypeEnum,
+)
+from fino_ingestor.domain.value.document_id import DocumentId
+from fino_ingestor.domain.value.format_type import FormatType, FormatTypeEnum
+from fino_ingestor.domain.value.ticker import Ticker
+from fino_ingestor.infrastructure.processor.integrity import (
+    CorruptPackageError,
+    PackageVerifier,
+)
+from fino_ingestor.interface.config.integrity import IntegrityConfig
+
+PDF = b"%PDF-1.7\n" + b"0" * 2048 + b"\n%%EOF\n"
+
+
+def build_document(format_type: FormatTypeEnum = FormatTypeEnum.XBRL) -> Document:
+    return Document(
+        document_id=DocumentId(value=f"EDINET_S100TEST_{format_type.value}"),
+        filing_name="有価証券報告書",
+        ticker=Ticker(value="12345"),
+        disclosure_type=DisclosureType(enum=DisclosureTypeEnum.ANNUAL_REPORT),
+        disclosure_source=DisclosureSource(enum=DisclosureSourceEnum.EDINET),
+        disclosure_date=DisclosureDate(value=date(2024, 3, 15)),
+        filing_format=FormatType(enum=format_type),
+    )
+
+
+def build_zip(
+    members: dict[str, bytes], compression: int = zipfile.ZIP_DEFLATED
+) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, mode="w", compression=compression) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+class TestPackageVerifier:
+    @pytest.fixture(autouse=True)
+    def no_retry_wait(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("fino_ingestor.util.retry.time.sleep", lambda _: None)
+
+    @pytest.fixture
+    def verifier(self) -> Generator[PackageVerifier, None, None]:
+        verifier = PackageVerifier(IntegrityConfig(max_workers=2, max_attempts=3))
+        yield verifier
+        verifier.close()
+
+    @pytest.fixture
+    def package(self) -> bytes:
+        return build_zip(
+            {f"XBRL/PublicDoc/{i}.xml": b"<xbrl/>" * 100 for i in range(5)}
+        )
+
+    ########## verify ##########
+    def test_verify_zip_returns_hash(
+        self, verifier: PackageVerifier, package: bytes
+    ) -> None:
+        verified = verifier.verify(build_document(), package)
+        assert verified.sha256 == hashlib.sha256(package).hexdigest()
+        assert verified.size == len(package)
+
+    def test_verify_truncated_zip_raises_error(
+        self, verifier: PackageVerifier, package: bytes
+    ) -> None:
+        with pytest.raises(CorruptPackageError, match="Invalid zip"):
+            _ = verifier.verify(build_document(), package[:-100])
+
+    def test_verify_zip_with_crc_mismatch_raises_error(
+        self, verifier: PackageVerifier
+    ) -> None:
+        package = build_zip(
+            {"a.xml": b"<a/>" * 10, "b.xml": b"<b/>" * 10},
+            compression=zipfile.ZIP_STORED,
+        )
+        # セントラルディレクトリを残したまま、メンバーの内容だけを書き換える
+        offset = package.index(b"<b/>")
+        corrupted = package[:offset] + b"<x/>" + package[offset + 4 :]
+
+        with pytest.raises(CorruptPackageError, match="b.xml"):
+            _ = verifier.verify(build_document(), corrupted)
+
+    def test_verify_error_response_as_zip_raises_error(
+        self, verifier: PackageVerifier
+    ) -> None:
+        body = b'{"metadata": {"status": "404", "message": "Not Found"}}'
+        with pytest.raises(CorruptPackageError):
+            _ = verifier.verify(build_document(FormatTypeEnum.CSV), body)
+
+    def test_verify_pdf(self, verifier: PackageVerifier) -> None:
+        document = build_document(FormatTypeEnum.PDF)
+        assert verifier.verify(document, PDF).size == len(PDF)
+        with pytest.raises(CorruptPackageError, match="header"):
+            _ = verifier.verify(document, b"<html></html>")
+        with pytest.raises(CorruptPackageError, match="truncated"):
+            _ = verifier.verify(document, PDF[:1024])
+
+    def test_verify_other_format_only_hashes(self, verifier: PackageVerifier) -> None:
+        verified = verifier.verify(build_document(FormatTypeEnum.OTHER), b"data")
+        assert verified.sha256 == hashlib.sha256(b"data").hexdigest()
+
+    ########## fetch_verified ##########
+    def test_fetch_verified_retries_corrupt_download(
+        self, verifier: PackageVerifier, package: bytes
+    ) -> None:
+        responses = [package[:10], package[:-10], package]
+
+        file, verified = verifier.fetch_verified(
+            build_document(), lambda: responses.pop(0)
+        )
+        assert file == package
+        assert verified.sha256 == hashlib.sha256(package).hexdigest()
+        assert responses == []
+
+    def test_fetch_verified_raises_error_after_max_attempts(
+        self, verifier: PackageVerifier, package: bytes
+    ) -> None:
+        calls: list[int] = []
+
+        def download() -> bytes:
+            calls.append(1)
+            return package[:10]
+
+        with pytest.raises(CorruptPackageError):
+            _ = verifier.fetch_verified(build_document(), download)
+        assert len(calls) == 3
+
+    def test_fetch_verified_does_not_retry_other_errors(
+        self, verifier: PackageVerifier
+    ) -> None:
+        calls: list[int] = []
+
+        def download() -> bytes:
+            calls.append(1)
+            raise OSError("connection reset")
+
+        with pytest.raises(OSError, match="connection reset"):
+            _ = verifier.fetch_verified(build_document(), download)
+        assert len(calls) == 1
@@ -0,0 +1,97 @@
+import io
+import zipfile
+
+import pytest
+from fino_ingestor.infrastructure.processor.zip_extractor import (
+    ZipExtractor,
+    ZipMember,
+)
+from fino_ingestor.interface.config.repository import ZipExtractionConfig
+
+
+def build_zip(members: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+class TestZipExtractor:
+    @pytest.fixture
+    def extractor(self) -> ZipExtractor:
+        return ZipExtractor(config=ZipExtractionConfig())
+
+    @pytest.fixture
+    def edinet_zip(self) -> bytes:
+        """EDINETの提出本文書zipを模したデータ"""
+        return build_zip(
+            {
+                "XBRL/PublicDoc/jpcrp030000-asr-001_E00001-000.xbrl": b"<xbrl/>",
+                "XBRL/PublicDoc/jpcrp030000-asr-001_E00001-000_lab.xml": b"<lab/>",
+                "XBRL/PublicDoc/jpcrp030000-asr-001_E00001-000_pre.xml": b"<pre/>",
+                "XBRL/PublicDoc/0101010_honbun.htm": b"<html/>",
+                "XBRL/PublicDoc/images/logo.png": b"png",
+                "XBRL/AuditDoc/jpaud-aar-cn-001.xbrl": b"<audit/>",
+            }
+        )
+
+    ########## is_zip ##########
+    def test_is_zip(self, edinet_zip: bytes) -> None:
+        assert ZipExtractor.is_zip(edinet_zip) is True
+        assert ZipExtractor.is_zip(b"%PDF-1.7") is False
+
+    ########## extract ##########
+    def test_extract_keeps_only_matching_members(
+        self, extractor: ZipExtractor, edinet_zip: bytes
+    ) -> None:
+        members = extractor.extract(edinet_zip)
+        assert [m.name for m in members] == [
+            "XBRL/PublicDoc/jpcrp030000-asr-001_E00001-000.xbrl",
+            "XBRL/PublicDoc/jpcrp030000-asr-001_E00001-000_lab.xml",
+            "XBRL/PublicDoc/jpcrp030000-asr-001_E00001-000_pre.xml",
+        ]
+        assert members[0].data == b"<xbrl/>"
+
+    def test_extract_with_custom_patterns(self, edinet_zip: bytes) -> None:
+        extractor = ZipExtractor(
+            config=ZipExtractionConfig(include_patterns=["XBRL/AuditDoc/*"])
+        )
+        members = extractor.extract(edinet_zip)
+        assert [m.name for m in members] == ["XBRL/AuditDoc/jpaud-aar-cn-001.xbrl"]
+
+    def test_extract_skips_members_outside_archive_root(
+        self, extractor: ZipExtractor
+    ) -> None:
+        # fnmatchの"*"は"/"や".."にも一致するため、名前の検証がないと展開先の外を指せる
+        package = build_zip(
+            {
+                "XBRL/PublicDoc/../../../../../../pwned.xbrl": b"evil",
+                "/XBRL/PublicDoc/absolute.xbrl": b"evil",
+                "XBRL/PublicDoc/./instance.xbrl": b"<xbrl/>",
+            }
+        )
+        members = extractor.extract(package)
+        assert [m.name for m in members] == ["XBRL/PublicDoc/instance.xbrl"]
+
+    @pytest.mark.parametrize(
+        "name", ["../a.xbrl", "/etc/a.xbrl", "XBRL\\..\\a.xbrl", "", "."]
+    )
+    def test_normalize_name_rejects_unsafe_names(self, name: str) -> None:
+        assert ZipExtractor.normalize_name(name) is None
+
+    ########## repack ##########
+    def test_repack_creates_slim_archive(
+        self, extractor: ZipExtractor, edinet_zip: bytes
+    ) -> None:
+        repacked = extractor.repack(extractor.extract(edinet_zip))
+        with zipfile.ZipFile(io.BytesIO(repacked)) as archive:
+            assert len(archive.namelist()) == 3
+            assert (
+                archive.read("XBRL/PublicDoc/jpcrp030000-asr-001_E00001-000_pre.xml")
+                == b"<pre/>"
+            )
+
+    def test_repack_rejects_unsafe_member_names(self, extractor: ZipExtractor) -> None:
+        with pytest.raises(ValueError, match="Unsafe zip member name"):
+            _ = extractor.repack([ZipMember(name="../pwned.xbrl", data=b"evil")])
@@ -0,0 +1,137 @@
+import tempfile
+import threading
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.value.disclosure_date import DisclosureDate
+from fino_ingestor.domain.value.disclosure_source import (
+    DisclosureSource,
+    DisclosureSourceEnum,
+)
+from fino_ingestor.domain.value.disclosure_type import (
+    DisclosureType,
+    DisclosureTypeEnum,
+)
+from fino_ingestor.domain.value.document_id import DocumentId
+from fino_ingestor.domain.value.format_type import FormatType, FormatTypeEnum
+from fino_ingestor.domain.value.ticker import Ticker
+from fino_ingestor.infrastructure.adapter.storage.local import LocalStorage
+from fino_ingestor.infrastructure.repository.dead_letter import (
+    DeadLetterRepositoryImpl,
+)
+from fino_ingestor.interface.config.storage import LocalStorageConfig
+
+
+def build_document(doc_id: str) -> Document:
+    return Document(
+        document_id=DocumentId(value=f"EDINET_{doc_id}_XBRL"),
+        filing_name="有価証券報告書",
+        ticker=Ticker(value="12345"),
+        disclosure_type=DisclosureType(enum=DisclosureTypeEnum.ANNUAL_REPORT),
+        disclosure_source=DisclosureSource(enum=DisclosureSourceEnum.EDINET),
+        disclosure_date=DisclosureDate(value=date(2024, 3, 15)),
+        filing_format=FormatType(enum=FormatTypeEnum.XBRL),
+    )
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = datetime(2024, 3, 15, 9, 0, tzinfo=UTC)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class TestDeadLetterRepositoryImpl:
+    @pytest.fixture
+    def storage(self) -> Generator[LocalStorage, None, None]:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield LocalStorage(config=LocalStorageConfig(base_dir=str(Path(tmpdir))))
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    ########## record method ##########
+    def test_record_updates_attempts_and_timestamps(
+        self, storage: LocalStorage, clock: FakeClock
+    ) -> None:
+        repository = DeadLetterRepositoryImpl(storage, clock=clock)
+        document = build_document("S100A")
+        first = repository.record(document, OSError("timeout"))
+        clock.now += timedelta(minutes=5)
+
+        second = repository.record(document, ValueError("broken"))
+
+        assert first.attempts == 1
+        assert second.attempts == 2
+        assert second.first_failed_at == first.first_failed_at
+        assert second.last_failed_at == clock.now
+        assert (second.error_type, second.error_message) == (
+            "builtins.ValueError",
+            "broken",
+        )
+
+    def test_record_is_durable(self, storage: LocalStorage, clock: FakeClock) -> None:
+        dead_letter = DeadLetterRepositoryImpl(storage, clock=clock).record(
+            build_document("S100A"), OSError("timeout")
+        )
+        storage.flush()
+
+        # 別のインスタンス（次回の実行）からも参照できる
+        (restored,) = DeadLetterRepositoryImpl(storage).list_dead_letters()
+        assert restored == dead_letter
+        assert restored.document.document_id.value == "EDINET_S100A_XBRL"
+
+    def test_record_locks_per_document(self, storage: LocalStorage) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+
+        class SlowStorage(LocalStorage):
+            def exists(self, path: str) -> bool:
+                # 異なる書類の記録が同時に進まない場合はタイムアウトする
+                if "S100A" in path or "S100B" in path:
+                    _ = barrier.wait()
+                return super().exists(path)
+
+        repository = DeadLetterRepositoryImpl(
+            SlowStorage(config=LocalStorageConfig(base_dir=str(storage.base_dir)))
+        )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(repository.record, build_document(doc_id), OSError())
+                for doc_id in ["S100A", "S100B"]
+            ]
+            assert [f.result().attempts for f in futures] == [1, 1]
+
+    def test_record_serializes_same_document(self, storage: LocalStorage) -> None:
+        repository = DeadLetterRepositoryImpl(storage)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for future in [
+                executor.submit(repository.record, build_document("S100A"), OSError())
+                for _ in range(8)
+            ]:
+                _ = future.result()
+
+        (dead_letter,) = repository.list_dead_letters()
+        assert dead_letter.attempts == 8
+        # 使い終わったロックは保持しない
+        assert repository._locks == {}  # type: ignore[reportPrivateUsage]
+
+    ########## list_dead_letters / remove method ##########
+    def test_list_returns_oldest_failure_first(
+        self, storage: LocalStorage, clock: FakeClock
+    ) -> None:
+        repository = DeadLetterRepositoryImpl(storage, clock=clock)
+        for doc_id in ["S100B", "S100A"]:
+            _ = repository.record(build_document(doc_id), OSError("timeout"))
+            clock.now += timedelta(seconds=1)
+        repository.remove(build_document("S100B"))
+        _ = repository.record(build_document("S100C"), OSError("timeout"))
+
+        assert [
+            d.document.document_id.value for d in repository.list_dead_letters()
+        ] == ["EDINET_S100A_XBRL", "EDINET_S100C_XBRL"]
@@ -0,0 +1,673 @@
+import hashlib
+import io
+import json
+import tempfile
+import zipfile
+from collections.abc import Generator
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.value.disclosure_date import DisclosureDate
+from fino_ingestor.domain.value.disclosure_source import (
+    DisclosureSource,
+    DisclosureSourceEnum,
+)
+from fino_ingestor.domain.value.disclosure_type import (
+    DisclosureType,
+    DisclosureTypeEnum,
+)
+from fino_ingestor.domain.value.document_id import DocumentId
+from fino_ingestor.domain.value.format_type import FormatType, FormatTypeEnum
+from fino_ingestor.domain.value.ticker import Ticker
+from fino_ingestor.domain.event.document_stored import DocumentStoredEvent
+from fino_ingestor.domain.repository.document import DocumentStoreError
+from fino_ingestor.infrastructure.adapter.event_sink.callback import (
+    CallbackEventSink,
+)
+from fino_ingestor.infrastructure.adapter.storage.local import LocalStorage
+from fino_ingestor.infrastructure.repository.document import DocumentRepositoryImpl
+from fino_ingestor.interface.config.repository import (
+    BundlingConfig,
+    ExistenceCacheConfig,
+    RepositoryConfig,
+    ZipExtractionConfig,
+)
+from fino_ingestor.interface.config.storage import LocalStorageConfig
+
+
+def build_document(
+    doc_id: str = "S100TEST",
+    format_type: FormatTypeEnum = FormatTypeEnum.XBRL,
+    disclosure_date: date = date(2024, 3, 15),
+) -> Document:
+    return Document(
+        document_id=DocumentId(value=f"EDINET_{doc_id}_{format_type.value}"),
+        filing_name="有価証券報告書",
+        ticker=Ticker(value="12345"),
+        disclosure_type=DisclosureType(enum=DisclosureTypeEnum.ANNUAL_REPORT),
+        disclosure_source=DisclosureSource(enum=DisclosureSourceEnum.EDINET),
+        disclosure_date=DisclosureDate(value=disclosure_date),
+        filing_format=FormatType(enum=format_type),
+    )
+
+
+def build_zip(members: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, mode="w") as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def bundle_files(temp_dir: Path, disclosure_date: date) -> list[Path]:
+    bundle_dir = temp_dir / "EDINET/_bundles" / disclosure_date.isoformat()
+    return sorted(bundle_dir.glob("*.bundle"))
+
+
+class TestDocumentRepositoryImpl:
+    @pytest.fixture
+    def temp_dir(self) -> Generator[Path, None, None]:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def storage(self, temp_dir: Path) -> LocalStorage:
+        return LocalStorage(config=LocalStorageConfig(base_dir=str(temp_dir)))
+
+    @pytest.fixture
+    def edinet_zip(self) -> bytes:
+        return build_zip(
+            {
+                "XBRL/PublicDoc/instance.xbrl": b"<xbrl/>",
+                "XBRL/PublicDoc/honbun.htm": b"<html/>",
+            }
+        )
+
+    ########## save / exists ##########
+    def test_save_and_exists(self, storage: LocalStorage, edinet_zip: bytes) -> None:
+        repository = DocumentRepositoryImpl(storage)
+        document = build_document()
+
+        assert repository.exists(document) is False
+        repository.save(document, edinet_zip)
+        repository.flush()
+        assert repository.exists(document) is True
+
+    def test_flush_commits_storage(self, temp_dir: Path, edinet_zip: bytes) -> None:
+        storage = LocalStorage(
+            config=LocalStorageConfig(
+                base_dir=str(temp_dir),
+                durability="group",
+                group_commit_interval_ms=60_000,
+            )
+        )
+        repository = DocumentRepositoryImpl(storage)
+
+        repository.save(build_document(), edinet_zip)
+        repository.flush()
+
+        saved = (
+            temp_dir
+            / "EDINET/12345/ANNUAL_REPORT/EDINET_S100TEST_XBRL_2024-03-15_XBRL.zip"
+        )
+        assert saved.read_bytes() == edinet_zip
+
+    ########## existence cache ##########
+    def test_existence_cache_is_disabled_by_default(
+        self, storage: LocalStorage, edinet_zip: bytes
+    ) -> None:
+        repository = DocumentRepositoryImpl(storage)
+        document = build_document()
+        assert repository.existence_cache is None
+        assert repository.exists(document) is False
+
+        # 他のプロセスが保存した書類もすぐに検出できる
+        storage.save(
+            "EDINET/12345/ANNUAL_REPORT/EDINET_S100TEST_XBRL_2024-03-15_XBRL.zip",
+            edinet_zip,
+        )
+        assert repository.exists(document) is True
+
+    def test_exists_is_served_from_cache(
+        self, storage: LocalStorage, edinet_zip: bytes
+    ) -> None:
+        repository = DocumentRepositoryImpl(
+            storage, config=RepositoryConfig(existence_cache=ExistenceCacheConfig())
+        )
+        stored, missing = build_document("S100A0"), build_document("S100A1")
+        storage.save(
+            "EDINET/12345/ANNUAL_REPORT/EDINET_S100A0_XBRL_2024-03-15_XBRL.zip",
+            edinet_zip,
+        )
+
+        with patch.object(storage, "exists", wraps=storage.exists) as mock_exists:
+            for _ in range(2):
+                assert repository.exists(stored) is True
+                assert repository.exists(missing) is False
+            assert mock_exists.call_count == 2
+
+    def test_save_updates_cache(self, storage: LocalStorage, edinet_zip: bytes) -> None:
+        repository = DocumentRepositoryImpl(
+            storage, config=RepositoryConfig(existence_cache=ExistenceCacheConfig())
+        )
+        document = build_document()
+        assert repository.exists(document) is False
+
+        repository.save(document, edinet_zip)
+        with patch.object(storage, "exists", wraps=storage.exists) as mock_exists:
+            assert repository.exists(document) is True
+            mock_exists.assert_not_called()
+
+    def test_failed_save_invalidates_cache(self, storage: LocalStorage) -> None:
+        repository = DocumentRepositoryImpl(
+            storage,
+            config=RepositoryConfig(
+                extraction=ZipExtractionConfig(),
+                existence_cache=ExistenceCacheConfig(),
+            ),
+        )
+        document = build_document()
+        broken = build_zip({"XBRL/PublicDoc/instance.xbrl": b"<xbrl/>"}).replace(
+            b"<xbrl/>", b"<xbrl!>"
+        )
+
+        repository.save(document, broken)
+        with pytest.raises(DocumentStoreError):
+            repository.flush()
+        assert repository.exists(document) is False
+
+    def test_flush_reports_every_failed_document(
+        self, storage: LocalStorage, edinet_zip: bytes
+    ) -> None:
+        repository = DocumentRepositoryImpl(
+            storage, config=RepositoryConfig(extraction=ZipExtractionConfig())
+        )
+        broken = build_zip({"XBRL/PublicDoc/instance.xbrl": b"<xbrl/>"}).replace(
+            b"<xbrl/>", b"<xbrl!>"
+        )
+        documents = [build_document(f"S100A{i}") for i in range(3)]
+        repository.save(documents[0], broken)
+        repository.save(documents[1], edinet_zip)
+        repository.save(documents[2], broken)
+
+        with pytest.raises(DocumentStoreError) as excinfo:
+            repository.flush()
+
+        # 失敗した書類をすべて返し、保存できた書類の書き込みは確定させる
+        assert [d.document_id.value for d, _ in excinfo.value.failures] == [
+            "EDINET_S100A0_XBRL",
+            "EDINET_S100A2_XBRL",
+        ]
+        assert [repository.exists(d) for d in documents] == [False, True, False]
+
+    def test_missing_results_are_not_cached_when_disabled(
+        self, storage: LocalStorage, edinet_zip: bytes
+    ) -> None:
+        repository = DocumentRepositoryImpl(
+            storage,
+            config=RepositoryConfig(
+                existence_cache=ExistenceCacheConfig(cache_missing=False)
+            ),
+        )
+        document = build_document()
+        assert repository.exists(document) is False
+
+        # 他のプロセスが保存した場合も検出できる
+        storage.save(
+            "EDINET/12345/ANNUAL_REPORT/EDINET_S100TEST_XBRL_2024-03-15_XBRL.zip",
+            edinet_zip,
+        )
+        assert repository.exists(document) is True
+
+    ########## extraction ##########
+    def test_save_repacks_zip(
+        self, storage: LocalStorage, temp_dir: Path, edinet_zip: bytes
+    ) -> None:
+        repository = DocumentRepositoryImpl(
+            storage, config=RepositoryConfig(extraction=ZipExtractionConfig())
+        )
+        document = build_document()
+
+        repository.save(document, edinet_zip)
+        repository.flush()
+
+        saved = (
+            temp_dir
+            / "EDINET/12345/ANNUAL_REPORT/EDINET_S100TEST_XBRL_2024-03-15_XBRL.zip"
+        )
+        with zipfile.ZipFile(saved) as archive:
+            assert archive.namelist() == ["XBRL/PublicDoc/instance.xbrl"]
+        assert repository.exists(document) is True
+
+    def test_save_overwrites_unless_disabled(self, storage: LocalStorage) -> None:
+        repository = DocumentRepositoryImpl(storage)
+        document = build_document()
+
+        # 未保存の書類の収集では、保存先ごとに保存済みかどうかをストレージに任せる
+        with patch.object(
+            storage, "save_if_absent", wraps=storage.save_if_absent
+        ) as mock_save_if_absent:
+            repository.save(document, b"fresh", overwrite=False)
+            mock_save_if_absent.assert_called_once()
+        # 修復などの再保存では上書きする
+        with patch.object(storage, "save", wraps=storage.save) as mock_save:
+            repository.save(document, b"repaired")
+            mock_save.assert_called_once()
+        assert repository.read(document) == b"repaired"
+
+    def test_save_stores_members(
+        self, storage: LocalStorage, temp_dir: Path, edinet_zip: bytes
+    ) -> None:
+        repository = DocumentRepositoryImpl(
+            storage,
+            config=RepositoryConfig(extraction=ZipExtractionConfig(output="members")),
+        )
+        document = build_document()
+
+        assert repository.exists(document) is False
+        repository.save(document, edinet_zip)
+        repository.flush()
+
+        base = (
+            temp_dir / "EDINET/12345/ANNUAL_REPORT/EDINET_S100TEST_XBRL_2024-03-15_XBRL"
+        )
+        assert (base / "XBRL/PublicDoc/instance.xbrl").read_bytes() == b"<xbrl/>"
+        assert not (base / "XBRL/PublicDoc/honbun.htm").exists()
+        manifest = json.loads((base / "manifest.json").read_text())
+        assert manifest["members"] == ["XBRL/PublicDoc/instance.xbrl"]
+        assert repository.exists(document) is True
+
+    def test_save_members_does_not_escape_document_directory(
+        self, storage: LocalStorage, temp_dir: Path
+    ) -> None:
+        repository = DocumentRepositoryImpl(
+            storage,
+            config=RepositoryConfig(extraction=ZipExtractionConfig(output="members")),
+        )
+        package = build_zip(
+            {
+                "XBRL/PublicDoc/../../../../../../pwned.xbrl": b"evil",
+                "XBRL/PublicDoc/instance.xbrl": b"<xbrl/>",
+            }
+        )
+
+        repository.save(build_document(), package)
+        repository.flush()
+
+        assert not (temp_dir / "pwned.xbrl").exists()
+        assert [p.name for p in temp_dir.rglob("*.xbrl")] == ["instance.xbrl"]
+
+    def test_save_stores_non_zip_payload_as_is(
+        self, storage: LocalStorage, temp_dir: Path
+    ) -> None:
+        repository = DocumentRepositoryImpl(
+            storage, config=RepositoryConfig(extraction=ZipExtractionConfig())
+        )
+        document = build_document(format_type=FormatTypeEnum.PDF)
+
+        repository.save(document, b"%PDF-1.7")
+        repository.flush()
+
+        saved = (
+            temp_dir
+            / "EDINET/12345/ANNUAL_REPORT/EDINET_S100TEST_PDF_2024-03-15_PDF.zip"
+        )
+        assert saved.read_bytes() == b"%PDF-1.7"
+
+    def test_flush_raises_extraction_error(self, storage: LocalStorage) -> None:
+        repository = DocumentRepositoryImpl(
+            storage, config=RepositoryConfig(extraction=ZipExtractionConfig())
+        )
+        # メンバーのデータが破損しているzip（CRC不一致）
+        broken = build_zip({"XBRL/PublicDoc/instance.xbrl": b"<xbrl/>"}).replace(
+            b"<xbrl/>", b"<xbrl!>"
+        )
+
+        document = build_document()
+        repository.save(document, broken)
+        with pytest.raises(DocumentStoreError) as excinfo:
+            repository.flush()
+        ((failed, error),) = excinfo.value.failures
+        assert failed is document
+        assert isinstance(error, zipfile.BadZipFile)
+
+    ########## read ##########
+    def test_read_returns_saved_file(
+        self, storage: LocalStorage, edinet_zip: bytes
+    ) -> None:
+        repository = DocumentRepositoryImpl(storage)
+        document = build_document()
+
+        repository.save(document, edinet_zip)
+        assert repository.read(document) == edinet_zip
+
+    def test_read_rebuilds_zip_from_members(
+        self, storage: LocalStorage, edinet_zip: bytes
+    ) -> None:
+        repository = DocumentRepositoryImpl(
+            storage,
+            config=RepositoryConfig(extraction=ZipExtractionConfig(output="members")),
+        )
+        document = build_document()
+
+        repository.save(document, edinet_zip)
+        repository.flush()
+
+        with zipfile.ZipFile(io.BytesIO(repository.read(document))) as archive:
+            assert archive.namelist() == ["XBRL/PublicDoc/instance.xbrl"]
+
+    def test_open_returns_view(self, storage: LocalStorage, edinet_zip: bytes) -> None:
+        repository = DocumentRepositoryImpl(storage)
+        document = build_document()
+        repository.save(document, edinet_zip)
+
+        with repository.open(document) as view:
+            assert bytes(view) == edinet_zip
+
+    def test_open_raises_error_when_not_stored(self, storage: LocalStorage) -> None:
+        repository = DocumentRepositoryImpl(storage)
+        with pytest.raises(FileNotFoundError):
+            _ = repository.open(build_document())
+
+    def test_iter_documents_skips_missing_documents(
+        self, storage: LocalStorage
+    ) -> None:
+        repository = DocumentRepositoryImpl(storage)
+        documents = [build_document(f"S100A{i}") for i in range(10)]
+        for document in documents[::2]:
+            repository.save(document, document.document_id.value.encode())
+
+        result = list(repository.iter_documents(documents, max_workers=2))
+
+        assert [document for document, _ in result] == documents[::2]
+        assert all(data == d.document_id.value.encode() for d, data in result)
+
+    ########## stored events ##########
+    def test_save_publishes_stored_event(
+        self, storage: LocalStorage, edinet_zip: bytes
+    ) -> None:
+        events: list[DocumentStoredEvent] = []
+        repository = DocumentRepositoryImpl(
+            storage, event_sinks=[CallbackEventSink(events.append)]
+        )
+        document = build_document()
+        repository.save(document, edinet_zip)
+
+        # 書き込みが確定した時点で通知する（flushを待たない）
+        assert len(events) == 1
+        assert events[0].document is document
+        assert storage.exists(events[0].path)
+        assert events[0].size == len(edinet_zip)
+        assert events[0].sha256 == hashlib.sha256(edinet_zip).hexdigest()
+
+    def test_save_with_hash_stores_metadata_and_reuses_hash(
+        self, storage: LocalStorage, edinet_zip: bytes
+    ) -> None:
+        events: list[DocumentStoredEvent] = []
+        repository = DocumentRepositoryImpl(
+            storage, event_sinks=[CallbackEventSink(events.append)]
+        )
+        repository.save(build_document(), edinet_zip, sha256="verified")
+        repository.flush()
+
+        # 検証済みのハッシュを計算し直さずに使用する
+        assert storage.read_metadata(events[0].path) == {"sha256": "verified"}
+        assert events[0].sha256 == "verified"
+
+    def test_save_with_hash_after_repack_stores_hash_of_stored_file(
+        self, storage: LocalStorage, edinet_zip: bytes
+    ) -> None:
+        repository = DocumentRepositoryImpl(
+            storage, config=RepositoryConfig(extraction=ZipExtractionConfig())
+        )
+        document = build_document()
+        repository.save(document, edinet_zip, sha256="verified")
+        repository.flush()
+
+        stored = repository.read(document)
+        path = "EDINET/12345/ANNUAL_REPORT/EDINET_S100TEST_XBRL_2024-03-15_XBRL.zip"
+        assert storage.read_metadata(path) == {
+            "sha256": hashlib.sha256(stored).hexdigest()
+        }
+
+    def test_bundled_document_event_is_published_on_flush(
+        self, storage: LocalStorage
+    ) -> None:
+        events: list[DocumentStoredEvent] = []
+        repository = DocumentRepositoryImpl(
+            storage,
+            config=RepositoryConfig(bundling=BundlingConfig()),
+            event_sinks=[CallbackEventSink(events.append)],
+        )
+        repository.save(build_document(), b"small")
+        assert events == []
+
+        repository.flush()
+        assert len(events) == 1
+
+    def test_failed_save_does_not_publish_event(self, storage: LocalStorage) -> None:
+        events: list[DocumentStoredEvent] = []
+        repository = DocumentRepositoryImpl(
+            storage, event_sinks=[CallbackEventSink(events.append)]
+        )
+        with patch.object(storage, "save", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                repository.save(build_document(), b"data")
+        repository.flush()
+        assert events == []
+
+    def test_event_is_published_after_group_commit(self, temp_dir: Path) -> None:
+        storage = LocalStorage(
+            config=LocalStorageConfig(
+                base_dir=str(temp_dir),
+                durability="group",
+                group_commit_interval_ms=60_000,
+            )
+        )
+        events: list[DocumentStoredEvent] = []
+        repository = DocumentRepositoryImpl(
+            storage, event_sinks=[CallbackEventSink(events.append)]
+        )
+        repository.save(build_document(), b"data")
+        # 書き込みが確定していない書類は通知しない
+        assert events == []
+
+        with (
+            patch("os.replace", side_effect=OSError("commit failed")),
+            pytest.raises(OSError),
+        ):
+            repository.flush()
+        assert events == []
+
+        repository.flush()
+        assert len(events) == 1
+
+    def test_event_is_published_per_commit_without_flush(self, temp_dir: Path) -> None:
+        storage = LocalStorage(
+            config=LocalStorageConfig(
+                base_dir=str(temp_dir), durability="group", group_commit_files=2
+            )
+        )
+        events: list[DocumentStoredEvent] = []
+        repository = DocumentRepositoryImpl(
+            storage, event_sinks=[CallbackEventSink(events.append)]
+        )
+        repository.save(build_document("S100A"), b"a")
+        assert events == []
+
+        # 確定単位に達した時点で、flushを待たずに確定した書類を通知する
+        repository.save(build_document("S100B"), b"b")
+        assert sorted(e.document.document_id.value for e in events) == [
+            "EDINET_S100A_XBRL",
+            "EDINET_S100B_XBRL",
+        ]
+
+    def test_skipped_save_if_absent_does_not_publish_event(
+        self, storage: LocalStorage
+    ) -> None:
+        events: list[DocumentStoredEvent] = []
+        repository = DocumentRepositoryImpl(
+            storage, event_sinks=[CallbackEventSink(events.append)]
+        )
+        with patch.object(storage, "save_if_absent", return_value=False):
+            repository.save(build_document(), b"data", overwrite=False)
+        repository.flush()
+        assert events == []
+
+    def test_failing_event_sink_does_not_fail_save(
+        self, storage: LocalStorage, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        events: list[DocumentStoredEvent] = []
+
+        def fail(_: DocumentStoredEvent) -> None:
+            raise ConnectionError("sink down")
+
+        repository = DocumentRepositoryImpl(
+            storage,
+            config=RepositoryConfig(
+                extraction=ZipExtractionConfig(),
+                existence_cache=ExistenceCacheConfig(),
+            ),
+            event_sinks=[CallbackEventSink(fail), CallbackEventSink(events.append)],
+        )
+        document = build_document()
+        repository.save(document, b"data")
+        repository.flush()
+
+        # 通知先の失敗は保存の失敗として扱わず、他の通知先への通知も続ける
+        assert len(events) == 1
+        assert repository.exists(document)
+        assert repository.existence_cache is not None
+        assert repository.existence_cache.get(document.document_id.value) is True
+        assert "EDINET_S100TEST_XBRL" in caplog.text
+
+    ########## bundling ##########
+    def test_bundling_packs_small_documents_per_day(
+        self, storage: LocalStorage, temp_dir: Path
+    ) -> None:
+        repository = DocumentRepositoryImpl(
+            storage, config=RepositoryConfig(bundling=BundlingConfig())
+        )
+        day1 = [
+            build_document(f"S100A{i}", disclosure_date=date(2024, 3, 15))
+            for i in range(3)
+        ]
+        day2 = build_document("S100B0", disclosure_date=date(2024, 3, 18))
+
+        # 優先度順・並列の収集では開示日が入り混じる
+        repository.save(day1[0], b"doc-0")
+        repository.save(day2, b"doc-day2")
+        repository.save(day1[1], b"doc-1")
+        repository.save(day1[2], b"doc-2")
+        # 保存前でもexistsはTrueを返す
+        assert repository.exists(day1[0]) is True
+        assert bundle_files(temp_dir, date(2024, 3, 15)) == []
+
+        repository.flush()
+        # 開示日ごとに1つのバンドルにまとまる
+        assert len(bundle_files(temp_dir, date(2024, 3, 15))) == 1
+        assert len(bundle_files(temp_dir, date(2024, 3, 18))) == 1
+        # 個別のファイルは作成されない
+        assert not (temp_dir / "EDINET/12345").exists()
+        assert repository.read(day1[1]) == b"doc-1"
+        assert repository.read(day2) == b"doc-day2"
+
+    def test_bundling_keeps_documents_when_bundle_save_fails(
+        self, storage: LocalStorage, temp_dir: Path
+    ) -> None:
+        repository = DocumentRepositoryImpl(
+            storage, config=RepositoryConfig(bundling=BundlingConfig())
+        )
+        document = build_document()
+        repository.save(document, b"small document")
+
+        with (
+            patch.object(storage, "save", side_effect=OSError("disk full")),
+            pytest.raises(OSError),
+        ):
+            repository.flush()
+        # 保存に失敗したバンドルは書き込み待ちのまま残る
+        assert repository.read(document) == b"small document"
+
+        repository.flush()
+        assert len(bundle_files(temp_dir, date(2024, 3, 15))) == 1
+        reader = DocumentRepositoryImpl(
+            storage, config=RepositoryConfig(bundling=BundlingConfig())
+        )
+        assert reader.read(document) == b"small document"
+
+    def test_bundling_reads_existing_bundles_with_new_repository(
+        self, storage: LocalStorage
+    ) -> None:
+        config = RepositoryConfig(bundling=BundlingConfig())
+        document = build_document()
+        writer = DocumentRepositoryImpl(storage, config=config)
+        writer.save(document, b"small document")
+        writer.flush()
+
+        reader = DocumentRepositoryImpl(storage, config=config)
+        assert reader.exists(document) is True
+        assert reader.exists(build_document("S100OTHER")) is False
+        assert reader.read(document) == b"small document"
+
+    def test_bundling_writes_bundle_when_size_limit_reached(
+        self, storage: LocalStorage, temp_dir: Path
+    ) -> None:
+        repository = DocumentRepositoryImpl(
+            storage,
+            config=RepositoryConfig(
+                bundling=BundlingConfig(max_member_bytes=10, max_bundle_bytes=15)
+            ),
+        )
+        repository.save(build_document("S100A0"), b"0123456789")
+        repository.save(build_document("S100A1"), b"0123456789")
+
+        assert len(bundle_files(temp_dir, date(2024, 3, 15))) == 1
+
+    def test_bundling_writes_largest_bundle_when_buffer_limit_reached(
+        self, storage: LocalStorage, temp_dir: Path
+    ) -> None:
+        repository = DocumentRepositoryImpl(
+            storage,
+            config=RepositoryConfig(
+                bundling=BundlingConfig(max_member_bytes=10, max_buffered_bytes=20)
+            ),
+        )
+        day1, day2 = date(2024, 3, 15), date(2024, 3, 18)
+        repository.save(build_document("S100A0", disclosure_date=day1), b"a" * 8)
+        repository.save(build_document("S100A1", disclosure_date=day1), b"a" * 8)
+        assert bundle_files(temp_dir, day1) == []
+
+        repository.save(build_document("S100B0", disclosure_date=day2), b"b" * 8)
+        assert len(bundle_files(temp_dir, day1)) == 1
+        assert bundle_files(temp_dir, day2) == []
+
+    def test_bundling_stores_large_documents_individually(
+        self, storage: LocalStorage, temp_dir: Path
+    ) -> None:
+        repository = DocumentRepositoryImpl(
+            storage,
+            config=RepositoryConfig(bundling=BundlingConfig(max_member_bytes=4)),
+        )
+        document = build_document()
+
+        repository.save(document, b"large document")
+        repository.flush()
+
+        saved = (
+            temp_dir
+            / "EDINET/12345/ANNUAL_REPORT/EDINET_S100TEST_XBRL_2024-03-15_XBRL.zip"
+        )
+        assert saved.read_bytes() == b"large document"
+        assert bundle_files(temp_dir, date(2024, 3, 15)) == []
+        assert repository.read(document) == b"large document"
+
+    def test_bundling_cannot_be_combined_with_members_extraction(self) -> None:
+        with pytest.raises(ValueError, match="bundling cannot be combined"):
+            _ = RepositoryConfig(
+                extraction=ZipExtractionConfig(output="members"),
+                bundling=BundlingConfig(),
+            )
@@ -0,0 +1,54 @@
+from fino_ingestor.infrastructure.repository.existence_cache import ExistenceCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestExistenceCache:
+    def test_get_returns_cached_value(self) -> None:
+        cache = ExistenceCache(max_entries=10, ttl_seconds=60)
+        assert cache.get("a") is None
+        cache.put("a", True)
+        cache.put("b", False)
+
+        assert cache.get("a") is True
+        assert cache.get("b") is False
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_entries_expire_after_ttl(self) -> None:
+        clock = FakeClock()
+        cache = ExistenceCache(max_entries=10, ttl_seconds=60, clock=clock)
+        cache.put("a", True)
+
+        clock.now = 59.9
+        assert cache.get("a") is True
+        clock.now = 60.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = ExistenceCache(max_entries=2, ttl_seconds=60)
+        cache.put("a", True)
+        cache.put("b", True)
+        # aを参照してbを最も古いエントリにする
+        assert cache.get("a") is True
+        cache.put("c", True)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is True
+        assert cache.get("c") is True
+
+    def test_invalidate_and_clear(self) -> None:
+        cache = ExistenceCache(max_entries=10, ttl_seconds=60)
+        cache.put("a", True)
+        cache.put("b", True)
+
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,166 @@
+import tempfile
+from collections.abc import Generator
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.value.disclosure_date import DisclosureDate
+from fino_ingestor.domain.value.disclosure_source import (
+    DisclosureSource,
+    DisclosureSourceEnum,
+)
+from fino_ingestor.domain.value.disclosure_type import (
+    DisclosureType,
+    DisclosureTypeEnum,
+)
+from fino_ingestor.domain.value.document_id import DocumentId
+from fino_ingestor.domain.value.format_type import FormatType, FormatTypeEnum
+from fino_ingestor.domain.value.ticker import Ticker
+from fino_ingestor.infrastructure.adapter.storage.local import LocalStorage
+from fino_ingestor.infrastructure.policy.document_path import create_path_policy
+from fino_ingestor.infrastructure.repository.document import DocumentRepositoryImpl
+from fino_ingestor.infrastructure.repository.layout_migration import LayoutMigrator
+from fino_ingestor.interface.config.repository import (
+    RepositoryConfig,
+    ZipExtractionConfig,
+)
+from fino_ingestor.interface.config.storage import LocalStorageConfig
+
+
+def build_document(doc_id: str, disclosure_date: date = date(2024, 3, 15)) -> Document:
+    return Document(
+        document_id=DocumentId(value=f"EDINET_{doc_id}_XBRL"),
+        filing_name="有価証券報告書",
+        ticker=Ticker(value="12345"),
+        disclosure_type=DisclosureType(enum=DisclosureTypeEnum.ANNUAL_REPORT),
+        disclosure_source=DisclosureSource(enum=DisclosureSourceEnum.EDINET),
+        disclosure_date=DisclosureDate(value=disclosure_date),
+        filing_format=FormatType(enum=FormatTypeEnum.XBRL),
+    )
+
+
+class TestLayoutMigrator:
+    @pytest.fixture
+    def temp_dir(self) -> Generator[Path, None, None]:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def storage(self, temp_dir: Path) -> LocalStorage:
+        return LocalStorage(config=LocalStorageConfig(base_dir=str(temp_dir)))
+
+    @pytest.fixture
+    def migrator(self, storage: LocalStorage) -> LayoutMigrator:
+        return LayoutMigrator(
+            storage,
+            source=create_path_policy("ticker"),
+            target=create_path_policy("hive"),
+            max_workers=4,
+        )
+
+    ########## migrate ##########
+    def test_migrate_moves_documents_to_target_layout(
+        self, storage: LocalStorage, migrator: LayoutMigrator, temp_dir: Path
+    ) -> None:
+        old = DocumentRepositoryImpl(storage)
+        documents = [build_document(f"S100A{i}") for i in range(5)]
+        for document in documents:
+            old.save(document, document.document_id.value.encode())
+        storage.save("EDINET/_bundles/2024-03-15/0001.bundle", b"bundle")
+
+        result = migrator.migrate()
+
+        assert len(result.moved) == 5
+        assert result.skipped == ["EDINET/_bundles/2024-03-15/0001.bundle"]
+        assert result.failed == []
+        assert not (temp_dir / "EDINET/12345").exists()
+
+        new = DocumentRepositoryImpl(
+            storage, config=RepositoryConfig(path_layout="hive")
+        )
+        for document in documents:
+            assert new.read(document) == document.document_id.value.encode()
+
+    def test_migrate_dry_run_does_not_move(
+        self, storage: LocalStorage, migrator: LayoutMigrator
+    ) -> None:
+        document = build_document("S100A0")
+        DocumentRepositoryImpl(storage).save(document, b"doc")
+
+        result = migrator.migrate(dry_run=True)
+
+        assert len(result.moved) == 1
+        assert DocumentRepositoryImpl(storage).exists(document) is True
+
+    def test_migrate_moves_manifest_last(
+        self, storage: LocalStorage, migrator: LayoutMigrator
+    ) -> None:
+        config = RepositoryConfig(extraction=ZipExtractionConfig(output="members"))
+        document = build_document("S100A0")
+        repository = DocumentRepositoryImpl(storage, config=config)
+        repository.save(document, b"not a zip")
+        repository.flush()
+
+        moves, _ = migrator.plan()
+        (document_moves,) = moves.values()
+        assert document_moves[-1][0].endswith("manifest.json")
+
+        result = migrator.migrate()
+        assert len(result.moved) == 2
+        new = DocumentRepositoryImpl(
+            storage,
+            config=RepositoryConfig(
+                path_layout="hive", extraction=ZipExtractionConfig(output="members")
+            ),
+        )
+        assert new.exists(document) is True
+
+    def test_migrate_reports_failures_and_can_be_resumed(
+        self, storage: LocalStorage, migrator: LayoutMigrator
+    ) -> None:
+        old = DocumentRepositoryImpl(storage)
+        documents = [build_document(f"S100A{i}") for i in range(3)]
+        for document in documents:
+            old.save(document, b"doc")
+
+        move = storage.move
+        failing = "S100A1"
+
+        def flaky_move(source_path: str, target_path: str) -> None:
+            if failing in source_path:
+                raise OSError("disk error")
+            move(source_path=source_path, target_path=target_path)
+
+        with patch.object(storage, "move", side_effect=flaky_move):
+            result = migrator.migrate()
+        assert len(result.moved) == 2
+        assert len(result.failed) == 1
+
+        # 再実行すると残っている書類のみを移動する
+        result = migrator.migrate()
+        assert len(result.moved) == 1
+        assert result.failed == []
+
+
+class TestRepositoryFallbackLayouts:
+    def test_exists_and_read_across_layouts(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = LocalStorage(config=LocalStorageConfig(base_dir=tmpdir))
+            document = build_document("S100A0")
+            DocumentRepositoryImpl(storage).save(document, b"doc")
+
+            hive_only = DocumentRepositoryImpl(
+                storage, config=RepositoryConfig(path_layout="hive")
+            )
+            hive_with_fallback = DocumentRepositoryImpl(
+                storage,
+                config=RepositoryConfig(
+                    path_layout="hive", fallback_layouts=["ticker"]
+                ),
+            )
+
+            assert hive_only.exists(document) is False
+            assert hive_with_fallback.exists(document) is True
+            assert hive_with_fallback.read(document) == b"doc"
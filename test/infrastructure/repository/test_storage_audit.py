@@ -0,0 +1,153 @@
+import hashlib
+import io
+import tempfile
+import zipfile
+from collections.abc import Generator
+from datetime import date
+from pathlib import Path
+
+import pytest
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.value.disclosure_date import DisclosureDate
+from fino_ingestor.domain.value.disclosure_source import (
+    DisclosureSource,
+    DisclosureSourceEnum,
+)
+from fino_ingestor.domain.value.disclosure_type import (
+    DisclosureType,
+    DisclosureTypeEnum,
+)
+from fino_ingestor.domain.value.document_id import DocumentId
+from fino_ingestor.domain.value.format_type import FormatType, FormatTypeEnum
+from fino_ingestor.domain.value.ticker import Ticker
+from fino_ingestor.infrastructure.adapter.storage.local import LocalStorage
+from fino_ingestor.infrastructure.policy.document_path import create_path_policy
+from fino_ingestor.infrastructure.repository.document import DocumentRepositoryImpl
+from fino_ingestor.infrastructure.repository.storage_audit import StorageAuditor
+from fino_ingestor.interface.config.storage import LocalStorageConfig
+
+
+def build_document(
+    doc_id: str, format_type: FormatTypeEnum = FormatTypeEnum.XBRL
+) -> Document:
+    return Document(
+        document_id=DocumentId(value=f"EDINET_{doc_id}_{format_type.value}"),
+        filing_name="有価証券報告書",
+        ticker=Ticker(value="12345"),
+        disclosure_type=DisclosureType(enum=DisclosureTypeEnum.ANNUAL_REPORT),
+        disclosure_source=DisclosureSource(enum=DisclosureSourceEnum.EDINET),
+        disclosure_date=DisclosureDate(value=date(2024, 3, 15)),
+        filing_format=FormatType(enum=format_type),
+    )
+
+
+def build_zip(members: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return buffer.getvalue()
+
+
+PDF = b"%PDF-1.7\n" + b"x" * 2048 + b"\n%%EOF\n"
+
+
+class TestStorageAuditor:
+    @pytest.fixture
+    def storage(self) -> Generator[LocalStorage, None, None]:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield LocalStorage(config=LocalStorageConfig(base_dir=str(Path(tmpdir))))
+
+    @pytest.fixture
+    def repository(self, storage: LocalStorage) -> DocumentRepositoryImpl:
+        return DocumentRepositoryImpl(storage)
+
+    def build_auditor(
+        self, storage: LocalStorage, verify_hashes: bool = False
+    ) -> StorageAuditor:
+        return StorageAuditor(
+            storage,
+            path_policies=[create_path_policy("ticker")],
+            max_workers=4,
+            verify_hashes=verify_hashes,
+        )
+
+    def problems(self, storage: LocalStorage, **kwargs: bool) -> dict[str, str]:
+        result = self.build_auditor(storage, **kwargs).scan()
+        return {f.key.document_id: f.problem for f in result.findings}
+
+    ########## scan method ##########
+    def test_scan_accepts_valid_packages(
+        self, storage: LocalStorage, repository: DocumentRepositoryImpl
+    ) -> None:
+        repository.save(build_document("S100A"), build_zip({"a.xbrl": b"x" * 100}))
+        repository.save(build_document("S100B", FormatTypeEnum.PDF), PDF)
+
+        result = self.build_auditor(storage).scan()
+
+        assert result.checked == 2
+        assert result.findings == []
+
+    def test_scan_detects_truncated_zip(
+        self, storage: LocalStorage, repository: DocumentRepositoryImpl
+    ) -> None:
+        package = build_zip({"a.xbrl": b"x" * 1000})
+        repository.save(build_document("S100A"), package[: len(package) // 2])
+
+        assert self.problems(storage) == {"EDINET_S100A_XBRL": "truncated"}
+
+    def test_scan_detects_broken_central_directory(
+        self, storage: LocalStorage, repository: DocumentRepositoryImpl
+    ) -> None:
+        package = bytearray(build_zip({"a.xbrl": b"x" * 1000}))
+        central = package.rfind(b"PK\x01\x02")
+        package[central : central + 4] = b"\x00\x00\x00\x00"
+        repository.save(build_document("S100A"), bytes(package))
+
+        assert self.problems(storage) == {"EDINET_S100A_XBRL": "truncated"}
+
+    def test_scan_detects_truncated_pdf(
+        self, storage: LocalStorage, repository: DocumentRepositoryImpl
+    ) -> None:
+        repository.save(build_document("S100A", FormatTypeEnum.PDF), PDF[:-64])
+
+        assert self.problems(storage) == {"EDINET_S100A_PDF": "truncated"}
+
+    def test_scan_detects_mislabeled_and_invalid_content(
+        self, storage: LocalStorage, repository: DocumentRepositoryImpl
+    ) -> None:
+        repository.save(build_document("S100A"), PDF)
+        repository.save(build_document("S100B"), b'{"statusCode": 404}')
+        repository.save(build_document("S100C", FormatTypeEnum.PDF), build_zip({}))
+
+        assert self.problems(storage) == {
+            "EDINET_S100A_XBRL": "mislabeled",
+            "EDINET_S100B_XBRL": "invalid",
+            "EDINET_S100C_PDF": "mislabeled",
+        }
+
+    def test_scan_verifies_hashes_only_when_requested(
+        self, storage: LocalStorage, repository: DocumentRepositoryImpl
+    ) -> None:
+        package = build_zip({"a.xbrl": b"x" * 100})
+        repository.save(
+            build_document("S100A"),
+            package,
+            sha256=hashlib.sha256(b"other").hexdigest(),
+        )
+
+        assert self.problems(storage) == {}
+        assert self.problems(storage, verify_hashes=True) == {
+            "EDINET_S100A_XBRL": "hash_mismatch"
+        }
+
+    def test_scan_skips_paths_outside_layout(
+        self, storage: LocalStorage, repository: DocumentRepositoryImpl
+    ) -> None:
+        repository.save(build_document("S100A"), build_zip({"a.xbrl": b"x"}))
+        storage.save("EDINET/_bundles/2024-03-15/0001.bundle", b"bundle")
+
+        result = self.build_auditor(storage).scan(prefix="EDINET/")
+
+        assert result.checked == 1
+        assert result.skipped == ["EDINET/_bundles/2024-03-15/0001.bundle"]
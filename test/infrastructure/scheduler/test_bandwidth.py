@@ -0,0 +1,162 @@
+import threading
+
+import pytest
+from fino_ingestor.infrastructure.factory.bandwidth import create_bandwidth_limiter
+from fino_ingestor.infrastructure.factory.client_registry import ClientRegistry
+from fino_ingestor.infrastructure.scheduler.bandwidth import BandwidthLimiter
+from fino_ingestor.interface.config.concurrency import BandwidthConfig
+
+
+class FakeClock:
+    """sleepで時刻を進める時計"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+        self._lock = threading.Lock()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        with self._lock:
+            self.sleeps.append(seconds)
+
+
+def build_limiter(
+    clock: FakeClock, bytes_per_second: int = 1000, burst_bytes: int | None = None
+) -> BandwidthLimiter:
+    return BandwidthLimiter(
+        bytes_per_second, burst_bytes=burst_bytes, clock=clock, sleep=clock.sleep
+    )
+
+
+class TestBandwidthLimiter:
+    ########## consume ##########
+    def test_consume_within_burst_does_not_wait(self) -> None:
+        clock = FakeClock()
+        limiter = build_limiter(clock)
+
+        limiter.consume(600)
+        limiter.consume(400)
+        assert clock.sleeps == []
+
+    def test_consume_waits_for_missing_tokens(self) -> None:
+        clock = FakeClock()
+        limiter = build_limiter(clock)
+
+        limiter.consume(1000)
+        limiter.consume(500)
+        assert clock.sleeps == [pytest.approx(0.5)]
+
+    def test_consume_larger_than_burst_waits_for_shortfall(self) -> None:
+        clock = FakeClock()
+        limiter = build_limiter(clock, burst_bytes=100)
+
+        limiter.consume(1100)
+        assert clock.sleeps == [pytest.approx(1.0)]
+
+    def test_consume_queues_concurrent_callers_in_order(self) -> None:
+        clock = FakeClock()
+        limiter = build_limiter(clock, burst_bytes=1)
+
+        # 不足分を持ち越すため、後の呼び出しほど長く待機する
+        limiter.consume(1001)
+        limiter.consume(1000)
+        limiter.consume(1000)
+        assert clock.sleeps == [
+            pytest.approx(1.0),
+            pytest.approx(2.0),
+            pytest.approx(3.0),
+        ]
+
+    def test_consume_refills_tokens_over_time(self) -> None:
+        clock = FakeClock()
+        limiter = build_limiter(clock)
+
+        limiter.consume(1000)
+        clock.now = 0.5
+        limiter.consume(500)
+        assert clock.sleeps == []
+
+    def test_tokens_do_not_exceed_burst(self) -> None:
+        clock = FakeClock()
+        limiter = build_limiter(clock)
+
+        clock.now = 100.0
+        limiter.consume(1500)
+        assert clock.sleeps == [pytest.approx(0.5)]
+
+    def test_throttle_consumes_each_chunk(self) -> None:
+        clock = FakeClock()
+        limiter = build_limiter(clock)
+
+        chunks = list(limiter.throttle([b"a" * 1000, b"b" * 250, b"c" * 250]))
+        assert chunks == [b"a" * 1000, b"b" * 250, b"c" * 250]
+        assert clock.sleeps == [pytest.approx(0.25), pytest.approx(0.5)]
+
+    def test_invalid_rate_raises_error(self) -> None:
+        with pytest.raises(ValueError, match="bytes_per_second"):
+            _ = BandwidthLimiter(0)
+
+    ########## metrics ##########
+    def test_metrics_reports_throughput(self) -> None:
+        clock = FakeClock()
+        limiter = build_limiter(clock)
+
+        limiter.consume(1000)
+        clock.now = 1.0
+        limiter.consume(1000)
+        clock.now = 2.0
+        metrics = limiter.metrics()
+        assert metrics.limit_bytes_per_second == 1000
+        assert metrics.total_bytes == 2000
+        assert metrics.throughput_bytes_per_second == pytest.approx(1000.0)
+        assert metrics.throttled_seconds == 0.0
+
+    def test_metrics_excludes_old_transfers_from_throughput(self) -> None:
+        clock = FakeClock()
+        limiter = build_limiter(clock)
+
+        limiter.consume(1000)
+        clock.now = 20.0
+        limiter.consume(500)
+        clock.now = 25.0
+        metrics = limiter.metrics()
+        assert metrics.total_bytes == 1500
+        assert metrics.throughput_bytes_per_second == pytest.approx(50.0)
+
+    def test_consume_discards_old_transfer_records(self) -> None:
+        """metricsを呼ばなくても転送記録は算出期間分しか保持しない"""
+        clock = FakeClock()
+        limiter = build_limiter(clock)
+
+        for second in range(100):
+            clock.now = float(second)
+            limiter.consume(100)
+
+        assert len(limiter._recent) <= 11
+        assert limiter.metrics().total_bytes == 10000
+
+
+class TestCreateBandwidthLimiter:
+    def test_returns_none_without_limit(self) -> None:
+        config = BandwidthConfig(upload_bytes_per_second=1000)
+        assert create_bandwidth_limiter(config, "download", None) is None
+
+    def test_creates_limiter_with_burst(self) -> None:
+        config = BandwidthConfig(upload_bytes_per_second=1000, burst_seconds=2.0)
+        limiter = create_bandwidth_limiter(config, "upload", None)
+        assert limiter is not None
+        assert limiter.bytes_per_second == 1000
+        assert limiter.burst_bytes == 2000
+
+    def test_shares_limiter_per_direction(self) -> None:
+        registry = ClientRegistry()
+        config = BandwidthConfig(
+            download_bytes_per_second=1000, upload_bytes_per_second=1000
+        )
+
+        download = create_bandwidth_limiter(config, "download", registry)
+        assert download is create_bandwidth_limiter(config, "download", registry)
+        assert download is not create_bandwidth_limiter(config, "upload", registry)
@@ -0,0 +1,96 @@
+import threading
+
+import pytest
+from fino_ingestor.infrastructure.scheduler.byte_budget import ByteBudget
+
+
+def run_in_thread(target: object) -> tuple[threading.Thread, threading.Event]:
+    done = threading.Event()
+
+    def run() -> None:
+        target()  # type: ignore[operator]
+        done.set()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread, done
+
+
+class TestByteBudget:
+    ########## reserve method ##########
+    def test_reserve_waits_until_bytes_are_released(self) -> None:
+        budget = ByteBudget(max_bytes=100)
+        first = budget.reserve(80)
+
+        thread, done = run_in_thread(lambda: budget.reserve(30).release())
+        assert not done.wait(timeout=0.1)
+
+        first.release()
+        assert done.wait(timeout=5)
+        thread.join()
+        assert budget.in_flight_bytes == 0
+        assert budget.waits == 1
+
+    def test_reserve_allows_oversized_request_when_idle(self) -> None:
+        budget = ByteBudget(max_bytes=100)
+        with budget.reserve(500):
+            assert budget.in_flight_bytes == 500
+        assert budget.in_flight_bytes == 0
+
+    ########## resize method ##########
+    def test_resize_shrinks_and_wakes_waiters(self) -> None:
+        budget = ByteBudget(max_bytes=100)
+        first = budget.reserve(100)
+
+        thread, done = run_in_thread(lambda: budget.reserve(50).release())
+        assert not done.wait(timeout=0.1)
+
+        first.resize(40)
+        assert done.wait(timeout=5)
+        thread.join()
+        first.release()
+
+    def test_resize_grow_waits_for_other_holders(self) -> None:
+        budget = ByteBudget(max_bytes=100)
+        first = budget.reserve(50)
+        second = budget.reserve(50)
+
+        thread, done = run_in_thread(lambda: second.resize(80))
+        assert not done.wait(timeout=0.1)
+
+        first.release()
+        assert done.wait(timeout=5)
+        thread.join()
+        assert budget.in_flight_bytes == 80
+
+    def test_resize_does_not_deadlock_when_all_holders_grow(self) -> None:
+        budget = ByteBudget(max_bytes=100)
+        reservations = [budget.reserve(50), budget.reserve(50)]
+
+        threads = [
+            run_in_thread(lambda r=reservation: r.resize(100))
+            for reservation in reservations
+        ]
+        # すべての予約が拡大待ちになった場合、いずれかは待たずに拡大できる
+        assert threads[0][1].wait(timeout=5) or threads[1][1].wait(timeout=5)
+
+        # 拡大できた予約が解放されると、もう一方も拡大できる
+        finished = 0 if threads[0][1].is_set() else 1
+        reservations[finished].release()
+        for thread, done in threads:
+            assert done.wait(timeout=5)
+            thread.join()
+        assert budget.in_flight_bytes == 100
+
+    def test_release_is_idempotent(self) -> None:
+        budget = ByteBudget(max_bytes=100)
+        reservation = budget.reserve(10)
+        reservation.release()
+        reservation.release()
+        reservation.resize(50)
+        assert budget.in_flight_bytes == 0
+
+    ########## instance check ##########
+    def test_invalid_max_bytes(self) -> None:
+        with pytest.raises(ValueError):
+            _ = ByteBudget(max_bytes=0)
@@ -0,0 +1,226 @@
+import threading
+import time
+from typing import Any
+
+import pytest
+from fino_ingestor.infrastructure.adapter.disclosure_source.ranged_download import (
+    RetryableDownloadError,
+)
+from fino_ingestor.infrastructure.scheduler.bandwidth import BandwidthLimiter
+from fino_ingestor.infrastructure.scheduler.byte_budget import ByteBudget
+from fino_ingestor.infrastructure.scheduler.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    excluded_from_latency,
+    is_overload_error,
+)
+from fino_ingestor.interface.config.concurrency import ConcurrencyConfig
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class HttpError(Exception):
+    def __init__(self, response: Any) -> None:
+        super().__init__("http error")
+        self.response = response
+
+
+class Response:
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+
+
+class TestIsOverloadError:
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (RetryableDownloadError("Server error"), True),
+            (TimeoutError(), True),
+            (HttpError(Response(429)), True),
+            (HttpError(Response(503)), True),
+            (HttpError(Response(404)), False),
+            (HttpError({"Error": {"Code": "SlowDown"}}), True),
+            (HttpError({"Error": {"Code": "NoSuchKey"}}), False),
+            (
+                HttpError(
+                    {
+                        "Error": {"Code": "X"},
+                        "ResponseMetadata": {"HTTPStatusCode": 500},
+                    }
+                ),
+                True,
+            ),
+            (ValueError("invalid"), False),
+        ],
+    )
+    def test_classification(self, error: Exception, expected: bool) -> None:
+        assert is_overload_error(error) is expected
+
+
+class TestAdaptiveConcurrencyLimiter:
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def limiter(self, clock: FakeClock) -> AdaptiveConcurrencyLimiter:
+        config = ConcurrencyConfig(
+            initial_limit=4, min_limit=1, max_limit=8, cooldown_seconds=1.0
+        )
+        return AdaptiveConcurrencyLimiter(config, clock=clock)
+
+    def complete(
+        self, limiter: AdaptiveConcurrencyLimiter, latency: float, count: int
+    ) -> None:
+        for _ in range(count):
+            limiter.acquire()
+            limiter.release(latency)
+
+    ########## release method ##########
+    def test_limit_increases_additively_on_success(
+        self, limiter: AdaptiveConcurrencyLimiter
+    ) -> None:
+        self.complete(limiter, latency=0.1, count=4)
+        assert limiter.limit == 4
+
+        self.complete(limiter, latency=0.1, count=1)
+        assert limiter.limit == 5
+
+    def test_limit_is_bounded_by_max(self, limiter: AdaptiveConcurrencyLimiter) -> None:
+        self.complete(limiter, latency=0.1, count=200)
+        assert limiter.limit == 8
+
+    def test_limit_decreases_multiplicatively_on_overload(
+        self, limiter: AdaptiveConcurrencyLimiter, clock: FakeClock
+    ) -> None:
+        limiter.acquire()
+        limiter.release(0.1, overloaded=True)
+        assert limiter.limit == 2
+
+        # クールダウン中の失敗では減らさない
+        limiter.acquire()
+        limiter.release(0.1, overloaded=True)
+        assert limiter.limit == 2
+
+        clock.now = 2.0
+        limiter.acquire()
+        limiter.release(0.1, overloaded=True)
+        limiter.acquire()
+        clock.now = 4.0
+        limiter.release(0.1, overloaded=True)
+        assert limiter.limit == 1
+        assert limiter.metrics().decreases == 3
+
+    def test_limit_decreases_on_latency_spike(
+        self, limiter: AdaptiveConcurrencyLimiter
+    ) -> None:
+        self.complete(limiter, latency=0.1, count=3)
+        self.complete(limiter, latency=1.0, count=1)
+        assert limiter.limit == 2
+
+    def test_error_without_overload_keeps_limit(
+        self, limiter: AdaptiveConcurrencyLimiter
+    ) -> None:
+        with pytest.raises(ValueError):
+            with limiter.slot():
+                raise ValueError("not found")
+        assert limiter.limit == 4
+        assert limiter.metrics().in_flight == 0
+
+    def test_slot_reports_overload_error(
+        self, limiter: AdaptiveConcurrencyLimiter
+    ) -> None:
+        with pytest.raises(RetryableDownloadError):
+            with limiter.slot():
+                raise RetryableDownloadError("Server error")
+        assert limiter.limit == 2
+
+    ########## measure method ##########
+    def test_measure_excludes_marked_waits(
+        self, limiter: AdaptiveConcurrencyLimiter, clock: FakeClock
+    ) -> None:
+        limiter.acquire()
+        with limiter.measure():
+            clock.now += 1.0
+            with excluded_from_latency():
+                clock.now += 5.0
+        assert limiter.metrics().latency_seconds == 1.0
+
+    def test_measure_excludes_bandwidth_sleep(
+        self, limiter: AdaptiveConcurrencyLimiter, clock: FakeClock
+    ) -> None:
+        def sleep(seconds: float) -> None:
+            clock.now += seconds
+
+        bandwidth = BandwidthLimiter(bytes_per_second=10, clock=clock, sleep=sleep)
+        limiter.acquire()
+        with limiter.measure():
+            clock.now += 0.5
+            bandwidth.consume(40)
+        assert limiter.metrics().latency_seconds == 0.5
+
+    def test_measure_excludes_byte_budget_wait(
+        self, limiter: AdaptiveConcurrencyLimiter, clock: FakeClock
+    ) -> None:
+        budget = ByteBudget(max_bytes=10)
+        other = budget.reserve(10)
+        waiting = threading.Event()
+
+        def measure() -> None:
+            limiter.acquire()
+            with limiter.measure():
+                waiting.set()
+                with budget.reserve(5):
+                    pass
+
+        thread = threading.Thread(target=measure)
+        thread.start()
+        assert waiting.wait(timeout=5)
+        while budget.waits == 0:
+            time.sleep(0.01)
+        # 待機に入るまで予約側がロックを保持するため、ロックの取得後に時間を進める
+        with budget._condition:  # type: ignore[reportPrivateUsage]
+            clock.now += 3.0
+        other.release()
+        thread.join(timeout=5)
+        assert limiter.metrics().latency_seconds == 0.0
+
+    def test_excluded_from_latency_without_measure_does_nothing(
+        self, limiter: AdaptiveConcurrencyLimiter, clock: FakeClock
+    ) -> None:
+        with excluded_from_latency():
+            clock.now += 1.0
+        limiter.acquire()
+        with limiter.measure():
+            clock.now += 2.0
+        assert limiter.metrics().latency_seconds == 2.0
+
+    ########## acquire method ##########
+    def test_acquire_blocks_when_limit_reached(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(
+            ConcurrencyConfig(initial_limit=1, min_limit=1, max_limit=1)
+        )
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def acquire() -> None:
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        assert not acquired.wait(timeout=0.1)
+
+        limiter.release(0.1)
+        assert acquired.wait(timeout=5)
+        thread.join()
+
+    ########## config ##########
+    def test_config_rejects_invalid_limits(self) -> None:
+        with pytest.raises(ValueError):
+            _ = ConcurrencyConfig(initial_limit=10, max_limit=4)
@@ -0,0 +1,130 @@
+import threading
+from datetime import date
+
+import pytest
+from fino_ingestor.domain.entity.document import Document
+from fino_ingestor.domain.value.disclosure_date import DisclosureDate
+from fino_ingestor.domain.value.disclosure_source import (
+    DisclosureSource,
+    DisclosureSourceEnum,
+)
+from fino_ingestor.domain.value.disclosure_type import (
+    DisclosureType,
+    DisclosureTypeEnum,
+)
+from fino_ingestor.domain.value.document_id import DocumentId
+from fino_ingestor.domain.value.format_type import FormatType, FormatTypeEnum
+from fino_ingestor.domain.value.ticker import Ticker
+from fino_ingestor.infrastructure.scheduler.download_queue import (
+    DownloadPriorityPolicy,
+    DownloadQueue,
+)
+from fino_ingestor.interface.config.priority import PriorityConfig
+
+TODAY = date(2024, 3, 15)
+
+
+def build_document(
+    doc_id: str,
+    disclosure_type: DisclosureTypeEnum = DisclosureTypeEnum.MATERIAL_EVENT_REPORT,
+    ticker: str = "12345",
+    disclosure_date: date = TODAY,
+) -> Document:
+    return Document(
+        document_id=DocumentId(value=f"EDINET_{doc_id}_XBRL"),
+        filing_name="有価証券報告書",
+        ticker=Ticker(value=ticker),
+        disclosure_type=DisclosureType(enum=disclosure_type),
+        disclosure_source=DisclosureSource(enum=DisclosureSourceEnum.EDINET),
+        disclosure_date=DisclosureDate(value=disclosure_date),
+        filing_format=FormatType(enum=FormatTypeEnum.XBRL),
+    )
+
+
+def doc_ids(documents: list[Document]) -> list[str]:
+    return [d.document_id.value.split("_")[1] for d in documents]
+
+
+class TestDownloadPriorityPolicy:
+    @pytest.fixture
+    def policy(self) -> DownloadPriorityPolicy:
+        config = PriorityConfig(
+            disclosure_type_weights={DisclosureTypeEnum.ANNUAL_REPORT: 30},
+            watchlist=["7203"],
+            watchlist_weight=100,
+            recency_weight=10,
+            recency_days=10,
+        )
+        return DownloadPriorityPolicy(config, today=lambda: TODAY)
+
+    ########## score method ##########
+    def test_score_combines_rules(self, policy: DownloadPriorityPolicy) -> None:
+        document = build_document(
+            "S100A", DisclosureTypeEnum.ANNUAL_REPORT, ticker="7203"
+        )
+        assert policy.score(document) == 140
+
+    def test_recency_decays_linearly(self, policy: DownloadPriorityPolicy) -> None:
+        assert (
+            policy.score(build_document("S100A", disclosure_date=date(2024, 3, 10)))
+            == 5
+        )
+        assert (
+            policy.score(build_document("S100A", disclosure_date=date(2023, 3, 10)))
+            == 0
+        )
+
+
+class TestDownloadQueue:
+    @pytest.fixture
+    def queue(self) -> DownloadQueue:
+        config = PriorityConfig(watchlist=["7203"])
+        return DownloadQueue(DownloadPriorityPolicy(config, today=lambda: TODAY))
+
+    ########## pop method ##########
+    def test_pop_returns_highest_priority_first(self, queue: DownloadQueue) -> None:
+        queue.push(
+            [
+                build_document("S100A"),
+                build_document("S100B", DisclosureTypeEnum.ANNUAL_REPORT),
+                build_document("S100C", ticker="7203"),
+                build_document("S100D"),
+            ]
+        )
+
+        popped: list[Document] = []
+        while (queued := queue.pop()) is not None:
+            popped.append(queued.document)
+
+        # 同じ優先度の書類は追加順
+        assert doc_ids(popped) == ["S100C", "S100B", "S100A", "S100D"]
+        assert len(queue) == 0
+
+    ########## snapshot method ##########
+    def test_snapshot_does_not_consume_queue(self, queue: DownloadQueue) -> None:
+        queue.push(
+            [
+                build_document("S100A"),
+                build_document("S100B", DisclosureTypeEnum.ANNUAL_REPORT),
+            ]
+        )
+
+        assert doc_ids([q.document for q in queue.snapshot()]) == ["S100B", "S100A"]
+        assert doc_ids([q.document for q in queue.snapshot(limit=1)]) == ["S100B"]
+        assert len(queue) == 2
+
+    def test_concurrent_push_and_pop(self, queue: DownloadQueue) -> None:
+        documents = [build_document(f"S100{i}") for i in range(100)]
+        threads = [
+            threading.Thread(target=queue.push, args=(documents[i::4],))
+            for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        popped: list[Document] = []
+        while (queued := queue.pop()) is not None:
+            popped.append(queued.document)
+        assert len(popped) == 100
@@ -0,0 +1,53 @@
+"""Import-time benchmark for fino_ingestor."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ("boto3", "botocore", "mypy_boto3_s3", "edinet", "pydantic", "dateutil")
+
+
+def _run_python(code: str, *args: str) -> subprocess.CompletedProcess[str]:
+    # 現在のsys.pathを引き継いだ新しいインタプリタで計測する（import済みモジュールの影響を排除）
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(p for p in sys.path if p)}
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+
+def _loaded_modules(code: str) -> set[str]:
+    result = _run_python(
+        f"{code}\nimport sys\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    return {m for m in result.stdout.strip().split(",") if m}
+
+
+@pytest.mark.benchmark
+class TestImportTime:
+    def test_package_import_does_not_load_heavy_dependencies(self) -> None:
+        assert _loaded_modules("import fino_ingestor") == set()
+
+    def test_local_storage_collector_does_not_load_s3_dependencies(self) -> None:
+        loaded = _loaded_modules(
+            "import tempfile\n"
+            "from fino_ingestor import DocumentCollector, EdinetConfig, LocalStorageConfig\n"
+            "DocumentCollector(EdinetConfig(api_key='x'), LocalStorageConfig(base_dir=tempfile.mkdtemp()))"
+        )
+        assert "boto3" not in loaded
+        assert "botocore" not in loaded
+        assert "mypy_boto3_s3" not in loaded
+        assert "dateutil" not in loaded
+
+    def test_package_import_defers_submodules(self) -> None:
+        """パッケージのimport時点では公開オブジェクトのモジュールを読み込まない"""
+        result = _run_python(
+            "import sys\nimport fino_ingestor\n"
+            "print(','.join(m for m in sys.modules if m.startswith('fino_ingestor.')))"
+        )
+        assert result.stdout.strip() == ""
@@ -0,0 +1,67 @@
+"""Tests for business calendar."""
+
+from datetime import date
+
+import pytest
+from fino_ingestor.util.business_calendar import (
+    BusinessCalendar,
+    JapanMarketCalendar,
+    WeekdayCalendar,
+)
+
+
+class TestWeekdayCalendar:
+    """WeekdayCalendarのテスト"""
+
+    @pytest.fixture
+    def calendar(self) -> WeekdayCalendar:
+        return WeekdayCalendar()
+
+    def test_instance_success(self, calendar: WeekdayCalendar) -> None:
+        assert isinstance(calendar, BusinessCalendar)
+
+    def test_weekday_is_business_day(self, calendar: WeekdayCalendar) -> None:
+        # 2024-03-15は金曜日
+        assert calendar.is_business_day(date(2024, 3, 15)) is True
+
+    def test_weekend_is_holiday(self, calendar: WeekdayCalendar) -> None:
+        # 2024-03-16は土曜日、2024-03-17は日曜日
+        assert calendar.is_holiday(date(2024, 3, 16)) is True
+        assert calendar.is_holiday(date(2024, 3, 17)) is True
+
+
+class TestJapanMarketCalendar:
+    """JapanMarketCalendarのテスト"""
+
+    @pytest.fixture
+    def calendar(self) -> JapanMarketCalendar:
+        return JapanMarketCalendar()
+
+    def test_national_holiday_is_holiday(self, calendar: JapanMarketCalendar) -> None:
+        # 春分の日（水曜日）
+        assert calendar.is_holiday(date(2024, 3, 20)) is True
+
+    def test_substitute_holiday_is_holiday(self, calendar: JapanMarketCalendar) -> None:
+        # 振替休日（建国記念の日が日曜日）
+        assert calendar.is_holiday(date(2024, 2, 12)) is True
+
+    def test_year_end_holidays(self, calendar: JapanMarketCalendar) -> None:
+        assert calendar.is_holiday(date(2024, 12, 31)) is True
+        assert calendar.is_holiday(date(2025, 1, 2)) is True
+        assert calendar.is_holiday(date(2025, 1, 3)) is True
+        assert calendar.is_business_day(date(2025, 1, 6)) is True
+
+    def test_business_day(self, calendar: JapanMarketCalendar) -> None:
+        assert calendar.is_business_day(date(2024, 3, 15)) is True
+
+    def test_covers(self) -> None:
+        assert JapanMarketCalendar.covers(date(2024, 1, 1)) is True
+        assert JapanMarketCalendar.covers(date(1999, 12, 31)) is False
+
+    def test_out_of_table_range_falls_back_to_weekdays(
+        self, calendar: JapanMarketCalendar
+    ) -> None:
+        """祝日テーブルの範囲外の年は土日と年末年始のみを休業日とする"""
+        # 2040-02-10は金曜日
+        assert calendar.is_business_day(date(2040, 2, 10)) is True
+        assert calendar.is_holiday(date(2040, 2, 11)) is True
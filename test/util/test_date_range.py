@@ -0,0 +1,121 @@
+"""Tests for date range algebra."""
+
+from datetime import date
+from itertools import chain
+
+import pytest
+from fino_ingestor.util.business_calendar import JapanMarketCalendar
+from fino_ingestor.util.date_range import DateRange, DateRangeSet
+from fino_ingestor.util.timescope import TimeScope
+
+
+class TestDateRange:
+    """DateRangeのテスト"""
+
+    def test_create_date_range(self) -> None:
+        date_range = DateRange(start=date(2024, 3, 1), end=date(2024, 3, 31))
+        assert date_range.days == 31
+        assert date_range.to_range() == (date(2024, 3, 1), date(2024, 3, 31))
+
+    def test_raises_error_when_start_after_end(self) -> None:
+        with pytest.raises(ValueError, match="start must be before or equal to end"):
+            _ = DateRange(start=date(2024, 3, 2), end=date(2024, 3, 1))
+
+    def test_last_days(self) -> None:
+        date_range = DateRange.last_days(45, until=date(2024, 3, 31))
+        assert date_range.start == date(2024, 2, 16)
+        assert date_range.end == date(2024, 3, 31)
+        assert len(list(date_range.iterate_by_day())) == 45
+
+    def test_iterate_by_day_with_calendar(self) -> None:
+        date_range = DateRange(start=date(2024, 3, 18), end=date(2024, 3, 24))
+        dates = list(date_range.iterate_by_day(calendar=JapanMarketCalendar()))
+        # 3/20は春分の日、3/23-24は土日
+        assert dates == [
+            date(2024, 3, 18),
+            date(2024, 3, 19),
+            date(2024, 3, 21),
+            date(2024, 3, 22),
+        ]
+
+
+class TestDateRangeSet:
+    """DateRangeSetのテスト"""
+
+    @pytest.fixture
+    def march(self) -> DateRangeSet:
+        return DateRangeSet.from_timescope(TimeScope(year=2024, month=3))
+
+    def test_normalize_merges_overlapping_and_adjacent_ranges(self) -> None:
+        range_set = DateRangeSet(
+            [
+                DateRange(start=date(2024, 1, 10), end=date(2024, 1, 20)),
+                DateRange(start=date(2024, 1, 1), end=date(2024, 1, 5)),
+                DateRange(start=date(2024, 1, 6), end=date(2024, 1, 12)),
+            ]
+        )
+        assert range_set.ranges == (
+            DateRange(start=date(2024, 1, 1), end=date(2024, 1, 20)),
+        )
+        assert len(range_set) == 20
+
+    def test_from_dates(self) -> None:
+        range_set = DateRangeSet.from_dates(
+            [date(2024, 1, 3), date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 5)]
+        )
+        assert range_set.ranges == (
+            DateRange(start=date(2024, 1, 1), end=date(2024, 1, 3)),
+            DateRange(start=date(2024, 1, 5), end=date(2024, 1, 5)),
+        )
+
+    def test_union(self, march: DateRangeSet) -> None:
+        april = DateRangeSet.from_timescope(TimeScope(year=2024, month=4))
+        union = march | april
+        assert union.ranges == (
+            DateRange(start=date(2024, 3, 1), end=date(2024, 4, 30)),
+        )
+
+    def test_intersection(self, march: DateRangeSet) -> None:
+        other = DateRange(start=date(2024, 2, 20), end=date(2024, 3, 10))
+        intersection = march & other
+        assert intersection.ranges == (
+            DateRange(start=date(2024, 3, 1), end=date(2024, 3, 10)),
+        )
+
+    def test_difference_with_completed_days(self, march: DateRangeSet) -> None:
+        completed = {date(2024, 3, day) for day in range(1, 11)} | {date(2024, 3, 15)}
+        remaining = march - completed
+        assert remaining.ranges == (
+            DateRange(start=date(2024, 3, 11), end=date(2024, 3, 14)),
+            DateRange(start=date(2024, 3, 16), end=date(2024, 3, 31)),
+        )
+        assert len(remaining) == 20
+        assert date(2024, 3, 15) not in remaining
+        assert date(2024, 3, 16) in remaining
+
+    def test_difference_all_days(self, march: DateRangeSet) -> None:
+        remaining = march - TimeScope(year=2024)
+        assert remaining.is_empty()
+        assert len(remaining) == 0
+
+    def test_chunk(self, march: DateRangeSet) -> None:
+        remaining = march - {date(2024, 3, 5)}
+        shards = remaining.chunk(max_days=7)
+        assert [len(shard) for shard in shards] == [7, 7, 7, 7, 2]
+        # シャードはレンジをまたぐことができる
+        assert shards[0].ranges == (
+            DateRange(start=date(2024, 3, 1), end=date(2024, 3, 4)),
+            DateRange(start=date(2024, 3, 6), end=date(2024, 3, 8)),
+        )
+        assert list(chain.from_iterable(shards)) == list(remaining)
+
+    def test_shard(self, march: DateRangeSet) -> None:
+        shards = march.shard(4)
+        assert len(shards) == 4
+        assert [len(shard) for shard in shards] == [8, 8, 8, 7]
+
+    def test_iterate_by_day(self, march: DateRangeSet) -> None:
+        dates = list(march.iterate_by_day())
+        assert len(dates) == 31
+        assert dates[0] == date(2024, 3, 1)
+        assert dates[-1] == date(2024, 3, 31)
@@ -4,6 +4,7 @@ from datetime import date
 from typing import Literal, TypeAlias
 
 import pytest
+from fino_ingestor.util.business_calendar import JapanMarketCalendar
 from fino_ingestor.util.timescope import Granularity, TimeScope
 
 
@@ -103,6 +104,26 @@ class TestTimeScope:
         assert len(dates) == 1
         assert dates[0] == date(2024, 3, 15)
 
+    def test_iterate_by_day_with_calendar(self, timescope_year_args: YearArgs) -> None:
+        """calendar指定時は営業日のみイテレートする"""
+        timescope = TimeScope(**timescope_year_args)
+        dates = list(timescope.iterate_by_day(calendar=JapanMarketCalendar()))
+        # 2024年の東証の営業日数
+        assert len(dates) == 245
+        assert dates[0] == date(2024, 1, 4)
+        assert dates[-1] == date(2024, 12, 30)
+
+    def test_iterate_non_business_days(self, timescope_month_args: MonthArgs) -> None:
+        """休業日のみをイテレートする"""
+        timescope = TimeScope(**timescope_month_args)
+        calendar = JapanMarketCalendar()
+        holidays = list(timescope.iterate_non_business_days(calendar))
+        business_days = list(timescope.iterate_by_day(calendar=calendar))
+        # 2024年6月は祝日がなく、土日のみが休業日
+        assert len(holidays) == 10
+        assert len(holidays) + len(business_days) == 30
+        assert set(holidays).isdisjoint(business_days)
+
     def test_closest_day_for_year(self) -> None:
         """Year: 閏年のテスト"""
         timescope = TimeScope(year=2024, month=2)